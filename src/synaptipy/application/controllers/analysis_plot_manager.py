@@ -47,9 +47,14 @@ class AnalysisPlotManager:
         preprocessing_settings: Optional[Dict] = None,
         filtered_indices: Optional[List[int]] = None,
         process_callback: Optional[Any] = None,  # Callback to self._process_signal_data
+        trial_callback: Optional[Any] = None,  # (channel, trial_index) -> preprocessed trial, e.g. cached
     ) -> Optional[PlotDataPackage]:
         """
         Prepares all necessary data for plotting.
+
+        When *trial_callback* is given it supplies preprocessed single trials
+        (main and context traces) instead of running *process_callback* on the
+        raw data, so a shared processed-trace cache can serve them.
         """
         if channel_id not in recording.channels:
             log.error(f"Channel {channel_id} not found in recording")
@@ -59,7 +64,7 @@ class AnalysisPlotManager:
 
         # 1. Handle Context Traces
         context_traces = AnalysisPlotManager._get_context_traces(
-            channel, filtered_indices, data_source, preprocessing_settings, process_callback
+            channel, filtered_indices, data_source, preprocessing_settings, process_callback, trial_callback
         )
 
         # 2. Handle Main Trace
@@ -71,7 +76,12 @@ class AnalysisPlotManager:
             return None
 
         # 3. Apply Preprocessing
-        if preprocessing_settings and process_callback:
+        processed = None
+        if preprocessing_settings and trial_callback and isinstance(data_source, int):
+            processed = AnalysisPlotManager._processed_trial(channel, data_source, trial_callback)
+        if processed is not None:
+            main_data = processed
+        elif preprocessing_settings and process_callback:
             main_data = AnalysisPlotManager._apply_preprocessing(
                 main_data, main_time, channel.sampling_rate, preprocessing_settings, process_callback
             )
@@ -95,6 +105,7 @@ class AnalysisPlotManager:
         data_source: Union[int, str],
         settings: Optional[Dict],
         callback: Optional[Any],
+        trial_callback: Optional[Any] = None,
     ) -> List[PlotContextTrace]:
         traces = []
         if not filtered_indices:
@@ -108,7 +119,14 @@ class AnalysisPlotManager:
             ctx_t = channel.get_relative_time_vector(idx)
 
             if ctx_d is not None and ctx_t is not None:
-                if settings and callback:
+                processed = (
+                    AnalysisPlotManager._processed_trial(channel, idx, trial_callback)
+                    if settings and trial_callback
+                    else None
+                )
+                if processed is not None:
+                    ctx_d = processed
+                elif settings and callback:
                     try:
                         ctx_d = callback(ctx_d, channel.sampling_rate, settings, time_vector=ctx_t)
                     except Exception as e:
@@ -116,6 +134,14 @@ class AnalysisPlotManager:
                 traces.append(PlotContextTrace(ctx_t, ctx_d))
         return traces
 
+    @staticmethod
+    def _processed_trial(channel: Channel, trial_index: int, trial_callback: Any) -> Optional[np.ndarray]:
+        try:
+            return trial_callback(channel, trial_index)
+        except Exception as e:
+            log.debug(f"Trial callback failed for trial {trial_index}: {e}")
+            return None
+
     @staticmethod
     def _get_main_trace_raw(
         channel: Channel, data_source: Union[int, str], filtered_indices: Optional[List[int]]
@@ -17,6 +17,7 @@ from synaptipy.core.data_model import Recording
 
 # Import from our package structure
 from synaptipy.infrastructure.file_readers.neo_adapter import NeoAdapter
+from synaptipy.infrastructure.file_readers.recording_cache import RecordingDiskCache
 from synaptipy.shared.data_cache import DataCache
 from synaptipy.shared.error_handling import SynaptipyError
 
@@ -57,6 +58,8 @@ class DataLoader(QtCore.QObject):
 
         # Initialize the data cache
         self.cache = DataCache.get_instance()
+        # Persistent decoded-recording cache (eager loads only)
+        self.disk_cache = RecordingDiskCache.get_instance()
         log.debug("DataLoader initialization complete.")
 
     @staticmethod
@@ -139,7 +142,7 @@ class DataLoader(QtCore.QObject):
 
             # Load the recording using NeoAdapter
             log.debug(f"Calling neo_adapter.read_recording for: {file_path} (lazy: {lazy_load})")
-            recording_data = self.neo_adapter.read_recording(file_path, lazy=lazy_load)
+            recording_data = self.disk_cache.read_recording(self.neo_adapter, file_path, lazy=lazy_load)
 
             self.loading_progress.emit(80)
 
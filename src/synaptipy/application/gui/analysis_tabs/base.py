@@ -36,6 +36,7 @@ from synaptipy.shared.cursor_manager import CursorToolManager
 from synaptipy.shared.plot_customization import get_average_pen, get_plot_customization_signals, get_single_trial_pen
 from synaptipy.shared.plot_exporter import PlotExporter
 from synaptipy.shared.plot_zoom_sync import PlotZoomSyncManager
+from synaptipy.shared.processed_cache import ProcessedTraceCache
 from synaptipy.shared.styling import (
     style_button,
 )
@@ -772,9 +773,17 @@ class BaseAnalysisTab(QtWidgets.QWidget, ABC, metaclass=QABCMeta):
         fs = self._current_plot_data.get("sampling_rate", 1.0)
         chan_id = self._current_plot_data.get("channel_id")
 
+        data_source = self._current_plot_data.get("data_source", "")
+        channel = self._selected_item_recording.channels.get(chan_id) if self._selected_item_recording else None
+
         processed_data = raw_data.copy()
         if self._active_preprocessing_settings and self.pipeline:
-            result = self.pipeline.process(raw_data, fs, raw_time)
+            result = None
+            if isinstance(data_source, int) and channel is not None:
+                # Single trial: reuse the shared processed-trace cache (filtered once per pipeline)
+                result = self._processed_channel_trials(channel, [data_source])[0]
+            if result is None:
+                result = self.pipeline.process(raw_data, fs, raw_time)
             if result is not None:
                 processed_data = result
 
@@ -783,36 +792,29 @@ class BaseAnalysisTab(QtWidgets.QWidget, ABC, metaclass=QABCMeta):
 
         # Clear and re-plot
         self.plot_widget.clear()
-        data_source = self._current_plot_data.get("data_source", "")
         trial_pen = get_single_trial_pen()
         avg_pen = get_average_pen()
 
         # For average, plot individual trials first (background)
-        if data_source == "average" and self._selected_item_recording and chan_id:
-            channel = self._selected_item_recording.channels.get(chan_id)
-            if channel:
-                # Get indices to plot
-                indices_to_plot = []
-                if hasattr(self, "_filtered_indices") and self._filtered_indices:
-                    indices_to_plot = sorted(list(self._filtered_indices))
-                else:
-                    num_trials = getattr(channel, "num_trials", 0)
-                    indices_to_plot = list(range(num_trials))
+        if data_source == "average" and channel is not None:
+            # Get indices to plot
+            indices_to_plot = []
+            if hasattr(self, "_filtered_indices") and self._filtered_indices:
+                indices_to_plot = sorted(list(self._filtered_indices))
+            else:
+                num_trials = getattr(channel, "num_trials", 0)
+                indices_to_plot = list(range(num_trials))
 
-                # Plot each trial with preprocessing
-                for trial_idx in indices_to_plot:
-                    try:
-                        trial_data = channel.get_data(trial_idx)
-                        trial_time = channel.get_relative_time_vector(trial_idx)
-
-                        if trial_data is not None and trial_time is not None:
-                            if self._active_preprocessing_settings and self.pipeline:
-                                processed_trial = self.pipeline.process(trial_data, fs, trial_time)
-                                if processed_trial is not None:
-                                    trial_data = processed_trial
-                            self.plot_widget.plot(trial_time, trial_data, pen=trial_pen)
-                    except (ValueError, IndexError) as e:
-                        log.debug(f"Could not plot trial {trial_idx}: {e}")
+            # Plot each trial with preprocessing (cached, misses processed in one batched call)
+            try:
+                processed_trials = self._processed_channel_trials(channel, indices_to_plot)
+            except (ValueError, IndexError) as e:
+                log.debug(f"Could not preprocess overlay trials: {e}")
+                processed_trials = []
+            for trial_idx, trial_data in zip(indices_to_plot, processed_trials):
+                trial_time = channel.get_relative_time_vector(trial_idx)
+                if trial_data is not None and trial_time is not None:
+                    self.plot_widget.plot(trial_time, trial_data, pen=trial_pen)
 
             # Plot average on top
             self.plot_widget.plot(raw_time, processed_data, pen=avg_pen)
@@ -832,6 +834,12 @@ class BaseAnalysisTab(QtWidgets.QWidget, ABC, metaclass=QABCMeta):
         self._on_data_plotted()
         log.debug("Preprocessing applied to cached data")
 
+    def _processed_channel_trials(self, channel, trial_indices: List[int]) -> List[Optional[np.ndarray]]:
+        """Trials of *channel* after the active pipeline, served from the shared :class:`ProcessedTraceCache`."""
+        if not (self._active_preprocessing_settings and self.pipeline):
+            return [channel.get_data(i) for i in trial_indices]
+        return ProcessedTraceCache.get_instance().get_trials(self.pipeline, channel, trial_indices)
+
     def _pipeline_process_adapter(
         self, data_in: np.ndarray, fs: float, params: Dict[str, Any], time_vector: Optional[np.ndarray] = None
     ) -> np.ndarray:
@@ -841,6 +849,10 @@ class BaseAnalysisTab(QtWidgets.QWidget, ABC, metaclass=QABCMeta):
         """
         return self.pipeline.process(data_in, fs, time_vector)
 
+    def _processed_trial_adapter(self, channel, trial_index: int) -> Optional[np.ndarray]:
+        """``trial_callback`` for AnalysisPlotManager: one cached, preprocessed trial."""
+        return self._processed_channel_trials(channel, [trial_index])[0]
+
     # --- END ADDED ---
     # --- END ADDED ---
 
@@ -2172,6 +2184,7 @@ class BaseAnalysisTab(QtWidgets.QWidget, ABC, metaclass=QABCMeta):
                 preprocessing_settings=self._active_preprocessing_settings,
                 filtered_indices=self._filtered_indices if hasattr(self, "_filtered_indices") else None,
                 process_callback=self._pipeline_process_adapter,
+                trial_callback=self._processed_trial_adapter,
             )
 
             if not plot_package:
@@ -2217,26 +2230,20 @@ class BaseAnalysisTab(QtWidgets.QWidget, ABC, metaclass=QABCMeta):
                 if indices_to_plot:
                     channel = self._selected_item_recording.channels.get(chan_id)
                     if channel:
-                        for trial_idx in indices_to_plot:
-                            try:
-                                trial_data = channel.get_data(trial_idx)
-                                trial_time = channel.get_relative_time_vector(trial_idx)
-
-                                if trial_data is not None and trial_time is not None:
-                                    # Apply any preprocessing if active
-                                    if self._active_preprocessing_settings:
-                                        processed = self.pipeline.process(
-                                            trial_data, plot_package.sampling_rate, trial_time
-                                        )
-                                        if processed is not None:
-                                            trial_data = processed
-
-                                    # CAPTURE CURVE TO TAG IT
-                                    curve = self.plot_widget.plot(trial_time, trial_data, pen=trial_pen)
-                                    curve.trial_index = trial_idx
-                                    curve.curve_type = "trial_trace"  # Tag for identification
-                            except Exception as e:
-                                log.debug(f"Could not plot trial {trial_idx}: {e}")
+                        # Apply any preprocessing if active (shared cache; misses in one batched call)
+                        try:
+                            processed_trials = self._processed_channel_trials(channel, indices_to_plot)
+                        except Exception as e:
+                            log.debug(f"Batched preprocessing of overlay trials failed: {e}")
+                            processed_trials = [channel.get_data(i) for i in indices_to_plot]
+                        for trial_idx, trial_data in zip(indices_to_plot, processed_trials):
+                            trial_time = channel.get_relative_time_vector(trial_idx)
+                            if trial_data is None or trial_time is None:
+                                continue
+                            # CAPTURE CURVE TO TAG IT
+                            curve = self.plot_widget.plot(trial_time, trial_data, pen=trial_pen)
+                            curve.trial_index = trial_idx
+                            curve.curve_type = "trial_trace"  # Tag for identification
 
                 # Plot the average on top
                 self.plot_widget.plot(
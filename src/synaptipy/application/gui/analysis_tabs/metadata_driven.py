@@ -932,18 +932,13 @@ class MetadataDrivenAnalysisTab(BaseAnalysisTab):
                 time_list = []
                 fs = data.get("sampling_rate", 10000.0)
 
-                for i in range(num_trials):
-                    trial_data = channel.get_data(i)
+                # Apply any global preprocessing if active (shared processed-trace cache;
+                # misses are processed in one batched call)
+                trials = self._processed_channel_trials(channel, list(range(num_trials)))
+                for i, trial_data in enumerate(trials):
                     trial_time = channel.get_relative_time_vector(i)
 
                     if trial_data is not None and trial_time is not None:
-                        # Apply any global preprocessing if active
-                        if hasattr(self, "_active_preprocessing_settings") and self._active_preprocessing_settings:
-                            if hasattr(self, "pipeline"):
-                                processed = self.pipeline.process(trial_data, fs, trial_time)
-                                if processed is not None:
-                                    trial_data = processed
-
                         data_list.append(trial_data)
                         time_list.append(trial_time)
 
@@ -18,6 +18,7 @@ import numpy as np
 import pandas as pd
 from PySide6 import QtCore, QtWidgets
 
+from synaptipy.application.gui.catalog_dialog import CatalogDialog
 from synaptipy.core.analysis.batch_engine import BatchAnalysisEngine
 from synaptipy.core.analysis.registry import AnalysisRegistry
 from synaptipy.shared.styling import style_button, style_label
@@ -594,6 +595,11 @@ class BatchAnalysisDialog(QtWidgets.QDialog):
         self.add_files_btn.clicked.connect(self._on_add_files)
         files_btn_layout.addWidget(self.add_files_btn)
 
+        self.add_catalog_btn = QtWidgets.QPushButton("From Catalog...")
+        self.add_catalog_btn.setToolTip("Add files matching a recording catalog query")
+        self.add_catalog_btn.clicked.connect(self._on_add_from_catalog)
+        files_btn_layout.addWidget(self.add_catalog_btn)
+
         self.remove_files_btn = QtWidgets.QPushButton("Remove Selected")
         self.remove_files_btn.clicked.connect(self._on_remove_files)
         files_btn_layout.addWidget(self.remove_files_btn)
@@ -808,24 +814,34 @@ class BatchAnalysisDialog(QtWidgets.QDialog):
         """Open file dialog to add files to the list."""
         file_paths, _ = QtWidgets.QFileDialog.getOpenFileNames(self, "Select Recording Files", "", "All Files (*.*)")
         if file_paths:
-            added_count = 0
-            for path_str in file_paths:
-                path = Path(path_str)
-                # Check duplication
-                if path not in self.files:
-                    self.files.append(path)
-                    item = QtWidgets.QListWidgetItem(path.name)
-                    item.setToolTip(str(path))
-                    item.setData(QtCore.Qt.UserRole, path)
-                    self.files_list.addItem(item)
-                    added_count += 1
-
-            if added_count > 0:
-                # Update group box title
-                for gb in self.findChildren(QtWidgets.QGroupBox):
-                    if gb.title().startswith("Files to Process"):
-                        gb.setTitle(f"Files to Process ({len(self.files)} files)")
-                        break
+            self._add_paths([Path(p) for p in file_paths])
+
+    def _on_add_from_catalog(self):
+        """Add the files chosen in a recording catalog query."""
+        dialog = CatalogDialog(parent=self)
+        if dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:
+            self._add_paths(dialog.selected_paths())
+
+    def _add_paths(self, paths: List[Path]) -> int:
+        """Append *paths* that are not already listed; returns the number added."""
+        added_count = 0
+        for path in paths:
+            # Check duplication
+            if path not in self.files:
+                self.files.append(path)
+                item = QtWidgets.QListWidgetItem(path.name)
+                item.setToolTip(str(path))
+                item.setData(QtCore.Qt.UserRole, path)
+                self.files_list.addItem(item)
+                added_count += 1
+
+        if added_count > 0:
+            # Update group box title
+            for gb in self.findChildren(QtWidgets.QGroupBox):
+                if gb.title().startswith("Files to Process"):
+                    gb.setTitle(f"Files to Process ({len(self.files)} files)")
+                    break
+        return added_count
 
     def _on_remove_files(self):
         """Remove selected files from list."""
@@ -0,0 +1,215 @@
+# src/synaptipy/application/gui/catalog_dialog.py
+# -*- coding: utf-8 -*-
+"""
+Widgets for searching the recording catalog.
+
+:class:`CatalogBrowser` indexes folders into the
+:class:`~synaptipy.infrastructure.file_readers.RecordingCatalog` in the
+background and filters it by sampling rate, channel units, sweep count,
+protocol and path.  The explorer sidebar embeds it as a tab; the batch dialog
+wraps it in :class:`CatalogDialog` to add matching files to a batch.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from PySide6 import QtCore, QtWidgets
+
+from synaptipy.application.gui.analysis_worker import AnalysisWorker
+from synaptipy.infrastructure.file_readers import CatalogUpdate, RecordingCatalog
+
+log = logging.getLogger(__name__)
+
+_ANY = "Any"
+
+
+class CatalogBrowser(QtWidgets.QWidget):
+    """Filter form and result list over a :class:`RecordingCatalog`."""
+
+    # Emitted on double-click: (paths of all results, index of the activated one)
+    files_activated = QtCore.Signal(list, int)
+    # Emitted when a background indexing pass completes.
+    index_finished = QtCore.Signal(object)  # CatalogUpdate
+
+    def __init__(self, catalog: Optional[RecordingCatalog] = None, parent: Optional[QtWidgets.QWidget] = None):
+        """
+        Args:
+            catalog: Catalog to browse (default: the process-wide instance, opened on first use).
+            parent: Parent widget.
+        """
+        super().__init__(parent)
+        self._catalog = catalog
+        self._results: List[Path] = []
+        self._indexing = False
+        self._setup_ui()
+
+    @property
+    def catalog(self) -> RecordingCatalog:
+        if self._catalog is None:
+            self._catalog = RecordingCatalog.get_instance()
+        return self._catalog
+
+    def _setup_ui(self):
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        index_layout = QtWidgets.QHBoxLayout()
+        self.index_btn = QtWidgets.QPushButton("Index Folder...")
+        self.index_btn.setToolTip("Add a folder to the catalog; later passes only rescan new or changed files")
+        self.index_btn.clicked.connect(self._on_index_folder)
+        index_layout.addWidget(self.index_btn)
+        self.status_label = QtWidgets.QLabel("")
+        self.status_label.setStyleSheet("color: gray; font-style: italic;")
+        index_layout.addWidget(self.status_label, 1)
+        layout.addLayout(index_layout)
+
+        form = QtWidgets.QFormLayout()
+        self.rate_combo = QtWidgets.QComboBox()
+        self.units_combo = QtWidgets.QComboBox()
+        self.min_sweeps_spin = QtWidgets.QSpinBox()
+        self.min_sweeps_spin.setRange(0, 100000)
+        self.min_sweeps_spin.setSpecialValueText(_ANY)
+        self.protocol_edit = QtWidgets.QLineEdit()
+        self.protocol_edit.setPlaceholderText("Protocol contains...")
+        self.path_edit = QtWidgets.QLineEdit()
+        self.path_edit.setPlaceholderText("Path contains (e.g. rig2)...")
+        form.addRow("Sampling rate:", self.rate_combo)
+        form.addRow("Channel units:", self.units_combo)
+        form.addRow("Min sweeps:", self.min_sweeps_spin)
+        form.addRow("Protocol:", self.protocol_edit)
+        form.addRow("Path:", self.path_edit)
+        layout.addLayout(form)
+
+        self.search_btn = QtWidgets.QPushButton("Search")
+        self.search_btn.clicked.connect(self.search)
+        self.protocol_edit.returnPressed.connect(self.search)
+        self.path_edit.returnPressed.connect(self.search)
+        layout.addWidget(self.search_btn)
+
+        self.results_list = QtWidgets.QListWidget()
+        self.results_list.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.results_list.itemDoubleClicked.connect(self._on_result_double_clicked)
+        layout.addWidget(self.results_list, 1)
+
+        self.count_label = QtWidgets.QLabel("")
+        layout.addWidget(self.count_label)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.rate_combo.count() == 0:
+            self.refresh_choices()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def refresh_choices(self) -> None:
+        """Fill the sampling-rate and units drop-downs from the catalog."""
+        for combo, column, fmt in (
+            (self.rate_combo, "sampling_rate", lambda v: f"{v:g}"),
+            (self.units_combo, "units", str),
+        ):
+            current = combo.currentText()
+            combo.clear()
+            combo.addItem(_ANY, None)
+            for value in self.catalog.distinct(column):
+                combo.addItem(fmt(value), value)
+            idx = combo.findText(current)
+            combo.setCurrentIndex(max(idx, 0))
+
+    def filters(self) -> Dict[str, Any]:
+        """Current form values as :meth:`RecordingCatalog.query` filters."""
+        return {
+            "sampling_rate": self.rate_combo.currentData(),
+            "units": self.units_combo.currentData(),
+            "min_sweeps": self.min_sweeps_spin.value() or None,
+            "protocol": self.protocol_edit.text().strip() or None,
+            "path_contains": self.path_edit.text().strip() or None,
+        }
+
+    def search(self) -> List[Path]:
+        """Run the query for the current filters and list the matching files."""
+        self._results = self.catalog.query_paths(**self.filters())
+        self.results_list.clear()
+        for path in self._results:
+            item = QtWidgets.QListWidgetItem(path.name)
+            item.setToolTip(str(path))
+            item.setData(QtCore.Qt.UserRole, path)
+            self.results_list.addItem(item)
+        self.count_label.setText(f"{len(self._results)} matching file(s)")
+        return list(self._results)
+
+    def result_paths(self) -> List[Path]:
+        return list(self._results)
+
+    def selected_paths(self) -> List[Path]:
+        """Selected results, or every result when nothing is selected."""
+        selected = [item.data(QtCore.Qt.UserRole) for item in self.results_list.selectedItems()]
+        return selected or list(self._results)
+
+    def _on_result_double_clicked(self, item: QtWidgets.QListWidgetItem):
+        self.files_activated.emit(list(self._results), self.results_list.row(item))
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def _on_index_folder(self):
+        directory = QtWidgets.QFileDialog.getExistingDirectory(self, "Select Folder to Index")
+        if directory:
+            self.index_directory(Path(directory))
+
+    def index_directory(self, directory: Path) -> None:
+        """Index *directory* on the global thread pool; the form refreshes when done."""
+        if self._indexing:
+            return
+        self._indexing = True
+        self.index_btn.setEnabled(False)
+        self.status_label.setText(f"Indexing {directory.name}...")
+        worker = AnalysisWorker(self.catalog.index_directory, directory)
+        worker.signals.result.connect(self._on_index_result)
+        worker.signals.error.connect(self._on_index_error)
+        worker.signals.finished.connect(self._on_index_done)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _on_index_result(self, result: CatalogUpdate):
+        self.status_label.setText(
+            f"{result.scanned} scanned, {result.unchanged} unchanged, {result.removed} removed"
+            + (f", {result.failed} failed" if result.failed else "")
+        )
+        self.refresh_choices()
+        self.index_finished.emit(result)
+
+    def _on_index_error(self, error: tuple):
+        log.error("Catalog indexing failed: %s", error[1])
+        self.status_label.setText(f"Indexing failed: {error[1]}")
+
+    def _on_index_done(self):
+        self._indexing = False
+        self.index_btn.setEnabled(True)
+
+
+class CatalogDialog(QtWidgets.QDialog):
+    """Modal :class:`CatalogBrowser` returning the chosen files."""
+
+    def __init__(self, catalog: Optional[RecordingCatalog] = None, parent: Optional[QtWidgets.QWidget] = None):
+        super().__init__(parent)
+        self.setWindowTitle("Select Files from Catalog")
+        self.resize(520, 560)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        self.browser = CatalogBrowser(catalog, self)
+        self.browser.files_activated.connect(lambda *_: self.accept())
+        layout.addWidget(self.browser)
+
+        buttons = QtWidgets.QDialogButtonBox(
+            QtWidgets.QDialogButtonBox.StandardButton.Ok | QtWidgets.QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.button(QtWidgets.QDialogButtonBox.StandardButton.Ok).setText("Add Files")
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def selected_paths(self) -> List[Path]:
+        return self.browser.selected_paths()
@@ -20,6 +20,8 @@ from synaptipy.application.controllers.live_analysis_controller import LiveAnaly
 from synaptipy.application.controllers.shortcut_manager import ShortcutManager
 from synaptipy.application.gui.analysis_worker import AnalysisWorker
 from synaptipy.application.gui.widgets.preprocessing import PreprocessingWidget
+from synaptipy.application.services.data_loader_service import DataLoaderService
+from synaptipy.application.services.prefetch_service import NeighbourPrefetcher
 from synaptipy.application.session_manager import SessionManager
 
 # --- Synaptipy Imports ---
@@ -31,6 +33,7 @@ from synaptipy.infrastructure.exporters.nwb_exporter import NWBExporter
 from synaptipy.infrastructure.file_readers import NeoAdapter
 from synaptipy.shared.constants import APP_NAME, SETTINGS_SECTION
 from synaptipy.shared.data_cache import DataCache
+from synaptipy.shared.processed_cache import ProcessedTraceCache
 
 from .config_panel import ExplorerConfigPanel
 from .plot_canvas import ExplorerPlotCanvas
@@ -76,6 +79,12 @@ class ExplorerTab(QtWidgets.QWidget):
         self.session_manager.selected_analysis_items_changed.connect(self._on_analysis_items_changed_from_session)
         self.session_manager.file_context_changed.connect(self._on_file_context_changed)
 
+        # Loads the next/previous files into DataCache while the user looks at this one
+        self.prefetcher = NeighbourPrefetcher(neo_adapter, parent=self)
+        self.session_manager.file_context_changed.connect(self.prefetcher.on_file_context_changed)
+        # Decodes the rest of a multi-file open / restored session in parallel
+        self.multi_loader = DataLoaderService(neo_adapter, parent=self)
+
         # Data State
         self.current_recording: Optional[Recording] = None
         self.file_list: List[Path] = []
@@ -151,6 +160,8 @@ class ExplorerTab(QtWidgets.QWidget):
             self._file_nav_timer.stop()
         if hasattr(self, "live_controller"):
             self.live_controller.cleanup()
+        if hasattr(self, "prefetcher"):
+            self.prefetcher.shutdown()
         super().closeEvent(event)
 
     def _init_components(self):
@@ -406,6 +417,7 @@ class ExplorerTab(QtWidgets.QWidget):
         self.sidebar.file_selected.connect(
             lambda f, files, i: self.load_recording_data(f, files, i, preserve_state=True)
         )
+        self.sidebar.files_dropped.connect(lambda files, primary: self.preload_recordings(files, skip=primary))
 
         # Config Panel
         self.config_panel.plot_mode_changed.connect(self._on_plot_mode_changed)
@@ -574,6 +586,28 @@ class ExplorerTab(QtWidgets.QWidget):
         """Worker function to read file."""
         return neo_adapter.read_recording(filepath, lazy=lazy, channel_whitelist=whitelist, force_kHz_to_Hz=force_units)
 
+    def preload_recordings(self, file_paths: List[Path], skip: Optional[Path] = None) -> Optional[int]:
+        """
+        Decode several files concurrently into DataCache.
+
+        Used when many files are opened at once (multi-file drop, session
+        restore): the file being displayed loads through
+        :meth:`load_recording_data` while the others are read in parallel, so
+        navigating to them afterwards is served from the cache.
+
+        Args:
+            file_paths: Files to load.
+            skip: File already being loaded in the foreground.
+
+        Returns:
+            The :class:`DataLoaderService` batch id, or None if nothing was queued.
+        """
+        paths = [Path(p) for p in file_paths if skip is None or Path(p) != Path(skip)]
+        if not paths:
+            return None
+        log.debug("Preloading %d file(s) in parallel", len(paths))
+        return self.multi_loader.load_recordings(paths)
+
     def load_recording_data(  # noqa: C901
         self,
         filepath: Path,
@@ -648,7 +682,7 @@ class ExplorerTab(QtWidgets.QWidget):
 
         # Start Worker
         # We wrap the loading function to also include quality check
-        worker = AnalysisWorker(self._load_and_check_quality, self.neo_adapter, filepath)
+        worker = AnalysisWorker(self._load_and_check_quality, self.neo_adapter, filepath, self.prefetcher)
         worker.signals.result.connect(self._on_file_load_success)
         worker.signals.error.connect(lambda err: self._on_file_load_error(err, filepath))
         worker.signals.finished.connect(self._finalize_loading_state)
@@ -657,10 +691,17 @@ class ExplorerTab(QtWidgets.QWidget):
         self.thread_pool.start(worker)
 
     @staticmethod
-    def _load_and_check_quality(adapter, filepath):
+    def _load_and_check_quality(adapter, filepath, prefetcher=None):
         """Background task: Load file AND run quality check."""
-        # 1. Load
-        rec = adapter.read_recording(filepath)
+        # 1. Load (served from DataCache when the file was prefetched)
+        if prefetcher is not None:
+            prefetcher.wait_for(filepath)
+        cache = DataCache.get_instance()
+        rec = cache.get(filepath)
+        if rec is None:
+            rec = adapter.read_recording(filepath)
+            if isinstance(rec, Recording):
+                cache.put(filepath, rec)
 
         # 2. Quality Check (on first channel or all?)
         # For 'Traffic Light', checking the first channel is usually enough for a quick indicator
@@ -748,9 +789,12 @@ class ExplorerTab(QtWidgets.QWidget):
 
         # Release the file handle held by the outgoing recording before replacing
         # the reference.  This is critical for lazy-loaded files: the Neo IO
-        # reader keeps the file descriptor open until explicitly closed.
-        if self.current_recording is not None and self.current_recording is not recording:
-            self.current_recording.close()
+        # reader keeps the file descriptor open until explicitly closed.  A
+        # recording DataCache still holds stays open: the cache closes it on
+        # eviction, and closing it here would break the next cache hit.
+        outgoing = self.current_recording
+        if outgoing is not None and outgoing is not recording and not DataCache.get_instance().holds(outgoing):
+            outgoing.close()
 
         self.current_recording = recording
         self.max_trials_current_recording = getattr(recording, "max_trials", 0)
@@ -1025,6 +1069,21 @@ class ExplorerTab(QtWidgets.QWidget):
             except Exception:
                 self.plot_canvas.widget.update()
 
+    def _processed_trials(self, channel, trial_indices: List[int]) -> List[Optional[np.ndarray]]:
+        """Trials after ``self.pipeline``, from the shared cache or, if the cache fails, processed directly."""
+        try:
+            return ProcessedTraceCache.get_instance().get_trials(self.pipeline, channel, trial_indices)
+        except Exception as e:
+            log.warning(f"Processed-trace cache unavailable, processing trials directly: {e}")
+        fs = channel.sampling_rate
+        results = []
+        for i in trial_indices:
+            data = channel.get_data(i)
+            if data is not None:
+                data = self.pipeline.process(data, fs, time_vector=channel.get_relative_time_vector(i))
+            results.append(data)
+        return results
+
     def _update_plot(self):  # noqa: C901
         """Standard plot update.
 
@@ -1073,12 +1132,10 @@ class ExplorerTab(QtWidgets.QWidget):
                 ch = self.current_recording.channels.get(primary_cid)
                 if ch:
                     try:
-                        raw_data = ch.get_data(self.current_trial_index)
-                        t_vec = ch.get_relative_time_vector(self.current_trial_index)
                         fs = ch.sampling_rate
 
-                        # Apply Pipeline
-                        proc_data = self.pipeline.process(raw_data, fs, time_vector=t_vec)
+                        # Apply Pipeline (shared processed-trace cache)
+                        proc_data = self._processed_trials(ch, [self.current_trial_index])[0]
 
                         # Push to Cache
                         DataCache.get_instance().set_active_trace(
@@ -1153,12 +1210,11 @@ class ExplorerTab(QtWidgets.QWidget):
                             data = channel.get_data(self.current_trial_index)
                             t = channel.get_relative_time_vector(self.current_trial_index)
 
-                            # APPLY PREPROCESSING (via Pipeline)
+                            # APPLY PREPROCESSING (via Pipeline, served from the shared cache)
                             if data is not None:
                                 try:
-                                    fs = channel.sampling_rate
                                     # Pipeline handles empty steps gracefully
-                                    data = self.pipeline.process(data, fs, time_vector=t)
+                                    data = self._processed_trials(channel, [self.current_trial_index])[0]
                                 except Exception as e:
                                     log.error(f"Error processing trial {self.current_trial_index}: {e}")
 
@@ -1181,24 +1237,16 @@ class ExplorerTab(QtWidgets.QWidget):
                     else:
                         trials_to_plot = list(range(channel.num_trials))
 
-                    for trial_idx in trials_to_plot:
-                        try:
-                            data = channel.get_data(trial_idx)
-                            t = channel.get_relative_time_vector(trial_idx)
-
-                            # APPLY PREPROCESSING (via Pipeline - same as CYCLE_SINGLE)
-                            if data is not None:
-                                try:
-                                    fs = channel.sampling_rate
-                                    # Pipeline handles empty steps gracefully
-                                    data = self.pipeline.process(data, fs, time_vector=t)
-                                except Exception as e:
-                                    log.error(f"Error processing trial {trial_idx}: {e}")
-
-                            if data is not None and t is not None:
-                                _emit_line(t, data, current_trial_pen)
-                        except Exception as e:
-                            log.debug(f"Skipped trial plot for channel {cid}: {e}")
+                    # APPLY PREPROCESSING (via Pipeline - same as CYCLE_SINGLE); cache misses in one call
+                    try:
+                        overlay = self._processed_trials(channel, trials_to_plot)
+                    except Exception as e:
+                        log.error(f"Error processing trials for {cid}: {e}")
+                        overlay = [channel.get_data(i) for i in trials_to_plot]
+                    for trial_idx, data in zip(trials_to_plot, overlay):
+                        t = channel.get_relative_time_vector(trial_idx)
+                        if data is not None and t is not None:
+                            _emit_line(t, data, current_trial_pen)
 
                     # 2. Plot Average on Top
                     try:
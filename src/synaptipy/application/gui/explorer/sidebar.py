@@ -11,6 +11,7 @@ from typing import Dict, Optional  # Added Dict
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
+from synaptipy.application.gui.catalog_dialog import CatalogBrowser
 from synaptipy.infrastructure.file_readers import NeoAdapter
 from synaptipy.shared.constants import APP_NAME, SETTINGS_SECTION
 
@@ -24,6 +25,7 @@ class ExplorerSidebar(QtWidgets.QGroupBox):
     """
 
     file_selected = QtCore.Signal(Path, list, int)  # path, file_list, index
+    files_dropped = QtCore.Signal(list, Path)  # all dropped files, file loaded first
 
     def __init__(self, neo_adapter: NeoAdapter, file_io_controller=None, parent=None):
         super().__init__("File Explorer", parent)
@@ -97,6 +99,11 @@ class ExplorerSidebar(QtWidgets.QGroupBox):
         project_layout.addWidget(self.project_tree)
         self.tabs.addTab(project_widget, "Project Tree")
 
+        # Catalog search across previously indexed folders
+        self.catalog_browser = CatalogBrowser(parent=self)
+        self.catalog_browser.files_activated.connect(self._on_catalog_files_activated)
+        self.tabs.addTab(self.catalog_browser, "Catalog")
+
         # Async Sync Handling
         self.file_model.directoryLoaded.connect(self._on_directory_loaded)
         self._pending_sync_path: Optional[Path] = None
@@ -201,6 +208,11 @@ class ExplorerSidebar(QtWidgets.QGroupBox):
 
             self.file_selected.emit(target_path, file_list, selected_index)
 
+    def _on_catalog_files_activated(self, file_list: list, index: int):
+        """Load the activated catalog result, navigating within the result list."""
+        if 0 <= index < len(file_list):
+            self.file_selected.emit(file_list[index], file_list, index)
+
     def get_selected_project_files(self) -> list[Path]:
         """Returns a list of selected files from the project tree (batch selection)."""
         files = []
@@ -357,6 +369,8 @@ class ExplorerSidebar(QtWidgets.QGroupBox):
 
             # Emit signal to trigger loading in ExplorerTab
             self.file_selected.emit(primary_file, file_list, index)
+            if len(file_list) > 1 and len(file_paths) > 1:
+                self.files_dropped.emit(file_list, primary_file)
 
             # Also sync sidebar to show this file
             self.sync_to_file(primary_file)
@@ -19,6 +19,7 @@ from synaptipy.application.session_manager import SessionManager
 
 # --- Synaptipy Imports / Dummies ---
 # --- Synaptipy Imports ---
+from synaptipy.core import precision
 from synaptipy.core.data_model import Recording
 from synaptipy.infrastructure.exporters import NWBExporter
 from synaptipy.infrastructure.file_readers import NeoAdapter
@@ -288,6 +289,16 @@ class MainWindow(QtWidgets.QMainWindow):
         # Create data loader instance
         self.data_loader = DataLoader()
 
+        # Keep the recording cache's RAM budget and the trial storage precision
+        # in sync with Preferences > Performance
+        self.session_manager.preferences_changed.connect(self.data_loader.cache.update_performance_settings)
+        self.session_manager.preferences_changed.connect(precision.update_performance_settings)
+        settings = QtCore.QSettings()
+        self.session_manager.performance_settings = {
+            "max_ram_allocation_gb": settings.value("performance/max_ram_allocation_gb", 4.0, type=float),
+            "float32_storage": settings.value("performance/float32_storage", False, type=bool),
+        }
+
         # Move the loader to the worker thread
         self.data_loader.moveToThread(self.data_loader_thread)
 
@@ -670,12 +681,18 @@ class MainWindow(QtWidgets.QMainWindow):
 
             dialog = PreferencesDialog(self)
             dialog.sigPluginsToggled.connect(self._on_plugins_toggled)
+            dialog.sigPerformanceChanged.connect(self._on_performance_changed)
             dialog.exec()
             log.debug("Preferences dialog closed")
         except Exception as e:
             log.error(f"Failed to show preferences dialog: {e}")
             QtWidgets.QMessageBox.critical(self, "Error", f"Failed to open preferences:\n{e}")
 
+    @QtCore.Slot(dict)
+    def _on_performance_changed(self, settings: Dict[str, Any]):
+        """Publish changed performance limits to subscribers via the SessionManager."""
+        self.session_manager.performance_settings = settings
+
     @QtCore.Slot(bool)
     def _on_plugins_toggled(self, enabled: bool):
         """Hot-reload plugins and rebuild Analyser tabs when the user toggles the plugin setting."""
@@ -1239,6 +1256,9 @@ class MainWindow(QtWidgets.QMainWindow):
             current_index,
             lazy_load=False,
         )
+        # Decode the remaining session files in parallel while the first one is shown.
+        if getattr(self, "explorer_tab", None) is not None:
+            self.explorer_tab.preload_recordings(file_paths, skip=first_file)
 
         # Restore active tab after a short delay (file loading is async).
         active_tab = session.get("active_tab_index", 0)
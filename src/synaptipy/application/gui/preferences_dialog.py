@@ -44,7 +44,8 @@ class PreferencesDialog(QtWidgets.QDialog):
     sigPluginsToggled = QtCore.Signal(bool)
 
     # Emitted when performance settings are saved.
-    # The dict contains 'max_cpu_cores' (int) and 'max_ram_allocation_gb' (float).
+    # The dict contains 'max_cpu_cores' (int), 'max_ram_allocation_gb' (float)
+    # and 'float32_storage' (bool).
     sigPerformanceChanged = QtCore.Signal(dict)
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None):
@@ -222,8 +223,8 @@ class PreferencesDialog(QtWidgets.QDialog):
         ram_layout = QtWidgets.QFormLayout(ram_group)
 
         ram_desc = QtWidgets.QLabel(
-            "Approximate RAM ceiling for batch analysis. "
-            "The engine calls gc.collect() after each file regardless of this setting."
+            "RAM budget for cached recordings. Loaded recordings beyond it are spilled "
+            "to a temporary on-disk cache and paged back in when reopened."
         )
         ram_desc.setWordWrap(True)
         ram_desc.setStyleSheet("color: gray; font-size: 11px;")
@@ -235,8 +236,18 @@ class PreferencesDialog(QtWidgets.QDialog):
         self.ram_spinbox.setDecimals(1)
         self.ram_spinbox.setSingleStep(0.5)
         self.ram_spinbox.setSuffix(" GB")
-        self.ram_spinbox.setToolTip("Target maximum RAM for batch analysis (informational; enforced via gc)")
+        self.ram_spinbox.setToolTip(
+            "Maximum RAM held by the recording cache; least recently used recordings are spilled to disk"
+        )
         ram_layout.addRow("Max RAM allocation:", self.ram_spinbox)
+
+        self.float32_checkbox = QtWidgets.QCheckBox("Store trial data as float32")
+        self.float32_checkbox.setToolTip(
+            "Halves the memory used by loaded recordings. Source data is 16-bit, so no "
+            "information is lost; curve fits still run in double precision. "
+            "Applies to recordings loaded after the change."
+        )
+        ram_layout.addRow(self.float32_checkbox)
         layout.addWidget(ram_group)
 
         # --- Hardware Acceleration Group ---
@@ -292,6 +303,7 @@ class PreferencesDialog(QtWidgets.QDialog):
         self.cpu_cores_spinbox.setValue(max(1, min(saved_cores, self._cpu_count)))
         saved_ram = self._settings.value("performance/max_ram_allocation_gb", 4.0, type=float)
         self.ram_spinbox.setValue(max(0.5, saved_ram))
+        self.float32_checkbox.setChecked(self._settings.value("performance/float32_storage", False, type=bool))
 
         # OpenGL toggle
         global_settings = SessionManager().global_settings
@@ -348,10 +360,13 @@ class PreferencesDialog(QtWidgets.QDialog):
         new_ram = self.ram_spinbox.value()
         old_cores = self._settings.value("performance/max_cpu_cores", 1, type=int)
         old_ram = self._settings.value("performance/max_ram_allocation_gb", 4.0, type=float)
+        new_f32 = self.float32_checkbox.isChecked()
+        old_f32 = self._settings.value("performance/float32_storage", False, type=bool)
         self._settings.setValue("performance/max_cpu_cores", new_cores)
         self._settings.setValue("performance/max_ram_allocation_gb", new_ram)
-        if new_cores != old_cores or new_ram != old_ram:
-            perf = {"max_cpu_cores": new_cores, "max_ram_allocation_gb": new_ram}
+        self._settings.setValue("performance/float32_storage", new_f32)
+        if new_cores != old_cores or new_ram != old_ram or new_f32 != old_f32:
+            perf = {"max_cpu_cores": new_cores, "max_ram_allocation_gb": new_ram, "float32_storage": new_f32}
             log.debug("Performance settings changed: %s", perf)
             self.sigPerformanceChanged.emit(perf)
 
@@ -388,6 +403,7 @@ class PreferencesDialog(QtWidgets.QDialog):
         self.enable_plugins_checkbox.setChecked(True)
         self.cpu_cores_spinbox.setValue(1)
         self.ram_spinbox.setValue(4.0)
+        self.float32_checkbox.setChecked(False)
 
         # Apply the defaults
         set_scroll_direction(ScrollDirection.SYSTEM)
@@ -396,6 +412,7 @@ class PreferencesDialog(QtWidgets.QDialog):
         self._settings.setValue("enable_plugins", True)
         self._settings.setValue("performance/max_cpu_cores", 1)
         self._settings.setValue("performance/max_ram_allocation_gb", 4.0)
+        self._settings.setValue("performance/float32_storage", False)
 
         # Update original values
         self._original_scroll_direction = ScrollDirection.SYSTEM
@@ -8,18 +8,49 @@ by encapsulating all thread-pool and worker-state management in one place.
 Consumers connect to :attr:`recording_loaded`, :attr:`load_failed`, and
 :attr:`load_finished` instead of creating :class:`AnalysisWorker` objects
 directly.
+
+:meth:`DataLoaderService.load_recordings` opens many files at once: each file
+is decoded on its own pool thread (file I/O and most of Neo's parsing release
+the GIL), results stream back through :attr:`file_loaded` /
+:attr:`file_failed` as each file completes, and every decoded recording is
+stored in the shared :class:`DataCache`.
 """
 
 import logging
-from typing import Any, Optional
+import sys
+import threading
+import traceback
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
 
 from PySide6 import QtCore
 
 from synaptipy.application.gui.analysis_worker import AnalysisWorker
+from synaptipy.core.data_model import Recording
+from synaptipy.infrastructure.file_readers.recording_cache import RecordingDiskCache
+from synaptipy.shared.data_cache import DataCache
 
 log = logging.getLogger(__name__)
 
 
+class _MultiLoad:
+    """Bookkeeping for one :meth:`DataLoaderService.load_recordings` call."""
+
+    def __init__(self, batch_id: int, paths: List[Path]) -> None:
+        self.batch_id = batch_id
+        self.paths = paths
+        self.results: List[Optional[Recording]] = [None] * len(paths)
+        self.done = 0
+        self._lock = threading.Lock()
+
+    def complete(self, index: int, recording: Optional[Recording]) -> int:
+        """Record the result for ``paths[index]`` and return the completed count."""
+        with self._lock:
+            self.results[index] = recording
+            self.done += 1
+            return self.done
+
+
 class DataLoaderService(QtCore.QObject):
     """Service that loads :class:`~Synaptipy.core.data_model.Recording` objects
     in background threads and notifies subscribers via Qt signals.
@@ -43,6 +74,16 @@ class DataLoaderService(QtCore.QObject):
     # Emitted unconditionally when the worker finishes (success or error).
     load_finished = QtCore.Signal()
 
+    # load_recordings(): emitted per file, in completion order, with (path, Recording).
+    file_loaded = QtCore.Signal(object, object)
+    # load_recordings(): emitted per file with (path, (exctype, value, traceback_str)).
+    file_failed = QtCore.Signal(object, tuple)
+    # load_recordings(): (batch_id, files_done, files_total) after every file.
+    batch_progress = QtCore.Signal(int, int, int)
+    # load_recordings(): (batch_id, {path: Recording}) once every file has completed.
+    # Failed files are absent from the mapping; its order follows the requested paths.
+    batch_finished = QtCore.Signal(int, object)
+
     def __init__(self, neo_adapter: Any, parent: Optional[QtCore.QObject] = None) -> None:
         """
         Initialise the service.
@@ -56,6 +97,8 @@ class DataLoaderService(QtCore.QObject):
         super().__init__(parent)
         self._neo_adapter = neo_adapter
         self._thread_pool = QtCore.QThreadPool()
+        self._batch_counter = 0
+        self._batch_lock = threading.Lock()
         log.debug(
             "DataLoaderService initialised (max threads: %d)",
             self._thread_pool.maxThreadCount(),
@@ -99,6 +142,72 @@ class DataLoaderService(QtCore.QObject):
         log.debug("DataLoaderService: starting async load for %s", path)
         self._thread_pool.start(worker)
 
+    def load_recordings(self, paths: Sequence[Any], use_cache: bool = True) -> int:
+        """Decode several recordings concurrently on the service's thread pool.
+
+        One task per file is submitted at once, so the wall time is governed
+        by the slowest file rather than the sum of all files (up to the pool's
+        ``maxThreadCount``).  Each completed file emits :attr:`file_loaded` or
+        :attr:`file_failed` immediately plus :attr:`batch_progress`; when the
+        last file completes, :attr:`batch_finished` delivers all recordings.
+
+        Args:
+            paths: Files to load; duplicates are loaded once.
+            use_cache: Serve files already held in :class:`DataCache` from
+                RAM and store newly decoded ones there (read through the
+                on-disk :class:`RecordingDiskCache`).
+
+        Returns:
+            Batch id carried by :attr:`batch_progress` and :attr:`batch_finished`.
+        """
+        unique: List[Path] = []
+        for p in paths:
+            if p and Path(p) not in unique:
+                unique.append(Path(p))
+
+        with self._batch_lock:
+            self._batch_counter += 1
+            batch = _MultiLoad(self._batch_counter, unique)
+
+        if not unique:
+            self.batch_finished.emit(batch.batch_id, {})
+            return batch.batch_id
+
+        log.debug("DataLoaderService: batch %d loading %d file(s) in parallel", batch.batch_id, len(unique))
+        for index in range(len(unique)):
+            self._thread_pool.start(AnalysisWorker(self._load_one, batch, index, use_cache))
+        return batch.batch_id
+
+    def _load_one(self, batch: _MultiLoad, index: int, use_cache: bool) -> None:
+        """Worker side of :meth:`load_recordings` for ``batch.paths[index]``."""
+        path = batch.paths[index]
+        recording: Optional[Recording] = None
+        try:
+            recording = self._read_cached(path) if use_cache else self._neo_adapter.read_recording(path)
+        except Exception:
+            exctype, value = sys.exc_info()[:2]
+            log.warning("DataLoaderService: failed to load %s: %s", path, value)
+            self.file_failed.emit(path, (exctype, value, traceback.format_exc()))
+        else:
+            self.file_loaded.emit(path, recording)
+
+        done = batch.complete(index, recording)
+        self.batch_progress.emit(batch.batch_id, done, len(batch.paths))
+        if done == len(batch.paths):
+            loaded: Dict[Path, Recording] = {p: r for p, r in zip(batch.paths, batch.results) if r is not None}
+            log.debug("DataLoaderService: batch %d finished (%d/%d loaded)", batch.batch_id, len(loaded), done)
+            self.batch_finished.emit(batch.batch_id, loaded)
+
+    def _read_cached(self, path: Path) -> Optional[Recording]:
+        cache = DataCache.get_instance()
+        recording = cache.get(path)
+        if recording is not None:
+            return recording
+        recording = RecordingDiskCache.get_instance().read_recording(self._neo_adapter, path)
+        if isinstance(recording, Recording):
+            cache.put(path, recording)
+        return recording
+
     def load_recording_direct(self, recording: Any) -> None:
         """Emit a pre-loaded recording directly without spawning a background thread.
 
@@ -0,0 +1,241 @@
+# src/synaptipy/application/services/prefetch_service.py
+# -*- coding: utf-8 -*-
+"""
+Background prefetch of neighbouring files in the navigation list.
+
+:class:`NeighbourPrefetcher` listens to
+:attr:`SessionManager.file_context_changed` and loads the files just after and
+just before the current one into the shared :class:`DataCache`, so that
+stepping through a folder with next/previous hits RAM instead of the disk.
+
+Prefetching never competes with foreground work for memory or CPU:
+
+* worker threads run at idle priority on a private pool;
+* a file is only prefetched while it fits in the cache's free byte and
+  entry budget, so it never evicts anything;
+* moving to another file bumps a generation counter and drops queued
+  prefetches for the old neighbourhood.
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from PySide6 import QtCore
+
+from synaptipy.core.data_model import Recording
+from synaptipy.infrastructure.file_readers.recording_cache import RecordingDiskCache
+from synaptipy.shared.data_cache import DataCache, estimate_recording_bytes
+
+log = logging.getLogger(__name__)
+
+# Decoded samples are float32/float64 while files usually store int16, so a
+# decoded recording is typically 2-4x its size on disk.
+_DECODE_EXPANSION = 2.0
+# Larger files are loaded lazily by the foreground path; prefetching them
+# eagerly would only waste memory.
+_MAX_PREFETCH_FILE_BYTES = 500 * 1024 * 1024
+
+
+class _PrefetchTask(QtCore.QRunnable):
+    """Runnable that loads one neighbour for a given navigation generation."""
+
+    def __init__(self, prefetcher: "NeighbourPrefetcher", path: Path, generation: int):
+        super().__init__()
+        self.setAutoDelete(True)
+        self._prefetcher = prefetcher
+        self._path = path
+        self._generation = generation
+
+    def run(self) -> None:
+        self._prefetcher._prefetch(self._path, self._generation)
+
+
+class NeighbourPrefetcher(QtCore.QObject):
+    """Prefetch the next/previous files of the navigation list into :class:`DataCache`.
+
+    Usage::
+
+        prefetcher = NeighbourPrefetcher(neo_adapter, parent=self)
+        session_manager.file_context_changed.connect(prefetcher.on_file_context_changed)
+        ...
+        prefetcher.wait_for(path)  # before a foreground load of *path*
+    """
+
+    # Emitted with the Path of each file stored in the cache.
+    file_prefetched = QtCore.Signal(object)
+
+    def __init__(
+        self,
+        neo_adapter: Any,
+        radius: int = 2,
+        max_threads: int = 2,
+        budget_fraction: float = 0.5,
+        cache: Optional[DataCache] = None,
+        parent: Optional[QtCore.QObject] = None,
+    ) -> None:
+        """
+        Args:
+            neo_adapter: Object with ``read_recording(path)``.
+            radius: Number of files to prefetch on each side of the current one.
+            max_threads: Worker threads in the private idle-priority pool.
+            budget_fraction: Share of the cache's byte budget that may be
+                filled before prefetching stops.
+            cache: Target cache (default: the :class:`DataCache` singleton).
+            parent: Optional Qt parent.
+        """
+        super().__init__(parent)
+        self._neo_adapter = neo_adapter
+        self.radius = max(0, int(radius))
+        self.budget_fraction = float(budget_fraction)
+        self.enabled = True
+        self._cache = cache if cache is not None else DataCache.get_instance()
+        self._disk_cache = RecordingDiskCache.get_instance()
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, int(max_threads)))
+        self._pool.setThreadPriority(QtCore.QThread.Priority.IdlePriority)
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._wanted: List[Path] = []
+        self._in_flight: Dict[Path, threading.Event] = {}
+        self._stats = {"scheduled": 0, "prefetched": 0, "skipped_budget": 0, "stale": 0, "failed": 0}
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def thread_pool(self) -> QtCore.QThreadPool:
+        return self._pool
+
+    @QtCore.Slot(list, int)
+    def on_file_context_changed(self, file_list: List[Path], current_index: int) -> None:
+        """Subscriber for ``SessionManager.file_context_changed``."""
+        self.schedule(file_list, current_index)
+
+    def schedule(self, file_list: List[Path], current_index: int) -> List[Path]:
+        """Cancel stale prefetches and queue the neighbours of *current_index*.
+
+        Returns:
+            The files queued for prefetch, nearest first.
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._wanted = self.neighbours(file_list, current_index) if self.enabled else []
+        self._pool.clear()  # queued tasks of older generations never start
+
+        queued: List[Path] = []
+        for path in self._wanted:
+            if self._already_cached(path) or path in self._in_flight:
+                continue
+            self._pool.start(_PrefetchTask(self, path, generation))
+            queued.append(path)
+        self._stats["scheduled"] += len(queued)
+        if queued:
+            log.debug("Prefetch generation %d: queued %s", generation, [p.name for p in queued])
+        return queued
+
+    def neighbours(self, file_list: List[Path], current_index: int) -> List[Path]:
+        """Files within :attr:`radius` of *current_index*, nearest first (next before previous)."""
+        out: List[Path] = []
+        current = Path(file_list[current_index]) if 0 <= current_index < len(file_list) else None
+        for distance in range(1, self.radius + 1):
+            for idx in (current_index + distance, current_index - distance):
+                if 0 <= idx < len(file_list):
+                    path = Path(file_list[idx])
+                    if path != current and path not in out:
+                        out.append(path)
+        return out
+
+    def cancel(self) -> None:
+        """Drop all queued prefetches; running ones finish but are discarded if no longer wanted."""
+        with self._lock:
+            self._generation += 1
+            self._wanted = []
+        self._pool.clear()
+
+    def wait_for(self, path: Path, timeout: Optional[float] = None) -> bool:
+        """Block until an in-flight prefetch of *path* finishes (call from worker threads only).
+
+        Returns:
+            ``True`` if no prefetch of *path* was running or it finished in time.
+        """
+        event = self._in_flight.get(Path(path))
+        return event.wait(timeout) if event is not None else True
+
+    def wait_for_done(self) -> None:
+        """Block until every queued prefetch has run (tests / shutdown only)."""
+        self._pool.waitForDone()
+
+    def shutdown(self) -> None:
+        """Cancel pending work and wait for running prefetches to finish."""
+        self.cancel()
+        self._pool.waitForDone()
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self._stats)
+
+    # ------------------------------------------------------------------
+    # Worker side
+    # ------------------------------------------------------------------
+
+    def _already_cached(self, path: Path) -> bool:
+        return self._cache.contains(path) or self._cache.is_spilled(path)
+
+    def _is_current(self, path: Path, generation: int) -> bool:
+        with self._lock:
+            return generation == self._generation or path in self._wanted
+
+    def _fits_budget(self, nbytes: float) -> bool:
+        cache = self._cache
+        if len(cache) + 1 > cache.max_size:
+            return False
+        return cache.bytes_in_ram() + nbytes <= cache.max_bytes * self.budget_fraction
+
+    def _prefetch(self, path: Path, generation: int) -> None:
+        if not self._is_current(path, generation):
+            self._stats["stale"] += 1
+            return
+        with self._lock:
+            if path in self._in_flight or self._already_cached(path):
+                return
+            done = self._in_flight[path] = threading.Event()
+        try:
+            self._load_into_cache(path, generation)
+        finally:
+            with self._lock:
+                self._in_flight.pop(path, None)
+            done.set()
+
+    def _load_into_cache(self, path: Path, generation: int) -> None:
+        try:
+            file_bytes = path.stat().st_size if path.is_file() else 0
+        except OSError:
+            file_bytes = 0
+        if file_bytes > _MAX_PREFETCH_FILE_BYTES or not self._fits_budget(file_bytes * _DECODE_EXPANSION):
+            self._stats["skipped_budget"] += 1
+            return
+
+        try:
+            recording = self._disk_cache.read_recording(self._neo_adapter, path)
+        except Exception as e:
+            self._stats["failed"] += 1
+            log.debug("Prefetch of %s failed: %s", path.name, e)
+            return
+        if not isinstance(recording, Recording) or not recording.channels:
+            return
+
+        if not self._is_current(path, generation):
+            self._stats["stale"] += 1
+            recording.close()
+            return
+        if not self._fits_budget(estimate_recording_bytes(recording)):
+            self._stats["skipped_budget"] += 1
+            recording.close()
+            return
+        self._cache.put(path, recording)
+        self._stats["prefetched"] += 1
+        log.debug("Prefetched %s into DataCache.", path.name)
+        self.file_prefetched.emit(path)
@@ -230,8 +230,9 @@ class SessionManager(QObject):
         :attr:`preferences_changed` keeps the engine in sync without restarts.
 
         Args:
-            settings: Dict with any subset of ``"max_cpu_cores"`` (int) and
-                      ``"max_ram_allocation_gb"`` (float).
+            settings: Dict with any subset of ``"max_cpu_cores"`` (int),
+                      ``"max_ram_allocation_gb"`` (float) and
+                      ``"float32_storage"`` (bool).
         """
         if not isinstance(settings, dict):
             log.warning("performance_settings must be a dict, got %s.", type(settings).__name__)
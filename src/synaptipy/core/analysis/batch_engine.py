@@ -19,6 +19,7 @@ Output Design Principles
 Author: Anzal K Shahul <anzal.ks@gmail.com>
 """
 
+import functools
 import gc
 import logging
 import multiprocessing
@@ -35,8 +36,10 @@ import pandas as pd
 import synaptipy.core.analysis  # noqa: F401 - Import triggers all registrations
 from synaptipy.core.analysis.cross_file_utils import average_padded_trials as get_cross_file_average
 from synaptipy.core.analysis.registry import AnalysisRegistry
-from synaptipy.core.data_model import Recording
-from synaptipy.infrastructure.file_readers import NeoAdapter
+from synaptipy.core.data_model import Recording, stack_trials
+from synaptipy.core.shared_recording import SharedRecording, attach_recording, detach, export_recording
+from synaptipy.core.time_axis import as_time_array
+from synaptipy.infrastructure.file_readers import NeoAdapter, RecordingDiskCache
 
 log = logging.getLogger(__name__)
 
@@ -76,6 +79,79 @@ _HUMAN_READABLE_ALIASES: Dict[str, str] = {
 }
 
 
+def _adapt_time_argument(func: Callable, meta: Dict[str, Any]) -> Callable:
+    """Materialise :class:`~synaptipy.core.time_axis.TimeAxis` arguments for functions that need dense arrays.
+
+    The engine passes implicit time axes around; only registrations declaring
+    ``accepts_time_axis=True`` receive them unchanged.
+    """
+    if meta.get("accepts_time_axis", False):
+        return func
+
+    @functools.wraps(func)
+    def _dense_time(data, time, sampling_rate, **kwargs):
+        return func(data, as_time_array(time), sampling_rate, **kwargs)
+
+    return _dense_time
+
+
+def _run_trials_batch(
+    meta: Dict[str, Any], data: List[Any], time: List[Any], sampling_rate: float, params: Dict[str, Any]
+) -> Optional[List[Dict[str, Any]]]:
+    """Results of the registration's ``trials_batch`` for every trial at once, or ``None`` to run trial by trial."""
+    trials_batch = meta.get("trials_batch")
+    if not callable(trials_batch) or len(data) < 2:
+        return None
+    p = {k: v for k, v in params.items() if k != "trial_index"}
+    batch_results = trials_batch(data, [as_time_array(t) for t in time], sampling_rate, **p)
+    if not isinstance(batch_results, list) or len(batch_results) != len(data):
+        log.warning(
+            "trials_batch returned %s results for %d trials; running trial by trial",
+            len(batch_results or []),
+            len(data),
+        )
+        return None
+    return batch_results
+
+
+def _window_span(analysis_name: str, params: Dict[str, Any], sampling_rate: float) -> Optional[Tuple[float, float]]:
+    """Trial-relative time span covering every ``data_windows`` window of *analysis_name*, or ``None``.
+
+    The span is padded by two samples on each side so boundary samples are
+    classified exactly as they would be on the full trace.
+    """
+    windows = AnalysisRegistry.get_data_windows(analysis_name, params)
+    if not windows or not sampling_rate or sampling_rate <= 0:
+        return None
+    pad = 2.0 / sampling_rate
+    return min(w[0] for w in windows) - pad, max(w[1] for w in windows) + pad
+
+
+def _pipeline_reads_windows_only(pipeline_config: List[Dict[str, Any]]) -> bool:
+    """True when every task is a non-averaging analysis that declares ``data_windows`` for its params."""
+    if not pipeline_config:
+        return False
+    for task in pipeline_config:
+        name = task.get("analysis")
+        meta = AnalysisRegistry.get_metadata(name) if name else {}
+        if meta.get("type") == "preprocessing" or task.get("scope") in ("average", "selected_trials_average"):
+            return False
+        if AnalysisRegistry.get_data_windows(name, task.get("params", {})) is None:
+            return False
+    return True
+
+
+def _load_scoped_trial(channel: Any, trial_index: int, span: Optional[Tuple[float, float]]) -> Tuple[Any, Any]:
+    """Return ``(data, relative_time)`` of one trial, restricted to *span* when given."""
+    if span is None:
+        return channel.get_data(trial_index), channel.get_relative_time_axis(trial_index)
+    bounds = channel.get_window_indices(trial_index, *span)
+    axis = channel.get_relative_time_axis(trial_index)
+    if bounds is None or axis is None:
+        return None, None
+    return channel.get_data_window(trial_index, *span), axis[bounds[0] : bounds[1]]
+
+
 class BatchAnalysisEngine:
     """
     Engine for running analysis across multiple files/recordings using a flexible pipeline.
@@ -115,6 +191,8 @@ class BatchAnalysisEngine:
                          parallelism.  Pass ``-1`` to use all available CPU cores.
         """
         self.neo_adapter = neo_adapter if neo_adapter else NeoAdapter()
+        # Persistent decoded-recording cache; unchanged files skip the Neo decode on re-runs.
+        self.disk_cache = RecordingDiskCache.get_instance()
         self._cancelled = False
         cpu_count = multiprocessing.cpu_count()
         if max_workers < 0:
@@ -388,10 +466,16 @@ class BatchAnalysisEngine:
     ) -> pd.DataFrame:
         """Distribute file-level processing across :attr:`max_workers` worker processes.
 
-        Each worker process receives a single file path (in-memory Recording objects
-        are serialised via pickle), imports the full analysis package to populate the
-        registry, and returns a list of result-row dicts.  Progress signals are emitted
-        through the optional *progress_callback* as each future completes.
+        Each worker process receives a single file path, or, for pre-loaded
+        Recording objects, a small descriptor of the recording exported to
+        shared memory (see :mod:`synaptipy.core.shared_recording`) so trial
+        arrays are never pickled.  Workers import the full analysis package to
+        populate the registry and return a list of result-row dicts.  Progress
+        signals are emitted through the optional *progress_callback* as each
+        future completes.
+
+        Recordings that cannot be exported (unloadable trials, unpicklable
+        metadata) are processed sequentially in this process.
 
         OOM safety: every worker calls ``gc.collect()`` after processing its file.
         """
@@ -399,7 +483,6 @@ class BatchAnalysisEngine:
         batch_start_time = datetime.now()
 
         # Separate paths from pre-loaded Recording objects.
-        # Pre-loaded Recording objects are processed sequentially (pickle cost not worth it).
         path_tasks: List[Tuple[int, Path]] = []
         inline_recordings: List[Tuple[int, Any]] = []
 
@@ -412,57 +495,81 @@ class BatchAnalysisEngine:
         all_rows: List[List[Dict[str, Any]]] = [[] for _ in range(total_files)]
         completed_count = 0
 
-        # Submit path-based tasks to the pool
+        # Export pre-loaded recordings to shared memory; the rest fall back to in-process.
+        shared_tasks: List[Tuple[int, SharedRecording]] = []
+        local_recordings: List[Tuple[int, Any]] = []
+        for orig_idx, recording in inline_recordings:
+            if self._cancelled:
+                break
+            try:
+                shared_tasks.append((orig_idx, export_recording(recording)))
+            except Exception as exc:  # noqa: BLE001
+                log.debug("Recording %d not exportable to shared memory (%s); processing in-process.", orig_idx, exc)
+                local_recordings.append((orig_idx, recording))
+
+        # Submit path-based and shared-memory tasks to the pool
         future_to_idx: Dict[Any, int] = {}
         pool_kwargs: Dict[str, Any] = {"max_workers": self.max_workers}
         # Use spawn context on all platforms for process-safety with Qt/numpy
         ctx = multiprocessing.get_context("spawn")
         pool_kwargs["mp_context"] = ctx
 
-        with ProcessPoolExecutor(**pool_kwargs) as executor:
-            for orig_idx, file_path in path_tasks:
-                future = executor.submit(
-                    _worker_process_file,
-                    str(file_path),
-                    pipeline_config,
-                    channel_filter,
-                )
-                future_to_idx[future] = orig_idx
+        try:
+            with ProcessPoolExecutor(**pool_kwargs) as executor:
+                for orig_idx, file_path in path_tasks:
+                    future = executor.submit(
+                        _worker_process_file,
+                        str(file_path),
+                        pipeline_config,
+                        channel_filter,
+                    )
+                    future_to_idx[future] = orig_idx
+                for orig_idx, shared in shared_tasks:
+                    future = executor.submit(
+                        _worker_process_shared_recording,
+                        shared.descriptor,
+                        pipeline_config,
+                        channel_filter,
+                    )
+                    future_to_idx[future] = orig_idx
 
-            for future in as_completed(future_to_idx):
-                orig_idx = future_to_idx[future]
-                file_path = files[orig_idx]
-                file_name = Path(str(file_path)).name
-                completed_count += 1
+                for future in as_completed(future_to_idx):
+                    orig_idx = future_to_idx[future]
+                    file_name, file_path = self._task_label(files[orig_idx], orig_idx)
+                    completed_count += 1
 
-                try:
-                    rows = future.result()
-                    all_rows[orig_idx] = rows
-                except Exception as exc:  # noqa: BLE001
-                    log.error("Worker failed for %s: %s", file_path, exc, exc_info=True)
-                    self._append_batch_error_log(file_name, str(file_path), exc)
-                    all_rows[orig_idx] = [
-                        {
-                            "file_name": file_name,
-                            "file_path": str(file_path),
-                            "error": str(exc),
-                            "debug_trace": traceback.format_exc(),
-                        }
-                    ]
-                finally:
-                    if progress_callback:
-                        progress_callback(completed_count, total_files, f"Processed {file_name}")
+                    try:
+                        rows = future.result()
+                        all_rows[orig_idx] = rows
+                    except Exception as exc:  # noqa: BLE001
+                        log.error("Worker failed for %s: %s", file_path, exc, exc_info=True)
+                        self._append_batch_error_log(file_name, str(file_path), exc)
+                        all_rows[orig_idx] = [
+                            {
+                                "file_name": file_name,
+                                "file_path": str(file_path),
+                                "error": str(exc),
+                                "debug_trace": traceback.format_exc(),
+                            }
+                        ]
+                    finally:
+                        if progress_callback:
+                            progress_callback(completed_count, total_files, f"Processed {file_name}")
 
-                if self._cancelled:
-                    executor.shutdown(wait=False, cancel_futures=True)
-                    break
+                    if self._cancelled:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+        finally:
+            # The executor has joined its workers, so no process still maps the blocks.
+            for _, shared in shared_tasks:
+                shared.close()
 
-        # Process in-memory recordings sequentially (they can't be pickled reliably)
-        for orig_idx, recording in inline_recordings:
+        # Process non-exportable in-memory recordings sequentially
+        for orig_idx, recording in local_recordings:
             if self._cancelled:
                 break
             completed_count += 1
-            file_name = getattr(getattr(recording, "source_file", None), "name", f"InMemory_{orig_idx}")
+            file_name, _ = self._task_label(recording, orig_idx)
             if progress_callback:
                 progress_callback(completed_count, total_files, f"Processing {file_name}...")
             try:
@@ -485,6 +592,16 @@ class BatchAnalysisEngine:
             df = self._order_columns(df)
         return df
 
+    @staticmethod
+    def _task_label(item: Union[Path, "Recording"], index: int) -> Tuple[str, str]:
+        """``(file_name, file_path)`` used in progress messages and error rows."""
+        if isinstance(item, (str, Path)):
+            return Path(str(item)).name, str(item)
+        source = getattr(item, "source_file", None)
+        if source:
+            return Path(source).name, str(source)
+        return f"InMemory_{index}", f"InMemory_{index}"
+
     def run_batch(  # noqa: C901
         self,
         files: List[Union[Path, "Recording"]],
@@ -573,7 +690,9 @@ class BatchAnalysisEngine:
                     file_name = file_path.name
                     if progress_callback:
                         progress_callback(i, total_files, f"Loading {file_name}...")
-                    recording = self.neo_adapter.read_recording(file_path, channel_whitelist=channel_filter)
+                    recording = self.disk_cache.read_recording(
+                        self.neo_adapter, file_path, channel_whitelist=channel_filter
+                    )
                     if not recording:
                         log.warning("Cross-file avg: failed to load %s", file_path)
                         continue
@@ -590,6 +709,9 @@ class BatchAnalysisEngine:
                         (k, ch) for k, ch in channels_to_process if k in channel_filter or str(k) in channel_filter
                     ]
 
+                # One bulk pass over the source for every lazily loaded channel
+                recording.load_trials([k for k, _ in channels_to_process])
+
                 for channel_key, channel in channels_to_process:
                     native_name = getattr(channel, "name", None)
                     channel_name = native_name if native_name else channel_key
@@ -604,7 +726,7 @@ class BatchAnalysisEngine:
 
                     for trial_idx in range(channel.num_trials):
                         trial_data = channel.get_data(trial_idx)
-                        trial_time = channel.get_relative_time_vector(trial_idx)
+                        trial_time = channel.get_relative_time_axis(trial_idx)
                         if trial_data is not None and trial_time is not None:
                             channel_data[channel_name]["trials"].append(trial_data)
                             channel_data[channel_name]["times"].append(trial_time)
@@ -670,6 +792,7 @@ class BatchAnalysisEngine:
 
                 try:
                     p = {k: v for k, v in params.items() if k != "trial_index"}
+                    analysis_func = _adapt_time_argument(analysis_func, AnalysisRegistry.get_metadata(analysis_name))
                     res = analysis_func(master_array, master_time, sampling_rate, **p)
                     # Flatten consolidated-module schema
                     if "metrics" in res and isinstance(res.get("metrics"), dict):
@@ -719,6 +842,8 @@ class BatchAnalysisEngine:
         """Sequential (single-process) batch processing — the original implementation."""
         results_list = []
         total_files = len(files)
+        # Pipelines that only read declared windows open files lazily (no full decode)
+        windowed_read = _pipeline_reads_windows_only(pipeline_config)
 
         # Add batch metadata
         batch_start_time = datetime.now()
@@ -735,6 +860,7 @@ class BatchAnalysisEngine:
             file_path_str = "InMemory"
             file_path = None  # Initialize file_path
 
+            opened_here = None  # Recording opened by this loop (closed after use)
             try:
                 # Determine if item is Path or Recording
                 recording = None
@@ -750,7 +876,11 @@ class BatchAnalysisEngine:
 
                     t0_io = time.perf_counter()
                     # Load recording from disk with whitelist (Memory Optimization)
-                    recording = self.neo_adapter.read_recording(file_path, channel_whitelist=channel_filter)
+                    read_kwargs: Dict[str, Any] = {"channel_whitelist": channel_filter}
+                    if windowed_read:
+                        read_kwargs["lazy"] = True
+                    recording = self.disk_cache.read_recording(self.neo_adapter, file_path, **read_kwargs)
+                    opened_here = recording
                     file_io_time = time.perf_counter() - t0_io
                     if not recording:
                         log.warning(f"Failed to load {file_path}")
@@ -950,6 +1080,8 @@ class BatchAnalysisEngine:
                 # each file to prevent cumulative PySide6 / NumPy OOM in headless batch
                 # runs.  gc.collect() ensures cyclic references are broken even when
                 # GC is otherwise disabled for test-mode offscreen stability.
+                if windowed_read and opened_here is not None:
+                    opened_here.close()  # lazy reads keep the source file open
                 recording = None  # noqa: F841  # drop reference
 
                 # Aggressive memory management: collect garbage every 10 files and after each file
@@ -1028,6 +1160,9 @@ class BatchAnalysisEngine:
                 }
             ], None
 
+        # Time reaches the function as a TimeAxis only if it declares support for it
+        analysis_func = _adapt_time_argument(analysis_func, meta)
+
         results = []
         sampling_rate = channel.sampling_rate
 
@@ -1072,7 +1207,8 @@ class BatchAnalysisEngine:
                                 "Use 'first_trial' or 'specific_trial' scope instead, or ensure "
                                 "all sweeps use the same protocol duration."
                             )
-                        data = np.mean(np.array(context["data"]), axis=0)
+                        stacked = stack_trials(context["data"])
+                        data = np.mean(stacked if stacked is not None else np.array(context["data"]), axis=0)
                         time = context["time"][0]
                     else:
                         log.warning("Context data empty, cannot average.")
@@ -1141,7 +1277,8 @@ class BatchAnalysisEngine:
                                 f"{sorted(lengths)} in {file_path.name}/{channel_name}. "
                                 "Ensure all selected sweeps use the same protocol duration."
                             )
-                        data = np.mean(np.array(selected_data), axis=0)
+                        stacked = stack_trials(selected_data)
+                        data = np.mean(stacked if stacked is not None else np.array(selected_data), axis=0)
                         time = context["time"][0]
                     else:
                         log.warning("No valid trials selected for averaging from context.")
@@ -1173,6 +1310,11 @@ class BatchAnalysisEngine:
                     )
 
         # If data is still None, load from channel
+        # Lazily loaded channels only read the span an analysis declares via
+        # ``data_windows``; preprocessing always needs (and caches) full trials.
+        span = None
+        if data is None and not is_preprocessing and getattr(channel, "loader", None):
+            span = _window_span(analysis_name, params, sampling_rate)
         if data is None:
             # Validate scope against available data
             if scope in ("all_trials", "selected_trials", "channel_set") and channel.num_trials == 0:
@@ -1193,13 +1335,14 @@ class BatchAnalysisEngine:
 
             if scope == "average":
                 data = channel.get_averaged_data()
-                time = channel.get_relative_averaged_time_vector()
+                time = channel.get_relative_averaged_time_axis()
             elif scope == "all_trials":
                 data = []
                 time = []
+                if span is None:
+                    channel.load_trials()
                 for i in range(channel.num_trials):
-                    d = channel.get_data(i)
-                    t = channel.get_relative_time_vector(i)
+                    d, t = _load_scoped_trial(channel, i, span)
                     if d is not None:
                         data.append(d)
                         time.append(t)
@@ -1233,9 +1376,10 @@ class BatchAnalysisEngine:
                 else:
                     selected_indices = list(range(channel.num_trials))
 
+                if span is None:
+                    channel.load_trials(selected_indices)
                 for i in selected_indices:
-                    d = channel.get_data(i)
-                    t = channel.get_relative_time_vector(i)
+                    d, t = _load_scoped_trial(channel, i, span)
                     if d is not None:
                         data.append(d)
                         time.append(t)
@@ -1266,24 +1410,23 @@ class BatchAnalysisEngine:
                     selected_indices = None
 
                 data = channel.get_averaged_data(trial_indices=selected_indices)
-                time = channel.get_relative_averaged_time_vector()
+                time = channel.get_relative_averaged_time_axis()
 
             elif scope == "first_trial":
-                data = channel.get_data(0)
-                time = channel.get_relative_time_vector(0)
+                data, time = _load_scoped_trial(channel, 0, span)
 
             elif scope == "specific_trial":
                 idx = int(params.get("trial_index", 0))
-                data = channel.get_data(idx)
-                time = channel.get_relative_time_vector(idx)
+                data, time = _load_scoped_trial(channel, idx, span)
 
             elif scope == "channel_set":
                 # channel_set usually implies list of all trials
                 data = []
                 time = []
+                if span is None:
+                    channel.load_trials()
                 for i in range(channel.num_trials):
-                    d = channel.get_data(i)
-                    t = channel.get_relative_time_vector(i)
+                    d, t = _load_scoped_trial(channel, i, span)
                     if d is not None:
                         data.append(d)
                         time.append(t)
@@ -1366,12 +1509,13 @@ class BatchAnalysisEngine:
                 # Helper to run analysis and format result
                 total_trials = getattr(channel, "num_trials", 0)
 
-                def run_single(d, t, trial_idx=None):
+                def run_single(d, t, trial_idx=None, res=None):
                     # Remove trial_index from params if present
                     p = params.copy()
                     p.pop("trial_index", None)
 
-                    res = analysis_func(d, t, sampling_rate, **p)
+                    if res is None:
+                        res = analysis_func(d, t, sampling_rate, **p)
                     # Flatten consolidated-module schema: {"module_used": ..., "metrics": {...}}
                     if "metrics" in res and isinstance(res.get("metrics"), dict):
                         metrics = res.pop("metrics")
@@ -1448,10 +1592,11 @@ class BatchAnalysisEngine:
                         else:
                             indices_list = list(range(total_trials))
 
+                        batch_results = _run_trials_batch(meta, data, time, sampling_rate, params)
                         for i, (d, t) in enumerate(zip(data, time)):
                             # Ensure we output correct trial index
                             real_idx = indices_list[i] if i < len(indices_list) else i
-                            results.append(run_single(d, t, real_idx))
+                            results.append(run_single(d, t, real_idx, batch_results[i] if batch_results else None))
 
                 elif scope == "specific_trial":
                     idx = int(params.get("trial_index", 0))
@@ -1523,3 +1668,37 @@ def _worker_process_file(
         return df.to_dict("records") if not df.empty else []
     finally:
         _gc.collect()
+
+
+def _worker_process_shared_recording(
+    descriptor: Any,
+    pipeline_config: List[Dict[str, Any]],
+    channel_filter: Optional[List[str]],
+) -> List[Dict[str, Any]]:
+    """Process a pre-loaded recording exported to shared memory, in a worker process.
+
+    Counterpart of :func:`_worker_process_file` for in-memory recordings: the
+    recording is rebuilt as zero-copy views over the parent's shared block
+    (see :func:`~synaptipy.core.shared_recording.attach_recording`).
+
+    Args:
+        descriptor: :class:`~synaptipy.core.shared_recording.SharedRecordingDescriptor`.
+        pipeline_config: Serialised pipeline task list.
+        channel_filter: Optional channel whitelist.
+
+    Returns:
+        List of result-row dicts ready for ``pd.DataFrame()``.
+    """
+    import gc as _gc
+
+    import synaptipy.core.analysis  # noqa: F401,F811
+
+    recording, shm = attach_recording(descriptor)
+    engine = BatchAnalysisEngine(max_workers=1)
+    try:
+        df = engine._run_batch_sequential([recording], pipeline_config, None, channel_filter)
+        return df.to_dict("records") if not df.empty else []
+    finally:
+        del recording
+        _gc.collect()
+        detach(shm)
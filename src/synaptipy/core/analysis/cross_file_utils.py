@@ -14,6 +14,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from synaptipy.core.data_model import stack_trials
+
 log = logging.getLogger(__name__)
 
 
@@ -81,6 +83,7 @@ def extract_per_file_trace(
         # Determine which trials to use for this item.
         effective_trials = _resolve_effective_trials(item, channel, parsed_trials)
 
+        channel.load_trials(list(effective_trials))
         file_traces: List[np.ndarray] = []
         file_times: List[np.ndarray] = []
         for trial_idx in effective_trials:
@@ -95,7 +98,10 @@ def extract_per_file_trace(
             return None
 
         min_file_len = min(len(t) for t in file_traces)
-        file_avg = np.mean(np.array([t[:min_file_len] for t in file_traces]), axis=0)
+        stacked = stack_trials(file_traces)  # zero-copy for consecutive rows of a Channel block
+        if stacked is None:
+            stacked = np.array([t[:min_file_len] for t in file_traces])
+        file_avg = np.mean(stacked, axis=0)
         return file_times[0][:min_file_len], file_avg
 
     except (IndexError, ValueError) as exc:
@@ -365,7 +371,8 @@ def average_padded_trials(trial_list: List[np.ndarray]) -> Optional[np.ndarray]:
 
     if len(set(lengths)) == 1:
         # Fast path: all arrays share the same length
-        return np.mean(np.array(trial_list), axis=0)
+        stacked = stack_trials(trial_list)
+        return np.mean(stacked if stacked is not None else np.array(trial_list), axis=0)
 
     # NaN-pad shorter arrays so nanmean keeps the full time axis intact
     padded = np.full((len(trial_list), max_len), np.nan)
@@ -22,7 +22,11 @@ import numpy as np
 from scipy.stats import linregress
 
 from synaptipy.core.analysis.registry import AnalysisRegistry
-from synaptipy.core.analysis.single_spike import calculate_spike_features, detect_spikes_threshold
+from synaptipy.core.analysis.single_spike import (
+    compute_spike_feature_table,
+    detect_spikes_threshold,
+    detect_spikes_threshold_batch,
+)
 from synaptipy.core.constants import EPSILON_ISI_SUM, EPSILON_ISI_SUM_SQ
 from synaptipy.core.results import AnalysisResult, BurstResult
 
@@ -75,11 +79,28 @@ def calculate_fi_curve(  # noqa: C901
     adaptation_ratios = []
     broadening_indices = []  # Width_last / Width_first within each sweep
 
+    # Sweeps sharing one time axis are detected together in a single vectorised call
+    batch_results = None
+    time0 = time_vectors[0] if len(time_vectors) else None
+    if (
+        len(sweeps) > 1
+        and isinstance(time0, np.ndarray)
+        and time0.ndim == 1
+        and time0.size > 1
+        and all(isinstance(d, np.ndarray) and d.shape == time0.shape for d in sweeps)
+        and all(t is time0 or np.array_equal(t, time0) for t in time_vectors)
+    ):
+        refractory_samples = int((refractory_ms / 1000.0) * (1.0 / (time0[1] - time0[0])))
+        batch_results = detect_spikes_threshold_batch(np.stack(sweeps), time0, threshold, refractory_samples)
+
     for i, (data, time) in enumerate(zip(sweeps, time_vectors)):
-        dt = time[1] - time[0] if len(time) > 1 else 1e-4
-        sampling_rate = 1.0 / dt
-        refractory_samples = int((refractory_ms / 1000.0) * sampling_rate)
-        result = detect_spikes_threshold(data, time, threshold, refractory_samples)
+        if batch_results is not None:
+            result = batch_results[i]
+        else:
+            dt = time[1] - time[0] if len(time) > 1 else 1e-4
+            sampling_rate = 1.0 / dt
+            refractory_samples = int((refractory_ms / 1000.0) * sampling_rate)
+            result = detect_spikes_threshold(data, time, threshold, refractory_samples)
         count = len(result.spike_indices) if result.spike_indices is not None else 0
         freq = result.mean_frequency if result.mean_frequency is not None else 0.0
         spike_counts.append(count)
@@ -101,9 +122,8 @@ def calculate_fi_curve(  # noqa: C901
         if count >= 2 and result.spike_indices is not None and len(result.spike_indices) >= 2:
             try:
                 spike_idx_arr = result.spike_indices
-                features = calculate_spike_features(data, time, spike_idx_arr)
-                widths = [getattr(f, "half_width", None) for f in features]
-                valid_widths = [w for w in widths if w is not None and not np.isnan(w) and w > 0]
+                widths = compute_spike_feature_table(data, time, spike_idx_arr).half_width
+                valid_widths = widths[~np.isnan(widths) & (widths > 0)]
                 if len(valid_widths) >= 2:
                     broadening_idx = float(valid_widths[-1] / valid_widths[0])
             except (ValueError, TypeError, IndexError):
@@ -752,8 +772,6 @@ def run_train_dynamics_wrapper(  # noqa: C901
     data: np.ndarray, time: np.ndarray, sampling_rate: float, **kwargs
 ) -> Dict[str, Any]:
     """Wrapper for Spike Train Dynamics."""
-    from synaptipy.core.analysis.single_spike import calculate_spike_features
-
     ap_threshold = kwargs.get("spike_threshold", 0.0)
     ap_times = kwargs.get("action_potential_times", None)
     analysis_start_s = float(kwargs.get("analysis_start_s", 0.0))
@@ -796,9 +814,8 @@ def run_train_dynamics_wrapper(  # noqa: C901
     spike_broadening_index = float(np.nan)
     if spike_indices is not None and len(spike_indices) >= 3:
         try:
-            features_list = calculate_spike_features(data, time, spike_indices)
-            widths = [getattr(f, "half_width", None) for f in features_list]
-            valid_widths = [w for w in widths if w is not None and not np.isnan(w)]
+            widths = compute_spike_feature_table(data, time, spike_indices).half_width
+            valid_widths = widths[~np.isnan(widths)]
             if len(valid_widths) >= 3:
                 spike_broadening_index = (
                     float(valid_widths[-1] / valid_widths[0]) if valid_widths[0] > 0 else float(np.nan)
@@ -23,7 +23,9 @@ from scipy.optimize import curve_fit
 from scipy.stats import linregress
 
 from synaptipy.core.analysis.registry import AnalysisRegistry
+from synaptipy.core.precision import as_float64
 from synaptipy.core.results import RinResult, RmpResult
+from synaptipy.core.time_axis import TimeAxis
 
 log = logging.getLogger(__name__)
 
@@ -105,8 +107,8 @@ def calculate_rmp(data: np.ndarray, time: np.ndarray, baseline_window: Tuple[flo
     ----------
     data : np.ndarray
         1-D voltage array (mV).
-    time : np.ndarray
-        1-D time array aligned with *data* (s).
+    time : np.ndarray or TimeAxis
+        1-D time array (or implicit axis) aligned with *data* (s).
     baseline_window : tuple of float
         ``(start_time, end_time)`` defining the pre-stimulus baseline period
         (s).  Must satisfy ``start_time < end_time``.
@@ -128,7 +130,7 @@ def calculate_rmp(data: np.ndarray, time: np.ndarray, baseline_window: Tuple[flo
     if not isinstance(data, np.ndarray) or data.ndim != 1 or data.size == 0:
         log.warning("calculate_rmp: Invalid data array provided.")
         return RmpResult(value=None, unit="mV", is_valid=False, error_message="Invalid data array")
-    if not isinstance(time, np.ndarray) or time.shape != data.shape:
+    if not isinstance(time, (np.ndarray, TimeAxis)) or time.shape != data.shape:
         log.warning("calculate_rmp: Time and data array shapes mismatch.")
         return RmpResult(value=None, unit="mV", is_valid=False, error_message="Time and data mismatch")
     if not isinstance(baseline_window, tuple) or len(baseline_window) != 2:
@@ -449,6 +451,7 @@ def _fit_vc_transient_decay(
     nan = float("nan")
     if len(decay_segment) < 4 or abs(i_peak) < 1e-12:
         return nan, nan
+    decay_segment, t_decay = as_float64(decay_segment), as_float64(t_decay)
 
     def _mono_exp(t, A, tau, offset):
         return A * np.exp(-t / tau) + offset
@@ -546,8 +549,8 @@ def calculate_vc_transient_parameters(
             log.warning("calculate_vc_transient_parameters: no transient samples found.")
             return result
 
-        i_trans = current_trace[trans_mask] - i_baseline
-        t_trans = time_vector[trans_mask] - step_onset_time
+        i_trans = as_float64(current_trace[trans_mask]) - i_baseline
+        t_trans = as_float64(time_vector[trans_mask]) - step_onset_time
 
         # Peak capacitive current
         if voltage_step_mv > 0:
@@ -607,6 +610,7 @@ def _extrapolate_rs_at_t0(t_art: np.ndarray, v_art: np.ndarray, artifact_window_
 
     if len(t_art) < 3:
         return float(np.mean(v_art))
+    t_art, v_art = as_float64(t_art), as_float64(v_art)
 
     _v_range_art = float(np.ptp(v_art)) if float(np.ptp(v_art)) > 1e-9 else 1.0
     try:
@@ -985,8 +989,9 @@ def calculate_tau(  # noqa: C901
         fit_end_time = stim_start_time + fit_duration
 
         fit_mask = (time_vector >= fit_start_time) & (time_vector < fit_end_time)
-        t_fit = time_vector[fit_mask] - fit_start_time
-        V_fit = voltage_trace[fit_mask]
+        # Fit in float64 regardless of the trial storage dtype
+        t_fit = as_float64(time_vector[fit_mask]) - fit_start_time
+        V_fit = as_float64(voltage_trace[fit_mask])
 
         # Dynamically truncate the fit window at the absolute voltage peak
         # (the point of maximum hyperpolarisation) so that I_h sag — which
@@ -1396,6 +1401,7 @@ def _fit_cm_from_transient(
     def _mono_exp(t: np.ndarray, a: float, tau: float) -> np.ndarray:
         return a * np.exp(-t / tau)
 
+    t_decay, i_decay = as_float64(t_decay), as_float64(i_decay)
     if len(t_decay) >= 4 and t_decay[-1] > 0:
         try:
             tau_guess = (t_decay[-1] - t_decay[0]) / 3.0
@@ -1453,9 +1459,9 @@ def calculate_capacitance_vc(
         if not np.any(trans_mask):
             return None
 
-        t_trans = time_vector[trans_mask]
+        t_trans = as_float64(time_vector[trans_mask])
         # Baseline-subtracted transient current (pA)
-        i_trans = current_trace[trans_mask] - i_baseline
+        i_trans = as_float64(current_trace[trans_mask]) - i_baseline
 
         # Steady-state: mean of the last 20 % of the transient window
         n = len(i_trans)
@@ -1499,14 +1505,14 @@ def _coerce_trial_lists(
     if isinstance(data_list, np.ndarray):
         if data_list.ndim == 1:
             data_list = [data_list]
-            time_list = [time_list] if isinstance(time_list, np.ndarray) else list(time_list)
+            time_list = [time_list] if isinstance(time_list, (np.ndarray, TimeAxis)) else list(time_list)
         elif data_list.ndim == 2:
             data_list = [data_list[i] for i in range(data_list.shape[0])]
-            if isinstance(time_list, np.ndarray) and time_list.ndim == 1:
+            if isinstance(time_list, TimeAxis) or (isinstance(time_list, np.ndarray) and time_list.ndim == 1):
                 time_list = [time_list for _ in range(len(data_list))]
             elif isinstance(time_list, np.ndarray) and time_list.ndim == 2:
                 time_list = [time_list[i] for i in range(time_list.shape[0])]
-    if isinstance(time_list, np.ndarray):
+    if isinstance(time_list, (np.ndarray, TimeAxis)):
         time_list = [time_list]
     return list(data_list), list(time_list)
 
@@ -1545,6 +1551,8 @@ def _resolve_sweep_baseline(
     "rmp_analysis",
     label="Baseline (RMP)",
     requires_multi_trial=True,
+    accepts_time_axis=True,
+    data_windows=lambda p: None if p.get("auto_detect") else [(p["baseline_start"], p["baseline_end"])],
     ui_params=[
         {
             "name": "baseline_start",
@@ -1818,6 +1826,11 @@ def run_sag_ratio_wrapper(data: np.ndarray, time: np.ndarray, sampling_rate: flo
 @AnalysisRegistry.register(
     "rin_analysis",
     label="Input Resistance",
+    data_windows=lambda p: (
+        None
+        if p.get("auto_detect_pulse")
+        else [(p["baseline_start"], p["baseline_end"]), (p["response_start"], p["response_end"])]
+    ),
     plots=[
         {"name": "Trace", "type": "trace"},
         {
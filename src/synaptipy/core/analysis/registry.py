@@ -8,7 +8,7 @@ to register themselves via decorators, enabling flexible pipeline configuration.
 """
 
 import logging
-from typing import Any, Callable, Dict, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 log = logging.getLogger(__name__)
 
@@ -52,6 +52,26 @@ class AnalysisRegistry:
 
                 This flag is stored in the registry metadata so tools,
                 documentation generators, and the GUI can inspect it.
+            accepts_time_axis: ``bool``, default ``False``.  When ``True`` the
+                batch engine passes ``time`` as an implicit
+                :class:`~synaptipy.core.time_axis.TimeAxis` (``t0, dt, n``)
+                instead of a dense array.  Leave ``False`` for functions that
+                rely on ``isinstance(time, np.ndarray)`` or other ndarray-only
+                behaviour; the engine then materialises the axis first.
+            data_windows: ``Callable[[dict], Optional[list]]``, optional.
+                Declares the only parts of each trace the function reads.
+                Called with the effective parameters, it returns a list of
+                ``(t_start, t_end)`` windows in trial-relative seconds, or
+                ``None`` when the whole trace is needed (e.g. auto-detection
+                modes).  The batch engine then reads just the covering span
+                from lazily loaded files (see :meth:`get_data_windows`).
+            trials_batch: ``Callable``, optional.  Companion of a single-trace
+                function, called as ``trials_batch(data_list, time_list,
+                sampling_rate, **params)`` with every trial the batch engine
+                would otherwise pass one at a time (``all_trials`` /
+                ``selected_trials`` scopes).  Returns one result dict per
+                trial, in order, so work shared by all trials (e.g. one
+                block-wide FFT) is done once.
             **kwargs: Additional metadata stored with the function
                 (e.g., ``ui_params``, ``plots``, ``label``).
 
@@ -154,6 +174,32 @@ class AnalysisRegistry:
         """
         return cls._metadata.get(name, {})
 
+    @classmethod
+    def get_data_windows(cls, name: str, params: Dict[str, Any]) -> Optional[List[Tuple[float, float]]]:
+        """
+        Evaluate the ``data_windows`` declaration of *name* for *params*.
+
+        Missing parameters fall back to their ``ui_params`` defaults.
+
+        Returns:
+            List of ``(t_start, t_end)`` windows, or ``None`` when the
+            analysis declares none or needs the full trace.
+        """
+        meta = cls._metadata.get(name, {})
+        declare = meta.get("data_windows")
+        if not callable(declare):
+            return None
+        effective = {p["name"]: p.get("default") for p in meta.get("ui_params", []) if "name" in p}
+        effective.update(params or {})
+        try:
+            windows = declare(effective)
+        except (KeyError, TypeError, ValueError) as e:
+            log.debug("data_windows for '%s' could not be evaluated: %s", name, e)
+            return None
+        if not windows:
+            return None
+        return [(float(start), float(end)) for start, end in windows]
+
     @classmethod
     def list_registered(cls) -> list:
         """
@@ -23,7 +23,8 @@ from scipy.signal import savgol_filter
 from synaptipy.core.analysis.passive_properties import apply_ljp_correction
 from synaptipy.core.analysis.registry import AnalysisRegistry
 from synaptipy.core.constants import DVDT_ARTIFACT_CEILING_VS, MIN_RISING_PHASE_MS
-from synaptipy.core.results import SingleSpikeResult, SpikeTrainResult
+from synaptipy.core.derived_signals import DerivedSignalStore, lowpass_dvdt, lowpass_sos
+from synaptipy.core.results import SingleSpikeResult, SpikeFeatureTable, SpikeTrainResult
 
 log = logging.getLogger(__name__)
 
@@ -56,10 +57,19 @@ def detect_spikes_threshold(  # noqa: C901
        at-or-above the threshold.
     3. **Refractory period enforcement**: candidate crossings separated by
        fewer than *refractory_samples* are suppressed, retaining only the
-       first crossing in each refractory interval (greedy forward scan).
+       first crossing in each refractory interval (greedy forward scan,
+       evaluated by pointer doubling over the crossing indices).
     4. **Peak localisation**: for each accepted onset, the voltage maximum
-       within the next *peak_search_window_samples* is found.  The candidate
-       is accepted as a spike only if ``data[peak_idx] >= threshold`` (mV).
+       within the next *peak_search_window_samples* is found (one argmax
+       over strided windows for all onsets).  The candidate is accepted as a
+       spike only if ``data[peak_idx] >= threshold`` (mV).
+
+    The 5 kHz anti-noise low-pass applied before differentiation is designed
+    once per sampling interval, and the filtered dV/dt is shared with other
+    analyses of the same trace through
+    :class:`~synaptipy.core.derived_signals.DerivedSignalStore`.  Use
+    :func:`detect_spikes_threshold_batch` for a ``(n_sweeps, n_samples)``
+    block.
 
     Parameters
     ----------
@@ -126,22 +136,18 @@ def detect_spikes_threshold(  # noqa: C901
 
     try:
         dt = time[1] - time[0] if len(time) > 1 else 1.0
-
-        # Apply 5 kHz low-pass filter
-        from scipy.signal import butter, sosfiltfilt
-
-        nyq = 0.5 / dt
-        if 5000.0 < nyq:
-            sos = butter(4, 5000.0, btype="low", output="sos", fs=1.0 / dt)
-            data_filtered = sosfiltfilt(sos, data)
-        else:
-            data_filtered = data
-
-        dvdt = np.gradient(data_filtered, dt)
-        dvdt_thresh_mvs = dvdt_threshold * 1000.0
-
-        crossings = np.where((dvdt[:-1] < dvdt_thresh_mvs) & (dvdt[1:] >= dvdt_thresh_mvs))[0] + 1
-        if crossings.size == 0:
+        # Filtered dV/dt is shared with other analyses of the same trace
+        dvdt = lowpass_dvdt(data, dt, _SPIKE_LOWPASS_HZ, "butter")
+        rows, peak_indices_arr, has_crossings = _detect_spike_peaks(
+            data[np.newaxis, :],
+            dt,
+            threshold,
+            refractory_samples,
+            peak_search_window_samples,
+            dvdt_threshold,
+            dvdt=dvdt[np.newaxis, :],
+        )
+        if not has_crossings[0]:
             return SpikeTrainResult(
                 value=0,
                 unit="spikes",
@@ -149,71 +155,213 @@ def detect_spikes_threshold(  # noqa: C901
                 spike_indices=np.array([]),
                 parameters=parameters or {},
             )
+        return _spike_train_result(peak_indices_arr, time, parameters)
 
-        if refractory_samples <= 0:
-            valid_crossing_indices = crossings
+    except (ValueError, TypeError, KeyError, IndexError) as e:
+        log.error(f"Error during spike detection: {e}", exc_info=True)
+        return SpikeTrainResult(
+            value=0, unit="spikes", is_valid=False, error_message=str(e), parameters=parameters or {}
+        )
+
+
+def _batch_input_error(data: Any, time: Any, threshold: Any, refractory_samples: Any) -> Optional[str]:
+    """Validation message for :func:`detect_spikes_threshold_batch` inputs, or ``None`` if they are usable."""
+    if not isinstance(data, np.ndarray) or data.ndim != 2 or data.shape[1] < 2:
+        return "Invalid data array"
+    if not isinstance(time, np.ndarray) or time.shape != data.shape[1:]:
+        return "Time and data mismatch"
+    if not isinstance(threshold, (int, float)):
+        return "Threshold must be numeric"
+    if not isinstance(refractory_samples, int) or refractory_samples < 0:
+        return "Invalid refractory period"
+    return None
+
+
+def _invalid_sweep_results(message: str, n_sweeps: int, parameters: Dict[str, Any] = None) -> List[SpikeTrainResult]:
+    """One invalid :class:`SpikeTrainResult` per sweep, tagged with ``metadata["sweep_index"]``."""
+    results = []
+    for i in range(n_sweeps):
+        result = SpikeTrainResult(
+            value=0, unit="spikes", is_valid=False, error_message=message, parameters=parameters or {}
+        )
+        result.metadata["sweep_index"] = i
+        results.append(result)
+    return results
+
+
+def detect_spikes_threshold_batch(
+    data: np.ndarray,
+    time: np.ndarray,
+    threshold: float,
+    refractory_samples: int,
+    peak_search_window_samples: int = None,
+    parameters: Dict[str, Any] = None,
+    dvdt_threshold: float = 20.0,
+) -> List[SpikeTrainResult]:
+    """
+    Run :func:`detect_spikes_threshold` on every row of a ``(n_sweeps, n_samples)`` block at once.
+
+    Filtering, dV/dt, crossing detection, refractory suppression and peak
+    search each run as one vectorised operation over the whole block, so the
+    result for every sweep equals a separate :func:`detect_spikes_threshold`
+    call without the per-sweep Python overhead.
+
+    Args:
+        data: 2-D voltage block (mV), one sweep per row.
+        time: 1-D time array shared by all sweeps (s).
+        threshold, refractory_samples, peak_search_window_samples, parameters, dvdt_threshold:
+            As for :func:`detect_spikes_threshold`.
+
+    Returns:
+        One :class:`SpikeTrainResult` per sweep, with ``metadata["sweep_index"]`` set.
+    """
+    n_sweeps = data.shape[0] if isinstance(data, np.ndarray) and data.ndim == 2 else 1
+    error = _batch_input_error(data, time, threshold, refractory_samples)
+    if error is not None:
+        return _invalid_sweep_results(error, n_sweeps, parameters)
+
+    try:
+        dt = time[1] - time[0]
+        rows, peaks, has_crossings = _detect_spike_peaks(
+            data, dt, threshold, refractory_samples, peak_search_window_samples, dvdt_threshold
+        )
+    except (ValueError, TypeError, KeyError, IndexError) as e:
+        log.error(f"Error during batched spike detection: {e}", exc_info=True)
+        return _invalid_sweep_results(str(e), n_sweeps, parameters)
+
+    bounds = np.searchsorted(rows, np.arange(n_sweeps + 1))
+    results = []
+    for i in range(n_sweeps):
+        if has_crossings[i]:
+            result = _spike_train_result(peaks[bounds[i] : bounds[i + 1]], time, parameters)
         else:
-            valid_crossings_list = [crossings[0]]
-            last_crossing_idx = crossings[0]
-            for idx in crossings[1:]:
-                if (idx - last_crossing_idx) >= refractory_samples:
-                    valid_crossings_list.append(idx)
-                    last_crossing_idx = idx
-            valid_crossing_indices = np.array(valid_crossings_list)
-
-        if valid_crossing_indices.size == 0:
-            return SpikeTrainResult(
+            result = SpikeTrainResult(
                 value=0,
                 unit="spikes",
                 spike_times=np.array([]),
                 spike_indices=np.array([]),
                 parameters=parameters or {},
             )
+        result.metadata["sweep_index"] = i
+        results.append(result)
+    return results
 
-        peak_indices_list = []
-        if peak_search_window_samples is None:
-            peak_search_window_samples = (
-                refractory_samples if refractory_samples > 0 else int(0.005 / (time[1] - time[0]))
-            )
 
-        for crossing_idx in valid_crossing_indices:
-            search_start = crossing_idx
-            search_end = min(crossing_idx + peak_search_window_samples, len(data))
-            if search_start >= search_end:
-                peak_idx = crossing_idx
-            else:
-                try:
-                    relative_peak_idx = np.argmax(data[search_start:search_end])
-                    peak_idx = search_start + relative_peak_idx
-                except ValueError:
-                    peak_idx = crossing_idx
-
-            if data[peak_idx] >= threshold:
-                peak_indices_list.append(peak_idx)
-
-        peak_indices_arr = np.array(peak_indices_list).astype(int)
-        peak_times_arr = time[peak_indices_arr]
-
-        mean_freq = 0.0
-        if len(peak_times_arr) > 1:
-            spike_span = peak_times_arr[-1] - peak_times_arr[0]
-            if spike_span > 0:
-                mean_freq = (len(peak_times_arr) - 1) / spike_span
+_PEAK_SEARCH_CHUNK = 1 << 22  # window elements gathered per argmax call
+_SPIKE_LOWPASS_HZ = 5000.0  # anti-noise low-pass before differentiation in spike detection
+_FEATURE_LOWPASS_HZ = 9900.0  # Bessel low-pass before differentiation in AP feature extraction
 
-        return SpikeTrainResult(
-            value=len(peak_indices_arr),
-            unit="spikes",
-            spike_times=peak_times_arr,
-            spike_indices=peak_indices_arr,
-            mean_frequency=mean_freq,
-            parameters=parameters or {},
-        )
 
-    except (ValueError, TypeError, KeyError, IndexError) as e:
-        log.error(f"Error during spike detection: {e}", exc_info=True)
-        return SpikeTrainResult(
-            value=0, unit="spikes", is_valid=False, error_message=str(e), parameters=parameters or {}
-        )
+def _refractory_mask(positions: np.ndarray, refractory_samples: int) -> np.ndarray:
+    """Greedy forward refractory suppression over sorted crossing positions.
+
+    Keeps the first crossing, then repeatedly the first crossing at least
+    *refractory_samples* after the last kept one.  Each crossing's successor
+    is found with one ``searchsorted``; the chain starting at the first
+    crossing is then marked by pointer doubling, so the scan takes
+    ``log2(n)`` vectorised passes instead of a Python loop over crossings.
+    """
+    n = positions.size
+    if n == 0 or refractory_samples <= 0 or np.all(np.diff(positions) >= refractory_samples):
+        return np.ones(n, dtype=bool)
+    # jump[i]: index of the next crossing kept after i (n is an absorbing sentinel)
+    jump = np.append(np.searchsorted(positions, positions + refractory_samples, side="left"), n)
+    keep = np.zeros(n + 1, dtype=bool)
+    keep[0] = True
+    while True:
+        # keep holds the chain nodes 0 .. 2**k - 1 steps from the start; jump spans 2**k steps
+        reached = jump[np.flatnonzero(keep)]
+        if keep[reached].all():
+            break
+        keep[reached] = True
+        jump = jump[jump]
+    return keep[:n]
+
+
+def _window_argmax(data: np.ndarray, rows: np.ndarray, starts: np.ndarray, width: int) -> np.ndarray:
+    """Index of the maximum of ``data[row, start:start + width]`` (clipped at the trace end) per pair."""
+    n_samples = data.shape[-1]
+    if width <= 0 or starts.size == 0:
+        return starts.copy()
+    width = min(width, n_samples)
+    out = np.empty_like(starts)
+    full = starts <= n_samples - width
+    windows = np.lib.stride_tricks.sliding_window_view(data, width, axis=-1)
+    full_idx = np.flatnonzero(full)
+    step = max(1, _PEAK_SEARCH_CHUNK // width)
+    for lo in range(0, full_idx.size, step):
+        sel = full_idx[lo : lo + step]
+        out[sel] = starts[sel] + np.argmax(windows[rows[sel], starts[sel]], axis=-1)
+    # Windows truncated by the end of the trace (at most the last few crossings per sweep)
+    for i in np.flatnonzero(~full):
+        out[i] = starts[i] + np.argmax(data[rows[i], starts[i] :])
+    return out
+
+
+def _detect_spike_peaks(
+    data: np.ndarray,
+    dt: float,
+    threshold: float,
+    refractory_samples: int,
+    peak_search_window_samples: Optional[int],
+    dvdt_threshold: float,
+    dvdt: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorised core of the dV/dt-threshold detector for a ``(n_sweeps, n_samples)`` block.
+
+    *dvdt* may carry the already computed derivative of the 5 kHz low-passed
+    block; it is computed here otherwise.
+
+    Returns:
+        ``(rows, peak_indices, has_crossings)``: sweep and sample index of each
+        accepted spike peak (sorted by sweep, then time), and for each sweep
+        whether any dV/dt crossing was found at all.
+    """
+    n_sweeps, n_samples = data.shape
+    if dvdt is None:
+        sos = lowpass_sos("butter", 4, _SPIKE_LOWPASS_HZ, float(dt))
+        if sos is not None:
+            from scipy.signal import sosfiltfilt
+
+            data_filtered = sosfiltfilt(sos, data, axis=-1)
+        else:
+            data_filtered = data
+        dvdt = np.gradient(data_filtered, dt, axis=-1)
+    dvdt_thresh_mvs = dvdt_threshold * 1000.0
+    rows, crossings = np.nonzero((dvdt[:, :-1] < dvdt_thresh_mvs) & (dvdt[:, 1:] >= dvdt_thresh_mvs))
+    crossings = crossings + 1
+    has_crossings = np.bincount(rows, minlength=n_sweeps) > 0
+
+    # Offset each sweep so crossings in different sweeps are always >= refractory_samples apart
+    positions = rows.astype(np.int64) * (n_samples + refractory_samples) + crossings
+    keep = _refractory_mask(positions, refractory_samples)
+    rows, crossings = rows[keep], crossings[keep]
+
+    if peak_search_window_samples is None:
+        peak_search_window_samples = refractory_samples if refractory_samples > 0 else int(0.005 / dt)
+    peaks = _window_argmax(data, rows, crossings, peak_search_window_samples)
+    accepted = data[rows, peaks] >= threshold
+    return rows[accepted], peaks[accepted].astype(int), has_crossings
+
+
+def _spike_train_result(
+    peak_indices: np.ndarray, time: np.ndarray, parameters: Optional[Dict[str, Any]]
+) -> SpikeTrainResult:
+    """Successful :class:`SpikeTrainResult` for accepted peak indices of one sweep."""
+    peak_times = time[peak_indices]
+    mean_freq = 0.0
+    if len(peak_times) > 1:
+        spike_span = peak_times[-1] - peak_times[0]
+        if spike_span > 0:
+            mean_freq = (len(peak_times) - 1) / spike_span
+    return SpikeTrainResult(
+        value=len(peak_indices),
+        unit="spikes",
+        spike_times=peak_times,
+        spike_indices=peak_indices,
+        mean_frequency=mean_freq,
+        parameters=parameters or {},
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -221,7 +369,7 @@ def detect_spikes_threshold(  # noqa: C901
 # ---------------------------------------------------------------------------
 
 
-def calculate_spike_features(  # noqa: C901
+def compute_spike_feature_table(  # noqa: C901
     data: np.ndarray,
     time: np.ndarray,
     spike_indices: np.ndarray,
@@ -230,13 +378,16 @@ def calculate_spike_features(  # noqa: C901
     onset_lookback: float = 0.01,
     fahp_window_ms: Tuple[float, float] = (1.0, 5.0),
     mahp_window_ms: Tuple[float, float] = (10.0, 50.0),
-) -> List[Dict[str, Any]]:
+) -> SpikeFeatureTable:
     """
-    Calculate detailed features for each detected spike (vectorised NumPy).
+    Calculate detailed features for all detected spikes at once (vectorised NumPy).
 
-    Returns list of SingleSpikeResult instances per spike, containing metrics like:
-    ap_threshold, amplitude, half_width, rise_time_10_90, decay_time_90_10,
-    fahp_depth, mahp_depth, ahp_duration_half, adp_amplitude, max_dvdt, min_dvdt.
+    Every feature is computed over per-spike windows gathered into 2-D arrays
+    (one row per spike), so the cost does not grow with Python-level work per
+    spike.  The result is a columnar :class:`SpikeFeatureTable` with one array
+    per feature: ap_threshold, amplitude, half_width, rise_time_10_90,
+    decay_time_90_10, fahp_depth, mahp_depth, ahp_duration_half,
+    adp_amplitude, max_dvdt, min_dvdt and the extended features.
 
     Methodology aligns with established electrophysiology standards:
 
@@ -257,33 +408,24 @@ def calculate_spike_features(  # noqa: C901
         mahp_window_ms: (start, end) of medium-AHP window after peak (ms).
 
     Returns:
-        A list of SingleSpikeResult objects.
+        A :class:`SpikeFeatureTable` (empty when no features can be computed).
     """
     if spike_indices is None or spike_indices.size == 0:
-        return []
+        return SpikeFeatureTable.empty()
 
     spike_indices = np.asarray(spike_indices, dtype=int)
     n_spikes = len(spike_indices)
     n_data = len(data)
     if n_data < 2:
-        return []
+        return SpikeFeatureTable.empty()
 
     dt = time[1] - time[0]
     if dt <= 0:
         log.warning("Invalid time vector (dt <= 0). Cannot calculate features.")
-        return []
-
-    # Apply 9.9 kHz low-pass Bessel filter for clean derivative calculation
-    from scipy.signal import bessel, sosfiltfilt
-
-    nyq = 0.5 / dt
-    if 9900.0 < nyq:
-        sos = bessel(4, 9900.0, btype="low", output="sos", fs=1.0 / dt)
-        data_filtered = sosfiltfilt(sos, data)
-    else:
-        data_filtered = data
+        return SpikeFeatureTable.empty()
 
-    dvdt = np.gradient(data_filtered, dt)
+    # Derivative of the 9.9 kHz low-pass Bessel-filtered trace (shared per trace)
+    dvdt = lowpass_dvdt(data, dt, _FEATURE_LOWPASS_HZ, "bessel")
 
     lookback_samples = int(onset_lookback / dt)
     post_peak_samples = int(0.01 / dt)
@@ -510,13 +652,19 @@ def calculate_spike_features(  # noqa: C901
     # Fallback to argmin if no clean zero-crossing is found
     ahp_min_rel_indices = np.where(has_crossing, first_crossing_idx, np.argmin(temp_ahp, axis=1))
 
+    # Trough voltage: mean of +/- 1 ms around the AHP minimum, clipped to the
+    # window start and to the next spike.  Centred windows are strided views
+    # into the zero-padded AHP waveforms.
     mean_window = int(0.001 / dt)
-    ahp_min_vals = np.zeros(n_spikes)
-    for i in range(n_spikes):
-        idx = ahp_min_rel_indices[i]
-        start = max(0, idx - mean_window)
-        end = min(ahp_max_samples_per_spike[i], idx + mean_window + 1)
-        ahp_min_vals[i] = np.mean(ahp_waveforms[i, start:end])
+    padded_ahp = np.pad(ahp_waveforms, ((0, 0), (mean_window, mean_window)))
+    trough_windows = np.lib.stride_tricks.sliding_window_view(padded_ahp, 2 * mean_window + 1, axis=1)[
+        np.arange(n_spikes), ahp_min_rel_indices
+    ]
+    trough_cols = ahp_min_rel_indices[:, None] + np.arange(-mean_window, mean_window + 1)
+    in_trough = (trough_cols >= 0) & (trough_cols < ahp_max_samples_per_spike[:, None])
+    n_trough = np.count_nonzero(in_trough, axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ahp_min_vals = np.where(in_trough, trough_windows, 0.0).sum(axis=1) / n_trough
 
     rec_targets = ap_thresholds - 0.1 * amplitudes
     rec_target_bcast = rec_targets[:, None]
@@ -627,9 +775,7 @@ def calculate_spike_features(  # noqa: C901
     # --- New Active Features ---
     ap_delays = time[thresh_indices]
 
-    ahp_times = np.zeros(n_spikes)
-    for i in range(n_spikes):
-        ahp_times[i] = time[ahp_indices[i, ahp_min_rel_indices[i]]]
+    ahp_times = time[ahp_indices[np.arange(n_spikes), ahp_min_rel_indices]]
 
     trough_vs = ahp_min_vals
 
@@ -637,59 +783,83 @@ def calculate_spike_features(  # noqa: C901
     valid_ratio = min_dvdts != 0
     upstroke_downstroke_ratios[valid_ratio] = max_dvdts[valid_ratio] / np.abs(min_dvdts[valid_ratio])
 
+    # --- Phase Plane Area (shoelace formula over threshold -> AP end) ---
+    # The V(t) / dV/dt loop of each spike spans window columns [pp_start, pp_end).
+    pp_start = thresh_indices - spike_indices + lookback_samples
+    pp_end = np.minimum(ap_end_rel_indices + lookback_samples, full_window_len)
+    pp_len = pp_end - np.maximum(pp_start, 0)
+    has_area = (
+        (thresh_indices < spike_indices + ap_end_rel_indices) & (pp_len > 2) & (thresh_indices + pp_len <= n_data)
+    )
+    # Onsets before the window start (fallback threshold with a short lookback)
+    # pair trace samples with misaligned dV/dt columns; keep that behaviour exactly.
+    irregular = has_area & (pp_start < 0)
+    has_area &= ~irregular
+
     phase_plane_areas = np.full(n_spikes, np.nan)
-    ap_widths_arbitrary = [None] * n_spikes
-
-    for i in range(n_spikes):
-        start_idx = thresh_indices[i]
-        end_idx = spike_indices[i] + ap_end_rel_indices[i]
-
-        # Calculate Phase Plane Area (Shoelace formula)
-        if start_idx < end_idx:
-            # Find the local slice within the full_dvdt window
-            rel_start = (start_idx - spike_indices[i]) + lookback_samples
-            rel_end = (end_idx - spike_indices[i]) + lookback_samples
-
-            # Ensure boundaries are within full_dvdt shape
-            rel_start = max(0, min(rel_start, full_window_len - 1))
-            rel_end = max(0, min(rel_end, full_window_len))
-
-            if rel_end > rel_start + 2:
-                x = data[start_idx : start_idx + (rel_end - rel_start)]
-                y = full_dvdt[i, rel_start:rel_end]
-
-                if len(x) == len(y):
-                    area = 0.5 * np.abs(np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1]))
-                    phase_plane_areas[i] = area
-
-    features_list = []
-    for i in range(n_spikes):
-        features_list.append(
-            SingleSpikeResult(
-                value=None,
-                unit="mV",
-                ap_threshold=float(ap_thresholds[i]),
-                amplitude=float(amplitudes[i]),
-                half_width=float(half_widths[i]),
-                rise_time_10_90=float(rise_times[i]),
-                decay_time_90_10=float(decay_times[i]),
-                fahp_depth=float(fahp_depths[i]),
-                mahp_depth=float(mahp_depths[i]),
-                ahp_duration_half=float(ahp_durations[i]),
-                adp_amplitude=float(adp_amplitudes[i]),
-                max_dvdt=float(max_dvdts[i]),
-                min_dvdt=float(min_dvdts[i]),
-                absolute_peak_mv=float(peak_vals[i]),
-                overshoot_mv=float(max(0.0, peak_vals[i])),
-                ap_delay=float(ap_delays[i]),
-                ap_width_arbitrary=ap_widths_arbitrary[i],
-                ahp_time=float(ahp_times[i]),
-                upstroke_downstroke_ratio=float(upstroke_downstroke_ratios[i]),
-                phase_plane_area=float(phase_plane_areas[i]),
-                trough_v=float(trough_vs[i]),
-            )
-        )
-    return features_list
+    if np.any(has_area) and full_window_len > 1:
+        # Terms k with pp_start <= k < pp_end - 1 pair sample k with sample k + 1
+        in_loop = (col_indices[None, :-1] >= pp_start[:, None]) & (col_indices[None, :-1] < pp_end[:, None] - 1)
+        forward = np.where(in_loop, waveforms[:, :-1] * full_dvdt[:, 1:], 0.0).sum(axis=1)
+        backward = np.where(in_loop, waveforms[:, 1:] * full_dvdt[:, :-1], 0.0).sum(axis=1)
+        phase_plane_areas[has_area] = 0.5 * np.abs(forward - backward)[has_area]
+    for i in np.flatnonzero(irregular):
+        x = data[thresh_indices[i] : thresh_indices[i] + pp_end[i]]
+        y = full_dvdt[i, : pp_end[i]]
+        phase_plane_areas[i] = 0.5 * np.abs(np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1]))
+
+    return SpikeFeatureTable(
+        spike_indices,
+        ap_threshold=ap_thresholds,
+        amplitude=amplitudes,
+        half_width=half_widths,
+        rise_time_10_90=rise_times,
+        decay_time_90_10=decay_times,
+        fahp_depth=fahp_depths,
+        mahp_depth=mahp_depths,
+        ahp_duration_half=ahp_durations,
+        adp_amplitude=adp_amplitudes,
+        max_dvdt=max_dvdts,
+        min_dvdt=min_dvdts,
+        absolute_peak_mv=peak_vals,
+        overshoot_mv=np.where(peak_vals > 0.0, peak_vals, 0.0),
+        ap_delay=ap_delays,
+        ahp_time=ahp_times,
+        upstroke_downstroke_ratio=upstroke_downstroke_ratios,
+        phase_plane_area=phase_plane_areas,
+        trough_v=trough_vs,
+    )
+
+
+def calculate_spike_features(
+    data: np.ndarray,
+    time: np.ndarray,
+    spike_indices: np.ndarray,
+    dvdt_threshold: float = 20.0,
+    ahp_window_sec: float = 0.05,
+    onset_lookback: float = 0.01,
+    fahp_window_ms: Tuple[float, float] = (1.0, 5.0),
+    mahp_window_ms: Tuple[float, float] = (10.0, 50.0),
+) -> List[SingleSpikeResult]:
+    """
+    Per-spike :class:`SingleSpikeResult` objects for display and legacy callers.
+
+    Same arguments as :func:`compute_spike_feature_table`, which does the work;
+    analysis code should use the table directly.
+
+    Returns:
+        A list of SingleSpikeResult objects.
+    """
+    return compute_spike_feature_table(
+        data,
+        time,
+        spike_indices,
+        dvdt_threshold=dvdt_threshold,
+        ahp_window_sec=ahp_window_sec,
+        onset_lookback=onset_lookback,
+        fahp_window_ms=fahp_window_ms,
+        mahp_window_ms=mahp_window_ms,
+    ).to_results()
 
 
 def calculate_isi(spike_times: np.ndarray) -> np.ndarray:
@@ -706,7 +876,23 @@ def analyze_multi_sweep_spikes(
     refractory_samples: int,
     dvdt_threshold: float = 20.0,
 ) -> List[SpikeTrainResult]:
-    """Detect spikes across multiple sweeps."""
+    """Detect spikes across multiple sweeps.
+
+    Equal-length sweeps matching *time_vector* are stacked and detected in
+    one :func:`detect_spikes_threshold_batch` call; anything else falls back
+    to one :func:`detect_spikes_threshold` call per sweep.
+    """
+    if (
+        data_trials
+        and isinstance(time_vector, np.ndarray)
+        and time_vector.ndim == 1
+        and time_vector.size >= 2
+        and all(isinstance(d, np.ndarray) and d.shape == time_vector.shape for d in data_trials)
+    ):
+        return detect_spikes_threshold_batch(
+            np.stack(data_trials), time_vector, threshold, refractory_samples, dvdt_threshold=dvdt_threshold
+        )
+
     results = []
     for i, trial_data in enumerate(data_trials):
         try:
@@ -747,22 +933,29 @@ def calculate_dvdt(voltage: np.ndarray, sampling_rate: float, sigma_ms: float =
             next odd integer.  Set to 0 for no smoothing.
 
     Returns:
-        1D array of dV/dt in V/s.
+        1D array of dV/dt in V/s (read-only; shared through
+        :class:`~synaptipy.core.derived_signals.DerivedSignalStore`).
     """
-    dt = 1.0 / sampling_rate
-    dvdt = np.gradient(voltage, dt) / 1000.0  # mV/s -> V/s
-
-    if sigma_ms > 0 and len(dvdt) >= 5:
-        # Dynamic window length derived from sigma_ms and sampling rate (must be odd >= 5)
-        window_samples = max(5, int(sigma_ms / 1000.0 * sampling_rate))
-        if window_samples % 2 == 0:
-            window_samples += 1
-        # Cap at signal length (savgol_filter requires window <= len)
-        window_samples = min(window_samples, len(dvdt) if len(dvdt) % 2 == 1 else len(dvdt) - 1)
-        if window_samples >= 5:
-            dvdt = savgol_filter(dvdt, window_samples, 3)
 
-    return dvdt
+    def _compute() -> np.ndarray:
+        dt = 1.0 / sampling_rate
+        dvdt = np.gradient(voltage, dt) / 1000.0  # mV/s -> V/s
+
+        if sigma_ms > 0 and len(dvdt) >= 5:
+            # Dynamic window length derived from sigma_ms and sampling rate (must be odd >= 5)
+            window_samples = max(5, int(sigma_ms / 1000.0 * sampling_rate))
+            if window_samples % 2 == 0:
+                window_samples += 1
+            # Cap at signal length (savgol_filter requires window <= len)
+            window_samples = min(window_samples, len(dvdt) if len(dvdt) % 2 == 1 else len(dvdt) - 1)
+            if window_samples >= 5:
+                dvdt = savgol_filter(dvdt, window_samples, 3)
+        return dvdt
+
+    # Phase-plane and kink-threshold analysis of one trace share this result
+    return DerivedSignalStore.get_instance().get_or_compute(
+        voltage, ("savgol_dvdt", float(sigma_ms), float(sampling_rate)), _compute
+    )
 
 
 def get_phase_plane_trajectory(
@@ -927,7 +1120,7 @@ def run_spike_detection_wrapper(
         )
 
         if result.is_valid:
-            features_list = calculate_spike_features(
+            feature_table = compute_spike_feature_table(
                 data,
                 time,
                 result.spike_indices,
@@ -935,41 +1128,8 @@ def run_spike_detection_wrapper(
                 ahp_window_sec=ahp_window,
                 onset_lookback=onset_lookback,
             )
-            stats: Dict[str, Any] = {}
-            if features_list:
-                import dataclasses
-
-                # Collect attributes dynamically from the first valid result
-                first_feat = features_list[0]
-                feat_dict = dataclasses.asdict(first_feat)
-                valid_keys = [
-                    k
-                    for k in feat_dict.keys()
-                    if k
-                    not in [
-                        "value",
-                        "unit",
-                        "is_valid",
-                        "error_message",
-                        "quality_flags",
-                        "confidence",
-                        "metadata",
-                        "parameters",
-                    ]
-                ]
-
-                for key in valid_keys:
-                    values = [
-                        getattr(f, key)
-                        for f in features_list
-                        if getattr(f, key) is not None and not np.isnan(getattr(f, key))
-                    ]
-                    if values:
-                        stats[f"{key}_mean"] = float(np.mean(values))
-                        stats[f"{key}_std"] = float(np.std(values))
-                    else:
-                        stats[f"{key}_mean"] = np.nan
-                        stats[f"{key}_std"] = np.nan
+            # <feature>_mean / <feature>_std straight from the feature columns
+            stats: Dict[str, Any] = feature_table.summary_stats()
 
             v_data = (
                 data[result.spike_indices]
@@ -23,16 +23,47 @@ from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 from scipy import signal
 from scipy.optimize import curve_fit
-from scipy.stats import median_abs_deviation
 
+from synaptipy.core import robust_stats
 from synaptipy.core.analysis.registry import AnalysisRegistry
+from synaptipy.core.baseline_estimators import BASELINE_METHODS, DEFAULT_BASELINE_METHOD, subtract_rolling_baseline
 from synaptipy.core.constants import NOISE_FLOOR_MIN_RMS
+from synaptipy.core.matched_filter import kernel_bank, matched_filter_bank
 from synaptipy.core.results import EventDetectionResult
 from synaptipy.core.signal_processor import find_artifact_windows
 
 log = logging.getLogger(__name__)
 
 
+def _baseline_estimator_params() -> List[Dict[str, Any]]:
+    """ui_params selecting the rolling-baseline estimator (fresh dicts for each analysis)."""
+    return [
+        {
+            "name": "baseline_method",
+            "label": "Baseline Estimator:",
+            "type": "choice",
+            "choices": list(BASELINE_METHODS),
+            "default": DEFAULT_BASELINE_METHOD,
+            "tooltip": (
+                "Rolling baseline algorithm. median: exact running median. "
+                "decimated_median: faster, within about +/-6 percentiles of the exact median. "
+                "percentile: running percentile. exponential / savgol: fastest smooth trends, "
+                "but pulled towards large or frequent events."
+            ),
+        },
+        {
+            "name": "baseline_percentile",
+            "label": "Baseline Percentile:",
+            "type": "float",
+            "default": 50.0,
+            "min": 0.0,
+            "max": 100.0,
+            "decimals": 1,
+            "visible_when": {"param": "baseline_method", "value": "percentile"},
+        },
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Quiescent Noise Floor
 # ---------------------------------------------------------------------------
@@ -607,6 +638,8 @@ def detect_events_threshold(  # noqa: C901
     artifact_mask: Optional[np.ndarray] = None,
     use_quiescent_noise_floor: bool = True,
     quiescent_window_ms: float = 20.0,
+    baseline_method: str = DEFAULT_BASELINE_METHOD,
+    baseline_percentile: float = 50.0,
 ) -> EventDetectionResult:
     """
     Detect events using topological prominence to handle shifting baselines.
@@ -622,19 +655,9 @@ def detect_events_threshold(  # noqa: C901
     try:
         fs = 1.0 / (time[1] - time[0]) if len(time) > 1 else 10000.0
 
-        if rolling_baseline_window_ms is not None and rolling_baseline_window_ms > 0:
-            from scipy.ndimage import median_filter
-
-            window_samples = int((rolling_baseline_window_ms / 1000.0) * fs)
-            if window_samples % 2 == 0:
-                window_samples += 1
-            if window_samples >= 3:
-                baseline = median_filter(data, size=window_samples)
-                baseline_corrected_data = data - baseline
-            else:
-                baseline_corrected_data = data
-        else:
-            baseline_corrected_data = data
+        baseline_corrected_data = subtract_rolling_baseline(
+            data, fs, rolling_baseline_window_ms, baseline_method, baseline_percentile
+        )
 
         is_negative = polarity == "negative"
         work_data = -baseline_corrected_data if is_negative else baseline_corrected_data
@@ -644,7 +667,7 @@ def detect_events_threshold(  # noqa: C901
             quiescent_rms, _ = find_quiescent_baseline_rms(work_data, fs, window_ms=quiescent_window_ms)
             noise_sd = quiescent_rms if quiescent_rms > 0 else 1e-12
         else:
-            noise_sd = median_abs_deviation(work_data, scale="normal")
+            noise_sd = robust_stats.mad(work_data)
             if noise_sd == 0:
                 noise_sd = 1e-12
 
@@ -771,6 +794,7 @@ detect_minis_threshold = detect_events_threshold
             "max": 5000.0,
             "decimals": 1,
         },
+        *_baseline_estimator_params(),
         {
             "name": "use_quiescent_noise_floor",
             "label": "Quiescent Noise Floor",
@@ -826,6 +850,8 @@ def run_event_detection_threshold_wrapper(
         artifact_mask=artifact_mask,
         use_quiescent_noise_floor=use_quiescent_noise_floor,
         quiescent_window_ms=quiescent_window_ms,
+        baseline_method=kwargs.get("baseline_method", DEFAULT_BASELINE_METHOD),
+        baseline_percentile=float(kwargs.get("baseline_percentile", 50.0)),
     )
 
     if not result.is_valid:
@@ -897,7 +923,143 @@ def run_event_detection_threshold_wrapper(
 # ---------------------------------------------------------------------------
 
 
-def detect_events_template(  # noqa: C901
+def _template_z_scores(
+    work_data: np.ndarray,
+    sampling_rate: float,
+    tau_rise: float,
+    tau_decay: float,
+    multipliers: List[float],
+    kernel_shape: str,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Combined matched-filter z-score and primary-kernel noise MAD for each row of 2-D *work_data*.
+
+    Each kernel's matched-filter peak is shifted from the true event time by
+    ``kernel_peak_idx - kernel_center`` samples; all z-score traces are aligned
+    to the primary (first) kernel so that the pointwise maximum produces a
+    single sharp peak per event rather than several spread-out humps.
+    """
+    n = work_data.shape[-1]
+    combined = None
+    primary_mad = None
+    ref_offset = 0
+    for k, filtered in matched_filter_bank(work_data, tau_rise, tau_decay, multipliers, sampling_rate, kernel_shape):
+        center, mad = robust_stats.median_mad(filtered, keepdims=True)
+        mad = np.where(mad == 0, 1e-12, mad)
+        z = filtered
+        z -= center
+        z /= mad
+        k_offset = int(np.argmax(k)) - (len(k) - 1) // 2
+        if combined is None:
+            # Noise estimate from the primary (unscaled) kernel for return metadata
+            combined, primary_mad, ref_offset = z, mad[..., 0], k_offset
+            continue
+        # Align this kernel's peak to the primary kernel's reference (zeros shifted in)
+        shift = k_offset - ref_offset
+        if abs(shift) >= n:
+            np.maximum(combined, 0.0, out=combined)
+        elif shift > 0:
+            np.maximum(combined[..., shift:], z[..., : n - shift], out=combined[..., shift:])
+            np.maximum(combined[..., :shift], 0.0, out=combined[..., :shift])
+        elif shift < 0:
+            np.maximum(combined[..., :shift], z[..., -shift:], out=combined[..., :shift])
+            np.maximum(combined[..., shift:], 0.0, out=combined[..., shift:])
+        else:
+            np.maximum(combined, z, out=combined)
+    return combined, primary_mad
+
+
+def _template_events(
+    data: np.ndarray,
+    baseline_corrected_data: np.ndarray,
+    z_score_trace: np.ndarray,
+    noise_mad: float,
+    sampling_rate: float,
+    threshold_std: float,
+    tau_rise: float,
+    tau_decay: float,
+    polarity: str,
+    artifact_mask: Optional[np.ndarray],
+    time: Optional[np.ndarray],
+    min_event_distance_ms: float,
+    multipliers: List[float],
+    kernel_shape: str,
+) -> EventDetectionResult:
+    """Peak picking, refinement and result assembly for one trace's combined z-score."""
+    dt = 1.0 / sampling_rate
+    n_points = len(data)
+    is_negative = polarity == "negative"
+
+    if min_event_distance_ms > 0:
+        min_dist_samples = int((min_event_distance_ms / 1000.0) * sampling_rate)
+    else:
+        min_dist_samples = int(tau_decay * sampling_rate)
+    if min_dist_samples < 1:
+        min_dist_samples = 1
+
+    peak_indices, _ = signal.find_peaks(z_score_trace, height=threshold_std, distance=min_dist_samples)
+
+    # Peak refinement: z_score peaks are aligned to the primary kernel reference,
+    # so apply only the primary kernel's offset when searching for the raw data peak.
+    primary_kernel = kernel_bank(tau_rise, tau_decay, (float(multipliers[0]),), sampling_rate, kernel_shape)[0]
+    kernel_peak_idx = int(np.argmax(primary_kernel))
+    template_offset = kernel_peak_idx - (len(primary_kernel) - 1) // 2
+    # Refinement radius must cover events much slower than the template (e.g. an EPSP
+    # with tau_decay >> template tau_decay).  tau_rise was previously used here but it
+    # is far too narrow: for a 0.5 ms template vs a 30 ms EPSP the baseline-corrected
+    # work_data peak can be >200 samples earlier than the raw data peak.  Using
+    # tau_decay (×2 for the largest multiplier kernel) as the half-window ensures the
+    # search always brackets the true amplitude maximum even with template mismatch.
+    refine_radius = max(20, int(tau_decay * sampling_rate * max(multipliers)))
+    # Search raw data (polarity-adjusted) so rolling-baseline distortion cannot
+    # shift the detected peak away from the true signal maximum.
+    _refine_search = -data if is_negative else data
+
+    if len(peak_indices) > 0:
+        corrected_indices = np.empty_like(peak_indices)
+        for i, idx in enumerate(peak_indices):
+            shifted = idx + template_offset
+            win_start = max(0, shifted - refine_radius)
+            win_end = min(n_points, shifted + refine_radius + 1)
+            local_peak = np.argmax(_refine_search[win_start:win_end])
+            corrected_indices[i] = win_start + local_peak
+        peak_indices = np.unique(corrected_indices)
+
+    if artifact_mask is not None and len(peak_indices) > 0:
+        n_mask = len(artifact_mask)
+        valid_mask = peak_indices < n_mask
+        not_artifact = ~artifact_mask[peak_indices[valid_mask]]
+        peak_indices = peak_indices[valid_mask][not_artifact]
+
+    event_count = len(peak_indices)
+    event_indices = peak_indices.astype(int)
+    event_amplitudes = baseline_corrected_data[event_indices] if event_count > 0 else np.array([])
+
+    if time is not None and len(time) == n_points:
+        time_axis = time
+    else:
+        time_axis = np.arange(n_points) * dt
+    event_times = time_axis[event_indices] if event_count > 0 else np.array([])
+
+    return EventDetectionResult(
+        value=event_count,
+        unit="counts",
+        is_valid=True,
+        event_count=event_count,
+        event_indices=event_indices,
+        event_times=event_times,
+        event_amplitudes=event_amplitudes,
+        detection_method="template_matching",
+        tau_rise_ms=tau_rise * 1000.0,
+        tau_decay_ms=tau_decay * 1000.0,
+        threshold_sd=threshold_std,
+        summary_stats={"noise_mad": noise_mad},
+        direction=polarity,
+        artifact_mask=artifact_mask,
+    )
+
+
+def detect_events_template(
     data: np.ndarray,
     sampling_rate: float,
     threshold_std: float,
@@ -910,6 +1072,8 @@ def detect_events_template(  # noqa: C901
     min_event_distance_ms: float = 0.0,
     kernel_multipliers: Optional[List[float]] = None,
     kernel_shape: str = "bi-exponential",
+    baseline_method: str = DEFAULT_BASELINE_METHOD,
+    baseline_percentile: float = 50.0,
 ) -> EventDetectionResult:
     """Detect events using a multi-kernel matched-filter bank.
 
@@ -919,146 +1083,36 @@ def detect_events_template(  # noqa: C901
     for distal inputs).  A combined z-score trace (pointwise maximum across all
     filtered traces) is used for peak detection, improving sensitivity to both
     somatic and dendritic events.
+
+    The trace is Fourier-transformed once and multiplied by the cached kernel
+    spectra (:func:`synaptipy.core.matched_filter.matched_filter_bank`); use
+    :func:`detect_events_template_batch` to filter many trials in one pass.
     """
     try:
-        dt = 1.0 / sampling_rate
-        n_points = len(data)
-
-        def _build_kernel(td: float) -> np.ndarray:
-            """Build normalised kernel: mono-exponential or bi-exponential (alpha-function)."""
-            if kernel_shape == "mono-exponential":
-                t_k = np.arange(0, 5 * td, dt)
-                k = np.exp(-t_k / td)
-            elif td == tau_rise:
-                t_k = np.arange(0, 5 * td, dt)
-                k = t_k * np.exp(-t_k / td)  # alpha function
-            else:
-                t_k = np.arange(0, 5 * max(td, tau_rise), dt)
-                k = np.exp(-t_k / td) - np.exp(-t_k / tau_rise)  # bi-exponential
-            max_abs = np.max(np.abs(k))
-            if max_abs > 0:
-                k /= max_abs
-            return k
-
-        _multipliers: List[float] = kernel_multipliers if kernel_multipliers else [1.0, 2.0, 3.0]
-        kernels = [_build_kernel(tau_decay * scale) for scale in _multipliers]
-
-        if rolling_baseline_window_ms is not None and rolling_baseline_window_ms > 0:
-            from scipy.ndimage import median_filter
-
-            window_samples = int((rolling_baseline_window_ms / 1000.0) * sampling_rate)
-            if window_samples % 2 == 0:
-                window_samples += 1
-            if window_samples >= 3:
-                baseline = median_filter(data, size=window_samples)
-                baseline_corrected_data = data - baseline
-            else:
-                baseline_corrected_data = data
-        else:
-            baseline_corrected_data = data
-
-        is_negative = polarity == "negative"
-        work_data = -baseline_corrected_data if is_negative else baseline_corrected_data
-
-        # Compute filtered traces and z-scores for each kernel.
-        # Each kernel's matched-filter peak is shifted from the true event time by
-        # (kernel_peak_idx - kernel_center) samples; align all z-score traces to
-        # the primary (1x) kernel reference so that the max-combination produces a
-        # single sharp peak per event rather than multiple spread-out humps.
-        primary_kernel = kernels[0]
-        kernel_center_0 = (len(primary_kernel) - 1) // 2
-        ref_offset = int(np.argmax(primary_kernel)) - kernel_center_0  # 1x shift
-
-        z_traces = []
-        for k in kernels:
-            matched_k = k[::-1]
-            filtered = signal.fftconvolve(work_data, matched_k, mode="same")
-            mad = median_abs_deviation(filtered, scale="normal")
-            if mad == 0:
-                mad = 1e-12
-            z = (filtered - np.median(filtered)) / mad
-            # Align this kernel's peak to the primary kernel's reference
-            k_offset = int(np.argmax(k)) - (len(k) - 1) // 2
-            relative_shift = k_offset - ref_offset
-            if relative_shift != 0:
-                z = np.roll(z, relative_shift)
-                if relative_shift > 0:
-                    z[:relative_shift] = 0.0
-                else:
-                    z[relative_shift:] = 0.0
-            z_traces.append(z)
-
-        z_score_trace = np.max(np.stack(z_traces, axis=0), axis=0)
-        # Noise estimate from the primary (unscaled) kernel for return metadata
-        mad = float(median_abs_deviation(signal.fftconvolve(work_data, kernels[0][::-1], mode="same"), scale="normal"))
-        if mad == 0:
-            mad = 1e-12
-
-        if min_event_distance_ms > 0:
-            min_dist_samples = int((min_event_distance_ms / 1000.0) * sampling_rate)
-        else:
-            min_dist_samples = int(tau_decay * sampling_rate)
-        if min_dist_samples < 1:
-            min_dist_samples = 1
-
-        peak_indices, _ = signal.find_peaks(z_score_trace, height=threshold_std, distance=min_dist_samples)
-
-        # Peak refinement: z_score peaks are aligned to the primary kernel reference,
-        # so apply only the primary kernel's offset when searching for the raw data peak.
-        kernel_peak_idx = int(np.argmax(primary_kernel))
-        template_offset = kernel_peak_idx - kernel_center_0
-        # Refinement radius must cover events much slower than the template (e.g. an EPSP
-        # with tau_decay >> template tau_decay).  tau_rise was previously used here but it
-        # is far too narrow: for a 0.5 ms template vs a 30 ms EPSP the baseline-corrected
-        # work_data peak can be >200 samples earlier than the raw data peak.  Using
-        # tau_decay (×2 for the largest multiplier kernel) as the half-window ensures the
-        # search always brackets the true amplitude maximum even with template mismatch.
-        refine_radius = max(20, int(tau_decay * sampling_rate * max(_multipliers)))
-        # Search raw data (polarity-adjusted) so rolling-baseline distortion cannot
-        # shift the detected peak away from the true signal maximum.
-        _refine_search = -data if is_negative else data
-
-        if len(peak_indices) > 0:
-            corrected_indices = np.empty_like(peak_indices)
-            for i, idx in enumerate(peak_indices):
-                shifted = idx + template_offset
-                win_start = max(0, shifted - refine_radius)
-                win_end = min(n_points, shifted + refine_radius + 1)
-                local_peak = np.argmax(_refine_search[win_start:win_end])
-                corrected_indices[i] = win_start + local_peak
-            peak_indices = np.unique(corrected_indices)
-
-        if artifact_mask is not None and len(peak_indices) > 0:
-            n_mask = len(artifact_mask)
-            valid_mask = peak_indices < n_mask
-            not_artifact = ~artifact_mask[peak_indices[valid_mask]]
-            peak_indices = peak_indices[valid_mask][not_artifact]
-
-        event_count = len(peak_indices)
-        event_indices = peak_indices.astype(int)
-        event_amplitudes = baseline_corrected_data[event_indices] if event_count > 0 else np.array([])
-
-        if time is not None and len(time) == n_points:
-            time_axis = time
-        else:
-            time_axis = np.arange(n_points) * dt
-        event_times = time_axis[event_indices] if event_count > 0 else np.array([])
-
-        return EventDetectionResult(
-            value=event_count,
-            unit="counts",
-            is_valid=True,
-            event_count=event_count,
-            event_indices=event_indices,
-            event_times=event_times,
-            event_amplitudes=event_amplitudes,
-            detection_method="template_matching",
-            tau_rise_ms=tau_rise * 1000.0,
-            tau_decay_ms=tau_decay * 1000.0,
-            threshold_sd=threshold_std,
-            summary_stats={"noise_mad": mad},
-            direction=polarity,
-            artifact_mask=artifact_mask,
+        data = np.asarray(data)
+        multipliers: List[float] = kernel_multipliers if kernel_multipliers else [1.0, 2.0, 3.0]
+        baseline_corrected_data = subtract_rolling_baseline(
+            data, sampling_rate, rolling_baseline_window_ms, baseline_method, baseline_percentile
+        )
+        work_data = -baseline_corrected_data if polarity == "negative" else baseline_corrected_data
+        z_scores, mads = _template_z_scores(
+            work_data[np.newaxis], sampling_rate, tau_rise, tau_decay, multipliers, kernel_shape
+        )
+        return _template_events(
+            data,
+            baseline_corrected_data,
+            z_scores[0],
+            float(mads[0]),
+            sampling_rate,
+            threshold_std,
+            tau_rise,
+            tau_decay,
+            polarity,
+            artifact_mask,
+            time,
+            min_event_distance_ms,
+            multipliers,
+            kernel_shape,
         )
 
     except (ValueError, TypeError, IndexError, RuntimeError) as e:
@@ -1066,9 +1120,199 @@ def detect_events_template(  # noqa: C901
         return EventDetectionResult(value=0, unit="Hz", is_valid=False, error_message=str(e))
 
 
+def detect_events_template_batch(
+    data: np.ndarray,
+    sampling_rate: float,
+    threshold_std: float,
+    tau_rise: float,
+    tau_decay: float,
+    polarity: str = "negative",
+    rolling_baseline_window_ms: Optional[float] = 100.0,
+    artifact_mask: Optional[np.ndarray] = None,
+    time: Optional[np.ndarray] = None,
+    min_event_distance_ms: float = 0.0,
+    kernel_multipliers: Optional[List[float]] = None,
+    kernel_shape: str = "bi-exponential",
+    baseline_method: str = DEFAULT_BASELINE_METHOD,
+    baseline_percentile: float = 50.0,
+) -> List[EventDetectionResult]:
+    """
+    Run :func:`detect_events_template` on every row of a ``(n_trials, n_samples)`` block at once.
+
+    Baseline removal, the forward FFT, every kernel's matched filter and the
+    z-scoring run once over the whole block; only peak picking is done per
+    trial.  Each result equals a separate :func:`detect_events_template` call.
+
+    Args:
+        data: 2-D block of equal-length trials, one per row.
+        artifact_mask: Optional 1-D mask shared by all trials, or one row per trial.
+        Other arguments: As for :func:`detect_events_template`.
+
+    Returns:
+        One :class:`EventDetectionResult` per trial, with ``metadata["sweep_index"]`` set.
+    """
+
+    def _invalid(message: str, n: int) -> List[EventDetectionResult]:
+        results = []
+        for i in range(n):
+            result = EventDetectionResult(value=0, unit="Hz", is_valid=False, error_message=message)
+            result.metadata["sweep_index"] = i
+            results.append(result)
+        return results
+
+    if not isinstance(data, np.ndarray) or data.ndim != 2:
+        return _invalid("Invalid data array", 1)
+    n_trials = data.shape[0]
+    masks = [artifact_mask] * n_trials
+    if artifact_mask is not None and np.ndim(artifact_mask) == 2:
+        if len(artifact_mask) != n_trials:
+            return _invalid("Artifact mask and data mismatch", n_trials)
+        masks = list(artifact_mask)
+
+    try:
+        multipliers: List[float] = kernel_multipliers if kernel_multipliers else [1.0, 2.0, 3.0]
+        baseline_corrected = subtract_rolling_baseline(
+            data, sampling_rate, rolling_baseline_window_ms, baseline_method, baseline_percentile
+        )
+        work_data = -baseline_corrected if polarity == "negative" else baseline_corrected
+        z_scores, mads = _template_z_scores(work_data, sampling_rate, tau_rise, tau_decay, multipliers, kernel_shape)
+        results = []
+        for i in range(n_trials):
+            result = _template_events(
+                data[i],
+                baseline_corrected[i],
+                z_scores[i],
+                float(mads[i]),
+                sampling_rate,
+                threshold_std,
+                tau_rise,
+                tau_decay,
+                polarity,
+                masks[i],
+                time,
+                min_event_distance_ms,
+                multipliers,
+                kernel_shape,
+            )
+            result.metadata["sweep_index"] = i
+            results.append(result)
+        return results
+    except (ValueError, TypeError, IndexError, RuntimeError) as e:
+        log.error(f"Error during batched template event detection: {e}", exc_info=True)
+        return _invalid(str(e), n_trials)
+
+
+def run_event_detection_template_trials(
+    data: List[np.ndarray], time: List[np.ndarray], sampling_rate: float, **kwargs
+) -> List[Dict[str, Any]]:
+    """
+    Template-matching event detection on every trial of a channel at once.
+
+    Registered as the ``trials_batch`` of ``event_detection_deconvolution``:
+    the batch engine calls it with all iterated trials instead of calling the
+    wrapper once per trial.  Equal-length trials sharing one time axis are
+    filtered as a single :func:`detect_events_template_batch` block; anything
+    else falls back to one wrapper call per trial.  Returns one wrapper
+    result per trial, in order.
+    """
+    same_axis = (
+        len(data) > 1
+        and all(np.shape(d) == np.shape(data[0]) and np.ndim(d) == 1 for d in data)
+        and all(np.array_equal(t, time[0]) for t in time)
+    )
+    masks = [_template_artifact_mask(d, sampling_rate, kwargs) for d in data] if same_axis else []
+    if not same_axis or any(m is not None and m.shape != np.shape(d) for m, d in zip(masks, data)):
+        return [run_event_detection_template_wrapper(d, t, sampling_rate, **kwargs) for d, t in zip(data, time)]
+
+    block = np.stack([np.asarray(d) for d in data])
+    results = detect_events_template_batch(
+        block,
+        sampling_rate,
+        artifact_mask=np.stack(masks) if masks[0] is not None else None,
+        time=time[0],
+        **_template_detection_params(kwargs),
+    )
+    direction = kwargs.get("direction", "negative")
+    return [_template_wrapper_metrics(r, row, time[0], sampling_rate, direction) for r, row in zip(results, block)]
+
+
+def _template_detection_params(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """:func:`detect_events_template` keyword arguments from the wrapper's UI parameters."""
+    # Parse kernel_multipliers from the comma-separated string provided by the UI.
+    raw_multipliers: str = kwargs.get("kernel_multipliers", "1.0, 2.0, 3.0")
+    try:
+        kernel_multipliers: List[float] = [float(x.strip()) for x in raw_multipliers.split(",") if x.strip()]
+        if not kernel_multipliers:
+            raise ValueError("Empty multipliers list")
+    except (ValueError, AttributeError):
+        log.warning(
+            "kernel_multipliers '%s' could not be parsed; using default [1.0, 2.0, 3.0].",
+            raw_multipliers,
+        )
+        kernel_multipliers = [1.0, 2.0, 3.0]
+
+    return {
+        "threshold_std": kwargs.get("threshold_sd", 4.0),
+        "tau_rise": kwargs.get("tau_rise_ms", 0.5) / 1000.0,
+        "tau_decay": kwargs.get("tau_decay_ms", 5.0) / 1000.0,
+        "polarity": kwargs.get("direction", "negative"),
+        "rolling_baseline_window_ms": kwargs.get("rolling_baseline_window_ms", 100.0),
+        "min_event_distance_ms": kwargs.get("min_event_distance_ms", 0.0),
+        "kernel_multipliers": kernel_multipliers,
+        "kernel_shape": kwargs.get("kernel_shape", "bi-exponential"),
+        "baseline_method": kwargs.get("baseline_method", DEFAULT_BASELINE_METHOD),
+        "baseline_percentile": float(kwargs.get("baseline_percentile", 50.0)),
+    }
+
+
+def _template_artifact_mask(data: np.ndarray, sampling_rate: float, kwargs: Dict[str, Any]) -> Optional[np.ndarray]:
+    if not kwargs.get("reject_artifacts", False):
+        return None
+    slope_thresh = kwargs.get("artifact_slope_threshold", 20.0)
+    padding_ms = kwargs.get("artifact_padding_ms", 2.0)
+    return find_artifact_windows(data, sampling_rate, slope_thresh, padding_ms)
+
+
+def _template_wrapper_metrics(
+    result: EventDetectionResult, data: np.ndarray, time: np.ndarray, sampling_rate: float, direction: str
+) -> Dict[str, Any]:
+    """Wrapper output for one trial's template-detection *result*."""
+    if not result.is_valid:
+        return {"module_used": "synaptic_events", "metrics": {"event_error": result.error_message}}
+
+    _idx = np.asarray(result.event_indices if result.event_indices is not None else [], dtype=int)
+
+    # Compute local pre-event baseline for each event (handles summating events).
+    local_baselines = compute_local_pre_event_baseline(data, _idx, sampling_rate, polarity=direction)
+    if len(_idx) > 0:
+        if direction == "negative":
+            local_amplitudes = local_baselines - data[_idx]
+        else:
+            local_amplitudes = data[_idx] - local_baselines
+    else:
+        local_amplitudes = np.array([], dtype=float)
+
+    return {
+        "module_used": "synaptic_events",
+        "metrics": {
+            "event_count": result.event_count,
+            "tau_rise_ms": result.tau_rise_ms,
+            "tau_decay_ms": result.tau_decay_ms,
+            "threshold_sd": result.threshold_sd,
+            "mean_local_amplitude": float(np.mean(local_amplitudes)) if local_amplitudes.size > 0 else 0.0,
+            "_event_times": time[_idx].tolist() if len(_idx) > 0 else [],
+            "_event_peaks": data[_idx].tolist() if len(_idx) > 0 else [],
+            "_local_baselines": local_baselines.tolist() if local_baselines.size > 0 else [],
+            "_local_amplitudes": local_amplitudes.tolist() if local_amplitudes.size > 0 else [],
+            "_result_obj": result,
+        },
+    }
+
+
 @AnalysisRegistry.register(
     "event_detection_deconvolution",
     label="Event (Template Match)",
+    trials_batch=run_event_detection_template_trials,
     plots=[
         {"name": "Trace", "type": "trace", "show_spikes": True},
         {"type": "markers", "x": "_event_times", "y": "_event_peaks", "color": "r", "symbol": "o"},
@@ -1131,6 +1375,7 @@ def detect_events_template(  # noqa: C901
             "max": 5000.0,
             "decimals": 1,
         },
+        *_baseline_estimator_params(),
         {
             "name": "min_event_distance_ms",
             "label": "Min Event Distance (ms):",
@@ -1168,79 +1413,14 @@ def run_event_detection_template_wrapper(
     data: np.ndarray, time: np.ndarray, sampling_rate: float, **kwargs
 ) -> Dict[str, Any]:
     """Wrapper for template-matching event detection."""
-    tau_rise_ms = kwargs.get("tau_rise_ms", 0.5)
-    tau_decay_ms = kwargs.get("tau_decay_ms", 5.0)
-    threshold_sd = kwargs.get("threshold_sd", 4.0)
-    direction = kwargs.get("direction", "negative")
-
-    tau_rise = tau_rise_ms / 1000.0
-    tau_decay = tau_decay_ms / 1000.0
-
-    # Parse kernel_multipliers from the comma-separated string provided by the UI.
-    raw_multipliers: str = kwargs.get("kernel_multipliers", "1.0, 2.0, 3.0")
-    try:
-        kernel_multipliers: List[float] = [float(x.strip()) for x in raw_multipliers.split(",") if x.strip()]
-        if not kernel_multipliers:
-            raise ValueError("Empty multipliers list")
-    except (ValueError, AttributeError):
-        log.warning(
-            "kernel_multipliers '%s' could not be parsed; using default [1.0, 2.0, 3.0].",
-            raw_multipliers,
-        )
-        kernel_multipliers = [1.0, 2.0, 3.0]
-
-    reject_artifacts = kwargs.get("reject_artifacts", False)
-    artifact_mask = None
-    if reject_artifacts:
-        slope_thresh = kwargs.get("artifact_slope_threshold", 20.0)
-        padding_ms = kwargs.get("artifact_padding_ms", 2.0)
-        artifact_mask = find_artifact_windows(data, sampling_rate, slope_thresh, padding_ms)
-
     result = detect_events_template(
         data=data,
         sampling_rate=sampling_rate,
-        threshold_std=threshold_sd,
-        tau_rise=tau_rise,
-        tau_decay=tau_decay,
-        polarity=direction,
-        rolling_baseline_window_ms=kwargs.get("rolling_baseline_window_ms", 100.0),
-        artifact_mask=artifact_mask,
+        artifact_mask=_template_artifact_mask(data, sampling_rate, kwargs),
         time=time,
-        min_event_distance_ms=kwargs.get("min_event_distance_ms", 0.0),
-        kernel_multipliers=kernel_multipliers,
-        kernel_shape=kwargs.get("kernel_shape", "bi-exponential"),
+        **_template_detection_params(kwargs),
     )
-
-    if not result.is_valid:
-        return {"module_used": "synaptic_events", "metrics": {"event_error": result.error_message}}
-
-    _idx = np.asarray(result.event_indices if result.event_indices is not None else [], dtype=int)
-
-    # Compute local pre-event baseline for each event (handles summating events).
-    local_baselines = compute_local_pre_event_baseline(data, _idx, sampling_rate, polarity=direction)
-    if len(_idx) > 0:
-        if direction == "negative":
-            local_amplitudes = local_baselines - data[_idx]
-        else:
-            local_amplitudes = data[_idx] - local_baselines
-    else:
-        local_amplitudes = np.array([], dtype=float)
-
-    return {
-        "module_used": "synaptic_events",
-        "metrics": {
-            "event_count": result.event_count,
-            "tau_rise_ms": result.tau_rise_ms,
-            "tau_decay_ms": result.tau_decay_ms,
-            "threshold_sd": result.threshold_sd,
-            "mean_local_amplitude": float(np.mean(local_amplitudes)) if local_amplitudes.size > 0 else 0.0,
-            "_event_times": time[_idx].tolist() if len(_idx) > 0 else [],
-            "_event_peaks": data[_idx].tolist() if len(_idx) > 0 else [],
-            "_local_baselines": local_baselines.tolist() if local_baselines.size > 0 else [],
-            "_local_amplitudes": local_amplitudes.tolist() if local_amplitudes.size > 0 else [],
-            "_result_obj": result,
-        },
-    }
+    return _template_wrapper_metrics(result, data, time, sampling_rate, kwargs.get("direction", "negative"))
 
 
 # ---------------------------------------------------------------------------
@@ -1291,6 +1471,8 @@ def detect_events_baseline_peak_kinetics(  # noqa: C901
     auto_baseline: bool = True,
     rolling_baseline_window_ms: float = 0.0,
     peak_prominence_factor: Optional[float] = None,
+    baseline_method: str = DEFAULT_BASELINE_METHOD,
+    baseline_percentile: float = 50.0,
 ) -> EventDetectionResult:
     """
     Detect events via stable-baseline estimation then prominence-based peak finding.
@@ -1319,6 +1501,10 @@ def detect_events_baseline_peak_kinetics(  # noqa: C901
         Window for rolling median baseline correction in ms, by default 0.0.
     peak_prominence_factor : float, optional
         Custom prominence for peak detection. If None, defaults to `threshold_val * 0.5`.
+    baseline_method : str, optional
+        Rolling-baseline estimator (see :mod:`synaptipy.core.baseline_estimators`), by default "median".
+    baseline_percentile : float, optional
+        Percentile for the "percentile" estimator, by default 50.0.
 
     Returns
     -------
@@ -1334,23 +1520,13 @@ def detect_events_baseline_peak_kinetics(  # noqa: C901
 
     is_negative = direction == "negative"
 
-    if rolling_baseline_window_ms > 0:
-        from scipy.ndimage import median_filter
-
-        window_samples = int((rolling_baseline_window_ms / 1000.0) * sample_rate)
-        if window_samples % 2 == 0:
-            window_samples += 1
-        if window_samples >= 3:
-            rolling_bl = median_filter(data, size=window_samples)
-            work_data = data - rolling_bl
-        else:
-            work_data = data
-    else:
-        work_data = data
+    work_data = subtract_rolling_baseline(
+        data, sample_rate, rolling_baseline_window_ms, baseline_method, baseline_percentile
+    )
 
     signal_to_process = -work_data if is_negative else work_data
 
-    noise_sd = median_abs_deviation(signal_to_process, scale="normal")
+    noise_sd = robust_stats.mad(signal_to_process)
     if noise_sd == 0:
         noise_sd = baseline_sd if baseline_sd and baseline_sd > 0 else 1e-12
 
@@ -1441,6 +1617,7 @@ def detect_events_baseline_peak_kinetics(  # noqa: C901
             "max": 5000.0,
             "decimals": 1,
         },
+        *_baseline_estimator_params(),
         {
             "name": "baseline_window_s",
             "label": "Baseline Win (s):",
@@ -1480,6 +1657,8 @@ def run_event_detection_baseline_peak_wrapper(
         baseline_step_s=kwargs.get("baseline_step_s", 0.1),
         rolling_baseline_window_ms=kwargs.get("rolling_baseline_window_ms", 100.0),
         peak_prominence_factor=prominence_param,
+        baseline_method=kwargs.get("baseline_method", DEFAULT_BASELINE_METHOD),
+        baseline_percentile=float(kwargs.get("baseline_percentile", 50.0)),
     )
     if not result.is_valid:
         return {"module_used": "synaptic_events", "metrics": {"event_error": result.error_message}}
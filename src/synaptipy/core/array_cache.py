@@ -0,0 +1,161 @@
+# src/synaptipy/core/array_cache.py
+# -*- coding: utf-8 -*-
+"""
+Byte-bounded LRU storage for shared NumPy arrays.
+
+:class:`ArrayLRUCache` is the common base of the process-wide caches that
+hand the same computed arrays to several consumers
+(:class:`~synaptipy.core.derived_signals.DerivedSignalStore`,
+:class:`~synaptipy.shared.processed_cache.ProcessedTraceCache`).  It owns the
+singleton accessors, the lock, the byte accounting, LRU eviction and the
+hit/miss counters; subclasses decide how keys are built and when entries go
+stale.  Stored arrays are made read-only because they are shared.
+
+:func:`array_fingerprint` is the cheap content check both caches use to
+notice that a source array was replaced or edited in place.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+FINGERPRINT_SAMPLES = 64
+
+
+def array_fingerprint(data: np.ndarray) -> Tuple[Any, ...]:
+    """Buffer address, shape, dtype and a strided sample of the values of *data*."""
+    stride = max(1, data.shape[-1] // FINGERPRINT_SAMPLES) if data.ndim else 1
+    return (
+        data.__array_interface__["data"][0],
+        data.shape,
+        data.dtype.str,
+        data[..., ::stride].tobytes() if data.ndim else data.tobytes(),
+    )
+
+
+class ArrayLRUCache:
+    """
+    Thread-safe LRU of read-only arrays bounded by their total ``nbytes``.
+
+    Every subclass gets its own process-wide instance (:meth:`get_instance`)
+    and its own re-entrant lock.  Each entry carries a *tag* (e.g. a source
+    fingerprint) that :meth:`_lookup` must match for a hit.  The ``_lookup``,
+    ``_store`` and ``_discard`` helpers expect the caller to hold the lock.
+    """
+
+    _instance: Optional["ArrayLRUCache"] = None
+    _lock = threading.RLock()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._instance = None
+        cls._lock = threading.RLock()
+
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes: Budget for stored arrays in bytes.
+        """
+        self.max_bytes = max(0, int(max_bytes))
+        # key -> (tag, array)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, np.ndarray]]" = OrderedDict()
+        self._bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    @classmethod
+    def get_instance(cls):
+        """Get the process-wide instance of this cache class."""
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Drop the process-wide instance (a fresh one is created on next access)."""
+        with cls._lock:
+            cls._instance = None
+
+    # ------------------------------------------------------------------
+    # Entry helpers (lock held)
+    # ------------------------------------------------------------------
+
+    def _lookup(self, key: Hashable, tag: Any = None) -> Optional[np.ndarray]:
+        """Stored array for *key* if its tag equals *tag*; a mismatching entry is dropped."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] != tag:
+            self._discard(key)
+            self._stats["invalidations"] += 1
+            entry = None
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return entry[1]
+
+    def _store(self, key: Hashable, data: np.ndarray, tag: Any = None) -> np.ndarray:
+        """Insert *data* as the most recently used entry and enforce the budget.
+
+        Arrays larger than the whole budget are returned without being stored.
+        """
+        if not isinstance(data, np.ndarray) or data.nbytes > self.max_bytes:
+            return data
+        self._discard(key)
+        data.setflags(write=False)
+        self._entries[key] = (tag, data)
+        self._bytes += data.nbytes
+        self._evict_to_budget()
+        return data
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1].nbytes
+
+    def _evict_to_budget(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            self._on_evicted(oldest)
+            self._stats["evictions"] += 1
+
+    def _on_evicted(self, key: Hashable) -> None:
+        """Hook called after *key* was evicted to fit the budget."""
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def set_memory_budget(self, max_bytes: int) -> None:
+        """Change the byte budget, evicting least recently used entries that no longer fit."""
+        with self._lock:
+            self.max_bytes = max(0, int(max_bytes))
+            self._evict_to_budget()
+
+    def bytes_in_use(self) -> int:
+        with self._lock:
+            return self._bytes
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Entry count, bytes held, budget and hit/miss counters."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+                **self._stats,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
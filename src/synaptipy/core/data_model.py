@@ -15,7 +15,9 @@ from typing import Any, Dict, List, Optional, Tuple  # Added Any for metadata di
 
 import numpy as np
 
+from synaptipy.core.precision import coerce_storage, get_default_storage_dtype, normalize_storage_dtype
 from synaptipy.core.source_interfaces import SourceHandle
+from synaptipy.core.time_axis import TimeAxis
 
 # Configure logger for this module
 log = logging.getLogger(__name__)
@@ -26,12 +28,41 @@ log = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
+# Total bytes of trial buffers an UndoStack may pin before old levels are evicted.
+DEFAULT_UNDO_MAX_BYTES = 512 * 1024 * 1024
+
+
+def _state_buffers(state: Dict[str, Any]) -> Dict[int, np.ndarray]:
+    """Map ``id(owner) -> owner`` for every array buffer referenced by an undo *state*."""
+    buffers: Dict[int, np.ndarray] = {}
+    for value in state.values():
+        items = value if isinstance(value, (list, tuple)) else [value]
+        for item in items:
+            if isinstance(item, np.ndarray):
+                owner = _memory_owner(item)
+                if isinstance(owner, np.ndarray):
+                    buffers[id(owner)] = owner
+    return buffers
+
+
+def _frozen_view(array):
+    """Read-only view of *array* for an undo snapshot; the array itself stays writable."""
+    if not isinstance(array, np.ndarray):
+        return array
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
 class UndoStack:
     """Lightweight state-history stack for non-destructive editing (Command pattern).
 
-    Stores deep-copy snapshots of channel data before destructive operations so
-    that a single :meth:`Channel.undo` call instantly restores the previous state.
-    Memory depth is capped at *max_depth* entries (oldest entries are evicted).
+    Snapshots are copy-on-write: :meth:`Channel.push_undo` stores read-only
+    views of the current trial arrays instead of copying them, so consecutive
+    snapshots share every trial that an edit did not replace.  The
+    stack is bounded both by *max_depth* and by *max_bytes*, the total size of
+    the distinct buffers it keeps alive; the oldest levels are evicted first
+    and the newest level is always kept.
 
     Usage::
 
@@ -41,15 +72,19 @@ class UndoStack:
         channel.undo()  # restores data_trials to state before the filter
     """
 
-    def __init__(self, max_depth: int = 20):
+    def __init__(self, max_depth: int = 20, max_bytes: Optional[int] = DEFAULT_UNDO_MAX_BYTES):
         """
         Initialise the undo stack.
 
         Args:
             max_depth: Maximum number of undo levels retained (default 20).
+            max_bytes: Maximum bytes of distinct array buffers pinned by the
+                stack (default :data:`DEFAULT_UNDO_MAX_BYTES`; ``None`` = no limit).
         """
         self._max_depth = max(1, int(max_depth))
+        self._max_bytes = None if max_bytes is None else max(0, int(max_bytes))
         self._states: List[Tuple[str, Dict[str, Any]]] = []
+        self._buffers: List[Dict[int, np.ndarray]] = []
 
     def push(self, label: str, state: Dict[str, Any]) -> None:
         """Save a named state snapshot.
@@ -59,8 +94,12 @@ class UndoStack:
             state: Arbitrary serialisable dict representing the channel state to restore.
         """
         self._states.append((label, state))
-        if len(self._states) > self._max_depth:
+        self._buffers.append(_state_buffers(state))
+        while len(self._states) > self._max_depth or (
+            self._max_bytes is not None and len(self._states) > 1 and self.nbytes > self._max_bytes
+        ):
             self._states.pop(0)
+            self._buffers.pop(0)
 
     def pop(self) -> Optional[Tuple[str, Dict[str, Any]]]:
         """Remove and return the most recently saved state.
@@ -68,7 +107,10 @@ class UndoStack:
         Returns:
             ``(label, state)`` tuple, or ``None`` if the stack is empty.
         """
-        return self._states.pop() if self._states else None
+        if not self._states:
+            return None
+        self._buffers.pop()
+        return self._states.pop()
 
     def can_undo(self) -> bool:
         """Return ``True`` if at least one undo level is available."""
@@ -79,15 +121,82 @@ class UndoStack:
         """Number of undo levels currently stored."""
         return len(self._states)
 
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of distinct array buffers held by all levels (shared buffers counted once)."""
+        unique: Dict[int, np.ndarray] = {}
+        for buffers in self._buffers:
+            unique.update(buffers)
+        return sum(b.nbytes for b in unique.values())
+
+    def holds(self, array: np.ndarray) -> bool:
+        """``True`` if any level references the buffer underlying *array*."""
+        key = id(_memory_owner(array))
+        return any(key in buffers for buffers in self._buffers)
+
     def clear(self) -> None:
         """Discard all saved states."""
         self._states.clear()
+        self._buffers.clear()
 
     def __repr__(self) -> str:
         labels = [lbl for lbl, _ in self._states]
         return f"UndoStack(depth={self.depth}, labels={labels})"
 
 
+# ---------------------------------------------------------------------------
+# Contiguous trial storage helpers
+# ---------------------------------------------------------------------------
+
+
+def _memory_owner(arr: np.ndarray) -> Any:
+    """Return the object that ultimately owns *arr*'s buffer."""
+    owner = arr
+    while isinstance(owner, np.ndarray) and owner.base is not None:
+        owner = owner.base
+    return owner
+
+
+def stack_trials(trials: List[Optional[np.ndarray]]) -> Optional[np.ndarray]:
+    """Return equal-length 1-D *trials* as one ``(n_trials, n_samples)`` array.
+
+    When the trials are already consecutive rows of a single contiguous block
+    (as stored by :class:`Channel`), the block is returned as a zero-copy
+    view; otherwise the trials are stacked into a new array.
+
+    Returns:
+        The 2-D array, or ``None`` if *trials* is empty, contains non-array
+        entries, or is ragged (different lengths / dtypes).
+    """
+    if not trials:
+        return None
+    first = trials[0]
+    if not isinstance(first, np.ndarray) or first.ndim != 1:
+        return None
+    n_samples, dtype = first.shape[0], first.dtype
+    for t in trials:
+        if not isinstance(t, np.ndarray) or t.ndim != 1 or t.shape[0] != n_samples or t.dtype != dtype:
+            return None
+
+    itemsize = dtype.itemsize
+    row_bytes = n_samples * itemsize
+    if n_samples > 0 and all(t.strides == (itemsize,) for t in trials):
+        owner = _memory_owner(first)
+        base_ptr = first.__array_interface__["data"][0]
+        if all(
+            _memory_owner(t) is owner and t.__array_interface__["data"][0] == base_ptr + i * row_bytes
+            for i, t in enumerate(trials)
+        ):
+            return np.lib.stride_tricks.as_strided(
+                first, shape=(len(trials), n_samples), strides=(row_bytes, itemsize), writeable=first.flags.writeable
+            )
+    return np.stack(trials)
+
+
 class Channel:
     """
     Represents a single channel of recorded data, potentially across multiple
@@ -123,14 +232,22 @@ class Channel:
         self.t_start: float = 0.0  # Absolute start time relative to recording start (set by adapter)
 
         # --- Data Trials Validation and Assignment ---
-        # For lazy loading, data_trials may be empty initially
-        if not isinstance(data_trials, list):
+        # Equal-length trials are packed into one contiguous (n_trials, n_samples)
+        # block and ``data_trials`` holds zero-copy row views of it (see the
+        # ``data_trials`` setter).  Ragged or partially loaded trials stay a list.
+        self._trial_matrix: Optional[np.ndarray] = None
+        self._matrix_rows: Tuple[np.ndarray, ...] = ()
+        self._data_trials: List[Optional[np.ndarray]] = []
+        # True while an undo snapshot shares the live trial buffers (see push_undo)
+        self._undo_shared = False
+        if isinstance(data_trials, np.ndarray) and data_trials.ndim == 2:
+            # A 2-D block is interpreted as (n_trials, n_samples).
+            self.data_trials = data_trials
+        elif not isinstance(data_trials, list):
             log.warning(f"Channel '{name}' received non-list data. Attempting conversion.")
             try:
                 # Ensure data is numpy array and handle potential conversion errors
-                self.data_trials: List[np.ndarray] = (
-                    [np.asarray(data_trials, dtype=float)] if data_trials is not None else []
-                )
+                self.data_trials = [np.asarray(data_trials, dtype=float)] if data_trials is not None else []
             except (TypeError, ValueError) as e:
                 log.error(f"Could not convert data_trials for channel '{name}' to list of arrays: {e}")
                 self.data_trials = []  # Assign empty list on failure
@@ -138,16 +255,15 @@ class Channel:
             # For lazy loading, data_trials may be empty or contain actual data
             if data_trials and all(isinstance(t, np.ndarray) for t in data_trials):
                 # Normal case: data is already loaded
-                self.data_trials: List[np.ndarray] = [np.asarray(t) for t in data_trials]
+                self.data_trials = [np.asarray(t) for t in data_trials]
             else:
                 # Lazy loading case: empty data_trials
                 # Ensure it's a list so we can append later.
-                # Crucially, we might want to pre-allocate None slots if we know num_trials (from metadata?)
                 # But for now, empty list is safer than [[]] which implies 1 empty trial.
-                self.data_trials: List[Optional[np.ndarray]] = []
+                self.data_trials = []
 
         # --- ADDED: Attributes for Associated Current Data ---
-        self.current_data_trials: List[np.ndarray] = []  # Populated by adapter if current signal found
+        self._current_data_trials: List[np.ndarray] = []  # Populated by adapter if current signal found
         self.current_units: Optional[str] = None  # Populated by adapter
         # --- END ADDED ---
 
@@ -174,13 +290,162 @@ class Channel:
         # --- Undo stack (non-destructive editing) ---
         self._undo_stack: UndoStack = UndoStack()
 
+    # --- Trial storage ---
+
+    @property
+    def storage_dtype(self) -> Optional[np.dtype]:
+        """Dtype trials are stored in: the owning Recording's policy, else the global one (``None`` = as read)."""
+        recording = getattr(self, "_recording_ref", None)
+        dtype = getattr(recording, "storage_dtype", None)
+        return dtype if dtype is not None else get_default_storage_dtype()
+
+    @property
+    def data_trials(self) -> List[Optional[np.ndarray]]:
+        """Per-trial arrays.  Row views of :attr:`trial_matrix` when trials share one block."""
+        self._detach_from_undo()
+        return self._data_trials
+
+    @data_trials.setter
+    def data_trials(self, trials) -> None:
+        dtype = self.storage_dtype
+        if isinstance(trials, np.ndarray) and trials.ndim == 2:
+            matrix = coerce_storage(trials, dtype)
+        else:
+            trials = [coerce_storage(t, dtype) for t in trials] if trials is not None else []
+            matrix = stack_trials(trials) if trials else None
+            if matrix is None:
+                self._trial_matrix, self._matrix_rows = None, ()
+                self._data_trials = trials
+                self._undo_shared = self._shares_undo_buffers()
+                return
+        self._trial_matrix = matrix
+        self._matrix_rows = tuple(matrix)
+        self._data_trials = list(self._matrix_rows)
+        self._undo_shared = self._shares_undo_buffers()
+
+    @property
+    def current_data_trials(self) -> List[np.ndarray]:
+        """Per-trial command/current arrays stored under the same precision policy as ``data_trials``."""
+        return self._current_data_trials
+
+    @current_data_trials.setter
+    def current_data_trials(self, trials) -> None:
+        dtype = self.storage_dtype
+        self._current_data_trials = [coerce_storage(t, dtype) for t in trials] if trials is not None else []
+
+    def apply_storage_dtype(self) -> None:
+        """Re-store loaded trials after the precision policy changed."""
+        with self._load_lock:
+            matrix = self.trial_matrix
+            self.data_trials = matrix if matrix is not None else self._data_trials
+            self.current_data_trials = self._current_data_trials
+
+    @property
+    def trial_matrix(self) -> Optional[np.ndarray]:
+        """The contiguous ``(n_trials, n_samples)`` block, or ``None`` for ragged/list storage.
+
+        Returns ``None`` as soon as ``data_trials`` has been modified element-wise
+        (e.g. ``data_trials[i] = filtered``) so callers never see stale data.
+        """
+        self._detach_from_undo()
+        return self._live_matrix()
+
+    def _live_matrix(self) -> Optional[np.ndarray]:
+        """:attr:`trial_matrix` for read-only use inside the channel (no copy-on-write detach)."""
+        if self._trial_matrix is None:
+            return None
+        rows, trials = self._matrix_rows, self._data_trials
+        if len(rows) != len(trials) or any(a is not b for a, b in zip(rows, trials)):
+            self._trial_matrix, self._matrix_rows = None, ()
+            return None
+        return self._trial_matrix
+
+    def get_trial_matrix(self, trial_indices: Optional[List[int]] = None) -> Optional[np.ndarray]:
+        """Return the requested trials as one 2-D ``(n_trials, n_samples)`` array.
+
+        Lazily loaded trials are fetched first and, once every trial is present
+        and of equal length, packed into contiguous storage so later calls are
+        zero-copy.  A full or contiguous-range selection is a view; any other
+        selection is a fancy-indexed copy.
+
+        Returns:
+            The 2-D array, or ``None`` if trials are missing or ragged.
+        """
+        self._detach_from_undo()
+        return self._packed_trial_matrix(trial_indices)
+
+    def _packed_trial_matrix(self, trial_indices: Optional[List[int]] = None) -> Optional[np.ndarray]:
+        """:meth:`get_trial_matrix` for read-only use inside the channel (no copy-on-write detach)."""
+        n = self.num_trials
+        indices = list(range(n)) if trial_indices is None else [int(i) for i in trial_indices]
+        if not indices or any(i < 0 or i >= n for i in indices):
+            return None
+        matrix = self._live_matrix()
+        if matrix is None:
+            self.load_trials(None if trial_indices is None else indices)
+            if len(self._data_trials) == n and all(t is not None for t in self._data_trials):
+                self.data_trials = self._data_trials  # consolidate into one block
+                matrix = self._live_matrix()
+            if matrix is None:
+                if any(i >= len(self._data_trials) for i in indices):
+                    return None
+                return stack_trials([self._data_trials[i] for i in indices])
+        if indices == list(range(indices[0], indices[-1] + 1)):
+            return matrix[indices[0] : indices[-1] + 1]
+        return matrix[indices]
+
+    def _missing_trials(self, trial_indices: Optional[List[int]] = None) -> List[int]:
+        """Valid trial indices (sorted, unique) whose data has not been loaded yet."""
+        n = self.num_trials
+        indices = range(n) if trial_indices is None else sorted({int(i) for i in trial_indices if 0 <= int(i) < n})
+        trials = self._data_trials
+        return [i for i in indices if i >= len(trials) or trials[i] is None]
+
+    def _source_handle(self) -> Optional[SourceHandle]:
+        return getattr(getattr(self, "_recording_ref", None), "source_handle", None)
+
+    def _store_loaded_trials(self, indices: List[int], trials: np.ndarray) -> None:
+        """Insert bulk-loaded *trials* (rows matching *indices*); caller holds ``_load_lock``."""
+        n = self.num_trials
+        trials = coerce_storage(trials, self.storage_dtype)
+        if indices == list(range(n)) and not any(t is not None for t in self._data_trials):
+            self.data_trials = trials  # whole channel: keep the block contiguous
+            return
+        while len(self._data_trials) < n:
+            self._data_trials.append(None)
+        for row, idx in enumerate(indices):
+            if self._data_trials[idx] is None:
+                self._data_trials[idx] = trials[row]
+
+    def load_trials(self, trial_indices: Optional[List[int]] = None) -> None:
+        """Fetch lazily loaded trials (all by default) ahead of use.
+
+        When the recording's source handle provides ``load_block`` the missing
+        trials are read in one bulk pass instead of one seek per trial; any
+        trial it cannot deliver falls back to the per-trial loader.
+        """
+        if not self.loader:
+            return
+        missing = self._missing_trials(trial_indices)
+        if not missing:
+            return
+        handle = self._source_handle()
+        if handle is not None and hasattr(handle, "load_block"):
+            with self._load_lock:
+                missing = self._missing_trials(missing)
+                block = handle.load_block([self.id], missing) if missing else None
+                if isinstance(block, np.ndarray) and block.shape[:2] == (1, len(missing)):
+                    self._store_loaded_trials(missing, block[0])
+        for idx in self._missing_trials(missing):
+            self.get_data(idx)
+
     @property
     def num_trials(self) -> int:
         """Returns the number of trials/segments available for this channel."""
         # For lazy loading, check metadata first, then data_trials
         if hasattr(self, "metadata") and "num_trials" in self.metadata:
             return self.metadata["num_trials"]
-        return len(self.data_trials)
+        return len(self._data_trials)
 
     @property
     def num_samples(self) -> int:
@@ -192,18 +457,21 @@ class Channel:
 
         Returns 0 if no trials are present.
         """
-        if not self.data_trials:
+        matrix = self._live_matrix()
+        if matrix is not None:
+            return matrix.shape[1]
+        if not self._data_trials:
             return 0
         # Ensure the first trial is valid before accessing shape
-        if not isinstance(self.data_trials[0], np.ndarray) or self.data_trials[0].ndim == 0:
+        if not isinstance(self._data_trials[0], np.ndarray) or self._data_trials[0].ndim == 0:
             log.warning(f"Channel '{self.name}': First trial is not a valid NumPy array.")
             return 0
 
-        first_trial_len = self.data_trials[0].shape[0]
+        first_trial_len = self._data_trials[0].shape[0]
         # Check other trials more carefully
         lengths = set()
         valid_trial_found = False
-        for arr in self.data_trials:
+        for arr in self._data_trials:
             if isinstance(arr, np.ndarray) and arr.ndim > 0:
                 lengths.add(arr.shape[0])
                 valid_trial_found = True
@@ -228,11 +496,14 @@ class Channel:
         Raises ValueError if trials have different lengths.
         Returns 0 if no trials.
         """
-        if not self.data_trials:
+        matrix = self._live_matrix()
+        if matrix is not None:
+            return matrix.shape[1]
+        if not self._data_trials:
             return 0
 
         lengths = set()
-        for arr in self.data_trials:
+        for arr in self._data_trials:
             if isinstance(arr, np.ndarray) and arr.ndim > 0:
                 lengths.add(arr.shape[0])
 
@@ -255,10 +526,13 @@ class Channel:
             log.warning(f"Channel {self.id}: Negative trial index {trial_index} requested. Returning None.")
             return None
 
-        if self.data_trials and trial_index >= len(self.data_trials):
+        # Lazy channels know their trial count from metadata before all trials are loaded.
+        lazy_count = self.metadata.get("num_trials") if self.loader else None
+        available = lazy_count if lazy_count is not None else len(self.data_trials)
+        if self.data_trials and trial_index >= available:
             log.warning(
                 f"Channel {self.id}: Trial index {trial_index} exceeds available trials "
-                f"(max index: {len(self.data_trials) - 1}). Returning None."
+                f"(max index: {available - 1}). Returning None."
             )
             return None
 
@@ -288,6 +562,7 @@ class Channel:
                         return None
 
                     if data is not None:
+                        data = coerce_storage(data, self.storage_dtype)
                         # Store valid data to avoid re-loading
                         # Ensure data_trials list is long enough
                         while len(self.data_trials) <= trial_index:
@@ -304,50 +579,119 @@ class Channel:
 
     # _load_trial_data_lazy removed (moved to ChannelLoader strategy)
 
-    def get_time_vector(self, trial_index: int) -> Optional[np.ndarray]:
-        # Returns the absolute time vector for a specific trial.
+    def _trial_length(self, trial_index: int) -> Optional[int]:
+        """Sample count of one trial, read from the trial block shape when available."""
+        matrix = self._live_matrix()
+        if matrix is not None and 0 <= trial_index < matrix.shape[0]:
+            return matrix.shape[1]
+        if self.loader and trial_index in self._missing_trials([trial_index]):
+            # Ask the source for the length instead of loading the trial
+            handle = self._source_handle()
+            length = handle.trial_length(self.id, trial_index) if hasattr(handle, "trial_length") else None
+            if isinstance(length, (int, np.integer)):
+                return int(length)
         data = self.get_data(trial_index)
-        if data is not None and self.sampling_rate and self.sampling_rate > 0:
-            num_samples = len(data)
+        return len(data) if data is not None else None
+
+    def get_window_indices(
+        self, trial_index: int, t_start: Optional[float] = None, t_end: Optional[float] = None
+    ) -> Optional[Tuple[int, int]]:
+        """Sample range ``[i_start, i_stop)`` covering ``t_start <= t < t_end`` (trial-relative seconds).
+
+        ``None`` bounds extend to the start/end of the trial.  Returns ``None``
+        if the trial length is unknown.
+        """
+        axis = self.get_relative_time_axis(trial_index)
+        if axis is None:
+            return None
+        i_start = axis.searchsorted(t_start, side="left") if t_start is not None else 0
+        i_stop = axis.searchsorted(t_end, side="left") if t_end is not None else len(axis)
+        return int(i_start), max(int(i_start), int(i_stop))
+
+    def get_data_window(
+        self, trial_index: int, t_start: Optional[float] = None, t_end: Optional[float] = None
+    ) -> Optional[np.ndarray]:
+        """Samples of one trial with ``t_start <= t < t_end`` (trial-relative seconds).
+
+        Loaded trials return a zero-copy view.  For lazily loaded trials the
+        source handle's ``load_window`` reads only the requested samples and
+        the result is *not* stored in ``data_trials``; without it the whole
+        trial is loaded and sliced.  Pair with
+        ``get_relative_time_axis(trial)[i_start:i_stop]`` (see
+        :meth:`get_window_indices`) for the matching time values.
+        """
+        bounds = self.get_window_indices(trial_index, t_start, t_end)
+        if bounds is None:
+            return None
+        return self.get_data_slice(trial_index, *bounds)
+
+    def get_data_slice(self, trial_index: int, i_start: int, i_stop: int) -> Optional[np.ndarray]:
+        """Samples ``i_start:i_stop`` of one trial, read like :meth:`get_data_window`.
+
+        Index-based counterpart of :meth:`get_data_window` for callers that walk
+        a trial in blocks (see :mod:`synaptipy.core.streaming_filter`).
+        """
+        if self.loader and trial_index in self._missing_trials([trial_index]):
+            handle = self._source_handle()
+            if handle is not None and hasattr(handle, "load_window"):
+                window = handle.load_window(self.id, trial_index, i_start, i_stop)
+                if isinstance(window, np.ndarray):
+                    return coerce_storage(window, self.storage_dtype)
+        data = self.get_data(trial_index)
+        return data[i_start:i_stop] if data is not None else None
+
+    def get_time_axis(self, trial_index: int) -> Optional[TimeAxis]:
+        """Absolute time axis of a trial as an allocation-free :class:`TimeAxis`."""
+        num_samples = self._trial_length(trial_index)
+        if num_samples is not None and self.sampling_rate and self.sampling_rate > 0:
             duration = num_samples / self.sampling_rate
             trial_t_start = self.t_start + trial_index * duration  # Approximate start time
-            return np.linspace(trial_t_start, trial_t_start + duration, num_samples, endpoint=False)
+            return TimeAxis.from_linspace(trial_t_start, trial_t_start + duration, num_samples)
         return None
 
+    def get_relative_time_axis(self, trial_index: int) -> Optional[TimeAxis]:
+        """Trial-relative time axis (starts at 0) as an allocation-free :class:`TimeAxis`."""
+        num_samples = self._trial_length(trial_index)
+        if num_samples is not None and self.sampling_rate and self.sampling_rate > 0:
+            return TimeAxis.from_linspace(0, num_samples / self.sampling_rate, num_samples)
+        return None
+
+    def get_time_vector(self, trial_index: int) -> Optional[np.ndarray]:
+        # Returns the absolute time vector for a specific trial (dense copy of get_time_axis).
+        axis = self.get_time_axis(trial_index)
+        return axis.materialize() if axis is not None else None
+
     def get_relative_time_vector(self, trial_index: int) -> Optional[np.ndarray]:
         # Returns the time vector relative to the start of the trial (starts at 0).
-        data = self.get_data(trial_index)
-        if data is not None and self.sampling_rate and self.sampling_rate > 0:
-            num_samples = len(data)
-            duration = num_samples / self.sampling_rate
-            return np.linspace(0, duration, num_samples, endpoint=False)
-        return None
+        axis = self.get_relative_time_axis(trial_index)
+        return axis.materialize() if axis is not None else None
 
     def get_averaged_data(self, trial_indices: Optional[List[int]] = None) -> Optional[np.ndarray]:
         # Returns the averaged data across all (or specified) trials.
 
         # Ensure trials are loaded (lazy loading support)
-        indices_to_load = trial_indices if trial_indices is not None else list(range(self.num_trials))
-        for idx in indices_to_load:
-            # get_data handles the lock and lazy load internally
-            self.get_data(idx)
+        if trial_indices is None:
+            # Loads every trial and packs equal-length trials into one block
+            self._packed_trial_matrix()
+        else:
+            self.load_trials(trial_indices)
 
-        if self.data_trials:
+        if self._data_trials:
             try:
                 # Determine which trials to use
                 if trial_indices is not None and len(trial_indices) > 0:
                     # Validate indices and warn about out-of-range values
-                    invalid_indices = [i for i in trial_indices if i < 0 or i >= len(self.data_trials)]
+                    invalid_indices = [i for i in trial_indices if i < 0 or i >= len(self._data_trials)]
                     if invalid_indices:
                         log.warning(
                             f"Channel {self.id}: Trial indices {invalid_indices} are out of range "
-                            f"(valid range: 0-{len(self.data_trials) - 1}). These will be ignored."
+                            f"(valid range: 0-{len(self._data_trials) - 1}). These will be ignored."
                         )
 
-                    valid_indices = [i for i in trial_indices if 0 <= i < len(self.data_trials)]
-                    trials_to_avg = [self.data_trials[i] for i in valid_indices if self.data_trials[i] is not None]
+                    valid_indices = [i for i in trial_indices if 0 <= i < len(self._data_trials)]
+                    trials_to_avg = [self._data_trials[i] for i in valid_indices if self._data_trials[i] is not None]
                 else:
-                    trials_to_avg = [t for t in self.data_trials if t is not None]
+                    trials_to_avg = [t for t in self._data_trials if t is not None]
 
                 if not trials_to_avg:
                     return None
@@ -355,7 +699,11 @@ class Channel:
                 # Ensure all trials have the same length for simple averaging
                 first_len = len(trials_to_avg[0])
                 if all(len(trial) == first_len for trial in trials_to_avg):
-                    return np.mean(np.array(trials_to_avg), axis=0)
+                    # Zero-copy when the trials are consecutive rows of the channel's block
+                    stacked = stack_trials(trials_to_avg)
+                    if stacked is None:
+                        stacked = np.array(trials_to_avg)
+                    return np.mean(stacked, axis=0)
                 else:
                     # Handle differing lengths by padding with NaNs and using nanmean
                     max_len = max(len(t) for t in trials_to_avg)
@@ -380,23 +728,36 @@ class Channel:
                 return None
         return None
 
-    def get_averaged_time_vector(self) -> Optional[np.ndarray]:
-        # Returns the absolute time vector for the averaged data (assumes first trial time base).
+    def _averaged_length(self) -> Optional[int]:
+        matrix = self._live_matrix()
+        if matrix is not None and matrix.shape[0] == self.num_trials:
+            return matrix.shape[1]
         avg_data = self.get_averaged_data()
-        if avg_data is not None and self.sampling_rate and self.sampling_rate > 0:
-            num_samples = len(avg_data)
-            duration = num_samples / self.sampling_rate
-            return np.linspace(self.t_start, self.t_start + duration, num_samples, endpoint=False)
+        return len(avg_data) if avg_data is not None else None
+
+    def get_averaged_time_axis(self) -> Optional[TimeAxis]:
+        """Absolute time axis of the averaged trace (first-trial time base)."""
+        num_samples = self._averaged_length()
+        if num_samples is not None and self.sampling_rate and self.sampling_rate > 0:
+            return TimeAxis.from_linspace(self.t_start, self.t_start + num_samples / self.sampling_rate, num_samples)
+        return None
+
+    def get_relative_averaged_time_axis(self) -> Optional[TimeAxis]:
+        """Relative time axis (starts at 0) of the averaged trace."""
+        num_samples = self._averaged_length()
+        if num_samples is not None and self.sampling_rate and self.sampling_rate > 0:
+            return TimeAxis.from_linspace(0, num_samples / self.sampling_rate, num_samples)
         return None
 
+    def get_averaged_time_vector(self) -> Optional[np.ndarray]:
+        # Returns the absolute time vector for the averaged data (assumes first trial time base).
+        axis = self.get_averaged_time_axis()
+        return axis.materialize() if axis is not None else None
+
     def get_relative_averaged_time_vector(self) -> Optional[np.ndarray]:
         # Returns the time vector relative to the start of the averaged data (starts at 0).
-        avg_data = self.get_averaged_data()
-        if avg_data is not None and self.sampling_rate and self.sampling_rate > 0:
-            num_samples = len(avg_data)
-            duration = num_samples / self.sampling_rate
-            return np.linspace(0, duration, num_samples, endpoint=False)
-        return None
+        axis = self.get_relative_averaged_time_axis()
+        return axis.materialize() if axis is not None else None
 
     def get_current_data(self, trial_index: int) -> Optional[np.ndarray]:
         # Returns the current data for a specific trial, if available.
@@ -434,11 +795,14 @@ class Channel:
 
     def get_data_bounds(self) -> Optional[Tuple[float, float]]:
         """Returns the min and max values across all trials for this channel."""
-        if not self.data_trials or not any(trial.size > 0 for trial in self.data_trials):
+        matrix = self._live_matrix()
+        if matrix is not None and matrix.size > 0:
+            return float(np.min(matrix)), float(np.max(matrix))
+        if not self._data_trials or not any(trial.size > 0 for trial in self._data_trials):
             return None
 
-        min_val = np.min([np.min(trial) for trial in self.data_trials if trial.size > 0])
-        max_val = np.max([np.max(trial) for trial in self.data_trials if trial.size > 0])
+        min_val = np.min([np.min(trial) for trial in self._data_trials if trial.size > 0])
+        max_val = np.max([np.max(trial) for trial in self._data_trials if trial.size > 0])
 
         return float(min_val), float(max_val)
 
@@ -447,13 +811,13 @@ class Channel:
         Returns the min and max values across all trials, ensuring they are finite.
         Returns None if no finite data is found.
         """
-        if not self.data_trials or not any(trial.size > 0 for trial in self.data_trials):
+        if not self._data_trials or not any(trial.size > 0 for trial in self._data_trials):
             return None
 
         try:
             # Concatenate all finite data from all trials
             all_finite_data = np.concatenate(
-                [trial[np.isfinite(trial)] for trial in self.data_trials if trial.size > 0]
+                [trial[np.isfinite(trial)] for trial in self._data_trials if trial.size > 0]
             )
 
             if all_finite_data.size == 0:
@@ -473,16 +837,54 @@ class Channel:
         """Save the current ``data_trials`` state so that :meth:`undo` can restore it.
 
         Call this *before* any destructive operation (filter, event deletion, …).
+        The snapshot stores read-only views of the trial arrays instead of
+        copies; the channel copies its trials the next time they are handed
+        out (``data_trials``, ``trial_matrix``, ``get_data``, …), so in-place
+        edits after this call never reach the saved state.
 
         Args:
             label: Short human-readable description of the upcoming change
                    (e.g. ``"lowpass 300 Hz"``).  Stored for UI display only.
         """
-        snapshot = {
-            "data_trials": [t.copy() if isinstance(t, np.ndarray) else t for t in self.data_trials],
-        }
+        matrix = self._live_matrix()
+        if matrix is not None:
+            # Shared contiguous block; restored as a 2-D block by the data_trials setter
+            snapshot = {"data_trials": _frozen_view(matrix)}
+        else:
+            snapshot = {"data_trials": [_frozen_view(t) for t in self._data_trials]}
         self._undo_stack.push(label, snapshot)
-        log.debug("Channel '%s': pushed undo state '%s' (stack depth %d).", self.name, label, self._undo_stack.depth)
+        self._undo_shared = self._shares_undo_buffers()
+        log.debug(
+            "Channel '%s': pushed undo state '%s' (stack depth %d, %d bytes pinned).",
+            self.name,
+            label,
+            self._undo_stack.depth,
+            self._undo_stack.nbytes,
+        )
+
+    def _shares_undo_buffers(self) -> bool:
+        """``True`` if any live trial buffer is also referenced by an undo level."""
+        stack = getattr(self, "_undo_stack", None)
+        if stack is None or not stack.can_undo():
+            return False
+        arrays = [self._trial_matrix] if self._trial_matrix is not None else self._data_trials
+        return any(isinstance(arr, np.ndarray) and stack.holds(arr) for arr in arrays)
+
+    def _detach_from_undo(self) -> None:
+        """Copy trials shared with an undo snapshot before they leave the channel.
+
+        This is the "copy" half of copy-on-write; it is a no-op unless
+        :meth:`push_undo` (or :meth:`undo`) left the live trials sharing a
+        snapshot's buffers.  Copying a packed channel keeps its block contiguous.
+        """
+        if not self._undo_shared:
+            return
+        matrix = self._live_matrix()
+        if matrix is not None:
+            self.data_trials = matrix.copy()
+        else:
+            self._data_trials = [t.copy() if isinstance(t, np.ndarray) else t for t in self._data_trials]
+        self._undo_shared = False
 
     def undo(self) -> bool:
         """Restore ``data_trials`` to the last saved state.
@@ -495,10 +897,23 @@ class Channel:
             log.debug("Channel '%s': undo requested but stack is empty.", self.name)
             return False
         label, snapshot = entry
+        # Restored views stay read-only (and are copied on access) while an older level still shares them
         self.data_trials = snapshot["data_trials"]
+        self._release_unshared_trials()
         log.debug("Channel '%s': undid '%s' (stack depth now %d).", self.name, label, self._undo_stack.depth)
         return True
 
+    def _release_unshared_trials(self) -> None:
+        """Make restored trials writable again once no remaining undo level shares them."""
+        matrix = self._live_matrix()
+        arrays = ([matrix] if matrix is not None else []) + list(self._data_trials)
+        for arr in arrays:
+            if isinstance(arr, np.ndarray) and not arr.flags.writeable and not self._undo_stack.holds(arr):
+                try:
+                    arr.flags.writeable = True
+                except ValueError:  # buffer is read-only at its source (e.g. a memmap)
+                    pass
+
     @property
     def can_undo(self) -> bool:
         """``True`` when at least one undo level is available."""
@@ -552,10 +967,49 @@ class Recording:
         # explicitly set by the file reader or the experimenter.
         self.recording_temperature: float = 22.0
 
-        # --- Lazy Loading Support ---
         # --- Lazy Loading Support ---
         self.source_handle: Optional[SourceHandle] = None  # Decoupled handle for lazy loading
 
+        # Trial storage dtype for this recording (None = follow the global policy
+        # in synaptipy.core.precision).  Change it with set_storage_dtype().
+        self.storage_dtype: Optional[np.dtype] = None
+
+    def set_storage_dtype(self, dtype: Any) -> None:
+        """Set this recording's trial storage dtype and convert already loaded trials.
+
+        Args:
+            dtype: ``"float32"``, ``"float64"`` or ``None`` to follow the global
+                policy.  Lazily loaded trials adopt it as they are read.
+        """
+        self.storage_dtype = normalize_storage_dtype(dtype)
+        for channel in self.channels.values():
+            channel.apply_storage_dtype()
+
+    def load_trials(self, channel_ids: Optional[List[str]] = None, trial_indices: Optional[List[int]] = None) -> None:
+        """Fetch lazily loaded trials of several channels in one pass over the source.
+
+        Uses ``source_handle.load_block`` (one sequential read covering every
+        requested channel per segment) when available, then lets each
+        :meth:`Channel.load_trials` fill whatever is still missing.
+
+        Args:
+            channel_ids: Channels to load (default: all).
+            trial_indices: Trials to load (default: all).
+        """
+        ids = list(self.channels) if channel_ids is None else [c for c in channel_ids if c in self.channels]
+        lazy = [self.channels[c] for c in ids if self.channels[c].loader]
+        handle = self.source_handle
+        if lazy and handle is not None and hasattr(handle, "load_block"):
+            wanted = sorted({i for ch in lazy for i in ch._missing_trials(trial_indices)})
+            if wanted:
+                block = handle.load_block([ch.id for ch in lazy], wanted)
+                if isinstance(block, np.ndarray) and block.shape[:2] == (len(lazy), len(wanted)):
+                    for row, ch in enumerate(lazy):
+                        with ch._load_lock:
+                            ch._store_loaded_trials(wanted, block[row])
+        for ch in lazy:
+            ch.load_trials(trial_indices)
+
     def add_preprocessing_step(self, operation: str, parameters: Dict[str, Any]) -> None:
         """
         Log a preprocessing operation to the processing_history for reproducibility.
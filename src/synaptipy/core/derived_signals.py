@@ -0,0 +1,171 @@
+# src/synaptipy/core/derived_signals.py
+# -*- coding: utf-8 -*-
+"""
+Shared store of signals derived from a trace (filtered copies, dV/dt).
+
+Spike detection, AP feature extraction, phase-plane and kink-threshold
+analysis, F-I, burst and train-dynamics wrappers all low-pass and
+differentiate the same sweep.  When several of them run on one trace - in a
+batch pipeline or while the user switches analysis tabs - the
+:class:`DerivedSignalStore` lets the work be done once.
+
+Entries are keyed by the *identity* of the source array (held through a weak
+reference, so they disappear with the trace) and a hashable spec such as
+``("lowpass", "butter", 4, 5000.0, dt)``.  A cheap fingerprint of the source
+(buffer address, shape, dtype and a strided sample of the values) guards
+against in-place edits.  The store is bounded in bytes with LRU eviction and
+returns read-only arrays because they are shared between analyses.
+"""
+
+import functools
+import logging
+import weakref
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+from synaptipy.core.array_cache import ArrayLRUCache, array_fingerprint
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_DERIVED_BYTES = 256 * 1024**2  # 256 MiB
+
+_Key = Tuple[int, Hashable]
+
+
+class DerivedSignalStore(ArrayLRUCache):
+    """Byte-bounded LRU store of arrays derived from live source traces."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_DERIVED_BYTES):
+        """
+        Args:
+            max_bytes: Budget for stored derived arrays in bytes.
+        """
+        super().__init__(max_bytes)
+        # id(source) -> (weak reference, fingerprint, specs stored for it)
+        self._owners: Dict[int, Tuple[weakref.ref, Tuple[Any, ...], set]] = {}
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get_or_compute(self, source: Any, spec: Hashable, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """Derived array *spec* of *source*, calling *compute* only if it is not stored.
+
+        Sources that are not NumPy arrays are passed straight to *compute*.
+        """
+        if not isinstance(source, np.ndarray) or self.max_bytes == 0:
+            return compute()
+        owner = id(source)
+        fingerprint = array_fingerprint(source)
+        with self._lock:
+            record = self._owners.get(owner)
+            if record is not None and (record[0]() is not source or record[1] != fingerprint):
+                # Same id reused by a new array, or the source was edited in place
+                self._drop_owner(owner)
+                self._stats["invalidations"] += 1
+                record = None
+            if record is not None:
+                cached = self._lookup((owner, spec))
+                if cached is not None:
+                    return cached
+            else:
+                self._stats["misses"] += 1
+
+        result = compute()
+        if not isinstance(result, np.ndarray) or result is source or result.nbytes > self.max_bytes:
+            return result
+        with self._lock:
+            record = self._owners.get(owner)
+            if record is None:
+                ref = weakref.ref(source, functools.partial(self._on_source_collected, owner))
+                record = (ref, fingerprint, set())
+                self._owners[owner] = record
+            elif record[0]() is not source:
+                return result
+            record[2].add(spec)
+            return self._store((owner, spec), result)
+
+    def _on_source_collected(self, owner: int, _ref: weakref.ref) -> None:
+        with self._lock:
+            record = self._owners.get(owner)
+            if record is not None and record[0] is _ref:
+                self._drop_owner(owner)
+
+    def _drop_owner(self, owner: int) -> None:
+        record = self._owners.pop(owner, None)
+        if record is not None:
+            for spec in record[2]:
+                self._discard((owner, spec))
+
+    def _on_evicted(self, key: _Key) -> None:
+        owner, spec = key
+        record = self._owners.get(owner)
+        if record is not None:
+            record[2].discard(spec)
+            if not record[2]:
+                del self._owners[owner]
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def invalidate(self, source: Any = None) -> None:
+        """Forget everything derived from *source*, or the whole store when ``None``."""
+        with self._lock:
+            if source is None:
+                super().clear()
+                self._owners.clear()
+            else:
+                self._drop_owner(id(source))
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self.invalidate()
+
+
+# ---------------------------------------------------------------------------
+# Shared derived signals
+# ---------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=64)
+def lowpass_sos(family: str, order: int, cutoff_hz: float, dt: float) -> Optional[np.ndarray]:
+    """
+    Low-pass SOS (``"butter"`` or ``"bessel"``) for sample spacing *dt*; ``None`` at/above Nyquist.
+
+    The array is shared between callers and must not be modified.  It is left
+    writable because ``scipy.signal.sosfilt`` rejects read-only SOS buffers.
+    """
+    nyq = 0.5 / dt
+    if not cutoff_hz < nyq:
+        return None
+    from scipy import signal
+
+    design = {"butter": signal.butter, "bessel": signal.bessel}[family]
+    return design(order, cutoff_hz, btype="low", output="sos", fs=1.0 / dt)
+
+
+def lowpass_filtered(data: np.ndarray, dt: float, cutoff_hz: float, family: str = "butter", order: int = 4):
+    """Zero-phase low-passed *data* (unchanged *data* when the cutoff is at/above Nyquist), shared per trace."""
+    sos = lowpass_sos(family, order, float(cutoff_hz), float(dt))
+    if sos is None:
+        return data
+
+    def _compute() -> np.ndarray:
+        from scipy.signal import sosfiltfilt
+
+        return sosfiltfilt(sos, data, axis=-1)
+
+    return DerivedSignalStore.get_instance().get_or_compute(
+        data, ("lowpass", family, order, float(cutoff_hz), float(dt)), _compute
+    )
+
+
+def lowpass_dvdt(data: np.ndarray, dt: float, cutoff_hz: float, family: str = "butter", order: int = 4):
+    """``np.gradient`` (per second) of :func:`lowpass_filtered` *data*, shared per trace."""
+    return DerivedSignalStore.get_instance().get_or_compute(
+        data,
+        ("dvdt", family, order, float(cutoff_hz), float(dt)),
+        lambda: np.gradient(lowpass_filtered(data, dt, cutoff_hz, family, order), dt, axis=-1),
+    )
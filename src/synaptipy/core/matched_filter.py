@@ -0,0 +1,164 @@
+# src/synaptipy/core/matched_filter.py
+# -*- coding: utf-8 -*-
+"""
+Matched-filter kernel banks for template event detection.
+
+Template matching correlates a trace with several PSC-shaped kernels (the
+same rise/decay shape with the decay scaled by a list of multipliers).
+Doing that with one ``fftconvolve`` per kernel transforms the data once per
+kernel, each time at the full padded trace length.  Here the data (or a 2-D
+block of trials) is transformed once and multiplied by the kernels' cached
+spectra.  Long traces are split into overlapping blocks a few kernel
+lengths long (overlap-save): the block spectra are shared by every kernel,
+each inverse transform is short, and the kernel spectra only depend on the
+block length, so they stay cached across traces of any length.
+
+``validation/benchmark_matched_filter.py`` times this against one
+``fftconvolve`` per kernel.
+
+The filtered traces equal ``scipy.signal.fftconvolve(data, kernel[::-1],
+mode="same")`` up to floating-point rounding.
+"""
+
+import functools
+from typing import Iterator, Sequence, Tuple
+
+import numpy as np
+from scipy import fft as sp_fft
+
+BI_EXPONENTIAL = "bi-exponential"
+MONO_EXPONENTIAL = "mono-exponential"
+
+# Overlap-save block length: at least this many samples and this many of the longest kernel
+MIN_BLOCK_LENGTH = 1 << 14
+BLOCK_KERNEL_LENGTHS = 8
+
+
+def event_kernel(tau_rise: float, tau_decay: float, sampling_rate: float, shape: str = BI_EXPONENTIAL) -> np.ndarray:
+    """
+    Peak-normalised event kernel spanning five time constants.
+
+    ``"mono-exponential"`` ignores *tau_rise*; ``"bi-exponential"`` uses the
+    difference of exponentials, or the alpha function when both taus are equal.
+    """
+    dt = 1.0 / sampling_rate
+    if shape == MONO_EXPONENTIAL:
+        t_k = np.arange(0, 5 * tau_decay, dt)
+        k = np.exp(-t_k / tau_decay)
+    elif tau_decay == tau_rise:
+        t_k = np.arange(0, 5 * tau_decay, dt)
+        k = t_k * np.exp(-t_k / tau_decay)  # alpha function
+    else:
+        t_k = np.arange(0, 5 * max(tau_decay, tau_rise), dt)
+        k = np.exp(-t_k / tau_decay) - np.exp(-t_k / tau_rise)  # bi-exponential
+    max_abs = np.max(np.abs(k))
+    if max_abs > 0:
+        k /= max_abs
+    return k
+
+
+@functools.lru_cache(maxsize=32)
+def kernel_bank(
+    tau_rise: float,
+    tau_decay: float,
+    multipliers: Tuple[float, ...],
+    sampling_rate: float,
+    shape: str = BI_EXPONENTIAL,
+) -> Tuple[np.ndarray, ...]:
+    """Read-only kernels with the decay scaled by each of *multipliers* (in order)."""
+    kernels = []
+    for scale in multipliers:
+        k = event_kernel(tau_rise, tau_decay * scale, sampling_rate, shape)
+        k.setflags(write=False)
+        kernels.append(k)
+    return tuple(kernels)
+
+
+# Spectra are as long as the transform (a block, or a whole short trace)
+@functools.lru_cache(maxsize=2)
+def _bank_spectra(
+    tau_rise: float,
+    tau_decay: float,
+    multipliers: Tuple[float, ...],
+    sampling_rate: float,
+    shape: str,
+    n_fft: int,
+) -> np.ndarray:
+    """rFFT of every time-reversed kernel at length *n_fft*, one row per kernel."""
+    kernels = kernel_bank(tau_rise, tau_decay, multipliers, sampling_rate, shape)
+    padded = np.zeros((len(kernels), n_fft))
+    for row, k in zip(padded, kernels):
+        row[: k.size] = k[::-1]
+    spectra = sp_fft.rfft(padded, axis=-1)
+    spectra.setflags(write=False)
+    return spectra
+
+
+def _block_spectra(data: np.ndarray, k_max: int, block: int) -> np.ndarray:
+    """
+    rFFT of the overlap-save segments of *data* along the last axis.
+
+    *data* is zero-padded by ``k_max - 1`` samples in front and cut into
+    segments of *block* samples that overlap by ``k_max - 1``.  Shape
+    ``(..., n_blocks, block // 2 + 1)``; enough blocks are taken to cover the
+    full linear convolution (``n + k_max - 1`` samples).
+    """
+    n = data.shape[-1]
+    step = block - k_max + 1
+    n_blocks = -(-(n + k_max - 1) // step)
+    widths = [(0, 0)] * (data.ndim - 1) + [(k_max - 1, n_blocks * step - n)]
+    segments = np.lib.stride_tricks.sliding_window_view(np.pad(data, widths), block, axis=-1)[..., ::step, :]
+    return sp_fft.rfft(segments, axis=-1)
+
+
+def matched_filter_bank(
+    data: np.ndarray,
+    tau_rise: float,
+    tau_decay: float,
+    multipliers: Sequence[float],
+    sampling_rate: float,
+    shape: str = BI_EXPONENTIAL,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Correlate *data* with every kernel of the bank, one kernel at a time.
+
+    Traces up to two blocks long are transformed whole; longer ones go
+    through overlap-save blocks of ``max(MIN_BLOCK_LENGTH,
+    BLOCK_KERNEL_LENGTHS * longest kernel)`` samples.
+
+    Args:
+        data: 1-D trace or 2-D block of equal-length trials (one per row).
+        tau_rise, tau_decay, multipliers, sampling_rate, shape: Bank
+            parameters, as for :func:`kernel_bank`.
+
+    Yields:
+        ``(kernel, filtered)`` in *multipliers* order, where *filtered* has the
+        shape of *data* and equals ``fftconvolve(data, kernel[::-1], mode="same")``
+        row by row.  Each filtered block is freshly allocated and may be
+        modified by the caller.
+    """
+    data = np.asarray(data, dtype=float)
+    key = (float(tau_rise), float(tau_decay), tuple(float(m) for m in multipliers), float(sampling_rate), shape)
+    kernels = kernel_bank(*key)
+    n = data.shape[-1]
+    k_max = max(k.size for k in kernels)
+    block = sp_fft.next_fast_len(max(MIN_BLOCK_LENGTH, BLOCK_KERNEL_LENGTHS * k_max), real=True)
+
+    if n + k_max - 1 <= 2 * block:
+        n_fft = sp_fft.next_fast_len(n + k_max - 1, real=True)
+        spectra = _bank_spectra(*key, n_fft)
+        data_spectrum = sp_fft.rfft(data, n_fft, axis=-1)
+        for k, spectrum in zip(kernels, spectra):
+            start = (k.size - 1) // 2
+            full = sp_fft.irfft(data_spectrum * spectrum, n_fft, axis=-1)
+            yield k, full[..., start : start + n]
+        return
+
+    spectra = _bank_spectra(*key, block)
+    segment_spectra = _block_spectra(data, k_max, block)
+    for k, spectrum in zip(kernels, spectra):
+        start = (k.size - 1) // 2
+        # The last block - k_max + 1 samples of each circular segment are valid and tile the full convolution
+        valid = sp_fft.irfft(segment_spectra * spectrum, block, axis=-1)[..., k_max - 1 :]
+        full = valid.reshape(data.shape[:-1] + (-1,))
+        yield k, full[..., start : start + n]
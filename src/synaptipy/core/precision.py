@@ -0,0 +1,84 @@
+# src/synaptipy/core/precision.py
+# -*- coding: utf-8 -*-
+"""
+Storage precision policy for trial data.
+
+Acquisition hardware delivers 16-bit samples, so holding every trial as
+float64 wastes half the memory without adding information.  The policy here
+decides the dtype :class:`~synaptipy.core.data_model.Channel` uses to *store*
+trials:
+
+* ``None`` (default) keeps whatever dtype the file reader produced.
+* ``np.float32`` halves memory for long multi-channel recordings.
+* ``np.float64`` forces double precision.
+
+A per-:class:`~synaptipy.core.data_model.Recording` policy overrides the
+global one.  Analyses that are sensitive to rounding (``curve_fit`` based
+fits) call :func:`as_float64` on the samples they fit, so results do not
+depend on the storage dtype.
+"""
+
+import logging
+from typing import Any, Optional
+
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+_SUPPORTED = (np.dtype(np.float32), np.dtype(np.float64))
+
+_default_storage_dtype: Optional[np.dtype] = None
+
+
+def normalize_storage_dtype(dtype: Any) -> Optional[np.dtype]:
+    """Validate a storage dtype specification.
+
+    Accepts ``None``, ``"float32"`` / ``"float64"`` (or the NumPy types) and
+    booleans, where ``True`` means float32 and ``False`` means "keep as read".
+
+    Raises:
+        ValueError: If *dtype* is not float32 or float64.
+    """
+    if dtype is None or dtype is False:
+        return None
+    if dtype is True:
+        return np.dtype(np.float32)
+    resolved = np.dtype(dtype)
+    if resolved not in _SUPPORTED:
+        raise ValueError(f"Unsupported storage dtype {resolved}; use float32 or float64")
+    return resolved
+
+
+def set_default_storage_dtype(dtype: Any) -> None:
+    """Set the global storage dtype used when a Recording has no policy of its own."""
+    global _default_storage_dtype
+    _default_storage_dtype = normalize_storage_dtype(dtype)
+    log.debug("Default trial storage dtype set to %s", _default_storage_dtype)
+
+
+def get_default_storage_dtype() -> Optional[np.dtype]:
+    """The global storage dtype, or ``None`` when reader dtypes are kept."""
+    return _default_storage_dtype
+
+
+def update_performance_settings(settings: dict) -> None:
+    """Subscriber for ``SessionManager.preferences_changed``: apply ``float32_storage``."""
+    if "float32_storage" in settings:
+        set_default_storage_dtype(bool(settings["float32_storage"]))
+
+
+def coerce_storage(data: Any, dtype: Optional[np.dtype]) -> Any:
+    """Return *data* cast to *dtype* (no copy when it already matches).
+
+    Non-float arrays and non-array values pass through unchanged.
+    """
+    if dtype is None or not isinstance(data, np.ndarray) or data.dtype == dtype:
+        return data
+    if data.dtype.kind != "f":
+        return data
+    return data.astype(dtype)
+
+
+def as_float64(data: Any) -> np.ndarray:
+    """Upcast *data* to a float64 array for numerically sensitive steps (no copy if already float64)."""
+    return np.asarray(data, dtype=np.float64)
@@ -7,12 +7,14 @@ Formalizes the order of operations for signal processing (e.g., Baseline -> Filt
 Ensures that both visualization and analysis use the exact same processing sequence.
 """
 
+import functools
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
-from synaptipy.core import signal_processor
+from synaptipy.core import robust_stats, signal_processor
 
 log = logging.getLogger(__name__)
 
@@ -24,6 +26,8 @@ class SignalProcessingPipeline:
 
     def __init__(self):
         self._steps: List[Dict[str, Any]] = []
+        # ((fs, n_samples, repr(steps)), CompiledPipeline) of the last process() call
+        self._compiled: Optional[Tuple[Tuple[float, int, str], "CompiledPipeline"]] = None
 
     def add_step(self, step_config: Dict[str, Any], index: Optional[int] = None):
         """
@@ -60,12 +64,67 @@ class SignalProcessingPipeline:
         self._steps = [s.copy() for s in steps]
         log.debug(f"Pipeline steps set to: {self._steps}")
 
-    def process(  # noqa: C901
-        self, data: np.ndarray, fs: float, time_vector: Optional[np.ndarray] = None
-    ) -> np.ndarray:
+    @property
+    def step_hash(self) -> str:
+        """Stable digest of the step configuration.
+
+        Two pipelines with equal steps share a hash, so processed data cached
+        under it (see :class:`~synaptipy.shared.processed_cache.ProcessedTraceCache`)
+        is reused across views; any change to the steps yields a new hash.
+        """
+        return hashlib.blake2b(repr(self._steps).encode(), digest_size=12).hexdigest()
+
+    def compile(self, fs: float, n_samples: int, fuse: bool = True) -> "CompiledPipeline":
+        """
+        Validate the steps once for a given sampling rate and trace length.
+
+        Filter designs are looked up in a shared cache, invalid steps are
+        dropped (with the same warnings the per-call path logs), and runs of
+        consecutive filter steps are merged into one SOS cascade applied with
+        a single forward-backward pass.
+
+        Args:
+            fs: Sampling rate in Hz.
+            n_samples: Trace length the compiled pipeline will be applied to.
+            fuse: Merge consecutive filters.  Away from the trace edges the
+                result is identical to applying them one by one; the edge
+                transients differ slightly.
+
+        Returns:
+            A reusable :class:`CompiledPipeline`.
+        """
+        stages: List[_Stage] = []
+        pending: List[Tuple[np.ndarray, int, str]] = []
+
+        def _flush() -> None:
+            groups = [pending[:]] if fuse else [[f] for f in pending]
+            for group in groups:
+                if group:
+                    stages.append(_FilterStage([g[0] for g in group], max(g[1] for g in group), [g[2] for g in group]))
+            pending.clear()
+
+        for step in self._steps:
+            if step.get("type") == "filter":
+                designed = _design_step(step, float(fs), int(n_samples))
+                if designed is not None:
+                    pending.append(designed)
+                continue
+            _flush()
+            stage = _make_stage(step)
+            if stage is not None:
+                stages.append(stage)
+        _flush()
+        return CompiledPipeline(stages, float(fs), int(n_samples))
+
+    def process(self, data: np.ndarray, fs: float, time_vector: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Apply all steps in order to the data.
 
+        The pipeline is compiled (see :meth:`compile`) on first use and the
+        compiled form is reused for as long as the steps, sampling rate and
+        trace length stay the same, so processing every sweep of a file
+        designs each filter once.
+
         Args:
             data: Input signal array
             fs: Sampling rate in Hz
@@ -76,101 +135,313 @@ class SignalProcessingPipeline:
         """
         if data is None or len(data) == 0:
             return data
+        return self._compiled_for(fs, np.shape(data)[-1])(data, time_vector)
+
+    def _compiled_for(self, fs: float, n_samples: int) -> "CompiledPipeline":
+        key = (float(fs), int(n_samples), repr(self._steps))
+        cached = self._compiled
+        if cached is None or cached[0] != key:
+            cached = (key, self.compile(fs, n_samples))
+            self._compiled = cached
+        return cached[1]
+
+    def process_batch(
+        self,
+        trials: Union[np.ndarray, Sequence[np.ndarray]],
+        fs: float,
+        time_vector: Union[np.ndarray, Sequence[np.ndarray], None] = None,
+    ) -> Union[np.ndarray, List[np.ndarray]]:
+        """
+        Apply all steps to many trials at once, vectorised along ``axis=-1``.
 
-        result = data.copy()
+        Filters run as one ``sosfilt`` call over the whole block and baseline
+        reductions are computed per row, so the result matches calling
+        :meth:`process` on each trial.
 
-        for step in self._steps:
-            try:
-                op_type = step.get("type")
-
-                if op_type == "baseline":
-                    method = step.get("method", "mode")
-                    start_t = step.get("start_t")
-                    end_t = step.get("end_t")
-                    use_region = (
-                        start_t is not None
-                        and end_t is not None
-                        and time_vector is not None
-                        and method in ("mean", "median", "mode")
-                    )
-                    if method == "mode":
-                        if use_region:
-                            mask = (time_vector >= float(start_t)) & (time_vector <= float(end_t))
-                            if np.any(mask):
-                                decimals = int(step.get("decimals", 1))
-                                rounded = np.round(result[mask], decimals)
-                                if len(rounded):
-                                    vals, counts = np.unique(rounded, return_counts=True)
-                                    result = result - float(vals[np.argmax(counts)])
-                            else:
-                                decimals = int(step.get("decimals", 1))
-                                result = signal_processor.subtract_baseline_mode(result, decimals=decimals)
-                        else:
-                            decimals = int(step.get("decimals", 1))
-                            result = signal_processor.subtract_baseline_mode(result, decimals=decimals)
-                    elif method == "mean":
-                        if use_region:
-                            result = signal_processor.subtract_baseline_region(
-                                result, time_vector, float(start_t), float(end_t)
-                            )
-                        else:
-                            result = signal_processor.subtract_baseline_mean(result)
-                    elif method == "median":
-                        if use_region:
-                            mask = (time_vector >= float(start_t)) & (time_vector <= float(end_t))
-                            if np.any(mask):
-                                result = result - float(np.median(result[mask]))
-                            else:
-                                result = signal_processor.subtract_baseline_median(result)
-                        else:
-                            result = signal_processor.subtract_baseline_median(result)
-                    elif method == "linear":
-                        result = signal_processor.subtract_baseline_linear(result)
-                    elif method == "region":
-                        if time_vector is not None:
-                            st = float(step.get("start_t", 0.0))
-                            et = float(step.get("end_t", 0.0))
-                            result = signal_processor.subtract_baseline_region(result, time_vector, st, et)
-                        else:
-                            log.warning("Region baseline requested but no time vector provided. Skipping.")
-
-                elif op_type == "filter":
-                    method = step.get("method")
-                    order = int(step.get("order", 5))
-
-                    if method == "lowpass":
-                        result = signal_processor.lowpass_filter(result, float(step.get("cutoff")), fs, order=order)
-                    elif method == "highpass":
-                        result = signal_processor.highpass_filter(result, float(step.get("cutoff")), fs, order=order)
-                    elif method == "bandpass":
-                        result = signal_processor.bandpass_filter(
-                            result, float(step.get("low_cut")), float(step.get("high_cut")), fs, order=order
-                        )
-                    elif method == "notch":
-                        result = signal_processor.notch_filter(
-                            result, float(step.get("freq")), float(step.get("q_factor")), fs
-                        )
-
-                elif op_type == "artifact":
-                    if time_vector is not None:
-                        onset = float(step.get("onset_time", 0.0))
-                        duration = float(step.get("duration_ms", 0.5))
-                        method = step.get("method", "hold")
-                        result = signal_processor.blank_artifact(result, time_vector, onset, duration, method=method)
-                    else:
-                        log.warning("Artifact blanking requested but no time " "vector provided. Skipping.")
-
-                # Check for bad data after each step
-                if result is not None:
-                    if np.any(np.isnan(result)) or np.any(np.isinf(result)):
-                        log.error(f"Step {op_type}/{step.get('method')} produced invalid data (NaN/Inf)")
+        Args:
+            trials: ``(n_trials, n_samples)`` array, or a sequence of 1-D
+                trials.  Ragged sequences are grouped by length and each group
+                is processed as one block.
+            fs: Sampling rate in Hz.
+            time_vector: One time vector shared by all trials, or one per
+                trial.  Trials of equal length are assumed to share the time
+                axis of the first trial in their group.
 
-            except Exception as e:
-                log.error(f"Error processing step {step}: {e}")
+        Returns:
+            A 2-D array for 2-D input, otherwise a list of processed trials in
+            input order.
+        """
+        if isinstance(trials, np.ndarray) and trials.ndim == 2:
+            if trials.size == 0:
+                return trials.copy()
+            t = time_vector[0] if _is_per_trial(time_vector) else time_vector
+            return self._compiled_for(fs, trials.shape[-1])(trials, t)
+
+        trials = list(trials)
+        out: List[Optional[np.ndarray]] = [None] * len(trials)
+        groups: Dict[int, List[int]] = {}
+        for i, trial in enumerate(trials):
+            if trial is None or len(trial) == 0:
+                out[i] = trial
+            else:
+                groups.setdefault(len(trial), []).append(i)
+        per_trial_time = _is_per_trial(time_vector)
+        for n_samples, indices in groups.items():
+            t = time_vector[indices[0]] if per_trial_time else time_vector
+            block = np.stack([trials[i] for i in indices])
+            processed = self._compiled_for(fs, n_samples)(block, t)
+            for row, i in zip(processed, indices):
+                out[i] = row
+        return out
 
+
+# ---------------------------------------------------------------------------
+# Compiled pipeline
+# ---------------------------------------------------------------------------
+
+
+def _is_per_trial(time_vector: Any) -> bool:
+    """True for a list of time vectors or a 2-D array of them."""
+    if time_vector is None:
+        return False
+    if isinstance(time_vector, np.ndarray):
+        return time_vector.ndim == 2
+    return len(time_vector) > 0 and np.ndim(time_vector[0]) == 1
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_sos(method: str, fs: float, order: int, params: Tuple[Tuple[str, float], ...]) -> Optional[np.ndarray]:
+    sos = signal_processor.design_filter_sos(method, fs, order=order, **dict(params))
+    if sos is not None:
+        sos = np.ascontiguousarray(sos, dtype=np.float64)
+        sos.flags.writeable = False  # shared between every compiled pipeline
+    return sos
+
+
+_FILTER_PARAMS = {
+    "lowpass": ("cutoff",),
+    "highpass": ("cutoff",),
+    "bandpass": ("low_cut", "high_cut"),
+    "notch": ("freq", "q_factor"),
+}
+
+
+def _design_step(step: Dict[str, Any], fs: float, n_samples: int) -> Optional[Tuple[np.ndarray, int, str]]:
+    """Return ``(sos, min_length, label)`` for a filter step, or ``None`` if it is skipped."""
+    method = step.get("method")
+    if method not in _FILTER_PARAMS:
+        log.warning(f"Unknown filter method '{method}'. Skipping step.")
+        return None
+    try:
+        order = 2 if method == "notch" else max(1, min(10, int(step.get("order", 5))))
+        params = tuple((name, float(step.get(name))) for name in _FILTER_PARAMS[method] if step.get(name) is not None)
+        sos = _cached_sos(method, fs, order, params)
+    except Exception as e:
+        log.error(f"Error processing step {step}: {e}")
+        return None
+    min_length = 3 * order + 1
+    if sos is None:
+        return None
+    if n_samples < min_length:
+        log.warning(f"Data too short ({n_samples} samples) for filter order {order}. Need at least {min_length}.")
+        return None
+    return sos, min_length, f"filter/{method}"
+
+
+class _Stage:
+    """One compiled step: ``apply(data, time_vector) -> data``."""
+
+    label = ""
+
+    def apply(self, data: np.ndarray, time_vector: Optional[np.ndarray]) -> np.ndarray:
+        raise NotImplementedError
+
+
+class _FilterStage(_Stage):
+    """A cascade of one or more filters applied with a single forward-backward pass."""
+
+    def __init__(self, sections: List[np.ndarray], min_length: int, labels: List[str]):
+        self.sos = np.ascontiguousarray(np.vstack(sections))
+        self.min_length = min_length
+        self.label = "+".join(labels)
+
+    def apply(self, data: np.ndarray, time_vector: Optional[np.ndarray]) -> np.ndarray:
+        if data.shape[-1] < self.min_length:
+            log.warning(f"Data too short ({data.shape[-1]} samples) for {self.label}. Skipping.")
+            return data
+        finite = np.isfinite(data).all(axis=-1)
+        if np.all(finite):
+            return signal_processor._sosfiltfilt_safe(self.sos, data)
+        log.warning("Data contains NaN or Inf values. Returning unchanged.")
+        if data.ndim == 1:
+            return data
+        # Leave rows with NaN/Inf untouched, as the per-trace path does.
+        result = np.array(data, dtype=np.float64)
+        if np.any(finite):
+            result[finite] = signal_processor._sosfiltfilt_safe(self.sos, data[finite])
         return result
 
 
+class _CallStage(_Stage):
+    def __init__(self, label: str, fn: Callable[[np.ndarray, Optional[np.ndarray]], np.ndarray]):
+        self.label = label
+        self._fn = fn
+
+    def apply(self, data: np.ndarray, time_vector: Optional[np.ndarray]) -> np.ndarray:
+        return self._fn(data, time_vector)
+
+
+def _region_slice(time_vector: np.ndarray, start_t: float, end_t: float) -> slice:
+    """Samples with ``start_t <= t <= end_t`` of a monotonic time vector."""
+    return slice(
+        int(np.searchsorted(time_vector, start_t, side="left")), int(np.searchsorted(time_vector, end_t, side="right"))
+    )
+
+
+def _mode_offset(values: np.ndarray, decimals: int) -> Any:
+    """Most common rounded value along the last axis (smallest on ties); keeps dims for 2-D input."""
+    return robust_stats.mode(values, decimals=decimals, keepdims=values.ndim > 1)
+
+
+def _baseline_offset(region: np.ndarray, method: str, decimals: int) -> Any:
+    """Mean/median/mode of *region* along the last axis (scalar for 1-D, one column per row for 2-D)."""
+    if method == "mode":
+        return _mode_offset(region, decimals)
+    if method == "mean":
+        return np.mean(region, axis=-1, keepdims=region.ndim > 1)
+    return robust_stats.median(region, keepdims=region.ndim > 1)
+
+
+def _statistic_baseline_fn(step: Dict[str, Any]) -> Callable[[np.ndarray, Optional[np.ndarray]], np.ndarray]:
+    """Mean/median/mode baseline, over ``start_t..end_t`` when a region and time vector are given.
+
+    1-D traces go through the ``signal_processor`` functions; 2-D blocks are
+    reduced row by row along the last axis.
+    """
+    method = step.get("method", "mode")
+    start_t, end_t = step.get("start_t"), step.get("end_t")
+    has_region = start_t is not None and end_t is not None
+    decimals = int(step.get("decimals", 1))
+
+    def _global(x: np.ndarray) -> np.ndarray:
+        if x.ndim > 1:
+            return x - _baseline_offset(x, method, decimals)
+        if method == "mode":
+            return signal_processor.subtract_baseline_mode(x, decimals=decimals)
+        if method == "mean":
+            return signal_processor.subtract_baseline_mean(x)
+        return signal_processor.subtract_baseline_median(x)
+
+    def _apply(x: np.ndarray, t: Optional[np.ndarray]) -> np.ndarray:
+        if not has_region or t is None:
+            return _global(x)
+        if method == "mean" and x.ndim == 1:
+            return signal_processor.subtract_baseline_region(x, t, float(start_t), float(end_t))
+        region = x[..., _region_slice(t, float(start_t), float(end_t))]
+        if region.shape[-1] > 0:
+            return x - _baseline_offset(region, method, decimals)
+        if method == "mean":
+            log.warning(f"Baseline region {start_t}-{end_t} contains no data points. Returning original.")
+            return x
+        return _global(x)
+
+    return _apply
+
+
+def _baseline_fn(step: Dict[str, Any]) -> Optional[Callable[[np.ndarray, Optional[np.ndarray]], np.ndarray]]:
+    """Build the callable for a baseline step (``None`` for unknown methods)."""
+    method = step.get("method", "mode")
+    if method in ("mean", "median", "mode"):
+        return _statistic_baseline_fn(step)
+    if method == "linear":
+        return lambda x, t: signal_processor.subtract_baseline_linear(x)
+    if method == "region":
+        st, et = float(step.get("start_t", 0.0)), float(step.get("end_t", 0.0))
+
+        def _apply_region(x: np.ndarray, t: Optional[np.ndarray]) -> np.ndarray:
+            if t is None:
+                log.warning("Region baseline requested but no time vector provided. Skipping.")
+                return x
+            if x.ndim == 1:
+                return signal_processor.subtract_baseline_region(x, t, st, et)
+            region = x[..., _region_slice(t, st, et)]
+            if region.shape[-1] == 0:
+                log.warning(f"Baseline region {st}-{et} contains no data points. Returning original.")
+                return x
+            return x - np.mean(region, axis=-1, keepdims=True)
+
+        return _apply_region
+    log.warning(f"Unknown baseline method '{method}'. Skipping step.")
+    return None
+
+
+def _artifact_fn(step: Dict[str, Any]) -> Callable[[np.ndarray, Optional[np.ndarray]], np.ndarray]:
+    onset = float(step.get("onset_time", 0.0))
+    duration = float(step.get("duration_ms", 0.5))
+    method = step.get("method", "hold")
+
+    def _apply(x: np.ndarray, t: Optional[np.ndarray]) -> np.ndarray:
+        if t is None:
+            log.warning("Artifact blanking requested but no time vector provided. Skipping.")
+            return x
+        return signal_processor.blank_artifact(x, t, onset, duration, method=method)
+
+    return _apply
+
+
+def _make_stage(step: Dict[str, Any]) -> Optional[_Stage]:
+    """Compile a non-filter step; unknown step types are ignored."""
+    op_type = step.get("type")
+    try:
+        if op_type == "baseline":
+            fn = _baseline_fn(step)
+        elif op_type == "artifact":
+            fn = _artifact_fn(step)
+        else:
+            return None
+    except Exception as e:
+        log.error(f"Error processing step {step}: {e}")
+        return None
+    return _CallStage(f"{op_type}/{step.get('method')}", fn) if fn is not None else None
+
+
+class CompiledPipeline:
+    """
+    A :class:`SignalProcessingPipeline` validated for one sampling rate and trace length.
+
+    Calling it applies the stages in order along the last axis, so *data* may
+    be one trace or a ``(n_trials, n_samples)`` block of trials sharing one
+    time vector.  A stage that raises is logged and skipped, as in
+    :meth:`SignalProcessingPipeline.process`; the input array is never modified.
+    """
+
+    def __init__(self, stages: List[_Stage], fs: float, n_samples: int):
+        self._stages = stages
+        self.fs = fs
+        self.n_samples = n_samples
+
+    @property
+    def stage_labels(self) -> List[str]:
+        """One label per stage; fused filters are joined with ``+``."""
+        return [s.label for s in self._stages]
+
+    @property
+    def n_filter_passes(self) -> int:
+        """Forward-backward filter passes per call."""
+        return sum(isinstance(s, _FilterStage) for s in self._stages)
+
+    def __call__(self, data: np.ndarray, time_vector: Optional[np.ndarray] = None) -> np.ndarray:
+        if data is None or len(data) == 0:
+            return data
+        result = data
+        for stage in self._stages:
+            try:
+                result = stage.apply(result, time_vector)
+            except Exception as e:
+                log.error(f"Error processing step {stage.label}: {e}")
+        return data.copy() if result is data else result
+
+
 # ---------------------------------------------------------------------------
 # Immutable Trace Correction Pipeline
 # ---------------------------------------------------------------------------
@@ -203,7 +474,7 @@ def _apply_noise_floor_zeroing(result: np.ndarray, time: np.ndarray, pre_event_w
     t0, t1 = float(pre_event_window_s[0]), float(pre_event_window_s[1])
     mask = (time >= t0) & (time < t1)
     if np.any(mask):
-        floor_offset = float(np.median(result[mask]))
+        floor_offset = float(robust_stats.median(result[mask], overwrite_input=True))
         result = result - floor_offset
         log.debug(
             "apply_trace_corrections: Step C — noise floor zeroed (%.4f mV, window %.3f-%.3f s).",
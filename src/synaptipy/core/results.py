@@ -122,6 +122,108 @@ class SingleSpikeResult(AnalysisResult):
         return f"SingleSpikeResult(Error: {self.error_message})"
 
 
+class SpikeFeatureTable:
+    """
+    Per-spike AP features stored column-wise: one float64 array per feature.
+
+    Row ``i`` describes the spike at ``spike_indices[i]``.  Columns are named
+    like the :class:`SingleSpikeResult` fields; missing values are NaN.
+    ``to_dataframe`` wraps the columns without copying them and
+    ``to_results`` / ``table[i]`` build :class:`SingleSpikeResult` objects
+    only when they are needed, e.g. for display.
+    """
+
+    COLUMNS = (
+        "ap_threshold",
+        "amplitude",
+        "half_width",
+        "rise_time_10_90",
+        "decay_time_90_10",
+        "fahp_depth",
+        "mahp_depth",
+        "ahp_duration_half",
+        "adp_amplitude",
+        "max_dvdt",
+        "min_dvdt",
+        "absolute_peak_mv",
+        "overshoot_mv",
+        "ap_delay",
+        "ahp_time",
+        "upstroke_downstroke_ratio",
+        "phase_plane_area",
+        "trough_v",
+    )
+    # SingleSpikeResult features in field order; ap_width_arbitrary is not computed yet
+    SUMMARY_FIELDS = COLUMNS[:14] + ("ap_width_arbitrary",) + COLUMNS[14:]
+
+    __slots__ = ("spike_indices",) + COLUMNS
+
+    def __init__(self, spike_indices: np.ndarray, **columns: np.ndarray):
+        unknown = set(columns) - set(self.COLUMNS)
+        if unknown:
+            raise TypeError(f"Unknown spike feature column(s): {sorted(unknown)}")
+        self.spike_indices = np.asarray(spike_indices, dtype=int).reshape(-1)
+        n = self.spike_indices.size
+        for name in self.COLUMNS:
+            values = columns.get(name)
+            col = np.full(n, np.nan) if values is None else np.asarray(values, dtype=np.float64).reshape(-1)
+            if col.size != n:
+                raise ValueError(f"Column '{name}' has {col.size} rows, expected {n}")
+            setattr(self, name, col)
+
+    @classmethod
+    def empty(cls) -> "SpikeFeatureTable":
+        return cls(np.array([], dtype=int))
+
+    def __len__(self) -> int:
+        return self.spike_indices.size
+
+    def __getitem__(self, i: int) -> SingleSpikeResult:
+        return SingleSpikeResult(
+            value=None,
+            unit="mV",
+            ap_width_arbitrary=None,
+            **{name: float(getattr(self, name)[i]) for name in self.COLUMNS},
+        )
+
+    def __repr__(self):
+        return f"SpikeFeatureTable(n_spikes={len(self)})"
+
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        """Column name -> array (no copies)."""
+        return {name: getattr(self, name) for name in self.COLUMNS}
+
+    def to_results(self) -> List[SingleSpikeResult]:
+        """One :class:`SingleSpikeResult` per spike."""
+        rows = zip(*(getattr(self, name).tolist() for name in self.COLUMNS))
+        return [
+            SingleSpikeResult(value=None, unit="mV", ap_width_arbitrary=None, **dict(zip(self.COLUMNS, row)))
+            for row in rows
+        ]
+
+    def to_dataframe(self):
+        """pandas DataFrame over the columns (not copied), indexed by spike sample index."""
+        import pandas as pd
+
+        return pd.DataFrame(self.to_dict(), index=pd.Index(self.spike_indices, name="spike_index"), copy=False)
+
+    def summary_stats(self) -> Dict[str, float]:
+        """``<feature>_mean`` / ``<feature>_std`` over non-NaN rows (NaN when a feature has none)."""
+        stats: Dict[str, float] = {}
+        if len(self) == 0:
+            return stats
+        for name in self.SUMMARY_FIELDS:
+            values = getattr(self, name) if name in self.COLUMNS else np.empty(0)
+            values = values[~np.isnan(values)]
+            if values.size:
+                stats[f"{name}_mean"] = float(np.mean(values))
+                stats[f"{name}_std"] = float(np.std(values))
+            else:
+                stats[f"{name}_mean"] = np.nan
+                stats[f"{name}_std"] = np.nan
+        return stats
+
+
 @dataclass
 class RinResult(AnalysisResult):
     """
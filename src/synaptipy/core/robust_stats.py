@@ -0,0 +1,324 @@
+# src/synaptipy/core/robust_stats.py
+# -*- coding: utf-8 -*-
+"""
+Fast robust statistics kernels for baseline and noise estimation.
+
+Baseline subtraction and event detection repeatedly take the mode, median and
+median absolute deviation (MAD) of whole traces.  The generic NumPy/SciPy
+routes sort the full array (``np.unique``, ``scipy.stats.mode``) or copy it
+several times (``scipy.stats.median_abs_deviation``).  The kernels here give
+the same results with less work:
+
+* :func:`mode` - mode of values rounded to ``decimals`` places via one
+  ``np.bincount`` over the integer grid, O(n) instead of a sort.  Ties resolve
+  to the smallest value, as with ``np.unique`` and ``scipy.stats.mode``.
+* :func:`median` - selection (``np.partition``) on a single scratch copy.
+* :func:`mad` - one deviation buffer, partitioned in place; an already
+  computed median can be passed as ``center`` so it is not recomputed.
+* :func:`median_mad` - median and MAD together for z-scoring.
+* :func:`streaming_quantile` - histogram quantiles over any sliceable 1-D
+  source (array, ``np.memmap``, h5py dataset, :class:`TrialSource`) in
+  fixed-size blocks, with an optional exact refinement pass.
+
+All kernels reduce along the last axis and accept 1-D traces or 2-D
+``(n_trials, n_samples)`` blocks.  Like ``np.median``, NaN propagates.
+"""
+
+import logging
+from typing import Any, Sequence, Tuple, Union
+
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+NORMAL_MAD_SCALE = 0.6744897501960817  # Phi^-1(3/4), the divisor of scipy's scale="normal"
+MAX_MODE_BINS = 1 << 24  # beyond this value span the mode falls back to np.unique
+DEFAULT_QUANTILE_BINS = 4096
+DEFAULT_REFINE_LIMIT = 1 << 20  # samples gathered for exact streaming quantiles
+
+Number = Union[float, np.ndarray]
+
+
+def _reduce_result(values: np.ndarray, keepdims: bool) -> Number:
+    """``float`` for a 0-d reduction, otherwise the array (with a kept last axis if requested)."""
+    if values.ndim == 0:
+        return float(values)
+    return values[..., np.newaxis] if keepdims else values
+
+
+# ---------------------------------------------------------------------------
+# Mode
+# ---------------------------------------------------------------------------
+
+
+def _rounded_grid(values: np.ndarray, decimals: int) -> Tuple[np.ndarray, float, bool]:
+    """Values rounded like ``np.round(values, decimals)`` but kept on the integer grid.
+
+    Returns ``(grid, factor, divide)`` with ``np.round(values, decimals) ==
+    grid / factor`` when *divide* else ``grid * factor``.
+    """
+    if decimals >= 0:
+        factor = float(10**decimals)
+        return np.rint(values * factor), factor, True
+    factor = float(10 ** (-decimals))
+    return np.rint(values / factor), factor, False
+
+
+def _mode_1d(values: np.ndarray, decimals: int) -> float:
+    if values.size == 0:
+        return float("nan")
+    grid, factor, divide = _rounded_grid(values, decimals)
+    lo, hi = grid.min(), grid.max()
+    if not (np.isfinite(lo) and np.isfinite(hi)):
+        return float("nan")
+    span = hi - lo + 1
+    if span > min(MAX_MODE_BINS, max(4 * values.size, 1 << 16)):
+        # Sparse values: counting bins would cost more than sorting
+        vals, counts = np.unique(grid, return_counts=True)
+        top = vals[np.argmax(counts)]
+    else:
+        counts = np.bincount((grid - lo).astype(np.int64), minlength=int(span))
+        top = lo + np.argmax(counts)
+    return float(top / factor if divide else top * factor)
+
+
+def mode(values: np.ndarray, decimals: int = 1, keepdims: bool = False) -> Number:
+    """
+    Most common value after rounding to *decimals* places, along the last axis.
+
+    Equal to ``np.unique(np.round(values, decimals), return_counts=True)``
+    followed by ``argmax`` (smallest value on ties), computed with a bincount
+    over the rounded integer grid.
+
+    Args:
+        values: 1-D trace or 2-D block of traces.
+        decimals: Rounding precision, as for ``np.round``.
+        keepdims: Keep the reduced axis (length 1) for 2-D input.
+
+    Returns:
+        A float for 1-D input, one value per row for 2-D input.  NaN if a row
+        is empty or contains non-finite values.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim <= 1:
+        return _mode_1d(values.ravel(), decimals)
+    rows = values.reshape(-1, values.shape[-1])
+    out = np.fromiter((_mode_1d(row, decimals) for row in rows), dtype=float, count=rows.shape[0])
+    return _reduce_result(out.reshape(values.shape[:-1]), keepdims)
+
+
+# ---------------------------------------------------------------------------
+# Median / MAD
+# ---------------------------------------------------------------------------
+
+
+def _median_inplace(buf: np.ndarray) -> np.ndarray:
+    """Median along the last axis of a scratch buffer, which is reordered."""
+    n = buf.shape[-1]
+    if n == 0:
+        return np.full(buf.shape[:-1], np.nan)
+    k = n // 2
+    kth = [k - 1, k] if n % 2 == 0 else [k]
+    # Include the last position so NaN (which sorts last) is detected in the same pass
+    buf.partition(sorted(set(kth + [n - 1])), axis=-1)
+    if n % 2 == 0:
+        result = 0.5 * (buf[..., k - 1] + buf[..., k])
+    else:
+        result = buf[..., k].astype(float)
+    return np.where(np.isnan(buf[..., n - 1]), np.nan, result)
+
+
+def median(values: np.ndarray, keepdims: bool = False, overwrite_input: bool = False) -> Number:
+    """
+    Median along the last axis by selection, equal to ``np.median(values, axis=-1)``.
+
+    Args:
+        values: 1-D trace or 2-D block of traces.
+        keepdims: Keep the reduced axis (length 1) for 2-D input.
+        overwrite_input: Reorder *values* in place instead of copying it.
+
+    Returns:
+        A float for 1-D input, one value per row for 2-D input.
+    """
+    values = np.asarray(values)
+    if not np.issubdtype(values.dtype, np.floating):
+        values = values.astype(float)
+        overwrite_input = True
+    buf = values if overwrite_input else values.copy()
+    return _reduce_result(_median_inplace(buf), keepdims)
+
+
+def mad(
+    values: np.ndarray,
+    center: Any = None,
+    scale: Union[str, float] = "normal",
+    keepdims: bool = False,
+) -> Number:
+    """
+    Median absolute deviation along the last axis.
+
+    Matches ``scipy.stats.median_abs_deviation(values, axis=-1, scale=scale)``
+    but builds one deviation buffer and selects on it in place.
+
+    Args:
+        values: 1-D trace or 2-D block of traces.
+        center: Precomputed median (scalar, or one value per row).  Computed
+            here when ``None``.
+        scale: ``"normal"`` for a consistent estimate of the standard
+            deviation of Gaussian noise, or a numeric divisor (``1.0`` for the
+            raw MAD).
+        keepdims: Keep the reduced axis (length 1) for 2-D input.
+
+    Returns:
+        A float for 1-D input, one value per row for 2-D input.
+    """
+    values = np.asarray(values, dtype=float)
+    if center is None:
+        center = median(values, keepdims=True)
+    center = np.asarray(center, dtype=float)
+    if center.ndim and center.ndim == values.ndim - 1:
+        center = center[..., np.newaxis]
+    deviation = np.subtract(values, center)
+    np.abs(deviation, out=deviation)
+    result = _median_inplace(deviation)
+    if isinstance(scale, str):
+        if scale != "normal":
+            raise ValueError(f"Unknown MAD scale '{scale}'")
+        scale = NORMAL_MAD_SCALE
+    result = result / float(scale)
+    return _reduce_result(np.asarray(result), keepdims)
+
+
+def median_mad(
+    values: np.ndarray, scale: Union[str, float] = "normal", keepdims: bool = False
+) -> Tuple[Number, Number]:
+    """``(median, mad)`` along the last axis, sharing the median between both."""
+    center = np.asarray(median(values, keepdims=True))
+    spread = mad(values, center=center, scale=scale, keepdims=keepdims)
+    if center.ndim == 0:
+        return float(center), spread
+    return (center if keepdims else center[..., 0]), spread
+
+
+# ---------------------------------------------------------------------------
+# Streaming quantiles
+# ---------------------------------------------------------------------------
+
+
+def _blocks(source: Any, block_size: int):
+    n = len(source)
+    for start in range(0, n, block_size):
+        yield np.asarray(source[start : min(start + block_size, n)], dtype=float)
+
+
+def streaming_quantile(
+    source: Any,
+    q: Union[float, Sequence[float]],
+    bins: int = DEFAULT_QUANTILE_BINS,
+    block_size: int = 1 << 20,
+    refine_limit: int = DEFAULT_REFINE_LIMIT,
+) -> Number:
+    """
+    Quantiles of a long 1-D source read in fixed-size blocks.
+
+    A first pass finds the value range, a second builds a *bins*-bin
+    histogram; quantiles are interpolated within the bin that holds the
+    target rank, so the error is at most ``(max - min) / bins``.  When the
+    bins holding the two order statistics around every requested rank
+    contain at most *refine_limit* samples in total, a third pass collects
+    them and the result equals ``np.quantile(source, q)`` exactly.
+
+    Peak memory is one block plus the histogram, so multi-hour recordings
+    stored as ``np.memmap``/h5py datasets or read lazily through
+    :class:`~synaptipy.core.streaming_filter.TrialSource` never need to be
+    loaded whole.
+
+    Args:
+        source: Sliceable 1-D sequence of samples.
+        q: Quantile or sequence of quantiles in ``[0, 1]``.
+        bins: Histogram resolution of the approximate estimate.
+        block_size: Samples read per block.
+        refine_limit: Maximum samples gathered for the exact pass (``0``
+            disables it).
+
+    Returns:
+        A float for scalar *q*, otherwise an array of quantiles.  NaN if the
+        source is empty or contains NaN.
+    """
+    qs = np.atleast_1d(np.asarray(q, dtype=float))
+    if np.any((qs < 0) | (qs > 1)):
+        raise ValueError("Quantiles must be in the range [0, 1]")
+    block_size = max(1, int(block_size))
+    bins = max(1, int(bins))
+
+    n = 0
+    lo, hi = np.inf, -np.inf
+    for block in _blocks(source, block_size):
+        if block.size == 0:
+            continue
+        if np.isnan(block).any():
+            return float("nan") if np.ndim(q) == 0 else np.full(qs.shape, np.nan)
+        n += block.size
+        lo, hi = min(lo, float(block.min())), max(hi, float(block.max()))
+    if n == 0:
+        return float("nan") if np.ndim(q) == 0 else np.full(qs.shape, np.nan)
+    if lo == hi:
+        return lo if np.ndim(q) == 0 else np.full(qs.shape, lo)
+
+    edges = np.linspace(lo, hi, bins + 1)
+    counts = np.zeros(bins, dtype=np.int64)
+    for block in _blocks(source, block_size):
+        counts += np.histogram(block, bins=edges)[0]
+    cumulative = np.cumsum(counts)
+
+    # Order statistics needed for linear interpolation: floor(h) and ceil(h), h = q * (n - 1)
+    position = qs * (n - 1)
+    below = np.floor(position).astype(np.int64)
+    above = np.minimum(below + 1, n - 1)
+    ranks = np.unique(np.concatenate([below, above]))
+    rank_bins = np.searchsorted(cumulative, ranks, side="right")
+
+    needed = np.unique(rank_bins)
+    if refine_limit > 0 and counts[needed].sum() <= refine_limit:
+        result = _refine_quantiles(source, block_size, edges, counts, cumulative, needed, position, below, above)
+    else:
+        # Approximate: interpolate the target rank uniformly within its bin
+        bin_index = np.minimum(np.searchsorted(cumulative, position, side="right"), bins - 1)
+        start = np.where(bin_index > 0, cumulative[bin_index - 1], 0)
+        fraction = np.clip((position - start + 0.5) / np.maximum(counts[bin_index], 1), 0.0, 1.0)
+        result = edges[bin_index] + fraction * (edges[bin_index + 1] - edges[bin_index])
+    return float(result[0]) if np.ndim(q) == 0 else result
+
+
+def _refine_quantiles(
+    source: Any,
+    block_size: int,
+    edges: np.ndarray,
+    counts: np.ndarray,
+    cumulative: np.ndarray,
+    needed: np.ndarray,
+    position: np.ndarray,
+    below: np.ndarray,
+    above: np.ndarray,
+) -> np.ndarray:
+    """Exact quantiles from the samples of the histogram bins that hold the needed ranks."""
+    wanted = np.zeros(counts.shape[0], dtype=bool)
+    wanted[needed] = True
+    last = counts.shape[0] - 1
+    gathered = {int(b): [] for b in needed}
+    for block in _blocks(source, block_size):
+        # Same bin assignment as np.histogram: right edge of the last bin is inclusive
+        idx = np.minimum(np.searchsorted(edges, block, side="right") - 1, last)
+        keep = wanted[idx]
+        for b in np.unique(idx[keep]):
+            gathered[int(b)].append(block[keep & (idx == b)])
+    sorted_bins = {b: np.sort(np.concatenate(parts)) if parts else np.empty(0) for b, parts in gathered.items()}
+
+    def order_statistic(rank: int) -> float:
+        b = int(np.searchsorted(cumulative, rank, side="right"))
+        start = int(cumulative[b - 1]) if b > 0 else 0
+        return float(sorted_bins[b][rank - start])
+
+    lower = np.array([order_statistic(int(r)) for r in below])
+    upper = np.array([order_statistic(int(r)) for r in above])
+    return lower + (position - below) * (upper - lower)
@@ -0,0 +1,197 @@
+# src/synaptipy/core/shared_recording.py
+# -*- coding: utf-8 -*-
+"""
+Shared-memory transport for in-memory :class:`Recording` objects.
+
+Sending a loaded recording to a worker process by pickling copies every trial
+through a pipe.  :func:`export_recording` instead writes the trial arrays of
+all channels into one :class:`multiprocessing.shared_memory.SharedMemory`
+block and returns a :class:`SharedRecording` whose small, picklable
+:class:`SharedRecordingDescriptor` is all a worker needs.
+:func:`attach_recording` rebuilds a lightweight :class:`Recording` in the
+worker whose channels are zero-copy views over that block.
+
+The exporting process owns the block: keep the :class:`SharedRecording` alive
+until every worker has finished, then :meth:`SharedRecording.close` it.
+"""
+
+import logging
+import pickle
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from synaptipy.core.data_model import Channel, Recording
+
+log = logging.getLogger(__name__)
+
+# Byte alignment of each array inside the shared block.
+_ALIGN = 64
+
+# Channel attributes that are runtime state rather than metadata.
+_CHANNEL_SKIP = {"loader"}
+_RECORDING_SKIP = {"channels", "source_handle"}
+
+# (offset, shape, dtype.str) of one array inside the shared block.
+ArraySpec = Tuple[int, Tuple[int, ...], str]
+
+
+@dataclass
+class SharedRecordingDescriptor:
+    """Picklable description of a recording exported to shared memory."""
+
+    shm_name: str
+    recording_attrs: Dict[str, Any]
+    # One dict per channel: key, attrs, data (ArraySpec of a 2-D block or list of 1-D specs), current.
+    channels: List[Dict[str, Any]] = field(default_factory=list)
+    nbytes: int = 0
+
+
+class SharedRecording:
+    """Owner side of an exported recording; releases the shared block on :meth:`close`."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, descriptor: SharedRecordingDescriptor) -> None:
+        self._shm: Optional[shared_memory.SharedMemory] = shm
+        self.descriptor = descriptor
+
+    @property
+    def name(self) -> str:
+        return self.descriptor.shm_name
+
+    def close(self) -> None:
+        """Close and unlink the shared block (idempotent)."""
+        shm, self._shm = self._shm, None
+        if shm is None:
+            return
+        shm.close()
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "SharedRecording":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _public_attrs(obj: Any, skip: set) -> Dict[str, Any]:
+    return {k: v for k, v in vars(obj).items() if not k.startswith("_") and k not in skip}
+
+
+def _channel_arrays(channel: Channel) -> Tuple[Any, List[np.ndarray]]:
+    """Return ``(data, current)`` where *data* is a 2-D block or a list of 1-D trials."""
+    matrix = channel.get_trial_matrix()
+    if matrix is not None:
+        data: Any = np.ascontiguousarray(matrix)
+    else:
+        data = []
+        for i in range(channel.num_trials):
+            trial = channel.get_data(i)
+            if trial is None:
+                raise ValueError(f"Channel '{channel.id}' trial {i} could not be loaded")
+            data.append(np.ascontiguousarray(trial))
+    current = [np.ascontiguousarray(t) for t in channel.current_data_trials if isinstance(t, np.ndarray)]
+    return data, current
+
+
+def export_recording(recording: Recording) -> SharedRecording:
+    """Copy the trials of *recording* into a new shared-memory block.
+
+    Lazily loaded trials are read first.  Equal-length trials are exported as
+    one 2-D block per channel, so workers see the same contiguous
+    ``trial_matrix`` as the parent.
+
+    Raises:
+        ValueError: If a trial cannot be loaded.
+        pickle.PicklingError / TypeError: If the recording metadata cannot be pickled.
+    """
+    recording_attrs = _public_attrs(recording, _RECORDING_SKIP)
+    layout: List[Tuple[np.ndarray, int]] = []
+    offset = 0
+
+    def _place(arr: np.ndarray) -> ArraySpec:
+        nonlocal offset
+        spec = (offset, tuple(arr.shape), arr.dtype.str)
+        layout.append((arr, offset))
+        offset += -(-arr.nbytes // _ALIGN) * _ALIGN
+        return spec
+
+    channels: List[Dict[str, Any]] = []
+    for key, channel in recording.channels.items():
+        data, current = _channel_arrays(channel)
+        channels.append(
+            {
+                "key": key,
+                "attrs": _public_attrs(channel, _CHANNEL_SKIP),
+                "data": _place(data) if isinstance(data, np.ndarray) else [_place(t) for t in data],
+                "current": [_place(t) for t in current],
+            }
+        )
+
+    descriptor = SharedRecordingDescriptor(shm_name="", recording_attrs=recording_attrs, channels=channels)
+    pickle.dumps(descriptor)  # fail before allocating if metadata is not transportable
+
+    shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    try:
+        buf = np.frombuffer(shm.buf, dtype=np.uint8)
+        for arr, start in layout:
+            buf[start : start + arr.nbytes] = arr.reshape(-1).view(np.uint8)
+        del buf
+    except Exception:
+        shm.close()
+        shm.unlink()
+        raise
+    descriptor.shm_name = shm.name
+    descriptor.nbytes = offset
+    log.debug("Exported %s to shared memory %s (%d bytes).", recording.source_file, shm.name, offset)
+    return SharedRecording(shm, descriptor)
+
+
+def attach_recording(descriptor: SharedRecordingDescriptor) -> Tuple[Recording, shared_memory.SharedMemory]:
+    """Rebuild the exported recording over the shared block (worker side).
+
+    Returns:
+        ``(recording, shm)``.  Drop every reference to the recording before
+        calling :func:`detach`, which closes *shm* without unlinking it.
+    """
+    shm = shared_memory.SharedMemory(name=descriptor.shm_name)
+    buf = np.frombuffer(shm.buf, dtype=np.uint8)
+
+    def _view(spec: ArraySpec) -> np.ndarray:
+        start, shape, dtype = spec
+        dt = np.dtype(dtype)
+        count = int(np.prod(shape)) if shape else 1
+        return buf[start : start + count * dt.itemsize].view(dt).reshape(shape)
+
+    attrs = dict(descriptor.recording_attrs)
+    source = attrs.get("source_file")
+    recording = Recording(source if isinstance(source, Path) else Path("./unknown_source_file"))
+    recording.__dict__.update(attrs)
+    for spec in descriptor.channels:
+        ch_attrs = dict(spec["attrs"])
+        data = spec["data"]
+        trials = _view(data) if isinstance(data, tuple) else [_view(s) for s in data]
+        channel = Channel(ch_attrs["id"], ch_attrs["name"], ch_attrs["units"], ch_attrs["sampling_rate"], trials)
+        for name, value in ch_attrs.items():
+            setattr(channel, name, value)
+        channel._current_data_trials = [_view(s) for s in spec["current"]]
+        channel._recording_ref = recording
+        recording.channels[spec["key"]] = channel
+    return recording, shm
+
+
+def detach(shm: shared_memory.SharedMemory) -> None:
+    """Close a block opened by :func:`attach_recording` in a worker (never unlinks).
+
+    If views are still referenced (e.g. held by results), the mapping is left
+    open and released when the worker process exits.
+    """
+    try:
+        shm.close()
+    except BufferError:
+        log.debug("Shared block %s still referenced; leaving it mapped.", shm.name)
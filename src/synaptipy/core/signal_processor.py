@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from synaptipy.core import robust_stats
 from synaptipy.core.constants import BASELINE_DRIFT_THRESHOLD_MV
 
 
@@ -196,11 +197,49 @@ def _sosfiltfilt_safe(sos: np.ndarray, data: np.ndarray) -> np.ndarray:
     sos = np.ascontiguousarray(sos, dtype=np.float64)
     # Forward pass
     y = scipy_signal.sosfilt(sos, data)
-    # Backward pass on reversed signal, then re-reverse
-    y = scipy_signal.sosfilt(sos, y[::-1])[::-1]
+    # Backward pass on reversed signal, then re-reverse (along the sample axis for 2-D blocks)
+    y = scipy_signal.sosfilt(sos, y[..., ::-1])[..., ::-1]
     return np.ascontiguousarray(y, dtype=np.float64)
 
 
+def _design_notch_sos(signal, freq: float, fs: float, q_factor: Optional[float]) -> Optional[np.ndarray]:
+    """SOS for :func:`notch_filter`."""
+    freq_norm = freq / (0.5 * fs)
+    if freq_norm <= 0 or freq_norm >= 1:
+        log.warning(f"Notch frequency {freq} Hz out of bounds for fs={fs} Hz. Skipping filter.")
+        return None
+    q = float(q_factor or 0.0)
+    if q <= 0:
+        log.warning(f"Q factor must be positive, got {q}. Using Q=30.")
+        q = 30.0
+    b, a = signal.iirnotch(freq_norm, q)
+    z, p, k = signal.tf2zpk(b, a)
+    return signal.zpk2sos(z, p, k)
+
+
+def _design_harmonic_notch_sos(
+    signal, fundamental_hz: float, fs: float, max_harmonics: Optional[int], q: float
+) -> Optional[np.ndarray]:
+    """SOS for :func:`multi_harmonic_notch`: an IIR comb, else stacked per-harmonic notches."""
+    nyq = 0.5 * fs
+    if fundamental_hz <= 0 or fundamental_hz >= nyq:
+        log.warning(f"Fundamental {fundamental_hz} Hz out of bounds for fs={fs} Hz. Skipping filter.")
+        return None
+    try:
+        b, a = signal.iircomb(fundamental_hz, q, ftype="notch", fs=fs)
+        z, p, k = signal.tf2zpk(b, a)
+        return signal.zpk2sos(z, p, k)
+    except Exception as exc:
+        log.debug("iircomb unavailable or failed (%s); stacking per-harmonic notches.", exc)
+    sections = []
+    harmonic = 1
+    while harmonic * fundamental_hz < nyq and (max_harmonics is None or harmonic <= max_harmonics):
+        b, a = signal.iirnotch(harmonic * fundamental_hz / nyq, q)
+        sections.append(signal.zpk2sos(*signal.tf2zpk(b, a)))
+        harmonic += 1
+    return np.vstack(sections) if sections else None
+
+
 def _validate_filter_input(data: np.ndarray, fs: float, order: int = 5) -> tuple:
     """
     Common validation for all filter functions.
@@ -239,6 +278,69 @@ def _validate_filter_input(data: np.ndarray, fs: float, order: int = 5) -> tuple
     return True, data
 
 
+def design_filter_sos(method: str, fs: float, order: int = 5, **params: float) -> Optional[np.ndarray]:
+    """
+    Design the SOS coefficients used by the ``*_filter`` functions, without filtering.
+
+    Applies the same bounds checks as :func:`lowpass_filter`, :func:`highpass_filter`,
+    :func:`bandpass_filter` and :func:`notch_filter`, so a design that those
+    functions would reject yields ``None``.
+
+    Args:
+        method: ``"lowpass"``, ``"highpass"``, ``"bandpass"``, ``"notch"`` or
+            ``"multi_harmonic_notch"``.
+        fs: Sampling frequency in Hz.
+        order: Butterworth order (clamped to 1-10; ignored for notch).
+        **params: ``cutoff`` (low/highpass), ``low_cut`` and ``high_cut``
+            (bandpass), ``freq`` and ``q_factor`` (notch) or ``fundamental_hz``,
+            ``q_factor`` and ``max_harmonics`` (multi-harmonic notch), in Hz.
+
+    Returns:
+        ``(n_sections, 6)`` SOS array, or ``None`` if the design is invalid.
+
+    Raises:
+        ValueError: If *method* is not a known filter type.
+    """
+    signal, _, has_scipy = _get_scipy()
+    if not has_scipy:
+        log.warning("Scipy not available. Cannot design %s filter.", method)
+        return None
+    if fs <= 0:
+        log.error(f"Sampling rate must be positive, got {fs}")
+        return None
+    order = max(1, min(10, int(order)))
+    nyq = 0.5 * fs
+
+    if method in ("lowpass", "highpass"):
+        normal_cutoff = float(params["cutoff"]) / nyq
+        if normal_cutoff <= 0 or normal_cutoff >= 1:
+            log.warning(f"Cutoff {params['cutoff']} Hz out of bounds for fs={fs} Hz. Skipping filter.")
+            return None
+        btype = "low" if method == "lowpass" else "high"
+        return signal.butter(order, normal_cutoff, btype=btype, analog=False, output="sos")
+
+    if method == "bandpass":
+        low, high = float(params["low_cut"]) / nyq, float(params["high_cut"]) / nyq
+        if not (0 < low < high < 1):
+            log.warning(f"Band {params['low_cut']}-{params['high_cut']} Hz invalid for fs={fs} Hz. Skipping filter.")
+            return None
+        return signal.butter(order, [low, high], btype="band", output="sos")
+
+    if method == "notch":
+        return _design_notch_sos(signal, float(params["freq"]), fs, params.get("q_factor"))
+
+    if method == "multi_harmonic_notch":
+        return _design_harmonic_notch_sos(
+            signal,
+            float(params["fundamental_hz"]),
+            fs,
+            params.get("max_harmonics"),
+            float(params.get("q_factor", 30.0)),
+        )
+
+    raise ValueError(f"Unknown filter method '{method}'")
+
+
 def bandpass_filter(data: np.ndarray, lowcut: float, highcut: float, fs: float, order: int = 5) -> np.ndarray:
     """
     Apply a Butterworth bandpass filter to the data.
@@ -495,36 +597,14 @@ def subtract_baseline_mode(data: np.ndarray, decimals: Optional[int] = None) ->
     if data is None or len(data) == 0:
         return data
 
-    _, stats, has_scipy = _get_scipy()
-    if not has_scipy:
-        log.warning("Scipy not available. Cannot use mode for baseline subtraction. Using median.")
-        return subtract_baseline_median(data)
-
-    # Infer decimals if not provided? For now default to 1 as per original behavior if None
-    # Better yet, let's keep it explicit.
     if decimals is None:
         decimals = 1
 
-    # Round data to bin values
-    rounded_data = np.round(data, decimals)
-
-    # Calculate mode
-    try:
-        # scipy.stats.mode returns (mode_array, count_array)
-        # Using keepdims=False for scalar result in newer scipy
-        # But older scipy might not have keepdims, or return array.
-        mode_result = stats.mode(rounded_data, axis=None, keepdims=False)
-
-        if np.isscalar(mode_result.mode):
-            baseline_offset = mode_result.mode
-        elif np.ndim(mode_result.mode) == 0:
-            baseline_offset = mode_result.mode.item()
-        else:
-            baseline_offset = mode_result.mode[0]
-
-    except (ValueError, TypeError, IndexError) as e:
-        log.warning(f"Mode calculation failed: {e}. Fallback to median.")
-        baseline_offset = np.median(data)
+    # Bincount over the rounded value grid: O(n), no sort of the whole trace
+    baseline_offset = robust_stats.mode(np.ravel(data), decimals=decimals)
+    if not np.isfinite(baseline_offset):
+        log.warning("Mode calculation failed (non-finite data). Fallback to median.")
+        baseline_offset = robust_stats.median(np.ravel(data))
 
     log.debug(f"Baseline subtraction (Mode): Calculated offset = {baseline_offset}")
     return data - baseline_offset
@@ -541,7 +621,7 @@ def subtract_baseline_median(data: np.ndarray) -> np.ndarray:
     """Subtract the median of the entire signal."""
     if data is None or len(data) == 0:
         return data
-    return data - np.median(data)
+    return data - robust_stats.median(np.ravel(data))
 
 
 def subtract_baseline_linear(data: np.ndarray) -> np.ndarray:
@@ -602,8 +682,9 @@ def blank_artifact(
       post-artifact boundary values.
 
     Args:
-        data: 1-D signal array.
-        time_vector: 1-D time array (same length as *data*), in seconds.
+        data: 1-D signal array, or 2-D ``(n_trials, n_samples)`` block of
+            trials sharing *time_vector* (the window is blanked in every row).
+        time_vector: 1-D time array (same length as the last axis of *data*), in seconds.
         onset_time: Start of the artifact window, in seconds.
         duration_ms: Duration of the artifact window, in milliseconds.
         method: Interpolation mode — ``"hold"``, ``"zero"``, or
@@ -635,18 +716,18 @@ def blank_artifact(
     idx_end = idx_start + int(np.sum(mask))
 
     if method == "zero":
-        result[idx_start:idx_end] = 0.0
+        result[..., idx_start:idx_end] = 0.0
 
     elif method == "hold":
-        hold_value = result[max(0, idx_start - 1)]
-        result[idx_start:idx_end] = hold_value
+        hold_value = result[..., max(0, idx_start - 1)]
+        result[..., idx_start:idx_end] = np.expand_dims(hold_value, -1)
 
     elif method == "linear":
-        pre_value = result[max(0, idx_start - 1)]
-        post_value = result[min(len(result) - 1, idx_end)]
+        pre_value = result[..., max(0, idx_start - 1)]
+        post_value = result[..., min(result.shape[-1] - 1, idx_end)]
         n_samples = idx_end - idx_start
         if n_samples > 0:
-            result[idx_start:idx_end] = np.linspace(pre_value, post_value, n_samples)
+            result[..., idx_start:idx_end] = np.linspace(pre_value, post_value, n_samples, axis=-1)
 
     log.debug(
         "Artifact blanked: onset=%.4fs, duration=%.2fms, method=%s, " "samples=%d",
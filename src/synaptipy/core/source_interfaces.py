@@ -1,5 +1,5 @@
 # src/synaptipy/core/source_interfaces.py
-from typing import Any, Dict, Optional, Protocol
+from typing import Any, Dict, Optional, Protocol, Sequence
 
 import numpy as np
 
@@ -19,6 +19,22 @@ class SourceHandle(Protocol):  # pragma: no cover
         """Loads data for a specific channel and trial index."""
         ...
 
+    def load_block(self, channel_ids: Sequence[str], trial_indices: Sequence[int]) -> Optional[np.ndarray]:
+        """Optional bulk read: ``(n_channels, n_trials, n_samples)`` array, or None if ragged/missing.
+
+        Callers check ``hasattr(handle, "load_block")`` and fall back to
+        :meth:`load_channel_data` per trial.
+        """
+        ...
+
+    def trial_length(self, channel_id: str, trial_index: int) -> Optional[int]:
+        """Optional: sample count of one trial without loading it (None if unknown)."""
+        ...
+
+    def load_window(self, channel_id: str, trial_index: int, i_start: int, i_stop: int) -> Optional[np.ndarray]:
+        """Optional: samples ``[i_start, i_stop)`` of one trial, reading only that range if possible."""
+        ...
+
     def get_metadata(self) -> Dict[str, Any]:
         """Returns metadata associated with the source."""
         ...
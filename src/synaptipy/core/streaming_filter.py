@@ -0,0 +1,237 @@
+# src/synaptipy/core/streaming_filter.py
+# -*- coding: utf-8 -*-
+"""
+Bounded-memory block filtering for traces too long to hold in RAM.
+
+The ``*_filter`` functions in :mod:`synaptipy.core.signal_processor` need the
+whole trace plus several full-size temporaries.  The functions here read the
+input in fixed-size blocks from any sliceable 1-D source - an in-memory array,
+an ``np.memmap``, an h5py dataset, or a lazily loaded trial via
+:class:`TrialSource` - and write each block straight into the output, which
+may itself be a ``.npy`` memmap.  Peak memory is a few blocks regardless of
+recording length.
+
+Two modes are provided:
+
+* **Causal** (``zero_phase=False``): the SOS state is carried from block to
+  block, so the result equals a single ``sosfilt`` over the whole trace.
+* **Zero-phase** (``zero_phase=True``): every block is read with ``pad``
+  samples of overlap on each side, filtered forward and backward, and only the
+  centre is kept.  ``pad`` is chosen by :func:`settling_samples` so the
+  impulse-response tail dropped at a block boundary sums to at most ``tol``
+  of its total; the deviation from a whole-trace
+  :func:`~synaptipy.core.signal_processor._sosfiltfilt_safe` is therefore at
+  most about ``2 * tol * sum|h|**2 * max|x|``.  Blocks touching either end of
+  the trace start from the same zero state as the whole-trace filter, so the
+  edges match exactly.
+"""
+
+import logging
+import os
+from typing import Any, Union
+
+import numpy as np
+
+from synaptipy.core import signal_processor
+
+log = logging.getLogger(__name__)
+
+DEFAULT_BLOCK_SIZE = 1 << 20  # samples per block (8 MB of float64)
+DEFAULT_TOLERANCE = 1e-7  # relative impulse-response tail dropped at block boundaries
+MAX_SETTLING_SAMPLES = 1 << 24
+
+OutputArg = Union[None, str, os.PathLike, np.ndarray]
+
+
+class TrialSource:
+    """Sliceable 1-D view of one channel trial that reads lazily on demand.
+
+    Slicing calls :meth:`Channel.get_data_slice`, so trials that have not
+    been loaded are read window by window from the recording's source handle
+    instead of being loaded whole.
+    """
+
+    __slots__ = ("channel", "trial_index", "_length")
+
+    ndim = 1
+
+    def __init__(self, channel: Any, trial_index: int):
+        self.channel = channel
+        self.trial_index = int(trial_index)
+        length = channel._trial_length(self.trial_index)
+        if length is None:
+            raise ValueError(f"Trial {trial_index} of channel '{channel.id}' has no data")
+        self._length = int(length)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, item: slice) -> np.ndarray:
+        if not isinstance(item, slice):
+            raise TypeError("TrialSource only supports slicing")
+        start, stop, _ = item.indices(self._length)
+        data = self.channel.get_data_slice(self.trial_index, start, max(start, stop))
+        return np.empty(0) if data is None else data
+
+
+def settling_samples(sos: np.ndarray, tol: float = DEFAULT_TOLERANCE, max_samples: int = MAX_SETTLING_SAMPLES) -> int:
+    """Number of samples after which the filter's impulse response is negligible.
+
+    Returns the smallest ``k`` such that ``sum(|h[k:]|) <= tol * sum(|h|)``,
+    capped at *max_samples* (with a warning) for very slowly decaying designs.
+    """
+    scipy_signal, _, has_scipy = signal_processor._get_scipy()
+    if not has_scipy:
+        return 0
+    sos = np.ascontiguousarray(sos, dtype=np.float64)
+    length = 4096
+    while True:
+        impulse = np.zeros(length)
+        impulse[0] = 1.0
+        magnitude = np.abs(scipy_signal.sosfilt(sos, impulse))
+        tail = np.cumsum(magnitude[::-1])[::-1]
+        total = tail[0]
+        if not np.isfinite(total) or total == 0:
+            return 0
+        # The last quarter must already be far below tol, so the unseen remainder cannot matter.
+        if tail[(3 * length) // 4] <= 1e-3 * tol * total:
+            return int(np.argmax(tail <= tol * total))
+        if length >= max_samples:
+            log.warning("Filter impulse response does not settle within %d samples; using that overlap.", max_samples)
+            return int(max_samples)
+        length = min(2 * length, int(max_samples))
+
+
+def sosfilt_blocks(
+    sos: np.ndarray,
+    source: Any,
+    out: OutputArg = None,
+    *,
+    zero_phase: bool = True,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    tol: float = DEFAULT_TOLERANCE,
+    dtype: Any = np.float64,
+) -> np.ndarray:
+    """Apply an SOS filter to *source* block by block.
+
+    Args:
+        sos: ``(n_sections, 6)`` second-order sections.
+        source: Sliceable 1-D input (ndarray, ``np.memmap``, h5py dataset,
+            :class:`TrialSource`, ...).
+        out: Output array of the same length, a path for a new ``.npy``
+            memmap, or ``None`` to allocate an in-memory array.
+        zero_phase: Forward-backward filtering with overlapping blocks;
+            ``False`` runs a single causal pass with carried state.
+        block_size: Samples written per block.  In zero-phase mode each read
+            is ``block_size + 2 * pad`` samples.
+        tol: Relative impulse-response tail allowed at block boundaries
+            (zero-phase only, see :func:`settling_samples`).
+        dtype: Output dtype when *out* is allocated here.
+
+    Returns:
+        The filled output array (flushed if it is a memmap).
+    """
+    n = _source_length(source)
+    result = _prepare_output(out, n, dtype)
+    block_size = max(1, int(block_size))
+    scipy_signal, _, has_scipy = signal_processor._get_scipy()
+    if not has_scipy:
+        log.warning("Scipy not available. Copying data through unfiltered.")
+        _copy_blocks(source, result, n, block_size)
+    elif zero_phase:
+        _zero_phase_blocks(scipy_signal, sos, source, result, n, block_size, tol)
+    else:
+        _causal_blocks(scipy_signal, sos, source, result, n, block_size)
+    if isinstance(result, np.memmap):
+        result.flush()
+    return result
+
+
+def filter_streaming(
+    source: Any,
+    fs: float,
+    method: str,
+    out: OutputArg = None,
+    *,
+    order: int = 5,
+    zero_phase: bool = True,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    tol: float = DEFAULT_TOLERANCE,
+    **params: Any,
+) -> np.ndarray:
+    """Block-wise counterpart of the ``signal_processor`` filter functions.
+
+    *method* and *params* are those of
+    :func:`~synaptipy.core.signal_processor.design_filter_sos`: ``"lowpass"``
+    / ``"highpass"`` (``cutoff``), ``"bandpass"`` (``low_cut``,
+    ``high_cut``), ``"notch"`` (``freq``, ``q_factor``) or
+    ``"multi_harmonic_notch"`` (``fundamental_hz``, ``q_factor``,
+    ``max_harmonics``).  An invalid design copies the data through unchanged,
+    as the in-memory functions do.
+
+    Example:
+        >>> src = np.load("trace.npy", mmap_mode="r")
+        >>> filter_streaming(src, 50_000, "bandpass", "filtered.npy", low_cut=1, high_cut=3000)
+    """
+    sos = signal_processor.design_filter_sos(method, fs, order, **params)
+    if sos is None:
+        n = _source_length(source)
+        result = _prepare_output(out, n, np.float64)
+        _copy_blocks(source, result, n, max(1, int(block_size)))
+        if isinstance(result, np.memmap):
+            result.flush()
+        return result
+    return sosfilt_blocks(sos, source, out, zero_phase=zero_phase, block_size=block_size, tol=tol)
+
+
+# ---------------------------------------------------------------------------
+# Internals
+# ---------------------------------------------------------------------------
+
+
+def _source_length(source: Any) -> int:
+    if getattr(source, "ndim", 1) != 1:
+        raise ValueError("Streaming filters take a 1-D source")
+    return len(source)
+
+
+def _prepare_output(out: OutputArg, n: int, dtype: Any) -> np.ndarray:
+    if out is None:
+        return np.empty(n, dtype=dtype)
+    if isinstance(out, (str, os.PathLike)):
+        return np.lib.format.open_memmap(os.fspath(out), mode="w+", dtype=dtype, shape=(n,))
+    if out.shape != (n,):
+        raise ValueError(f"Output shape {out.shape} does not match source length {n}")
+    return out
+
+
+def _read(source: Any, start: int, stop: int) -> np.ndarray:
+    return np.ascontiguousarray(source[start:stop], dtype=np.float64)
+
+
+def _copy_blocks(source, out, n, block_size) -> None:
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        out[start:stop] = _read(source, start, stop)
+
+
+def _causal_blocks(scipy_signal, sos, source, out, n, block_size) -> None:
+    sos = np.ascontiguousarray(sos, dtype=np.float64)
+    zi = np.zeros((sos.shape[0], 2))
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        out[start:stop], zi = scipy_signal.sosfilt(sos, _read(source, start, stop), zi=zi)
+
+
+def _zero_phase_blocks(scipy_signal, sos, source, out, n, block_size, tol) -> None:
+    sos = np.ascontiguousarray(sos, dtype=np.float64)
+    pad = settling_samples(sos, tol)
+    if pad > block_size:
+        log.debug("Raising block size from %d to the %d-sample filter overlap.", block_size, pad)
+        block_size = pad
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        lo, hi = max(0, start - pad), min(n, stop + pad)
+        y = scipy_signal.sosfilt(sos, _read(source, lo, hi))
+        y = scipy_signal.sosfilt(sos, y[::-1])[::-1]
+        out[start:stop] = y[start - lo : stop - lo]
@@ -0,0 +1,267 @@
+# src/synaptipy/core/time_axis.py
+# -*- coding: utf-8 -*-
+"""
+Implicit (virtual) time axis for uniformly sampled traces.
+
+A :class:`TimeAxis` stores only ``(t0, dt, n)`` and computes sample times on
+demand, instead of allocating an ``n``-element float64 array for every trace.
+It mirrors the parts of the NumPy array interface that analysis code relies
+on - ``len``, integer/slice indexing, ``searchsorted``, arithmetic with
+scalars, comparisons - and materialises transparently (``np.asarray``) for
+everything else.
+
+Materialised values are bit-identical to
+``np.linspace(t0, t0 + n * dt, n, endpoint=False)`` as previously produced by
+:meth:`Channel.get_time_vector`, so swapping the dense array for a
+``TimeAxis`` never changes analysis results.
+"""
+
+import logging
+import numbers
+from typing import Any, Optional, Union
+
+import numpy as np
+from numpy.lib.mixins import NDArrayOperatorsMixin
+
+log = logging.getLogger(__name__)
+
+ArrayOrAxis = Union[np.ndarray, "TimeAxis"]
+
+
+class TimeAxis(NDArrayOperatorsMixin):
+    """Uniform time axis ``t[i] = t0 + (i0 + i) * dt`` for ``0 <= i < n``.
+
+    ``i0`` is the index offset of a contiguous slice: ``axis[a:b]`` keeps the
+    parent's ``t0``/``dt`` and sets ``i0 = a`` so windowed axes stay
+    bit-identical to the corresponding part of the full axis.
+
+    Instances are immutable.  Slicing with a positive step returns another
+    ``TimeAxis``; adding/subtracting a scalar shifts ``t0`` and multiplying by
+    a positive scalar rescales, both without allocation.  Any other NumPy
+    operation sees the materialised float64 array.
+    """
+
+    __slots__ = ("t0", "dt", "n", "i0")
+    __hash__ = None  # mutable-array semantics for ==
+
+    def __init__(self, t0: float, dt: float, n: int, i0: int = 0):
+        if n < 0:
+            raise ValueError(f"TimeAxis length must be non-negative, got {n}")
+        object.__setattr__(self, "t0", float(t0))
+        object.__setattr__(self, "dt", float(dt))
+        object.__setattr__(self, "n", int(n))
+        object.__setattr__(self, "i0", int(i0))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("TimeAxis is immutable")
+
+    def __reduce__(self):
+        return (TimeAxis, (self.t0, self.dt, self.n, self.i0))
+
+    # ------------------------------------------------------------------
+    # Constructors
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_sampling_rate(cls, n_samples: int, sampling_rate: float, t0: float = 0.0) -> "TimeAxis":
+        """Axis of *n_samples* starting at *t0*, matching ``np.linspace(t0, t0 + n/fs, n, endpoint=False)``."""
+        if sampling_rate <= 0:
+            raise ValueError(f"Sampling rate must be positive, got {sampling_rate}")
+        return cls.from_linspace(t0, t0 + n_samples / sampling_rate, n_samples)
+
+    @classmethod
+    def from_linspace(cls, start: float, stop: float, n: int) -> "TimeAxis":
+        """Equivalent of ``np.linspace(start, stop, n, endpoint=False)``."""
+        dt = (float(stop) - float(start)) / n if n > 0 else 0.0
+        return cls(start, dt, n)
+
+    @classmethod
+    def from_array(cls, time: np.ndarray, rtol: float = 1e-9) -> Optional["TimeAxis"]:
+        """Return a ``TimeAxis`` when *time* is uniformly spaced, otherwise ``None``."""
+        time = np.asarray(time)
+        if time.ndim != 1 or time.size < 2:
+            return None
+        dt = (float(time[-1]) - float(time[0])) / (time.size - 1)
+        if dt == 0 or not np.allclose(np.diff(time), dt, rtol=rtol, atol=abs(dt) * rtol):
+            return None
+        return cls(float(time[0]), dt, time.size)
+
+    # ------------------------------------------------------------------
+    # Array-like protocol
+    # ------------------------------------------------------------------
+
+    @property
+    def shape(self):
+        return (self.n,)
+
+    @property
+    def size(self) -> int:
+        return self.n
+
+    ndim = 1
+    dtype = np.dtype(np.float64)
+
+    @property
+    def sampling_rate(self) -> float:
+        """``1 / dt`` (``inf`` for a degenerate zero-step axis)."""
+        return 1.0 / self.dt if self.dt else float("inf")
+
+    @property
+    def start(self) -> float:
+        """Time of the first sample (``t0 + i0 * dt``)."""
+        return float(self._value(np.asarray(0)))
+
+    @property
+    def t_end(self) -> float:
+        """Time just past the last sample."""
+        return float(self._value(np.asarray(self.n)))
+
+    @property
+    def duration(self) -> float:
+        return self.n * self.dt
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __repr__(self) -> str:
+        offset = f", i0={self.i0}" if self.i0 else ""
+        return f"TimeAxis(t0={self.t0!r}, dt={self.dt!r}, n={self.n}{offset})"
+
+    def materialize(self, dtype: Any = None) -> np.ndarray:
+        """Allocate and return the dense time array."""
+        out = np.arange(self.i0, self.i0 + self.n, dtype=np.float64)
+        out *= self.dt
+        out += self.t0
+        return out if dtype is None else out.astype(dtype, copy=False)
+
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> np.ndarray:
+        return self.materialize(dtype)
+
+    def __iter__(self):
+        return iter(self.materialize().tolist())
+
+    def _value(self, index: np.ndarray) -> np.ndarray:
+        # Same float64 operations as materialize() so values are bit-identical.
+        return (index + self.i0).astype(np.float64) * self.dt + self.t0
+
+    def __getitem__(self, key):
+        if isinstance(key, numbers.Integral) and not isinstance(key, (bool, np.bool_)):
+            i = int(key)
+            if i < 0:
+                i += self.n
+            if not 0 <= i < self.n:
+                raise IndexError(f"index {key} is out of bounds for axis 0 with size {self.n}")
+            return float(self._value(np.asarray(i)))
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.n)
+            length = len(range(start, stop, step))
+            if step == 1:
+                return TimeAxis(self.t0, self.dt, length, self.i0 + start)
+            if step > 0:
+                return TimeAxis(float(self._value(np.asarray(start))), self.dt * step, length)
+            return self.materialize()[key]
+        if isinstance(key, tuple) and len(key) == 1:
+            return self[key[0]]
+        return self.materialize()[key]
+
+    def copy(self) -> "TimeAxis":
+        return self
+
+    def tolist(self) -> list:
+        return self.materialize().tolist()
+
+    def astype(self, dtype: Any, copy: bool = True) -> np.ndarray:
+        return self.materialize(dtype)
+
+    def min(self, *args, **kwargs) -> float:
+        if self.n == 0:
+            raise ValueError("zero-size TimeAxis has no minimum")
+        return self[0] if self.dt >= 0 else self[-1]
+
+    def max(self, *args, **kwargs) -> float:
+        if self.n == 0:
+            raise ValueError("zero-size TimeAxis has no maximum")
+        return self[-1] if self.dt >= 0 else self[0]
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def searchsorted(self, v, side: str = "left", sorter=None):
+        """``np.searchsorted`` without materialising the axis (ascending axes only)."""
+        if self.dt <= 0 or sorter is not None:
+            return np.searchsorted(self.materialize(), v, side=side, sorter=sorter)
+        values = np.asarray(v, dtype=np.float64)
+        idx = np.floor((values - self.t0) / self.dt) - self.i0
+        idx = np.clip(np.nan_to_num(idx, nan=self.n, posinf=self.n, neginf=0), 0, self.n).astype(np.int64)
+        # Floating-point correction against the exact sample values.
+        for _ in range(2):
+            below = idx > 0
+            prev = self._value(idx - 1)
+            step_back = below & ((prev >= values) if side == "left" else (prev > values))
+            idx = np.where(step_back, idx - 1, idx)
+        for _ in range(2):
+            inside = idx < self.n
+            cur = self._value(idx)
+            step_fwd = inside & ((cur < values) if side == "left" else (cur <= values))
+            idx = np.where(step_fwd, idx + 1, idx)
+        return int(idx) if idx.ndim == 0 else idx
+
+    def index_of(self, t: float) -> int:
+        """Index of the sample nearest to time *t*, clipped to the axis."""
+        if self.n == 0:
+            raise ValueError("zero-size TimeAxis has no samples")
+        i = int(round((float(t) - self.t0) / self.dt)) - self.i0 if self.dt else 0
+        return min(max(i, 0), self.n - 1)
+
+    # ------------------------------------------------------------------
+    # ufunc support
+    # ------------------------------------------------------------------
+
+    _COMPARE = {np.greater_equal: "ge", np.greater: "gt", np.less: "lt", np.less_equal: "le"}
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method == "__call__" and not kwargs and len(inputs) == 2:
+            fast = self._fast_binary(ufunc, *inputs)
+            if fast is not NotImplemented:
+                return fast
+        inputs = tuple(x.materialize() if isinstance(x, TimeAxis) else x for x in inputs)
+        if "out" in kwargs:
+            kwargs["out"] = tuple(x.materialize() if isinstance(x, TimeAxis) else x for x in kwargs["out"])
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def _fast_binary(self, ufunc, a, b):
+        """Allocation-free results for ``axis (+,-,*) scalar`` and boolean masks for comparisons."""
+        scalar_right = a is self and np.isscalar(b) and isinstance(b, numbers.Real)
+        scalar_left = b is self and np.isscalar(a) and isinstance(a, numbers.Real)
+        if not (scalar_right or scalar_left):
+            return NotImplemented
+        s = float(b if scalar_right else a)
+        if ufunc is np.add:
+            return TimeAxis(self.t0 + s, self.dt, self.n, self.i0)
+        if ufunc is np.subtract:
+            if scalar_right:
+                return TimeAxis(self.t0 - s, self.dt, self.n, self.i0)
+            return TimeAxis(s - self.t0, -self.dt, self.n, self.i0)
+        if ufunc is np.multiply:
+            return TimeAxis(self.t0 * s, self.dt * s, self.n, self.i0)
+        if ufunc in self._COMPARE and self.dt > 0:
+            op = self._COMPARE[ufunc]
+            if scalar_left:  # s OP axis  ->  axis (mirrored OP) s
+                op = {"ge": "le", "gt": "lt", "lt": "gt", "le": "ge"}[op]
+            mask = np.zeros(self.n, dtype=bool)
+            if op in ("ge", "gt"):
+                mask[self.searchsorted(s, side="left" if op == "ge" else "right") :] = True
+            else:
+                mask[: self.searchsorted(s, side="right" if op == "le" else "left")] = True
+            return mask
+        return NotImplemented
+
+
+def as_time_array(time: Any) -> Any:
+    """Return *time* as a dense ndarray if it is a :class:`TimeAxis`; lists are converted element-wise."""
+    if isinstance(time, TimeAxis):
+        return time.materialize()
+    if isinstance(time, list):
+        return [t.materialize() if isinstance(t, TimeAxis) else t for t in time]
+    return time
@@ -8,9 +8,24 @@ internal data models (Recording, Channel).
 """
 
 # Expose available file reader adapters
+from .abf_reader import AbfReader, AbfSourceHandle
+from .metadata_scan import FileMetadata, scan_directory, scan_files
 from .neo_adapter import NeoAdapter
+from .nwb_reader import NwbReader, NwbSourceHandle
+from .recording_cache import RecordingDiskCache
+from .recording_catalog import CatalogUpdate, RecordingCatalog
 
 # Define the public API for this subpackage
 __all__ = [
+    "AbfReader",
+    "AbfSourceHandle",
+    "CatalogUpdate",
+    "FileMetadata",
     "NeoAdapter",
+    "NwbReader",
+    "NwbSourceHandle",
+    "RecordingCatalog",
+    "RecordingDiskCache",
+    "scan_directory",
+    "scan_files",
 ]
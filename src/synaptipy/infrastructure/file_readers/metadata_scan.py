@@ -0,0 +1,170 @@
+# src/synaptipy/infrastructure/file_readers/metadata_scan.py
+# -*- coding: utf-8 -*-
+"""
+Header-only metadata records and a parallel directory scanner.
+
+Planning a batch or populating the file browser only needs a handful of
+fields per file (channels, units, sampling rate, sweep count and length,
+protocol, recording date).  :meth:`NeoAdapter.scan_metadata` extracts them
+from the file header without decoding any samples; :func:`scan_files` and
+:func:`scan_directory` fan that out over a thread pool and return one table
+row per file.
+"""
+
+import datetime
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from synaptipy.infrastructure.file_readers.neo_adapter import NeoAdapter
+
+log = logging.getLogger(__name__)
+
+# Header parsing is dominated by small file reads, so threads scale well even
+# on network shares; cap the pool to stay friendly to spinning disks.
+DEFAULT_SCAN_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+METADATA_COLUMNS = [
+    "path",
+    "file_name",
+    "file_format",
+    "channel_names",
+    "channel_units",
+    "electrodes",
+    "sampling_rate",
+    "num_sweeps",
+    "sweep_length",
+    "sweep_duration_s",
+    "protocol_name",
+    "rec_datetime",
+    "file_size",
+    "header_only",
+    "error",
+]
+
+
+@dataclass
+class FileMetadata:
+    """Summary of one recording file, as read from its header."""
+
+    path: Path
+    file_format: str = ""
+    channel_names: List[str] = field(default_factory=list)
+    channel_units: List[str] = field(default_factory=list)
+    electrodes: List[str] = field(default_factory=list)  # per channel; empty when the format has none
+    sampling_rate: Optional[float] = None
+    num_sweeps: int = 0
+    sweep_length: Optional[int] = None  # samples per sweep (first sweep)
+    protocol_name: Optional[str] = None
+    rec_datetime: Optional[datetime.datetime] = None
+    file_size: int = 0
+    # False when the format has no header-only API and a lazy read was needed.
+    header_only: bool = True
+    error: Optional[str] = None
+
+    @property
+    def file_name(self) -> str:
+        return self.path.name
+
+    @property
+    def sweep_duration_s(self) -> Optional[float]:
+        if self.sweep_length is None or not self.sampling_rate:
+            return None
+        return self.sweep_length / self.sampling_rate
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat row for :func:`scan_files` tables (see :data:`METADATA_COLUMNS`)."""
+        row = asdict(self)
+        row["file_name"] = self.file_name
+        row["sweep_duration_s"] = self.sweep_duration_s
+        return row
+
+
+def scan_files(
+    paths: Iterable[Union[str, Path]],
+    adapter: Optional["NeoAdapter"] = None,
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> pd.DataFrame:
+    """Scan the headers of *paths* in parallel and return one row per file.
+
+    Files that cannot be scanned still get a row, with the ``error`` column set.
+
+    Args:
+        paths: Files to scan.
+        adapter: Adapter providing :meth:`NeoAdapter.scan_metadata` (a new one by default).
+        max_workers: Thread pool size (default :data:`DEFAULT_SCAN_WORKERS`; 1 scans serially).
+        progress_callback: Optional ``callback(done, total)`` invoked as files complete.
+
+    Returns:
+        DataFrame with :data:`METADATA_COLUMNS`, in the order of *paths*.
+    """
+    if adapter is None:
+        from synaptipy.infrastructure.file_readers.neo_adapter import NeoAdapter
+
+        adapter = NeoAdapter()
+    paths = [Path(p) for p in paths]
+    total = len(paths)
+    workers = max(1, int(max_workers or DEFAULT_SCAN_WORKERS))
+
+    def _scan(path: Path) -> FileMetadata:
+        try:
+            return adapter.scan_metadata(path)
+        except Exception as e:  # one bad file must not abort the scan
+            log.debug("Metadata scan failed for %s: %s", path, e)
+            return FileMetadata(path=path, error=str(e) or type(e).__name__)
+
+    records: List[FileMetadata] = []
+    if workers == 1 or total <= 1:
+        for done, path in enumerate(paths, 1):
+            records.append(_scan(path))
+            if progress_callback:
+                progress_callback(done, total)
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, total), thread_name_prefix="synaptipy-scan") as pool:
+            for done, record in enumerate(pool.map(_scan, paths), 1):
+                records.append(record)
+                if progress_callback:
+                    progress_callback(done, total)
+
+    log.debug("Scanned %d file header(s) with %d worker(s).", total, workers)
+    return pd.DataFrame([r.to_dict() for r in records], columns=METADATA_COLUMNS)
+
+
+def scan_directory(
+    directory: Union[str, Path],
+    adapter: Optional["NeoAdapter"] = None,
+    recursive: bool = True,
+    extensions: Optional[Iterable[str]] = None,
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> pd.DataFrame:
+    """Scan every supported recording under *directory* (see :func:`scan_files`).
+
+    Args:
+        directory: Folder to scan.
+        adapter: Adapter to use (a new :class:`NeoAdapter` by default).
+        recursive: Descend into sub-folders.
+        extensions: File extensions to include, without dots (default: all
+            extensions supported by the adapter).
+        max_workers: Thread pool size.
+        progress_callback: Optional ``callback(done, total)``.
+
+    Returns:
+        DataFrame with :data:`METADATA_COLUMNS`, sorted by path.
+    """
+    if adapter is None:
+        from synaptipy.infrastructure.file_readers.neo_adapter import NeoAdapter
+
+        adapter = NeoAdapter()
+    directory = Path(directory)
+    wanted = {e.lower().lstrip(".") for e in (extensions or adapter.get_supported_extensions())}
+    walker = directory.rglob("*") if recursive else directory.glob("*")
+    paths = sorted(p for p in walker if p.suffix.lower().lstrip(".") in wanted and p.is_file())
+    return scan_files(paths, adapter=adapter, max_workers=max_workers, progress_callback=progress_callback)
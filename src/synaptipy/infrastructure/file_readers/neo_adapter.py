@@ -31,12 +31,21 @@ from typing import Dict, List, Optional, Tuple, Type
 import neo  # Added missing import
 import neo.io as nIO  # Keep original import style
 import numpy as np
+from neo.rawio.baserawio import BaseRawIO
 
 from synaptipy.core.data_model import Channel, Recording
 from synaptipy.core.signal_processor import validate_sampling_rate
 
 # Import from our package structure
+from synaptipy.infrastructure.file_readers.abf_reader import (
+    AbfReader,
+    _normalise_units,
+    parse_abf_header,
+    protocol_name_from_path,
+)
+from synaptipy.infrastructure.file_readers.metadata_scan import FileMetadata
 from synaptipy.infrastructure.file_readers.neo_source_handle import NeoSourceHandle
+from synaptipy.infrastructure.file_readers.nwb_reader import NwbReader, scan_nwb_file
 from synaptipy.shared.error_handling import (
     FileReadError,
     SynaptipyFileNotFoundError,
@@ -121,6 +130,10 @@ class NeoAdapter:
     """
 
     _has_warned_nwbv1 = False
+    # Route plain .abf reads through the memory-mapped AbfReader before Neo.
+    use_native_abf_reader = True
+    # Route icephys .nwb reads through the lazy h5py NwbReader before Neo; any failure falls back to Neo.
+    use_native_nwb_reader = True
 
     def _get_neo_io_class(self, filepath: Path) -> Type:  # Use generic Type hint
         """Determines appropriate neo IO class using neo.io.get_io first, then fallback to IODict."""
@@ -355,6 +368,21 @@ class NeoAdapter:
 
         self._cache_abf_epochs(reader, recording)
 
+    def _attach_abf_protocol(self, filepath: Path, recording: Recording) -> bool:
+        """Stage 4 of the neo path for an eagerly, natively read ABF recording.
+
+        Fills command waveforms and ``abf_epochs`` from neo's AxonIO header
+        parse (no sample data is read).  Returns ``False`` when AxonIO cannot
+        parse the file, i.e. when the neo path would use the pyabf rescue.
+        """
+        try:
+            reader = nIO.AxonIO(filename=str(filepath))
+        except Exception as e:
+            log.debug("AxonIO header parse failed for '%s': %s", filepath.name, e)
+            return False
+        self._populate_command_signals(reader, list(recording.channels.values()), recording, lazy=False)
+        return True
+
     def _pyabf_to_neo_block(self, filepath: Path) -> Tuple[neo.Block, object]:
         """Convert a pyabf ABF file to a neo Block for downstream processing.
 
@@ -478,6 +506,19 @@ class NeoAdapter:
         protocols = []
 
         try:
+            # Icephys NWB: protocols come from the sweep index (no sample data read)
+            if self.use_native_nwb_reader and filepath.suffix.lower() == ".nwb":
+                try:
+                    index = scan_nwb_file(filepath)
+                    protocols = index.protocols
+                    if len(protocols) > 1 or (protocols and index.nwb_version.startswith("1")):
+                        return protocols
+                    return []
+                except (UnsupportedFormatError, FileReadError) as e:
+                    log.debug("Native NWB index declined '%s' (%s).", filepath.name, e)
+                except Exception as e:
+                    log.warning("Native NWB index failed on '%s' (%s); using Neo.", filepath.name, e)
+
             # Check for NWBv1 first as PyNWB crashes on it
             if filepath.suffix.lower() == ".nwb":
                 import h5py
@@ -499,10 +540,20 @@ class NeoAdapter:
                         if protocols:
                             return protocols
 
+            # ABF files always hold a single block
+            if self.use_native_abf_reader and filepath.suffix.lower() == ".abf":
+                return []
+
             # Generic Neo approach
             io_class = self._get_neo_io_class(filepath)
             reader = io_class(filename=str(filepath))
 
+            # Raw-IO backed readers have parsed their header by now: single-block
+            # files cannot be nested, so skip building the lazy block tree.
+            header = getattr(reader, "header", None)
+            if isinstance(reader, BaseRawIO) and header is not None and header.get("nb_block", 1) <= 1:
+                return []
+
             # read() returns a list of blocks
             blocks = reader.read(lazy=True)
             for block in blocks:
@@ -518,6 +569,116 @@ class NeoAdapter:
 
         return protocols
 
+    def scan_metadata(self, filepath: Path) -> FileMetadata:
+        """Return channel, sweep, protocol and date metadata without reading samples.
+
+        ABF files are parsed by the native header reader; formats backed by a
+        Neo raw IO only parse their header.  Formats without a header-only API
+        fall back to a lazy :meth:`read_recording` (``header_only=False``).
+
+        Raises:
+            SynaptipyFileNotFoundError: If *filepath* does not exist.
+            UnsupportedFormatError: If no reader supports the file.
+        """
+        filepath = Path(filepath)
+        if not filepath.is_file():
+            raise SynaptipyFileNotFoundError(f"File not found: {filepath}")
+        record = FileMetadata(path=filepath, file_size=filepath.stat().st_size)
+
+        if self.use_native_abf_reader and filepath.suffix.lower() == ".abf":
+            try:
+                return self._scan_abf_header(record)
+            except (UnsupportedFormatError, FileReadError, OSError, ValueError) as e:
+                log.debug("Native ABF header scan declined '%s' (%s); using Neo.", filepath.name, e)
+
+        if self.use_native_nwb_reader and filepath.suffix.lower() == ".nwb":
+            try:
+                return self._scan_nwb_index(record)
+            except (UnsupportedFormatError, FileReadError) as e:
+                log.debug("Native NWB index declined '%s' (%s); using Neo.", filepath.name, e)
+            except Exception as e:
+                log.warning("Native NWB index failed on '%s' (%s); using Neo.", filepath.name, e)
+
+        io_class = self._get_neo_io_class(filepath)
+        if issubclass(io_class, BaseRawIO):
+            reader = io_class(filename=str(filepath))
+            if getattr(reader, "header", None) is None:
+                reader.parse_header()
+            return self._scan_rawio_header(record, reader)
+
+        recording = self.read_recording(filepath, lazy=True)
+        try:
+            return self._scan_recording(record, recording)
+        finally:
+            recording.close()
+
+    @staticmethod
+    def _scan_abf_header(record: FileMetadata) -> FileMetadata:
+        header = parse_abf_header(record.path)
+        record.file_format = "ABF"
+        record.channel_names = [c.name for c in header.channels]
+        # Same canonical units ('pA', 'mV') the native reader gives the channels
+        record.channel_units = [_normalise_units(c.units)[0] for c in header.channels]
+        record.sampling_rate = header.sampling_rate
+        record.num_sweeps = len(header.segments)
+        record.sweep_length = header.segments[0][1] if header.segments else None
+        record.protocol_name = protocol_name_from_path(header.protocol_path)
+        record.rec_datetime = header.rec_datetime
+        return record
+
+    @staticmethod
+    def _scan_nwb_index(record: FileMetadata) -> FileMetadata:
+        index = scan_nwb_file(record.path)
+        record.file_format = f"NWB {index.nwb_version}".strip()
+        record.channel_names = [c.name for c in index.channels]
+        record.channel_units = [c.units for c in index.channels]
+        record.electrodes = [c.electrode for c in index.channels]
+        first = index.channels[0].sweeps[0]
+        record.sampling_rate = first.sampling_rate
+        record.num_sweeps = index.num_sweeps
+        record.sweep_length = first.n_samples
+        protocols = index.protocols
+        record.protocol_name = ", ".join(protocols) if protocols else None
+        record.rec_datetime = index.rec_datetime
+        return record
+
+    def _scan_rawio_header(self, record: FileMetadata, reader: BaseRawIO) -> FileMetadata:
+        header = reader.header
+        channels = header["signal_channels"]
+        record.file_format = type(reader).__name__
+        record.channel_names = [self._extract_channel_name(ch, str(ch["id"])) for ch in channels]
+        record.channel_units = [self._standard_unit_scale(str(ch["units"]))[0] or str(ch["units"]) for ch in channels]
+        record.num_sweeps = int(header["nb_segment"][0]) if len(header["nb_segment"]) else 0
+        if len(channels):
+            record.sampling_rate = float(channels[0]["sampling_rate"])
+            if record.num_sweeps and len(header["signal_streams"]):
+                record.sweep_length = int(reader.get_signal_size(0, 0, 0))
+        blocks = getattr(reader, "raw_annotations", {}).get("blocks") or [{}]
+        record.rec_datetime = blocks[0].get("rec_datetime")
+        axon_info = getattr(reader, "_axon_info", None)
+        if isinstance(axon_info, dict) and "sProtocolPath" in axon_info:
+            raw = axon_info["sProtocolPath"]
+            record.protocol_name = protocol_name_from_path(
+                raw.decode("utf-8", "ignore") if isinstance(raw, bytes) else str(raw)
+            )
+        return record
+
+    @staticmethod
+    def _scan_recording(record: FileMetadata, recording: Recording) -> FileMetadata:
+        channels = list(recording.channels.values())
+        record.file_format = "Neo"
+        record.header_only = False
+        record.channel_names = [ch.name for ch in channels]
+        record.channel_units = [ch.units for ch in channels]
+        record.electrodes = [ch.electrode_description or "" for ch in channels]
+        record.sampling_rate = recording.sampling_rate
+        record.num_sweeps = recording.max_trials
+        if channels and channels[0].num_trials:
+            record.sweep_length = channels[0]._trial_length(0)
+        record.protocol_name = recording.protocol_name
+        record.rec_datetime = recording.session_start_time_dt
+        return record
+
     def _allen_nwb_rescue(self, filepath: Path, protocol: Optional[str] = None) -> Tuple[neo.Block, object]:
         """Convert an old Allen SDK NWBv1 file to a neo Block using raw h5py.
 
@@ -647,6 +808,31 @@ class NeoAdapter:
         else:
             filepath = Path(filepath)
 
+        if self.use_native_abf_reader and protocol is None and filepath.suffix.lower() == ".abf" and filepath.is_file():
+            try:
+                recording = AbfReader().read_recording(
+                    filepath, lazy=lazy, channel_whitelist=channel_whitelist, force_kHz_to_Hz=force_kHz_to_Hz
+                )
+            except UnitError:
+                raise
+            except (UnsupportedFormatError, FileReadError, OSError, ValueError) as e:
+                log.debug("Native ABF reader declined '%s' (%s); falling back to neo AxonIO.", filepath.name, e)
+            else:
+                if lazy or self._attach_abf_protocol(filepath, recording):
+                    return recording
+                log.debug("neo AxonIO cannot parse '%s'; reading it through the neo path.", filepath.name)
+
+        if self.use_native_nwb_reader and filepath.suffix.lower() == ".nwb" and filepath.is_file():
+            try:
+                return NwbReader().read_recording(
+                    filepath, lazy=lazy, channel_whitelist=channel_whitelist, protocol=protocol
+                )
+            except (UnsupportedFormatError, FileReadError, KeyError) as e:
+                log.debug("Native NWB reader declined '%s' (%s); falling back to Neo.", filepath.name, e)
+            except Exception as e:
+                # Any failure of the fast path (odd layouts, h5py errors, bugs) must not hide a file Neo can read
+                log.warning("Native NWB reader failed on '%s' (%s); falling back to Neo.", filepath.name, e)
+
         io_class = self._get_neo_io_class(filepath)
         _pyabf_rescue: bool = False
         try:
@@ -898,6 +1084,22 @@ class NeoAdapter:
             log.debug(f"Discovered {len(channel_metadata_map)} channels from header.")
         return channel_metadata_map
 
+    @staticmethod
+    def _standard_unit_scale(units) -> Tuple[Optional[str], float]:
+        """Return ``("mV" | "pA", factor)`` converting native *units*, or ``(None, 1.0)``."""
+        import quantities as pq
+
+        one = pq.Quantity(1.0, units)
+        for target in ("mV", "pA"):
+            try:
+                return target, float(one.rescale(target).magnitude)
+            except ValueError:
+                continue
+            except Exception as e:
+                log.debug(f"Could not derive unit scale for {units}: {e}")
+                break
+        return None, 1.0
+
     def _process_segment_signals(  # noqa: C901
         self,
         segment: neo.Segment,
@@ -1004,6 +1206,12 @@ class NeoAdapter:
                 # We should update metadata with the number of segments ideally.
                 if "num_trials" not in channel_metadata_map[map_key]:
                     channel_metadata_map[map_key]["num_trials"] = 0
+                    # Same mV / pA standardisation as eager reads, applied by the handle on load
+                    unit, scale = self._standard_unit_scale(anasig.units)
+                    if unit is not None:
+                        channel_metadata_map[map_key]["_rescaled_unit"] = unit
+                        if handle_map is not None and anasig_id in handle_map:
+                            handle_map[anasig_id]["scale"] = scale
                 channel_metadata_map[map_key]["num_trials"] += 1
             else:
                 # --- Data unit standardization via Neo's native rescale() ---
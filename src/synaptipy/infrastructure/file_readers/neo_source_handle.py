@@ -1,10 +1,11 @@
 # src/synaptipy/infrastructure/file_readers/neo_source_handle.py
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import neo
 import numpy as np
+from neo.rawio.baserawio import BaseRawIO
 
 from synaptipy.core.source_interfaces import SourceHandle
 
@@ -22,6 +23,8 @@ class NeoSourceHandle(SourceHandle):
         self._block = block
         self._reader = reader
         self._channel_map: Dict[str, Dict[str, int]] = {}
+        # channel_id -> (stream_index, channel index within the stream), taken from the lazy proxies
+        self._raw_map: Optional[Dict[str, Tuple[int, int]]] = None
 
     @property
     def source_identifier(self) -> str:
@@ -30,9 +33,13 @@ class NeoSourceHandle(SourceHandle):
     def set_channel_map(self, channel_map: Dict[str, Any]):
         """
         Sets the mapping required to locate a channel's data within the Neo structure.
-        Format: channel_id -> { 'signal_index': int, 'channel_offset': int }
+        Format: channel_id -> { 'signal_index': int, 'channel_offset': int, 'scale': float }
+
+        ``scale`` (optional, default 1.0) converts lazily read samples from the
+        signal's native units to the channel's standardised units (mV / pA).
         """
         self._channel_map = channel_map
+        self._raw_map = None
 
     def load_channel_data(self, channel_id: str, trial_index: int) -> Optional[np.ndarray]:
         """
@@ -63,6 +70,13 @@ class NeoSourceHandle(SourceHandle):
 
         analog_signal = segment.analogsignals[sig_idx]
 
+        if isinstance(analog_signal, neo.io.proxyobjects.AnalogSignalProxy):
+            # Lazy proxies are not sliceable; read the samples through rawio, or load the proxy itself
+            raw_map = self._rawio_channel_map()
+            if raw_map is not None and channel_id in raw_map:
+                return self._read_rawio([channel_id], [trial_index], raw_map).get((channel_id, trial_index))
+            return self._load_proxy(channel_id, analog_signal, ch_offset)
+
         # Retrieve specific channel column
         if analog_signal.shape[1] > ch_offset:
             data = analog_signal[:, ch_offset]
@@ -72,6 +86,171 @@ class NeoSourceHandle(SourceHandle):
 
         return None
 
+    def trial_length(self, channel_id: str, trial_index: int) -> Optional[int]:
+        """Number of samples in one trial, from the rawio header or the (proxy) signal shape."""
+        if not self._block or not 0 <= trial_index < len(self._block.segments):
+            return None
+        raw_map = self._rawio_channel_map()
+        if raw_map is not None and channel_id in raw_map:
+            try:
+                return int(
+                    self._reader.get_signal_size(
+                        block_index=0, seg_index=trial_index, stream_index=raw_map[channel_id][0]
+                    )
+                )
+            except Exception as e:
+                log.debug(f"NeoSourceHandle: get_signal_size failed: {e}")
+        mapping = self._channel_map.get(channel_id) or {}
+        signals = self._block.segments[trial_index].analogsignals
+        sig_idx = mapping.get("signal_index")
+        if sig_idx is None or sig_idx >= len(signals):
+            return None
+        return int(signals[sig_idx].shape[0])
+
+    def load_window(self, channel_id: str, trial_index: int, i_start: int, i_stop: int) -> Optional[np.ndarray]:
+        """
+        Load samples ``[i_start, i_stop)`` of one trial.
+
+        Rawio-backed readers fetch only the requested sample range from disk;
+        other readers slice a full trial.
+        """
+        if not self._block or not 0 <= trial_index < len(self._block.segments):
+            log.warning(f"NeoSourceHandle: Trial index {trial_index} out of range.")
+            return None
+        n = self.trial_length(channel_id, trial_index)
+        if n is None:
+            return None
+        i_start, i_stop = min(max(0, int(i_start)), n), min(max(0, int(i_stop)), n)
+        raw_map = self._rawio_channel_map()
+        if raw_map is not None and channel_id in raw_map:
+            stream_index, index = raw_map[channel_id]
+            try:
+                raw = self._reader.get_analogsignal_chunk(
+                    block_index=0,
+                    seg_index=trial_index,
+                    i_start=i_start,
+                    i_stop=max(i_start, i_stop),
+                    stream_index=stream_index,
+                    channel_indexes=[index],
+                )
+                scaled = self._reader.rescale_signal_raw_to_float(
+                    raw, dtype="float32", stream_index=stream_index, channel_indexes=[index]
+                )
+                return self._to_channel_units(channel_id, np.ascontiguousarray(scaled[:, 0]))
+            except Exception as e:
+                log.warning(f"NeoSourceHandle: windowed read failed for trial {trial_index}: {e}")
+                return None
+        data = self.load_channel_data(channel_id, trial_index)
+        return data[i_start:i_stop] if data is not None else None
+
+    def load_block(self, channel_ids: Sequence[str], trial_indices: Sequence[int]) -> Optional[np.ndarray]:
+        """
+        Load several channels x trials in one pass and return them stacked.
+
+        For rawio-backed readers each requested segment is read with a single
+        ``get_analogsignal_chunk`` call per signal stream covering every
+        requested channel, visiting segments in file order so the file is
+        scanned sequentially instead of one proxy load (and seek) per trial.
+        Other readers fall back to :meth:`load_channel_data`.
+
+        Returns:
+            Array of shape ``(len(channel_ids), len(trial_indices), n_samples)``
+            in the order requested, or ``None`` if any trial is missing or the
+            trials differ in length.
+        """
+        channel_ids = [str(c) for c in channel_ids]
+        trial_indices = [int(t) for t in trial_indices]
+        if not channel_ids or not trial_indices:
+            return None
+        if not self._block or any(t < 0 or t >= len(self._block.segments) for t in trial_indices):
+            log.warning(f"NeoSourceHandle: Trial indices {trial_indices} out of range.")
+            return None
+
+        raw_map = self._rawio_channel_map()
+        if raw_map is not None and all(c in raw_map for c in channel_ids):
+            trials = self._read_rawio(channel_ids, trial_indices, raw_map)
+        else:
+            trials = {(c, t): self.load_channel_data(c, t) for t in sorted(set(trial_indices)) for c in channel_ids}
+        rows = [[trials.get((c, t)) for t in trial_indices] for c in channel_ids]
+        flat = [r for row in rows for r in row]
+        if any(r is None for r in flat) or len({len(r) for r in flat}) != 1:
+            return None
+        return np.asarray(rows)
+
+    def _rawio_channel_map(self) -> Optional[Dict[str, Tuple[int, int]]]:
+        """
+        Locate each mapped channel in the rawio streams as ``(stream_index, channel_index)``.
+
+        The location comes from the lazy proxy the channel map points at, so it
+        does not depend on channel ids matching (or being unique across
+        streams in) the rawio header.  Channels backed by eager signals or by
+        another reader are left out and load through :meth:`load_channel_data`.
+        """
+        if self._raw_map is not None:
+            return self._raw_map
+        if not isinstance(self._reader, BaseRawIO) or not self._block or not self._block.segments:
+            return None
+        signals = self._block.segments[0].analogsignals
+        raw_map: Dict[str, Tuple[int, int]] = {}
+        for channel_id, mapping in self._channel_map.items():
+            sig_idx = mapping.get("signal_index")
+            if sig_idx is None or sig_idx >= len(signals):
+                continue
+            proxy = signals[sig_idx]
+            if not isinstance(proxy, neo.io.proxyobjects.AnalogSignalProxy) or proxy._rawio is not self._reader:
+                continue
+            inner = np.arange(proxy._nb_total_chann_in_stream)[proxy._inner_stream_channels]
+            offset = mapping.get("channel_offset", 0)
+            if offset < inner.size:
+                raw_map[channel_id] = (int(proxy._stream_index), int(inner[offset]))
+        self._raw_map = raw_map
+        return raw_map
+
+    def _load_proxy(
+        self, channel_id: str, proxy: neo.io.proxyobjects.AnalogSignalProxy, ch_offset: int
+    ) -> Optional[np.ndarray]:
+        """Load one column of a lazy proxy that is not addressable through the handle's rawio reader."""
+        if proxy.shape[1] <= ch_offset:
+            return None
+        try:
+            signal = proxy.load()
+        except Exception as e:
+            log.warning(f"NeoSourceHandle: proxy load failed for channel '{channel_id}': {e}")
+            return None
+        return self._to_channel_units(channel_id, np.array(signal.magnitude[:, ch_offset]))
+
+    def _read_rawio(
+        self, channel_ids: List[str], trial_indices: List[int], raw_map: Dict[str, Tuple[int, int]]
+    ) -> Dict[Tuple[str, int], np.ndarray]:
+        """One chunk read per (segment, stream), segments in ascending order."""
+        by_stream: Dict[int, List[str]] = {}
+        for c in dict.fromkeys(channel_ids):
+            by_stream.setdefault(raw_map[c][0], []).append(c)
+
+        out: Dict[Tuple[str, int], np.ndarray] = {}
+        for seg in sorted(set(trial_indices)):
+            for stream_index, ids in by_stream.items():
+                indexes = [raw_map[c][1] for c in ids]
+                try:
+                    raw = self._reader.get_analogsignal_chunk(
+                        block_index=0, seg_index=seg, stream_index=stream_index, channel_indexes=indexes
+                    )
+                    scaled = self._reader.rescale_signal_raw_to_float(
+                        raw, dtype="float32", stream_index=stream_index, channel_indexes=indexes
+                    )
+                except Exception as e:
+                    log.warning(f"NeoSourceHandle: chunk read failed for segment {seg}: {e}")
+                    continue
+                for col, c in enumerate(ids):
+                    out[(c, seg)] = self._to_channel_units(c, np.ascontiguousarray(scaled[:, col]))
+        return out
+
+    def _to_channel_units(self, channel_id: str, data: np.ndarray) -> np.ndarray:
+        scale = (self._channel_map.get(channel_id) or {}).get("scale", 1.0)
+        if scale != 1.0:
+            data *= np.float32(scale) if data.dtype == np.float32 else scale
+        return data
+
     def get_metadata(self) -> Dict[str, Any]:
         meta: Dict[str, Any] = {}
         if self._block and hasattr(self._block, "annotations"):
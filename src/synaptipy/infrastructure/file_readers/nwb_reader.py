@@ -0,0 +1,584 @@
+# src/synaptipy/infrastructure/file_readers/nwb_reader.py
+# -*- coding: utf-8 -*-
+"""
+Native lazy reader for intracellular (icephys) NWB files.
+
+Neo's ``NWBIO`` and the Allen NWBv1 h5py rescue both decode every sweep of a
+file into memory on open, which costs gigabytes for Allen-style files with
+hundreds of sweeps.  This reader indexes the HDF5 layout once (group
+attributes only), keeps the file open and maps every sweep to its h5py
+dataset, so samples are read only when a trial or a window of a trial is
+requested.
+
+Supported layouts:
+
+* **NWB 2.x**: ``PatchClampSeries`` subtypes (``CurrentClampSeries``,
+  ``VoltageClampSeries``, ``IZeroClampSeries``) under ``/acquisition``.
+  Series are grouped into channels by electrode, series base name (sweep
+  suffix stripped) and units, and ordered by ``sweep_number``.  The protocol
+  of a sweep is its ``stimulus_description``.
+* **NWB 1.x (Allen Cell Types)**: ``/acquisition/timeseries/Sweep_N`` plus
+  the matching ``/stimulus/presentation/Sweep_N``.  The protocol of a sweep
+  is parsed from ``/epochs/Experiment_N/description``
+  (``"Stimulus was <protocol>, ..."``).
+
+Selecting a protocol only maps the sweeps indexed under that protocol.  Files
+without icephys series raise :class:`UnsupportedFormatError` so that
+:class:`~synaptipy.infrastructure.file_readers.neo_adapter.NeoAdapter` can
+fall back to Neo.
+"""
+
+import datetime
+import logging
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import h5py
+import numpy as np
+
+from synaptipy.core.data_model import Channel, Recording
+from synaptipy.core.signal_processor import validate_sampling_rate
+from synaptipy.core.source_interfaces import SourceHandle
+from synaptipy.shared.error_handling import FileReadError, UnsupportedFormatError
+
+log = logging.getLogger(__name__)
+
+_ICEPHYS_TYPES = {"PatchClampSeries", "CurrentClampSeries", "VoltageClampSeries", "IZeroClampSeries"}
+# "Vm_trial_003", "Sweep_12", "data_00005" -> "Vm", "", "data"
+_SWEEP_SUFFIX = re.compile(r"[_\-\s]*(?:trial|sweep|series)?[_\-\s]*\d+$", re.IGNORECASE)
+_PROTOCOL_RE = re.compile(r"Stimulus was\s+([^,]+)")
+_NO_PROTOCOL = {"", "n/a", "na", "none", "unknown"}
+
+# NWB unit strings -> (canonical units, multiplier)
+_UNIT_SCALE: Dict[str, Tuple[str, float]] = {
+    "volts": ("mV", 1e3),
+    "volt": ("mV", 1e3),
+    "v": ("mV", 1e3),
+    "mv": ("mV", 1.0),
+    "millivolts": ("mV", 1.0),
+    "amperes": ("pA", 1e12),
+    "amps": ("pA", 1e12),
+    "a": ("pA", 1e12),
+    "nanoamperes": ("pA", 1e3),
+    "pa": ("pA", 1.0),
+}
+# Placeholder unit strings; "NA" means "not available" (nanoamperes is spelled "nA", see _normalise_units)
+_NO_UNITS = {"", "n/a", "na", "none", "unknown"}
+
+# HDF5 chunk cache per open file, and the decoded-sweep LRU used by window reads.
+_RDCC_NBYTES = 32 * 1024 * 1024
+DEFAULT_SWEEP_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def _attr_str(obj: Any, name: str, default: str = "") -> str:
+    value = obj.attrs.get(name, default)
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "ignore")
+    if isinstance(value, np.ndarray) and value.size == 1:
+        value = value.item()
+        return value.decode("utf-8", "ignore") if isinstance(value, bytes) else str(value)
+    return str(value)
+
+
+def _normalise_units(units: str) -> Tuple[str, float]:
+    text = units.strip()
+    if text == "nA":  # case-sensitive: "NA" / "na" are placeholders, not nanoamperes
+        return "pA", 1e3
+    key = text.lower()
+    if key in _UNIT_SCALE:
+        return _UNIT_SCALE[key]
+    if key in _NO_UNITS:
+        return "unknown", 1.0
+    return text, 1.0
+
+
+def _read_scalar_str(f: h5py.File, path: str) -> Optional[str]:
+    if path not in f:
+        return None
+    value = f[path][()]
+    if isinstance(value, np.ndarray):
+        value = value.flat[0] if value.size else ""
+    return value.decode("utf-8", "ignore") if isinstance(value, bytes) else str(value)
+
+
+def _parse_datetime(text: Optional[str]) -> Optional[datetime.datetime]:
+    if not text:
+        return None
+    try:
+        return datetime.datetime.fromisoformat(text.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+@dataclass
+class NwbSweep:
+    """One sweep of one channel: an HDF5 dataset plus the scaling to canonical units."""
+
+    dataset: str  # HDF5 path of the ``data`` dataset
+    n_samples: int
+    sampling_rate: float
+    t_start: float
+    gain: float  # NWB ``conversion`` x unit multiplier
+    offset: float  # NWB ``offset`` x unit multiplier
+    sweep_number: int
+    protocol: Optional[str] = None
+
+
+@dataclass
+class NwbChannelInfo:
+    id: str
+    name: str
+    units: str
+    sweeps: List[NwbSweep] = field(default_factory=list)
+    electrode: str = ""
+
+
+@dataclass
+class NwbIcephysIndex:
+    """Channels and sweeps of an icephys NWB file, built from HDF5 metadata only."""
+
+    path: Path
+    nwb_version: str
+    channels: List[NwbChannelInfo]
+    rec_datetime: Optional[datetime.datetime] = None
+
+    @property
+    def protocols(self) -> List[str]:
+        """Distinct protocol names, in sweep order."""
+        seen: List[str] = []
+        for ch in self.channels:
+            for sweep in ch.sweeps:
+                if sweep.protocol and sweep.protocol not in seen:
+                    seen.append(sweep.protocol)
+        return seen
+
+    @property
+    def num_sweeps(self) -> int:
+        return max((len(ch.sweeps) for ch in self.channels), default=0)
+
+    def select_protocol(self, protocol: str) -> "NwbIcephysIndex":
+        """Index restricted to the sweeps recorded with *protocol*.
+
+        Raises:
+            ValueError: If no sweep uses *protocol*.
+        """
+        channels = [
+            replace(ch, sweeps=[s for s in ch.sweeps if s.protocol == protocol])
+            for ch in self.channels
+            if any(s.protocol == protocol for s in ch.sweeps)
+        ]
+        if not channels:
+            raise ValueError(f"Protocol '{protocol}' not found in file {self.path.name}")
+        return replace(self, channels=channels)
+
+
+def _sweep_from_group(
+    group: h5py.Group, sweep_number: int, protocol: Optional[str], default_unit: str = ""
+) -> Optional[NwbSweep]:
+    """Describe the ``data`` dataset of a TimeSeries group without reading it."""
+    data = group.get("data")
+    if not isinstance(data, h5py.Dataset) or data.ndim != 1:
+        return None
+    t_start, rate = 0.0, None
+    starting_time = group.get("starting_time")
+    if isinstance(starting_time, h5py.Dataset):
+        rate = float(starting_time.attrs.get("rate", 0.0)) or None
+        t_start = float(starting_time[()])
+    elif isinstance(group.get("timestamps"), h5py.Dataset) and group["timestamps"].shape[0] > 1:
+        stamps = group["timestamps"][:2]
+        t_start, rate = float(stamps[0]), 1.0 / float(stamps[1] - stamps[0])
+    if not rate:
+        return None
+    _, factor = _normalise_units(_attr_str(data, "unit", default_unit))
+    conversion = float(data.attrs.get("conversion", 1.0))
+    offset = float(data.attrs.get("offset", 0.0))
+    return NwbSweep(
+        dataset=data.name,
+        n_samples=int(data.shape[0]),
+        sampling_rate=rate,
+        t_start=t_start,
+        gain=conversion * factor,
+        offset=offset * factor,
+        sweep_number=sweep_number,
+        protocol=protocol,
+    )
+
+
+def _index_nwb2(f: h5py.File) -> List[NwbChannelInfo]:
+    groups: "OrderedDict[Tuple[str, str, str], NwbChannelInfo]" = OrderedDict()
+    acquisition = f.get("acquisition")
+    if not isinstance(acquisition, h5py.Group):
+        return []
+    for position, (name, obj) in enumerate(acquisition.items()):
+        if not isinstance(obj, h5py.Group) or _attr_str(obj, "neurodata_type") not in _ICEPHYS_TYPES:
+            continue
+        sweep_number = int(obj.attrs.get("sweep_number", position))
+        protocol = _attr_str(obj, "stimulus_description").strip()
+        sweep = _sweep_from_group(obj, sweep_number, None if protocol.lower() in _NO_PROTOCOL else protocol)
+        if sweep is None:
+            continue
+        try:
+            electrode = obj["electrode"].name.rsplit("/", 1)[-1]
+        except (KeyError, AttributeError):
+            electrode = ""
+        base = _SWEEP_SUFFIX.sub("", name) or electrode or name
+        units, _ = _normalise_units(_attr_str(obj["data"], "unit"))
+        key = (electrode, base, units)
+        if key not in groups:
+            groups[key] = NwbChannelInfo(id=str(len(groups)), name=base, units=units, electrode=electrode)
+        groups[key].sweeps.append(sweep)
+    for ch in groups.values():
+        ch.sweeps.sort(key=lambda s: s.sweep_number)
+    return list(groups.values())
+
+
+def _allen_protocols(f: h5py.File) -> Dict[str, str]:
+    """``Sweep_N -> protocol`` from ``/epochs/Experiment_N/description``."""
+    out: Dict[str, str] = {}
+    epochs = f.get("epochs")
+    if not isinstance(epochs, h5py.Group):
+        return out
+    for name, epoch in epochs.items():
+        if not isinstance(epoch, h5py.Group) or "description" not in epoch:
+            continue
+        desc = epoch["description"][()]
+        match = _PROTOCOL_RE.search(desc.decode("utf-8", "ignore") if isinstance(desc, bytes) else str(desc))
+        if match:
+            out[name.replace("Experiment_", "Sweep_")] = match.group(1).strip()
+    return out
+
+
+def _index_nwb1(f: h5py.File) -> List[NwbChannelInfo]:
+    protocols = _allen_protocols(f)
+    channels: "OrderedDict[Tuple[str, str], NwbChannelInfo]" = OrderedDict()
+    sources = [("acquisition", f.get("acquisition/timeseries")), ("stimulus", f.get("stimulus/presentation"))]
+    names = {"acquisition": {"mV": "Voltage", "pA": "Current"}, "stimulus": {"pA": "Current", "mV": "Command"}}
+    for source, group in sources:
+        if not isinstance(group, h5py.Group):
+            continue
+        for sweep_name, obj in group.items():
+            if not isinstance(obj, h5py.Group):
+                continue
+            tail = sweep_name.rsplit("_", 1)[-1]
+            sweep_number = int(tail) if tail.isdigit() else 0
+            default_unit = "V" if source == "acquisition" else "A"
+            sweep = _sweep_from_group(obj, sweep_number, protocols.get(sweep_name), default_unit)
+            if sweep is None:
+                continue
+            units, _ = _normalise_units(_attr_str(obj["data"], "unit", default_unit))
+            key = (source, units)
+            if key not in channels:
+                name = names[source].get(units, f"{source}_{units}")
+                if any(ch.name == name for ch in channels.values()):
+                    name = f"{name} ({source})"
+                channels[key] = NwbChannelInfo(id=str(len(channels)), name=name, units=units)
+            channels[key].sweeps.append(sweep)
+    for ch in channels.values():
+        ch.sweeps.sort(key=lambda s: s.sweep_number)
+    return list(channels.values())
+
+
+def index_nwb_file(f: h5py.File, path: Path) -> NwbIcephysIndex:
+    """Build the sweep index of an open NWB file from group and dataset attributes.
+
+    Raises:
+        UnsupportedFormatError: If the file contains no icephys series.
+    """
+    version = _attr_str(f, "nwb_version") or (_read_scalar_str(f, "nwb_version") or "")
+    if "acquisition/timeseries" in f:
+        channels = _index_nwb1(f)
+        version = version or "1"
+    else:
+        channels = _index_nwb2(f)
+    if not channels:
+        raise UnsupportedFormatError(f"No intracellular series found in {path.name}")
+    rec_datetime = _parse_datetime(_read_scalar_str(f, "session_start_time"))
+    return NwbIcephysIndex(path=Path(path), nwb_version=version, channels=channels, rec_datetime=rec_datetime)
+
+
+def scan_nwb_file(filepath: Path) -> NwbIcephysIndex:
+    """Open *filepath* just long enough to index it."""
+    try:
+        with h5py.File(str(filepath), "r") as f:
+            return index_nwb_file(f, Path(filepath))
+    except OSError as e:
+        raise FileReadError(f"Could not open NWB file {filepath}: {e}") from e
+
+
+class NwbSourceHandle(SourceHandle):
+    """:class:`SourceHandle` over an open NWB file; each trial is an h5py dataset.
+
+    Whole-trial reads go straight to the caller (the Channel keeps them).
+    Window reads on compressed datasets decode the full sweep once and keep
+    it in a small byte-bounded LRU, so several windows of the same sweep cost
+    one decompression; uncompressed datasets are sliced directly.
+    """
+
+    def __init__(
+        self, source_path: Path, h5file: h5py.File, index: NwbIcephysIndex, cache_bytes: int = DEFAULT_SWEEP_CACHE_BYTES
+    ):
+        self._source_path = Path(source_path)
+        self._file: Optional[h5py.File] = h5file
+        self._index = index
+        self._channels: Dict[str, NwbChannelInfo] = {ch.id: ch for ch in index.channels}
+        self._cache: "OrderedDict[Tuple[str, int], np.ndarray]" = OrderedDict()
+        self._cache_bytes = 0
+        self._cache_limit = max(0, int(cache_bytes))
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, filepath: Path, cache_bytes: int = DEFAULT_SWEEP_CACHE_BYTES) -> "NwbSourceHandle":
+        """Open *filepath* read-only and index it.
+
+        Raises:
+            FileReadError: If the file cannot be opened as HDF5.
+            UnsupportedFormatError: If it holds no icephys series.
+        """
+        try:
+            h5file = h5py.File(str(filepath), "r", rdcc_nbytes=_RDCC_NBYTES)
+        except OSError as e:
+            raise FileReadError(f"Could not open NWB file {filepath}: {e}") from e
+        try:
+            index = index_nwb_file(h5file, Path(filepath))
+        except Exception:
+            h5file.close()
+            raise
+        return cls(filepath, h5file, index, cache_bytes)
+
+    @property
+    def source_identifier(self) -> str:
+        return str(self._source_path)
+
+    @property
+    def index(self) -> NwbIcephysIndex:
+        return self._index
+
+    def restrict_to_protocol(self, protocol: str) -> None:
+        """Only expose the sweeps recorded with *protocol* (see :meth:`NwbIcephysIndex.select_protocol`)."""
+        self._index = self._index.select_protocol(protocol)
+        self._channels = {ch.id: ch for ch in self._index.channels}
+
+    def _sweep(self, channel_id: str, trial_index: int) -> Optional[NwbSweep]:
+        ch = self._channels.get(str(channel_id))
+        if ch is None:
+            log.warning(f"NwbSourceHandle: No mapping found for channel '{channel_id}'.")
+            return None
+        if not 0 <= trial_index < len(ch.sweeps):
+            log.warning(f"NwbSourceHandle: Trial index {trial_index} out of range.")
+            return None
+        return ch.sweeps[trial_index]
+
+    def _dataset(self, sweep: NwbSweep) -> Optional[h5py.Dataset]:
+        if self._file is None:
+            log.warning("NwbSourceHandle: handle for %s is closed.", self._source_path.name)
+            return None
+        return self._file[sweep.dataset]
+
+    @staticmethod
+    def _scale(raw: np.ndarray, sweep: NwbSweep) -> np.ndarray:
+        """Scale freshly read samples to canonical units (float64 data stays float64)."""
+        data = raw.astype(np.float64 if raw.dtype == np.float64 else np.float32, copy=False)
+        if sweep.gain != 1.0:
+            data *= sweep.gain
+        if sweep.offset:
+            data += sweep.offset
+        return data
+
+    def load_channel_data(self, channel_id: str, trial_index: int) -> Optional[np.ndarray]:
+        """Read and scale one whole sweep (served from the window cache when already decoded)."""
+        with self._lock:
+            cached = self._cache.pop((str(channel_id), trial_index), None)
+            if cached is not None:
+                self._cache_bytes -= cached.nbytes
+                return cached  # ownership moves to the caller
+        sweep = self._sweep(channel_id, trial_index)
+        ds = self._dataset(sweep) if sweep is not None else None
+        if ds is None:
+            return None
+        return self._scale(ds[()], sweep)
+
+    def trial_length(self, channel_id: str, trial_index: int) -> Optional[int]:
+        """Sample count of one sweep, from the dataset shape (no data access)."""
+        ch = self._channels.get(str(channel_id))
+        if ch is None or not 0 <= trial_index < len(ch.sweeps):
+            return None
+        return ch.sweeps[trial_index].n_samples
+
+    def load_window(self, channel_id: str, trial_index: int, i_start: int, i_stop: int) -> Optional[np.ndarray]:
+        """Scale samples ``[i_start, i_stop)`` of one sweep, touching only the chunks that hold them."""
+        sweep = self._sweep(channel_id, trial_index)
+        ds = self._dataset(sweep) if sweep is not None else None
+        if ds is None:
+            return None
+        i_start, i_stop = max(0, int(i_start)), min(sweep.n_samples, max(0, int(i_stop)))
+        if ds.compression is None:
+            return self._scale(ds[i_start:i_stop], sweep)
+        key = (str(channel_id), trial_index)
+        with self._lock:
+            full = self._cache.get(key)
+            if full is not None:
+                self._cache.move_to_end(key)
+        if full is None:
+            full = self._scale(ds[()], sweep)
+            self._remember(key, full)
+        return full[i_start:i_stop].copy()
+
+    def _remember(self, key: Tuple[str, int], data: np.ndarray) -> None:
+        if data.nbytes > self._cache_limit:
+            return
+        with self._lock:
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self._cache_bytes -= old.nbytes
+            self._cache[key] = data
+            self._cache_bytes += data.nbytes
+            while self._cache_bytes > self._cache_limit and self._cache:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= evicted.nbytes
+
+    def load_block(self, channel_ids: Sequence[str], trial_indices: Sequence[int]) -> Optional[np.ndarray]:
+        """Read several channels x sweeps into one array, visiting datasets in file order.
+
+        Returns:
+            Array of shape ``(len(channel_ids), len(trial_indices), n_samples)``,
+            or ``None`` if the handle is closed, an index is invalid or sweep lengths differ.
+        """
+        if self._file is None or not channel_ids or not trial_indices:
+            return None
+        sweeps = []
+        for c in channel_ids:
+            row = [self._sweep(c, int(t)) for t in trial_indices]
+            if any(s is None for s in row):
+                return None
+            sweeps.append(row)
+        lengths = {s.n_samples for row in sweeps for s in row}
+        if len(lengths) != 1:
+            return None
+
+        jobs = [(c, t, self._file[sweeps[c][t].dataset]) for c in range(len(sweeps)) for t in range(len(sweeps[c]))]
+        dtype = np.float64 if any(ds.dtype == np.float64 for _, _, ds in jobs) else np.float32
+        out = np.empty((len(sweeps), len(trial_indices), lengths.pop()), dtype=dtype)
+        # Contiguous datasets have a file offset; reading in that order keeps I/O sequential
+        for c, t, ds in sorted(jobs, key=lambda j: j[2].id.get_offset() or 0):
+            out[c, t] = self._scale(ds[()], sweeps[c][t])
+        return out
+
+    def get_metadata(self) -> Dict[str, Any]:
+        return {"nwb_version": self._index.nwb_version, "nwb_protocols": self._index.protocols}
+
+    def close(self):
+        with self._lock:
+            self._cache.clear()
+            self._cache_bytes = 0
+        f, self._file = self._file, None
+        if f is not None:
+            try:
+                f.close()
+            except Exception as e:  # already closed by h5py at interpreter shutdown
+                log.debug("Error closing %s: %s", self._source_path.name, e)
+
+
+class NwbReader:
+    """Build :class:`Recording` objects from icephys NWB files via :class:`NwbSourceHandle`."""
+
+    def read_recording(
+        self,
+        filepath: Path,
+        lazy: bool = False,
+        channel_whitelist: Optional[List[str]] = None,
+        protocol: Optional[str] = None,
+    ) -> Recording:
+        """
+        Read an NWB file into a Recording.
+
+        In lazy mode the file stays open and each channel loads sweeps on
+        first access; otherwise every sweep is read once and the file is
+        closed.
+
+        Raises:
+            UnsupportedFormatError: If the file holds no icephys series.
+            FileReadError: If the file cannot be opened.
+            ValueError: If *protocol* is given but no sweep uses it.
+        """
+        filepath = Path(filepath)
+        handle = NwbSourceHandle.open(filepath)
+        try:
+            if protocol is not None:
+                handle.restrict_to_protocol(protocol)
+            recording = self._build_recording(filepath, handle, lazy, channel_whitelist)
+        except Exception:
+            handle.close()
+            raise
+        if protocol is not None:
+            recording.protocol_name = protocol
+        if not lazy:
+            handle.close()
+        else:
+            recording.source_handle = handle
+        log.debug(
+            "Native NWB reader: %s (NWB %s, %d channel(s), %d sweep(s), protocol=%s, lazy=%s).",
+            filepath.name,
+            handle.index.nwb_version,
+            len(recording.channels),
+            recording.max_trials,
+            protocol,
+            lazy,
+        )
+        return recording
+
+    def _build_recording(
+        self, filepath: Path, handle: NwbSourceHandle, lazy: bool, channel_whitelist: Optional[List[str]]
+    ) -> Recording:
+        index = handle.index
+        recording = Recording(source_file=filepath)
+        recording.session_start_time_dt = index.rec_datetime
+        recording.metadata.update(handle.get_metadata())
+        protocols = index.protocols
+        if len(protocols) == 1:
+            recording.protocol_name = protocols[0]
+
+        infos = [
+            info
+            for info in index.channels
+            if not channel_whitelist or info.id in channel_whitelist or info.name in channel_whitelist
+        ]
+        channels: List[Channel] = [self._build_channel(info, handle, lazy) for info in infos]
+        for ch in channels:
+            ch._recording_ref = recording
+        recording.channels = {ch.id: ch for ch in channels}
+        if channels:
+            # Ids are not list positions once a protocol or whitelist dropped channels
+            first = infos[0].sweeps[0]
+            recording.sampling_rate = channels[0].sampling_rate
+            recording.t_start = channels[0].t_start
+            recording.duration = first.n_samples / first.sampling_rate
+        return recording
+
+    @staticmethod
+    def _build_channel(info: NwbChannelInfo, handle: NwbSourceHandle, lazy: bool) -> Channel:
+        fs = info.sweeps[0].sampling_rate
+        validate_sampling_rate(fs)
+        if any(s.sampling_rate != fs for s in info.sweeps):
+            log.warning(
+                "NWB channel '%s' mixes sampling rates across sweeps; select a protocol to read uniform sweeps.",
+                info.name,
+            )
+        if lazy:
+            channel = Channel(
+                id=info.id,
+                name=info.name,
+                units=info.units,
+                sampling_rate=fs,
+                data_trials=[],
+                loader=lambda idx, ch_id=info.id: handle.load_channel_data(ch_id, idx),
+            )
+            channel.metadata["num_trials"] = len(info.sweeps)
+        else:
+            trials = [handle.load_channel_data(info.id, i) for i in range(len(info.sweeps))]
+            channel = Channel(id=info.id, name=info.name, units=info.units, sampling_rate=fs, data_trials=trials)
+        channel.t_start = info.sweeps[0].t_start
+        return channel
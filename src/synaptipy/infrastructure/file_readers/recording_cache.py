@@ -0,0 +1,450 @@
+# src/synaptipy/infrastructure/file_readers/recording_cache.py
+# -*- coding: utf-8 -*-
+"""
+Persistent on-disk cache of decoded Recording objects.
+
+Re-reading a file through :class:`NeoAdapter` repeats header parsing, unit
+conversion and channel discovery every time.  :class:`RecordingDiskCache`
+stores the *decoded* result (trial arrays, command waveforms, units, sampling
+rates and recording metadata such as ``abf_epochs``) as one uncompressed
+``.npz`` archive per file under ``~/.synaptipy/cache``, so a subsequent read of
+an unchanged file is a single sequential load.
+
+Entries are keyed by a fingerprint of the resolved path, file size,
+modification time and a sampled content hash (BLAKE2b over the first and last
+MiB), plus the read options (channel whitelist, kHz correction) and the trial
+storage dtype policy (:mod:`synaptipy.core.precision`).  Any edit to
+the source file therefore produces a new key and the stale entry simply ages
+out.  Total cache size is capped; the least recently used entries (tracked via
+the entry's mtime, which is refreshed on every hit) are evicted first.
+
+Metadata is stored as JSON with tagged values, so numpy arrays and scalars,
+datetimes, paths and tuples come back with their original types (arrays are
+kept as archive members, not JSON lists).
+
+Only fully materialised recordings are stored; lazy reads always go straight
+to the adapter.  The default instance is opt-in: set ``SYNAPTIPY_DISK_CACHE=1``
+to enable it (the variable is inherited by batch worker processes).
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from synaptipy.core.data_model import Channel, Recording
+from synaptipy.core.precision import get_default_storage_dtype
+
+log = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".synaptipy" / "cache"
+DEFAULT_MAX_BYTES = 4 * 1024**3  # 4 GiB
+
+_CACHE_FORMAT_VERSION = 2
+_HASH_SPAN_BYTES = 1024 * 1024
+_META_KEY = "__meta__"
+
+_CHANNEL_ATTRS = (
+    "t_start",
+    "current_units",
+    "electrode_description",
+    "electrode_location",
+    "electrode_filtering",
+    "electrode_gain",
+    "electrode_offset",
+    "electrode_resistance",
+    "electrode_seal",
+)
+_RECORDING_ATTRS = (
+    "sampling_rate",
+    "duration",
+    "t_start",
+    "protocol_name",
+    "injected_current",
+    "subject_id",
+    "cell_id",
+    "recording_temperature",
+)
+
+
+# Types stored as text; datetime comes before its base class date.
+_TEXT_TAGS = ((datetime.datetime, "__datetime__"), (datetime.date, "__date__"), (Path, "__path__"))
+
+
+def _pack(obj: Any, arrays: Dict[str, np.ndarray]) -> Any:
+    """Turn *obj* into JSON-safe data; non-JSON types become single-key tagged dicts.
+
+    Arrays and numpy scalars are added to *arrays* (the ``.npz`` members) and
+    referenced by name, so dtype and shape survive the round trip.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, (np.ndarray, np.generic)):
+        array = np.asarray(obj)
+        if array.dtype.hasobject:
+            raise TypeError("object arrays are not cacheable")
+        name = f"m{len(arrays)}"
+        arrays[name] = array
+        return {"__array__" if isinstance(obj, np.ndarray) else "__scalar__": name}
+    for cls, tag in _TEXT_TAGS:
+        if isinstance(obj, cls):
+            return {tag: obj.isoformat() if tag != "__path__" else str(obj)}
+    if isinstance(obj, tuple):
+        return {"__tuple__": [_pack(v, arrays) for v in obj]}
+    if isinstance(obj, list):
+        return [_pack(v, arrays) for v in obj]
+    if isinstance(obj, dict):
+        if all(isinstance(k, str) for k in obj):
+            return {k: _pack(v, arrays) for k, v in obj.items()}
+        return {"__items__": [[_pack(k, arrays), _pack(v, arrays)] for k, v in obj.items()]}
+    raise TypeError(f"Object of type {type(obj).__name__} is not cacheable")
+
+
+_UNPACKERS = {
+    "__array__": lambda value, archive: archive[value],
+    "__scalar__": lambda value, archive: archive[value][()],
+    "__datetime__": lambda value, archive: datetime.datetime.fromisoformat(value),
+    "__date__": lambda value, archive: datetime.date.fromisoformat(value),
+    "__path__": lambda value, archive: Path(value),
+    "__tuple__": lambda value, archive: tuple(_unpack(v, archive) for v in value),
+    "__items__": lambda value, archive: {_unpack(k, archive): _unpack(v, archive) for k, v in value},
+}
+
+
+def _unpack(obj: Any, archive: Any) -> Any:
+    """Inverse of :func:`_pack`."""
+    if isinstance(obj, list):
+        return [_unpack(v, archive) for v in obj]
+    if isinstance(obj, dict):
+        if len(obj) == 1:
+            tag, value = next(iter(obj.items()))
+            if tag in _UNPACKERS:
+                return _UNPACKERS[tag](value, archive)
+        return {k: _unpack(v, archive) for k, v in obj.items()}
+    return obj
+
+
+def _is_fully_loaded(recording: Recording) -> bool:
+    """True when every channel holds all of its trials in memory."""
+    for ch in recording.channels.values():
+        trials = ch.data_trials
+        if len(trials) != ch.num_trials or any(t is None for t in trials):
+            return False
+    return True
+
+
+class RecordingDiskCache:
+    """
+    Fingerprint-keyed, size-capped disk cache for decoded recordings.
+
+    Thread- and process-safe for concurrent readers/writers: entries are
+    written to a unique temporary file and atomically renamed into place.
+    """
+
+    _instance: Optional["RecordingDiskCache"] = None
+    _lock = threading.RLock()
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        enabled: bool = True,
+    ):
+        """
+        Args:
+            cache_dir: Directory holding the cache entries (default ``~/.synaptipy/cache``).
+            max_bytes: Size cap in bytes; LRU entries are evicted beyond it.
+            enabled: When ``False`` every lookup misses and nothing is written.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+        self.max_bytes = int(max_bytes)
+        self.enabled = bool(enabled)
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    @classmethod
+    def get_instance(cls) -> "RecordingDiskCache":
+        """Get the process-wide cache instance."""
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls(enabled=os.environ.get("SYNAPTIPY_DISK_CACHE", "0") == "1")
+            return cls._instance
+
+    @classmethod
+    def set_instance(cls, instance: Optional["RecordingDiskCache"]) -> None:
+        """Replace the process-wide instance (``None`` restores the default on next access)."""
+        with cls._lock:
+            cls._instance = instance
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def content_hash(filepath: Path) -> str:
+        """BLAKE2b digest of the first and last MiB of *filepath*."""
+        h = hashlib.blake2b(digest_size=16)
+        with open(filepath, "rb") as fid:
+            h.update(fid.read(_HASH_SPAN_BYTES))
+            fid.seek(0, os.SEEK_END)
+            size = fid.tell()
+            if size > _HASH_SPAN_BYTES:
+                fid.seek(max(_HASH_SPAN_BYTES, size - _HASH_SPAN_BYTES))
+                h.update(fid.read(_HASH_SPAN_BYTES))
+        return h.hexdigest()
+
+    def fingerprint(
+        self,
+        filepath: Path,
+        channel_whitelist: Optional[List[str]] = None,
+        force_kHz_to_Hz: bool = False,
+    ) -> Optional[str]:
+        """Return the cache key for *filepath* with the given read options, or ``None`` if unreadable."""
+        try:
+            path = Path(filepath).resolve()
+            st = path.stat()
+            digest = self.content_hash(path)
+        except OSError as e:
+            log.debug("RecordingDiskCache: cannot fingerprint %s: %s", filepath, e)
+            return None
+        parts = [
+            str(_CACHE_FORMAT_VERSION),
+            str(path),
+            str(st.st_size),
+            str(st.st_mtime_ns),
+            digest,
+            ",".join(sorted(str(c) for c in channel_whitelist)) if channel_whitelist else "*",
+            "kHz" if force_kHz_to_Hz else "Hz",
+            str(get_default_storage_dtype()),
+        ]
+        return hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=20).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.npz"
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def read_recording(self, adapter: Any, filepath: Path, **kwargs: Any) -> Optional[Recording]:
+        """
+        Read-through helper: return the cached recording or decode it with *adapter*.
+
+        Args:
+            adapter: Object exposing ``read_recording`` (normally :class:`NeoAdapter`).
+            filepath: File to read.
+            **kwargs: Forwarded verbatim to ``adapter.read_recording``.  ``lazy=True``
+                bypasses the cache; ``channel_whitelist`` and ``force_kHz_to_Hz``
+                are part of the cache key.
+        """
+        if kwargs.get("lazy") or kwargs.get("protocol") or not self.enabled:
+            return adapter.read_recording(filepath, **kwargs)
+
+        whitelist = kwargs.get("channel_whitelist")
+        force_khz = bool(kwargs.get("force_kHz_to_Hz", False))
+        key = self.fingerprint(filepath, whitelist, force_khz)
+        if key is not None:
+            cached = self._load(key, Path(filepath))
+            if cached is not None:
+                return cached
+
+        recording = adapter.read_recording(filepath, **kwargs)
+        if key is not None and isinstance(recording, Recording):
+            self._store(key, recording)
+        return recording
+
+    def get(
+        self, filepath: Path, channel_whitelist: Optional[List[str]] = None, force_kHz_to_Hz: bool = False
+    ) -> Optional[Recording]:
+        """Return the cached recording for *filepath*, or ``None`` on a miss."""
+        if not self.enabled:
+            return None
+        key = self.fingerprint(filepath, channel_whitelist, force_kHz_to_Hz)
+        return self._load(key, Path(filepath)) if key else None
+
+    def put(
+        self,
+        filepath: Path,
+        recording: Recording,
+        channel_whitelist: Optional[List[str]] = None,
+        force_kHz_to_Hz: bool = False,
+    ) -> bool:
+        """Store *recording* for *filepath*; returns ``True`` if an entry was written."""
+        if not self.enabled:
+            return False
+        key = self.fingerprint(filepath, channel_whitelist, force_kHz_to_Hz)
+        return self._store(key, recording) if key else False
+
+    def clear(self) -> None:
+        """Delete every cache entry."""
+        for entry in self._entries():
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+
+    def size_bytes(self) -> int:
+        """Total size of all cache entries on disk."""
+        total = 0
+        for entry in self._entries():
+            try:
+                total += entry.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/store/eviction counters plus current on-disk size."""
+        stats = dict(self._stats)
+        stats.update({"enabled": self.enabled, "size_bytes": self.size_bytes(), "max_bytes": self.max_bytes})
+        return stats
+
+    # ------------------------------------------------------------------
+    # Serialisation
+    # ------------------------------------------------------------------
+
+    def _load(self, key: str, filepath: Path) -> Optional[Recording]:
+        entry = self._entry_path(key)
+        if not entry.is_file():
+            self._stats["misses"] += 1
+            return None
+        try:
+            with np.load(entry, allow_pickle=False) as archive:
+                meta = _unpack(json.loads(bytes(archive[_META_KEY]).decode("utf-8")), archive)
+                recording = self._decode(meta, archive, filepath)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            log.warning("RecordingDiskCache: discarding unreadable entry %s: %s", entry.name, e)
+            self._stats["misses"] += 1
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+            return None
+        try:
+            os.utime(entry)  # LRU bookkeeping
+        except OSError:
+            pass
+        self._stats["hits"] += 1
+        log.debug("RecordingDiskCache: hit for %s", filepath.name)
+        return recording
+
+    def _store(self, key: str, recording: Recording) -> bool:
+        if not recording.channels or not _is_fully_loaded(recording):
+            return False
+        arrays: Dict[str, np.ndarray] = {}
+        try:
+            meta = _pack(self._encode(recording, arrays), arrays)
+            arrays[_META_KEY] = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+        except (TypeError, ValueError) as e:
+            log.debug("RecordingDiskCache: recording not cacheable: %s", e)
+            return False
+
+        entry = self._entry_path(key)
+        tmp = entry.with_name(f".{entry.stem}.{uuid.uuid4().hex}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as fid:
+                np.savez(fid, **arrays)
+            os.replace(tmp, entry)
+        except OSError as e:
+            log.warning("RecordingDiskCache: failed to write %s: %s", entry.name, e)
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return False
+        self._stats["stores"] += 1
+        self._evict()
+        return True
+
+    @staticmethod
+    def _encode(recording: Recording, arrays: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        channels_meta = []
+        for ci, ch in enumerate(recording.channels.values()):
+            for ti, trial in enumerate(ch.data_trials):
+                arrays[f"c{ci}_t{ti}"] = np.asarray(trial)
+            for ti, trial in enumerate(ch.current_data_trials or []):
+                arrays[f"c{ci}_i{ti}"] = np.asarray(trial)
+            channels_meta.append(
+                {
+                    "id": ch.id,
+                    "name": ch.name,
+                    "units": ch.units,
+                    "sampling_rate": ch.sampling_rate,
+                    "n_trials": len(ch.data_trials),
+                    "n_current": len(ch.current_data_trials or []),
+                    "attrs": {a: getattr(ch, a, None) for a in _CHANNEL_ATTRS},
+                    "metadata": ch.metadata,
+                }
+            )
+        return {
+            "version": _CACHE_FORMAT_VERSION,
+            "attrs": {a: getattr(recording, a, None) for a in _RECORDING_ATTRS},
+            "session_start_time_dt": recording.session_start_time_dt,
+            "metadata": recording.metadata,
+            "channels": channels_meta,
+        }
+
+    @staticmethod
+    def _decode(meta: Dict[str, Any], archive: Any, filepath: Path) -> Recording:
+        recording = Recording(source_file=Path(filepath))
+        for attr, value in meta["attrs"].items():
+            setattr(recording, attr, value)
+        if meta.get("session_start_time_dt") is not None:
+            recording.session_start_time_dt = meta["session_start_time_dt"]
+        recording.metadata = meta.get("metadata") or {}
+
+        for ci, ch_meta in enumerate(meta["channels"]):
+            trials = [archive[f"c{ci}_t{ti}"] for ti in range(ch_meta["n_trials"])]
+            ch = Channel(
+                id=ch_meta["id"],
+                name=ch_meta["name"],
+                units=ch_meta["units"],
+                sampling_rate=ch_meta["sampling_rate"],
+                data_trials=trials,
+            )
+            for attr, value in ch_meta["attrs"].items():
+                setattr(ch, attr, value)
+            ch.current_data_trials = [archive[f"c{ci}_i{ti}"] for ti in range(ch_meta["n_current"])]
+            ch.metadata = ch_meta.get("metadata") or {}
+            ch._recording_ref = recording
+            recording.channels[ch.id] = ch
+        return recording
+
+    # ------------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------------
+
+    def _entries(self) -> List[Path]:
+        if not self.cache_dir.is_dir():
+            return []
+        return list(self.cache_dir.glob("*.npz"))
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits in ``max_bytes``."""
+        sized = []
+        for entry in self._entries():
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            sized.append((st.st_mtime_ns, st.st_size, entry))
+        total = sum(size for _, size, _ in sized)
+        if total <= self.max_bytes:
+            return
+        for _, size, entry in sorted(sized, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
+            self._stats["evictions"] += 1
+            log.debug("RecordingDiskCache: evicted %s", entry.name)
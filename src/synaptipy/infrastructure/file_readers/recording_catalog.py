@@ -0,0 +1,563 @@
+# src/synaptipy/infrastructure/file_readers/recording_catalog.py
+# -*- coding: utf-8 -*-
+"""
+Persistent SQLite catalog of recording metadata.
+
+Finding "all 20 kHz current-clamp files with more than ten sweeps" in a large
+experiment tree should not require opening every file.  :class:`RecordingCatalog`
+keeps one row per file (path, size, modification time, sampled content hash,
+format, sampling rate, sweep count and length, protocol, recording date) plus
+one row per channel (name, units, electrode) in a local SQLite database, so such
+questions become a single indexed query.
+
+Indexing is incremental.  Every candidate file is stat-ed (in parallel); files
+whose size and ``mtime_ns`` match the stored row are skipped outright, files
+that were merely touched (same content hash) only get their ``mtime_ns``
+refreshed, and only new or changed files have their headers re-scanned through
+:func:`~synaptipy.infrastructure.file_readers.metadata_scan.scan_files`.  Files
+that fail to scan are stored with their error, so an unchanged broken file is
+not retried on every pass.
+
+The connection is shared between threads behind a lock, so the GUI can query
+the catalog while a background worker re-indexes a folder.  The default
+database lives at ``~/.synaptipy/catalog.sqlite``; set ``SYNAPTIPY_CATALOG`` to
+use another file.
+"""
+
+import datetime
+import logging
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from synaptipy.infrastructure.file_readers.metadata_scan import DEFAULT_SCAN_WORKERS, METADATA_COLUMNS, scan_files
+from synaptipy.infrastructure.file_readers.recording_cache import RecordingDiskCache
+
+if TYPE_CHECKING:
+    from synaptipy.infrastructure.file_readers.neo_adapter import NeoAdapter
+
+log = logging.getLogger(__name__)
+
+DEFAULT_CATALOG_PATH = Path.home() / ".synaptipy" / "catalog.sqlite"
+
+_SCHEMA_VERSION = 1
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalog_info (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    file_name TEXT NOT NULL,
+    file_format TEXT,
+    file_size INTEGER,
+    mtime_ns INTEGER,
+    content_hash TEXT,
+    sampling_rate REAL,
+    num_sweeps INTEGER,
+    sweep_length INTEGER,
+    protocol_name TEXT,
+    rec_datetime TEXT,
+    header_only INTEGER,
+    error TEXT,
+    indexed_at TEXT
+);
+CREATE TABLE IF NOT EXISTS channels (
+    path TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT,
+    units TEXT,
+    electrode TEXT,
+    PRIMARY KEY (path, position)
+);
+CREATE INDEX IF NOT EXISTS idx_files_sampling_rate ON files(sampling_rate);
+CREATE INDEX IF NOT EXISTS idx_files_num_sweeps ON files(num_sweeps);
+CREATE INDEX IF NOT EXISTS idx_files_rec_datetime ON files(rec_datetime);
+CREATE INDEX IF NOT EXISTS idx_channels_units ON channels(units);
+"""
+
+# Columns returned by :meth:`RecordingCatalog.query`.
+CATALOG_COLUMNS = METADATA_COLUMNS + ["mtime_ns", "content_hash", "indexed_at"]
+
+# Keys per ``IN (...)`` lookup; stays below SQLite's default host parameter limit.
+_IN_CHUNK = 900
+
+# (file_size, mtime_ns, content_hash) stored per file.
+_Fingerprint = Tuple[int, int, Optional[str]]
+
+# Relative tolerance for ``query(sampling_rate=...)``; headers store rates as floats.
+_RATE_RTOL = 1e-3
+
+# filter name -> (SQL condition, number of parameters the value fills)
+_FILTERS: Dict[str, Tuple[str, int]] = {
+    "min_sampling_rate": ("f.sampling_rate >= ?", 1),
+    "max_sampling_rate": ("f.sampling_rate <= ?", 1),
+    "sampling_rate": ("ABS(f.sampling_rate - ?) <= ? * ?", 0),  # parameters built in _where()
+    "min_sweeps": ("f.num_sweeps >= ?", 1),
+    "max_sweeps": ("f.num_sweeps <= ?", 1),
+    "min_sweep_duration": ("f.sweep_length >= ? * f.sampling_rate", 1),
+    "protocol": ("instr(lower(f.protocol_name), lower(?)) > 0", 1),
+    "file_format": ("instr(lower(f.file_format), lower(?)) > 0", 1),
+    "path_contains": ("instr(lower(f.path), lower(?)) > 0", 1),
+    "directory": ("substr(f.path, 1, length(?)) = ?", 2),
+    "recorded_after": ("f.rec_datetime >= ?", 1),
+    "recorded_before": ("f.rec_datetime <= ?", 1),
+    "units": ("EXISTS (SELECT 1 FROM channels c WHERE c.path = f.path AND c.units = ?)", 1),
+    "channel_name": (
+        "EXISTS (SELECT 1 FROM channels c WHERE c.path = f.path AND instr(lower(c.name), lower(?)) > 0)",
+        1,
+    ),
+    "electrode": (
+        "EXISTS (SELECT 1 FROM channels c WHERE c.path = f.path AND instr(lower(c.electrode), lower(?)) > 0)",
+        1,
+    ),
+}
+
+# Columns accepted by :meth:`RecordingCatalog.distinct`.
+_DISTINCT_COLUMNS = {
+    "file_format": "SELECT DISTINCT file_format FROM files WHERE error IS NULL",
+    "sampling_rate": "SELECT DISTINCT sampling_rate FROM files WHERE error IS NULL",
+    "protocol_name": "SELECT DISTINCT protocol_name FROM files WHERE error IS NULL",
+    "units": "SELECT DISTINCT units FROM channels",
+    "channel_name": "SELECT DISTINCT name FROM channels",
+    "electrode": "SELECT DISTINCT electrode FROM channels WHERE electrode <> ''",
+}
+
+
+@dataclass
+class CatalogUpdate:
+    """Counts of what one indexing pass did."""
+
+    added: int = 0
+    updated: int = 0
+    touched: int = 0  # mtime changed but content hash did not
+    unchanged: int = 0
+    removed: int = 0
+    failed: int = 0
+
+    @property
+    def scanned(self) -> int:
+        """Number of files whose headers were (re-)read."""
+        return self.added + self.updated
+
+
+def _normalise(path: Union[str, Path]) -> str:
+    return str(Path(path).resolve())
+
+
+def _iso(value: Any) -> Optional[str]:
+    if value is None or pd.isna(value):  # pandas turns missing datetimes into NaT
+        return None
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _int_or_none(value: Any) -> Optional[int]:
+    return None if value is None or pd.isna(value) else int(value)
+
+
+def _float_or_none(value: Any) -> Optional[float]:
+    return None if value is None or pd.isna(value) else float(value)
+
+
+def _check_file(path: str, previous: Optional[_Fingerprint]) -> Tuple[str, str, Optional[_Fingerprint]]:
+    """Classify *path* against its stored fingerprint.
+
+    Returns:
+        ``(path, outcome, fingerprint)`` where *outcome* is ``"missing"``,
+        ``"unchanged"``, ``"touched"``, ``"changed"`` or ``"new"``.  The content
+        hash is only computed when size or ``mtime_ns`` differ.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return path, "missing", None
+    if previous is not None and previous[0] == st.st_size and previous[1] == st.st_mtime_ns:
+        return path, "unchanged", None
+    try:
+        digest: Optional[str] = RecordingDiskCache.content_hash(Path(path))
+    except OSError:
+        digest = None
+    outcome = "new" if previous is None else "changed"
+    if previous is not None and digest is not None and previous[0] == st.st_size and previous[2] == digest:
+        outcome = "touched"
+    return path, outcome, (st.st_size, st.st_mtime_ns, digest)
+
+
+class RecordingCatalog:
+    """
+    Incrementally updated SQLite index of recording file metadata.
+
+    Usage::
+
+        catalog = RecordingCatalog.get_instance()
+        catalog.index_directory("/data/ephys")           # only new/changed files are scanned
+        paths = catalog.query_paths(sampling_rate=20000, units="mV", min_sweeps=11, path_contains="rig2")
+    """
+
+    _instance: Optional["RecordingCatalog"] = None
+    _class_lock = threading.RLock()
+
+    def __init__(self, db_path: Union[str, Path, None] = None, adapter: Optional["NeoAdapter"] = None):
+        """
+        Args:
+            db_path: SQLite database file (default ``~/.synaptipy/catalog.sqlite``);
+                ``":memory:"`` keeps the catalog in RAM.
+            adapter: Adapter used for header scans (a new :class:`NeoAdapter` by default).
+        """
+        self.db_path = str(db_path) if db_path is not None else str(DEFAULT_CATALOG_PATH)
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._adapter = adapter
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            if self.db_path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(
+                "INSERT OR IGNORE INTO catalog_info (key, value) VALUES ('schema_version', ?)",
+                (str(_SCHEMA_VERSION),),
+            )
+
+    @classmethod
+    def get_instance(cls) -> "RecordingCatalog":
+        """Get the process-wide catalog (``SYNAPTIPY_CATALOG`` overrides the database path)."""
+        with cls._class_lock:
+            if cls._instance is None:
+                cls._instance = cls(os.environ.get("SYNAPTIPY_CATALOG") or None)
+            return cls._instance
+
+    @classmethod
+    def set_instance(cls, instance: Optional["RecordingCatalog"]) -> None:
+        """Replace the process-wide instance (``None`` restores the default on next access)."""
+        with cls._class_lock:
+            cls._instance = instance
+
+    @property
+    def adapter(self) -> "NeoAdapter":
+        if self._adapter is None:
+            from synaptipy.infrastructure.file_readers.neo_adapter import NeoAdapter
+
+            self._adapter = NeoAdapter()
+        return self._adapter
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0])
+
+    def __contains__(self, path: Union[str, Path]) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM files WHERE path = ?", (_normalise(path),)).fetchone()
+        return row is not None
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def index_directory(
+        self,
+        directory: Union[str, Path],
+        recursive: bool = True,
+        extensions: Optional[Iterable[str]] = None,
+        prune: bool = True,
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> CatalogUpdate:
+        """Bring the catalog up to date with every supported recording under *directory*.
+
+        Args:
+            directory: Folder to index.
+            recursive: Descend into sub-folders.
+            extensions: File extensions to include, without dots (default: all
+                extensions supported by the adapter).
+            prune: Drop catalog rows for files under *directory* that no longer exist.
+            max_workers: Thread pool size for stat/hash and header scans.
+            progress_callback: Optional ``callback(done, total)`` over the files being scanned.
+        """
+        directory = Path(directory).resolve()
+        wanted = {e.lower().lstrip(".") for e in (extensions or self.adapter.get_supported_extensions())}
+        walker = directory.rglob("*") if recursive else directory.glob("*")
+        paths = sorted(p for p in walker if p.suffix.lower().lstrip(".") in wanted and p.is_file())
+        result = self.index_files(paths, max_workers=max_workers, progress_callback=progress_callback)
+        if prune:
+            found = {str(p) for p in paths}
+            stale = [p for p in self._paths_under(directory, recursive) if p not in found]
+            result.removed += self.remove(stale)
+        return result
+
+    def index_files(
+        self,
+        paths: Iterable[Union[str, Path]],
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> CatalogUpdate:
+        """Add or refresh *paths*; files that no longer exist are removed from the catalog.
+
+        Returns:
+            :class:`CatalogUpdate` with per-outcome counts.
+        """
+        paths = list(dict.fromkeys(_normalise(p) for p in paths))
+        workers = max(1, int(max_workers or DEFAULT_SCAN_WORKERS))
+        known = self._fingerprints(paths)
+        result = CatalogUpdate()
+
+        if workers == 1 or len(paths) <= 1:
+            checks = [_check_file(p, known.get(p)) for p in paths]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(workers, len(paths)), thread_name_prefix="synaptipy-catalog"
+            ) as pool:
+                checks = list(pool.map(lambda p: _check_file(p, known.get(p)), paths))
+
+        to_scan: Dict[str, _Fingerprint] = {}
+        touched: List[Tuple[int, str]] = []
+        missing: List[str] = []
+        for path, outcome, stat in checks:
+            if outcome == "unchanged":
+                result.unchanged += 1
+            elif outcome == "missing":
+                missing.append(path)
+            elif outcome == "touched":
+                touched.append((stat[1], path))
+            else:
+                to_scan[path] = stat
+                if outcome == "new":
+                    result.added += 1
+                else:
+                    result.updated += 1
+
+        if to_scan:
+            table = scan_files(
+                list(to_scan), adapter=self.adapter, max_workers=workers, progress_callback=progress_callback
+            )
+            result.failed = int(table["error"].notna().sum())
+            self._store(table, to_scan)
+        if touched:
+            with self._lock, self._conn:
+                self._conn.executemany("UPDATE files SET mtime_ns = ? WHERE path = ?", touched)
+            result.touched = len(touched)
+        result.removed = self.remove(missing)
+        log.info(
+            "Catalog update: %d added, %d updated, %d touched, %d unchanged, %d removed, %d failed.",
+            result.added,
+            result.updated,
+            result.touched,
+            result.unchanged,
+            result.removed,
+            result.failed,
+        )
+        return result
+
+    def remove(self, paths: Iterable[Union[str, Path]]) -> int:
+        """Delete *paths* from the catalog; returns the number of rows removed."""
+        keys = [(_normalise(p),) for p in paths]
+        if not keys:
+            return 0
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany("DELETE FROM files WHERE path = ?", keys)
+            removed = self._conn.total_changes - before
+            self._conn.executemany("DELETE FROM channels WHERE path = ?", keys)
+        return removed
+
+    def clear(self) -> None:
+        """Delete every catalog row."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM channels")
+            self._conn.execute("DELETE FROM files")
+
+    def _fingerprints(self, paths: List[str]) -> Dict[str, _Fingerprint]:
+        rows = self._select_in("SELECT path, file_size, mtime_ns, content_hash FROM files WHERE path IN", paths)
+        return {r["path"]: (r["file_size"], r["mtime_ns"], r["content_hash"]) for r in rows}
+
+    def _select_in(self, sql: str, keys: List[str], suffix: str = "") -> List[sqlite3.Row]:
+        """Run ``sql (?, ?, ...) suffix`` over *keys* in chunks below SQLite's parameter limit."""
+        rows: List[sqlite3.Row] = []
+        with self._lock:
+            for start in range(0, len(keys), _IN_CHUNK):
+                chunk = keys[start : start + _IN_CHUNK]
+                marks = ", ".join("?" * len(chunk))
+                rows.extend(self._conn.execute(f"{sql} ({marks}) {suffix}", chunk).fetchall())
+        return rows
+
+    def _paths_under(self, directory: Path, recursive: bool) -> List[str]:
+        prefix = str(directory) + os.sep
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path FROM files WHERE substr(path, 1, length(?)) = ?", (prefix, prefix)
+            ).fetchall()
+        paths = [r["path"] for r in rows]
+        if not recursive:
+            paths = [p for p in paths if os.sep not in p[len(prefix) :]]
+        return paths
+
+    def _store(self, table: pd.DataFrame, stats: Dict[str, _Fingerprint]) -> None:
+        now = datetime.datetime.now().isoformat(timespec="seconds")
+        file_rows: List[Tuple[Any, ...]] = []
+        channel_rows: List[Tuple[Any, ...]] = []
+        for row in table.to_dict("records"):
+            path = str(row["path"])
+            size, mtime_ns, digest = stats[path]
+            file_rows.append(
+                (
+                    path,
+                    row["file_name"],
+                    row["file_format"] or None,
+                    size,
+                    mtime_ns,
+                    digest,
+                    _float_or_none(row["sampling_rate"]),
+                    _int_or_none(row["num_sweeps"]),
+                    _int_or_none(row["sweep_length"]),
+                    row["protocol_name"] or None,
+                    _iso(row["rec_datetime"]),
+                    int(bool(row["header_only"])),
+                    row["error"] or None,
+                    now,
+                )
+            )
+            names, units = row["channel_names"] or [], row["channel_units"] or []
+            electrodes = row["electrodes"] or []
+            for i, name in enumerate(names):
+                unit = units[i] if i < len(units) else None
+                electrode = electrodes[i] if i < len(electrodes) else ""
+                channel_rows.append((path, i, name, unit, electrode or ""))
+
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM channels WHERE path = ?", [(r[0],) for r in file_rows])
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", file_rows
+            )
+            self._conn.executemany("INSERT INTO channels VALUES (?, ?, ?, ?, ?)", channel_rows)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query(self, include_errors: bool = False, limit: Optional[int] = None, **filters: Any) -> pd.DataFrame:
+        """Return catalog rows matching every given filter.
+
+        Filters (all optional, combined with AND):
+            sampling_rate: Exact rate in Hz (within 0.1 %).
+            min_sampling_rate / max_sampling_rate: Rate bounds in Hz.
+            min_sweeps / max_sweeps: Sweep count bounds.
+            min_sweep_duration: Minimum sweep duration in seconds.
+            units: At least one channel with exactly these units (e.g. ``"mV"``
+                for current clamp, ``"pA"`` for voltage clamp).
+            channel_name / electrode: Case-insensitive substring of a channel's name / electrode.
+            protocol / file_format / path_contains: Case-insensitive substrings.
+            directory: Only files under this folder.
+            recorded_after / recorded_before: ``datetime`` or ISO string bounds.
+
+        Args:
+            include_errors: Also return files whose header scan failed.
+            limit: Maximum number of rows.
+
+        Returns:
+            DataFrame with :data:`CATALOG_COLUMNS`, sorted by path.
+
+        Raises:
+            ValueError: On an unknown filter name.
+        """
+        where, params = self._where(filters, include_errors)
+        sql = "SELECT f.* FROM files f" + (f" WHERE {where}" if where else "") + " ORDER BY f.path"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            channels = self._channels_for([r["path"] for r in rows])
+        records = []
+        for r in rows:
+            chans = channels.get(r["path"], [])
+            rate, length = r["sampling_rate"], r["sweep_length"]
+            records.append(
+                {
+                    "path": Path(r["path"]),
+                    "file_name": r["file_name"],
+                    "file_format": r["file_format"] or "",
+                    "channel_names": [c[0] for c in chans],
+                    "channel_units": [c[1] for c in chans],
+                    "electrodes": [c[2] for c in chans],
+                    "sampling_rate": rate,
+                    "num_sweeps": r["num_sweeps"],
+                    "sweep_length": length,
+                    "sweep_duration_s": length / rate if length is not None and rate else None,
+                    "protocol_name": r["protocol_name"],
+                    "rec_datetime": (datetime.datetime.fromisoformat(r["rec_datetime"]) if r["rec_datetime"] else None),
+                    "file_size": r["file_size"],
+                    "header_only": bool(r["header_only"]),
+                    "error": r["error"],
+                    "mtime_ns": r["mtime_ns"],
+                    "content_hash": r["content_hash"],
+                    "indexed_at": r["indexed_at"],
+                }
+            )
+        return pd.DataFrame(records, columns=CATALOG_COLUMNS)
+
+    def query_paths(self, **filters: Any) -> List[Path]:
+        """Paths of the files matching *filters* (see :meth:`query`)."""
+        where, params = self._where(filters, include_errors=False)
+        sql = "SELECT f.path FROM files f" + (f" WHERE {where}" if where else "") + " ORDER BY f.path"
+        with self._lock:
+            return [Path(r[0]) for r in self._conn.execute(sql, params).fetchall()]
+
+    def distinct(self, column: str) -> List[Any]:
+        """Sorted distinct values of *column* (for populating filter widgets).
+
+        Raises:
+            ValueError: If *column* is not one of ``file_format``, ``sampling_rate``,
+                ``protocol_name``, ``units``, ``channel_name`` or ``electrode``.
+        """
+        if column not in _DISTINCT_COLUMNS:
+            raise ValueError(f"Cannot list distinct values of '{column}'")
+        with self._lock:
+            values = [r[0] for r in self._conn.execute(_DISTINCT_COLUMNS[column]).fetchall()]
+        return sorted(v for v in values if v is not None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """File, channel and error counts plus the database location."""
+        with self._lock:
+            files = self._conn.execute("SELECT COUNT(*), COUNT(error) FROM files").fetchone()
+            channels = self._conn.execute("SELECT COUNT(*) FROM channels").fetchone()[0]
+        return {"db_path": self.db_path, "files": files[0], "errors": files[1], "channels": channels}
+
+    @staticmethod
+    def _where(filters: Dict[str, Any], include_errors: bool) -> Tuple[str, List[Any]]:
+        unknown = set(filters) - set(_FILTERS)
+        if unknown:
+            raise ValueError(f"Unknown catalog filter(s): {', '.join(sorted(unknown))}")
+        clauses: List[str] = [] if include_errors else ["f.error IS NULL"]
+        params: List[Any] = []
+        for name, value in filters.items():
+            if value is None or value == "":
+                continue
+            clause, n_params = _FILTERS[name]
+            if name == "sampling_rate":
+                params.extend([float(value), _RATE_RTOL, float(value)])
+            elif name == "directory":
+                prefix = _normalise(value) + os.sep
+                params.extend([prefix, prefix])
+            elif name in ("recorded_after", "recorded_before"):
+                params.append(_iso(value))
+            else:
+                params.extend([value] * n_params)
+            clauses.append(clause)
+        return " AND ".join(clauses), params
+
+    def _channels_for(self, paths: List[str]) -> Dict[str, List[Tuple[str, str, str]]]:
+        out: Dict[str, List[Tuple[str, str, str]]] = {}
+        sql = "SELECT path, name, units, electrode FROM channels WHERE path IN"
+        for r in self._select_in(sql, paths, "ORDER BY path, position"):
+            out.setdefault(r["path"], []).append((r["name"], r["units"], r["electrode"]))
+        return out
@@ -6,13 +6,25 @@ Data cache implementation for Synaptipy application.
 This module provides a Singleton in-memory cache for Recording objects and
 manages the 'Active Trace' state, serving as the Single Source of Truth
 for the current analysis context.
+
+The RAM tier is bounded in bytes (``performance_settings["max_ram_allocation_gb"]``)
+as well as by entry count.  Fully loaded recordings evicted from RAM are
+spilled to a memory-mapped on-disk tier (one ``.npy`` file per channel block)
+instead of being discarded; a later :meth:`DataCache.get` pages them back in
+without touching the original file.
 """
 
+import atexit
 import logging
+import mmap
+import shutil
+import tempfile
 import threading
+import uuid
 from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -20,6 +32,53 @@ from synaptipy.core.data_model import Recording
 
 log = logging.getLogger(__name__)
 
+DEFAULT_MAX_RAM_GB = 4.0
+DEFAULT_MAX_SPILL_BYTES = 16 * 1024**3  # 16 GiB
+
+
+def _is_file_backed(arr: np.ndarray) -> bool:
+    """True when *arr*'s buffer is a memory map (its pages are reclaimable by the OS)."""
+    owner = arr
+    while isinstance(owner, np.ndarray) and owner.base is not None:
+        owner = owner.base
+    return isinstance(owner, mmap.mmap)
+
+
+def _channel_arrays(channel: Any) -> List[np.ndarray]:
+    """Distinct in-memory arrays held by *channel* (the trial block counts once)."""
+    matrix = getattr(channel, "trial_matrix", None)
+    arrays = [matrix] if matrix is not None else [t for t in getattr(channel, "data_trials", []) or []]
+    arrays.extend(getattr(channel, "current_data_trials", None) or [])
+    return [a for a in arrays if isinstance(a, np.ndarray)]
+
+
+def estimate_recording_bytes(recording: Recording) -> int:
+    """Approximate RAM held by *recording*'s sample arrays (memory-mapped data excluded)."""
+    total = 0
+    for channel in getattr(recording, "channels", {}).values():
+        total += sum(a.nbytes for a in _channel_arrays(channel) if not _is_file_backed(a))
+    return total
+
+
+def _is_spillable(recording: Recording) -> bool:
+    """Only recordings whose trials are all in memory can be reconstructed from the spill tier."""
+    if not recording.channels:
+        return False
+    for channel in recording.channels.values():
+        trials = channel.data_trials
+        if not trials or len(trials) != channel.num_trials or any(t is None for t in trials):
+            return False
+    return True
+
+
+@dataclass
+class _SpillEntry:
+    """A recording whose sample arrays live in memory-mapped files under *directory*."""
+
+    recording: Recording
+    directory: Path
+    nbytes: int
+
 
 class DataCache:
     """
@@ -40,12 +99,24 @@ class DataCache:
                     cls._instance._initialized = False
         return cls._instance
 
-    def __init__(self, max_size: int = 10):
+    def __init__(
+        self,
+        max_size: int = 10,
+        max_bytes: Optional[int] = None,
+        spill_enabled: bool = True,
+        spill_dir: Optional[Path] = None,
+        max_spill_bytes: int = DEFAULT_MAX_SPILL_BYTES,
+    ):
         """
         Initialize the data cache.
 
         Args:
             max_size: Maximum number of recordings to cache (default: 10)
+            max_bytes: RAM budget for cached sample data in bytes
+                       (default: ``DEFAULT_MAX_RAM_GB`` GiB)
+            spill_enabled: Move recordings evicted from RAM to the on-disk tier
+            spill_dir: Directory for spill files (default: a private temp dir)
+            max_spill_bytes: Size cap of the on-disk tier in bytes
         """
         if self._initialized:
             return
@@ -54,14 +125,35 @@ class DataCache:
             if self._initialized:
                 return
             self.max_size = max_size
+            self.max_bytes = int(max_bytes) if max_bytes is not None else int(DEFAULT_MAX_RAM_GB * 1024**3)
             self._cache: OrderedDict[Path, Recording] = OrderedDict()
+            self._sizes: Dict[Path, int] = {}
+
+            # Disk (spill) tier
+            self.spill_enabled = spill_enabled
+            self.max_spill_bytes = int(max_spill_bytes)
+            self._spill_root: Optional[Path] = Path(spill_dir) if spill_dir is not None else None
+            self._owns_spill_root = spill_dir is None
+            self._spilled: OrderedDict[Path, _SpillEntry] = OrderedDict()
+            # Evicted recordings waiting for, or in the middle of, their spill-file writes.
+            # The writes run outside the lock (see _flush_spills); get() can still reclaim them.
+            self._pending_spills: OrderedDict[Path, Recording] = OrderedDict()
+            self._spilling: Dict[Path, Recording] = {}
+            self._stats = {
+                "hits": 0,
+                "misses": 0,
+                "evictions": 0,
+                "spills": 0,
+                "spill_hits": 0,
+                "spill_evictions": 0,
+            }
 
             # Active Trace State (Single Source of Truth for Live Analysis)
             # Tuple: (data_array, sampling_rate, metadata_dict)
             self._active_trace: Optional[Tuple[np.ndarray, float, Dict[str, Any]]] = None
 
             self._initialized = True
-            log.debug(f"Initialized DataCache Singleton with max_size={max_size}")
+            log.debug(f"Initialized DataCache Singleton with max_size={max_size}, max_bytes={self.max_bytes}")
 
     @classmethod
     def get_instance(cls) -> "DataCache":
@@ -74,8 +166,35 @@ class DataCache:
     def reset_instance(cls) -> None:
         """Reset the singleton instance for testing purposes."""
         with cls._lock:
+            if cls._instance is not None and getattr(cls._instance, "_initialized", False):
+                cls._instance._drop_spill_tier()
             cls._instance = None
 
+    # --- Budget ---
+
+    def set_memory_budget(self, max_bytes: int) -> None:
+        """Change the RAM budget, evicting (spilling) entries that no longer fit."""
+        with self._lock:
+            self.max_bytes = max(0, int(max_bytes))
+            self._enforce_budget()
+        self._flush_spills()
+        log.info("DataCache: RAM budget set to %.2f GB", self.max_bytes / 1024**3)
+
+    def update_performance_settings(self, settings: Dict[str, Any]) -> None:
+        """Subscriber for ``SessionManager.preferences_changed``: apply ``max_ram_allocation_gb``."""
+        if "max_ram_allocation_gb" in settings:
+            try:
+                gb = float(settings["max_ram_allocation_gb"])
+            except (TypeError, ValueError):
+                log.warning("DataCache: ignoring invalid max_ram_allocation_gb=%r", settings["max_ram_allocation_gb"])
+                return
+            self.set_memory_budget(int(gb * 1024**3))
+
+    def bytes_in_ram(self) -> int:
+        """Estimated bytes held by the RAM tier."""
+        with self._lock:
+            return sum(self._sizes.values())
+
     def get(self, path: Path) -> Optional[Recording]:
         """
         Retrieve a Recording object from the cache.
@@ -90,14 +209,42 @@ class DataCache:
             path = Path(path)
 
         with self._lock:
-            if path in self._cache:
-                # Move to end (most recently used)
-                recording = self._cache.pop(path)
-                self._cache[path] = recording
-                log.debug(f"Cache hit for: {path.name}")
-                return recording
-
-        log.debug(f"Cache miss for: {path.name}")
+            recording = self._get_locked(path)
+        # Entries evicted to make room for this one are written to disk outside the lock
+        self._flush_spills()
+        if recording is None:
+            log.debug(f"Cache miss for: {path.name}")
+        return recording
+
+    def _get_locked(self, path: Path) -> Optional[Recording]:
+        """Look *path* up in the RAM tier, the pending spills and the spill tier (lock held)."""
+        if path in self._cache:
+            # Move to end (most recently used)
+            recording = self._cache.pop(path)
+            self._cache[path] = recording
+            # Lazily loaded trials may have been filled in since the last access
+            self._sizes[path] = estimate_recording_bytes(recording)
+            self._enforce_budget()
+            self._stats["hits"] += 1
+            log.debug(f"Cache hit for: {path.name}")
+            return recording
+
+        # Evicted but not yet spilled: cancel the spill and take it back
+        recording = self._pending_spills.pop(path, None) or self._spilling.pop(path, None)
+        if recording is not None:
+            self._stats["hits"] += 1
+            self._insert(path, recording)
+            log.debug(f"Cache hit for: {path.name} (spill cancelled)")
+            return recording
+
+        recording = self._unspill(path)
+        if recording is not None:
+            self._stats["spill_hits"] += 1
+            self._insert(path, recording)
+            log.debug(f"Spill-tier hit for: {path.name}")
+            return recording
+
+        self._stats["misses"] += 1
         return None
 
     def put(self, path: Path, recording: Recording) -> None:
@@ -119,19 +266,48 @@ class DataCache:
             # Remove existing entry if present
             if path in self._cache:
                 del self._cache[path]
+            self._discard_spill(path)
+            self._drop_pending_spill(path)
 
-            # Add new entry
-            self._cache[path] = recording
+            self._insert(path, recording)
+        self._flush_spills()
 
-            # Evict oldest entries if cache is full
-            while len(self._cache) > self.max_size:
-                oldest_path, oldest_recording = self._cache.popitem(last=False)
-                log.debug(f"Evicted from cache: {oldest_path.name}")
+        log.debug(f"Cached recording: {path.name} (cache size: {len(self._cache)}/{self.max_size})")
+
+    def _insert(self, path: Path, recording: Recording) -> None:
+        """Add *recording* as the most recently used entry and enforce both limits (lock held)."""
+        self._cache[path] = recording
+        self._sizes[path] = estimate_recording_bytes(recording)
+        if self._sizes[path] > self.max_bytes:
+            log.warning(
+                "DataCache: %s (%.1f MB) alone exceeds the RAM budget (%.1f MB)",
+                path.name,
+                self._sizes[path] / 1024**2,
+                self.max_bytes / 1024**2,
+            )
+        self._enforce_budget()
+
+    def _enforce_budget(self) -> None:
+        """Evict least recently used entries beyond ``max_size`` or ``max_bytes`` (lock held).
+
+        Spillable entries are queued for :meth:`_flush_spills`, which the
+        public methods call after releasing the lock.
+
+        The most recently used entry is never evicted for exceeding the byte
+        budget on its own; it is the recording the user is working with.
+        """
+        while len(self._cache) > self.max_size or (len(self._cache) > 1 and sum(self._sizes.values()) > self.max_bytes):
+            oldest_path, oldest_recording = self._cache.popitem(last=False)
+            self._sizes.pop(oldest_path, None)
+            self._stats["evictions"] += 1
+            log.debug(f"Evicted from cache: {oldest_path.name}")
+            if self._can_spill(oldest_recording):
+                # Written by _flush_spills once the caller releases the lock
+                self._pending_spills[oldest_path] = oldest_recording
+            else:
                 # Clean up the evicted recording if needed
                 self._cleanup_recording(oldest_recording)
 
-        log.debug(f"Cached recording: {path.name} (cache size: {len(self._cache)}/{self.max_size})")
-
     def remove(self, path: Path) -> bool:
         """
         Remove a specific Recording from the cache.
@@ -148,9 +324,16 @@ class DataCache:
         with self._lock:
             if path in self._cache:
                 recording = self._cache.pop(path)
+                self._sizes.pop(path, None)
                 self._cleanup_recording(recording)
                 log.debug(f"Removed from cache: {path.name}")
                 return True
+            if self._discard_spill(path) is not None:
+                log.debug(f"Removed from spill tier: {path.name}")
+                return True
+            if self._drop_pending_spill(path):
+                log.debug(f"Removed pending spill: {path.name}")
+                return True
 
         return False
 
@@ -161,6 +344,11 @@ class DataCache:
             for recording in self._cache.values():
                 self._cleanup_recording(recording)
             self._cache.clear()
+            self._sizes.clear()
+            for path in list(self._spilled):
+                self._discard_spill(path)
+            for path in list(self._pending_spills) + list(self._spilling):
+                self._drop_pending_spill(path)
             self._active_trace = None
 
     def size(self) -> int:
@@ -173,13 +361,30 @@ class DataCache:
         with self._lock:
             return len(self._cache) >= self.max_size
 
+    def is_spilled(self, path: Path) -> bool:
+        """Check if a path is held in (or being written to) the on-disk spill tier."""
+        if not isinstance(path, Path):
+            path = Path(path)
+        with self._lock:
+            return path in self._spilled or path in self._pending_spills or path in self._spilling
+
     def contains(self, path: Path) -> bool:
-        """Check if a path exists in the cache."""
+        """Check if a path exists in the (RAM) cache."""
         if not isinstance(path, Path):
             path = Path(path)
         with self._lock:
             return path in self._cache
 
+    def holds(self, recording: Recording) -> bool:
+        """Check if *recording* itself is held in the (RAM) cache.
+
+        Recordings held here are closed by the cache when they are evicted or
+        removed, so callers must not close them while they are cached.
+        """
+        with self._lock:
+            held = list(self._cache.values()) + list(self._pending_spills.values()) + list(self._spilling.values())
+            return any(cached is recording for cached in held)
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics.
@@ -188,11 +393,20 @@ class DataCache:
             Dictionary containing cache statistics
         """
         with self._lock:
+            ram_bytes = sum(self._sizes.values())
+            lookups = self._stats["hits"] + self._stats["spill_hits"] + self._stats["misses"]
             return {
                 "size": len(self._cache),
                 "max_size": self.max_size,
                 "utilization": len(self._cache) / self.max_size if self.max_size > 0 else 0,
                 "cached_files": [str(path) for path in self._cache.keys()],
+                "bytes_in_ram": ram_bytes,
+                "max_bytes": self.max_bytes,
+                "byte_utilization": ram_bytes / self.max_bytes if self.max_bytes > 0 else 0,
+                "spilled_files": [str(path) for path in self._spilled.keys()],
+                "spill_bytes": sum(e.nbytes for e in self._spilled.values()),
+                "hit_rate": (self._stats["hits"] + self._stats["spill_hits"]) / lookups if lookups else 0.0,
+                **self._stats,
             }
 
     # --- Active Trace Management (Single Source of Truth) ---
@@ -226,6 +440,160 @@ class DataCache:
         with self._lock:
             self._active_trace = None
 
+    # --- Spill Tier ---
+
+    def _spill_directory(self) -> Path:
+        """Root of the spill tier, created on first use (lock held)."""
+        if self._spill_root is None:
+            self._spill_root = Path(tempfile.mkdtemp(prefix="synaptipy-spill-"))
+            atexit.register(shutil.rmtree, self._spill_root, True)
+        self._spill_root.mkdir(parents=True, exist_ok=True)
+        return self._spill_root
+
+    def _can_spill(self, recording: Recording) -> bool:
+        """Whether an evicted *recording* should go to the spill tier (lock held)."""
+        if not self.spill_enabled or self.max_spill_bytes <= 0 or not _is_spillable(recording):
+            return False
+        return 0 < estimate_recording_bytes(recording) <= self.max_spill_bytes
+
+    def _drop_pending_spill(self, path: Path) -> bool:
+        """Cancel a queued or in-flight spill of *path* and clean up its recording (lock held)."""
+        recording = self._pending_spills.pop(path, None) or self._spilling.pop(path, None)
+        if recording is None:
+            return False
+        self._cleanup_recording(recording)
+        return True
+
+    def _flush_spills(self) -> None:
+        """Spill the recordings queued by :meth:`_enforce_budget`.
+
+        The ``.npy`` files are written without holding the lock; the entry is
+        swapped into the spill tier under the lock afterwards, unless the
+        recording was fetched back (or replaced) while the files were written.
+        """
+        while True:
+            with self._lock:
+                if not self._pending_spills:
+                    return
+                path, recording = self._pending_spills.popitem(last=False)
+                self._spilling[path] = recording
+                root = self._spill_directory()
+            written = self._write_spill(path, recording, root)
+            with self._lock:
+                if self._spilling.get(path) is not recording:
+                    # Fetched back by get() or replaced by put() while the files were written
+                    if written is not None:
+                        shutil.rmtree(written[0].directory, ignore_errors=True)
+                    continue
+                del self._spilling[path]
+                if written is None:
+                    self._cleanup_recording(recording)
+                else:
+                    self._spill(path, *written)
+
+    def _write_spill(self, path: Path, recording: Recording, root: Path) -> Optional[Tuple[_SpillEntry, List[Tuple]]]:
+        """Write *recording*'s arrays to a new spill directory (lock not held).
+
+        Returns:
+            The entry plus, per channel, ``(source arrays, mapped trials,
+            mapped current trials)``; ``None`` if the files could not be written.
+        """
+        try:
+            directory = root / uuid.uuid4().hex
+            directory.mkdir()
+        except OSError as e:
+            log.warning("DataCache: cannot create spill directory: %s", e)
+            return None
+        entry = _SpillEntry(recording=recording, directory=directory, nbytes=estimate_recording_bytes(recording))
+        try:
+            mapped = [self._spill_channel(channel, ci, entry) for ci, channel in enumerate(recording.channels.values())]
+        except OSError as e:
+            log.warning("DataCache: failed to spill %s: %s", path.name, e)
+            shutil.rmtree(directory, ignore_errors=True)
+            return None
+        return entry, mapped
+
+    def _spill(self, path: Path, entry: _SpillEntry, mapped: List[Tuple]) -> None:
+        """Re-point the recording at its spill files and register the entry (lock held).
+
+        The Recording object itself is kept, with its trials re-pointed at
+        copy-on-write memory maps, so references held elsewhere (e.g. the
+        plot the user is looking at) stay valid; it is not closed.  A channel
+        whose arrays changed while the files were written keeps its new arrays.
+        """
+        for channel, (sources, data, current) in zip(entry.recording.channels.values(), mapped):
+            arrays = _channel_arrays(channel)
+            if len(arrays) != len(sources) or any(a is not b for a, b in zip(arrays, sources)):
+                continue
+            channel.data_trials = data
+            if current:
+                channel.current_data_trials = current
+        self._spilled[path] = entry
+        self._stats["spills"] += 1
+        log.debug(f"Spilled to disk: {path.name} ({entry.nbytes / 1024**2:.1f} MB)")
+        self._evict_spilled()
+
+    @staticmethod
+    def _spill_channel(channel: Any, ci: int, entry: _SpillEntry) -> Tuple[List[np.ndarray], Any, List[np.ndarray]]:
+        """Write one channel's arrays to *entry*; returns the source arrays and their memory maps."""
+
+        def _dump(name: str, arr: np.ndarray) -> np.ndarray:
+            target = entry.directory / f"{name}.npy"
+            np.save(target, np.ascontiguousarray(arr))
+            return np.load(target, mmap_mode="c")
+
+        sources = _channel_arrays(channel)
+        matrix = channel.trial_matrix
+        if matrix is not None:
+            mapped = _dump(f"c{ci}", matrix)
+        else:
+            mapped = [_dump(f"c{ci}_t{ti}", np.asarray(t)) for ti, t in enumerate(channel.data_trials)]
+        current = [_dump(f"c{ci}_i{ti}", np.asarray(t)) for ti, t in enumerate(channel.current_data_trials or [])]
+        return sources, mapped, current
+
+    def _unspill(self, path: Path) -> Optional[Recording]:
+        """Page a spilled recording back into RAM and delete its files (lock held)."""
+        entry = self._spilled.pop(path, None)
+        if entry is None:
+            return None
+        for channel in entry.recording.channels.values():
+            matrix = channel.trial_matrix
+            if matrix is not None:
+                channel.data_trials = np.array(matrix)
+            else:
+                channel.data_trials = [np.array(t) for t in channel.data_trials]
+            if channel.current_data_trials:
+                channel.current_data_trials = [np.array(t) for t in channel.current_data_trials]
+        shutil.rmtree(entry.directory, ignore_errors=True)
+        return entry.recording
+
+    def _discard_spill(self, path: Path) -> Optional[_SpillEntry]:
+        """Drop a spilled entry: release its memory maps, then delete its files."""
+        entry = self._spilled.pop(path, None)
+        if entry is not None:
+            self._cleanup_recording(entry.recording)
+            shutil.rmtree(entry.directory, ignore_errors=True)
+        return entry
+
+    def _evict_spilled(self) -> None:
+        """Drop the oldest spilled recordings until the disk tier fits ``max_spill_bytes``."""
+        total = sum(e.nbytes for e in self._spilled.values())
+        while self._spilled and total > self.max_spill_bytes:
+            oldest_path = next(iter(self._spilled))
+            entry = self._discard_spill(oldest_path)
+            total -= entry.nbytes
+            self._stats["spill_evictions"] += 1
+            log.debug(f"Evicted from spill tier: {oldest_path.name}")
+
+    def _drop_spill_tier(self) -> None:
+        """Delete every spill file (and the private spill directory)."""
+        with self._lock:
+            for path in list(self._spilled):
+                self._discard_spill(path)
+            if self._owns_spill_root and self._spill_root is not None:
+                shutil.rmtree(self._spill_root, ignore_errors=True)
+                self._spill_root = None
+
     # --- Internal Cleanup ---
 
     def _cleanup_recording(self, recording: Recording) -> None:
@@ -250,7 +618,8 @@ class DataCache:
                 for channel in recording.channels.values():
                     # Clear loaded data from channels
                     if hasattr(channel, "data_trials"):
-                        channel.data_trials.clear()
+                        # Re-assign (not .clear()) so the contiguous trial block is released too
+                        channel.data_trials = []
                     # Clear any other cached data
                     if hasattr(channel, "current_data_trials"):
                         channel.current_data_trials.clear()
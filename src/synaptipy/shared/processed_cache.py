@@ -0,0 +1,147 @@
+# src/synaptipy/shared/processed_cache.py
+# -*- coding: utf-8 -*-
+"""
+Shared cache of preprocessed trials.
+
+The explorer, every analysis tab and live analysis apply the same global
+preprocessing pipeline to the same raw trials whenever the user switches
+trial, tab or channel.  :class:`ProcessedTraceCache` keeps the result keyed by
+``(recording, channel, trial, pipeline step hash)`` so each trial is filtered
+once per pipeline configuration.
+
+Entries are invalidated implicitly:
+
+* a different pipeline configuration has a different
+  :attr:`~synaptipy.core.processing_pipeline.SignalProcessingPipeline.step_hash`
+  and therefore a different key;
+* each entry remembers a fingerprint of the raw trial it was computed from
+  (array identity, buffer address, shape, dtype and a strided sample of the
+  values), so reloaded, re-stored or edited trials are recomputed.
+
+The cache is bounded in bytes and evicts the least recently used entries.
+Cached arrays are returned read-only because they are shared between views.
+"""
+
+import logging
+from typing import Any, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from synaptipy.core.array_cache import ArrayLRUCache, array_fingerprint
+from synaptipy.core.processing_pipeline import SignalProcessingPipeline
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_PROCESSED_BYTES = 512 * 1024**2  # 512 MiB
+
+_Key = Tuple[Hashable, str, int, str]
+
+
+def _fingerprint(raw: np.ndarray) -> Tuple[Any, ...]:
+    """Cheap identity of a raw trial; changes when the trial is replaced or edited."""
+    return (id(raw),) + array_fingerprint(raw)
+
+
+def _recording_key(channel: Any) -> Hashable:
+    recording = getattr(channel, "_recording_ref", None)
+    source = getattr(recording, "source_file", None)
+    return str(source) if source is not None else id(recording if recording is not None else channel)
+
+
+def _channel_key(channel: Any) -> str:
+    return str(getattr(channel, "id", id(channel)))
+
+
+class ProcessedTraceCache(ArrayLRUCache):
+    """Byte-bounded LRU cache of preprocessed channel trials."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_PROCESSED_BYTES):
+        """
+        Args:
+            max_bytes: Budget for cached processed arrays in bytes.
+        """
+        super().__init__(max_bytes)
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get_trial(self, pipeline: Any, channel: Any, trial_index: int) -> Optional[np.ndarray]:
+        """Trial *trial_index* of *channel* after *pipeline*, computed at most once per configuration.
+
+        An empty pipeline, or an object that is not a
+        :class:`SignalProcessingPipeline`, is applied directly without caching.
+
+        Returns:
+            The processed trial, or ``None`` if the trial has no data.
+        """
+        result = self.get_trials(pipeline, channel, [trial_index])
+        return result[0] if result else None
+
+    def get_trials(self, pipeline: Any, channel: Any, trial_indices: Sequence[int]) -> List[Optional[np.ndarray]]:
+        """Processed trials for *trial_indices*, in order (``None`` where a trial has no data).
+
+        Cache misses are computed together with one
+        :meth:`~SignalProcessingPipeline.process_batch` call (a single miss
+        goes through :meth:`~SignalProcessingPipeline.process`).
+        """
+        fs = channel.sampling_rate
+        raws = [channel.get_data(i) for i in trial_indices]
+        cacheable = isinstance(pipeline, SignalProcessingPipeline) and bool(pipeline.get_steps())
+        if not cacheable:
+            return [
+                pipeline.process(raw, fs, time_vector=channel.get_relative_time_vector(i)) if raw is not None else None
+                for i, raw in zip(trial_indices, raws)
+            ]
+
+        step_hash = pipeline.step_hash
+        recording, channel_id = _recording_key(channel), _channel_key(channel)
+        results: List[Optional[np.ndarray]] = [None] * len(raws)
+        missing: List[Tuple[int, _Key, Tuple[Any, ...]]] = []
+        with self._lock:
+            for pos, (trial, raw) in enumerate(zip(trial_indices, raws)):
+                if raw is None:
+                    continue
+                key = (recording, channel_id, int(trial), step_hash)
+                fingerprint = _fingerprint(raw)
+                cached = self._lookup(key, fingerprint)
+                if cached is not None:
+                    results[pos] = cached
+                else:
+                    missing.append((pos, key, fingerprint))
+
+        if not missing:
+            return results
+        times = [channel.get_relative_time_vector(trial_indices[pos]) for pos, _, _ in missing]
+        if len(missing) == 1:
+            processed = [pipeline.process(raws[missing[0][0]], fs, time_vector=times[0])]
+        else:
+            processed = pipeline.process_batch([raws[pos] for pos, _, _ in missing], fs, times)
+        with self._lock:
+            for (pos, key, fingerprint), data in zip(missing, processed):
+                results[pos] = self._store(key, data, fingerprint) if data is not None else raws[pos]
+        return results
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def invalidate(self, channel: Any = None) -> int:
+        """Drop every cached trial of *channel*, or the whole cache when *channel* is ``None``.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            if channel is None:
+                keys = list(self._entries)
+            else:
+                recording, channel_id = _recording_key(channel), _channel_key(channel)
+                keys = [k for k in self._entries if k[0] == recording and k[1] == channel_id]
+            for key in keys:
+                self._discard(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self.invalidate()
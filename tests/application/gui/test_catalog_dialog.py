@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Tests for the recording catalog browser widget."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from synaptipy.application.gui.catalog_dialog import CatalogBrowser
+from synaptipy.infrastructure.file_readers import RecordingCatalog
+
+DATA_DIR = Path(__file__).resolve().parents[3] / "examples" / "data"
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    (tmp_path / "rig2").mkdir()
+    shutil.copy(DATA_DIR / "2023_04_11_0018.abf", tmp_path / "2023_04_11_0018.abf")
+    shutil.copy(DATA_DIR / "240326_003.wcp", tmp_path / "rig2" / "240326_003.wcp")
+    cat = RecordingCatalog(":memory:")
+    cat.index_directory(tmp_path)
+    yield cat
+    cat.close()
+
+
+def test_browser_filters_and_activates(qtbot, catalog):
+    browser = CatalogBrowser(catalog)
+    qtbot.addWidget(browser)
+    browser.refresh_choices()
+    assert browser.units_combo.findText("pA") >= 0
+
+    browser.units_combo.setCurrentIndex(browser.units_combo.findText("pA"))
+    assert [p.name for p in browser.search()] == ["240326_003.wcp"]
+
+    browser.units_combo.setCurrentIndex(0)
+    browser.path_edit.setText("rig2")
+    assert [p.name for p in browser.search()] == ["240326_003.wcp"]
+    assert browser.selected_paths() == browser.result_paths()
+
+    with qtbot.waitSignal(browser.files_activated) as blocker:
+        browser._on_result_double_clicked(browser.results_list.item(0))
+    assert blocker.args[1] == 0
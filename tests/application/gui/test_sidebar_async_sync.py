@@ -123,3 +123,27 @@ def test_sidebar_async_sync(qtbot):
 
     # And pending path cleared
     assert sidebar._pending_sync_path is None
+
+
+def test_multi_file_drop_requests_preload(qtbot, tmp_path):
+    """Dropping several files loads the first and asks for the rest to be preloaded."""
+    files = [tmp_path / f"cell{i}.wcp" for i in range(3)]
+    file_io = MagicMock()
+    file_io.load_files.return_value = (files[0], files, 0, False)
+    sidebar = ExplorerSidebar(MagicMock(spec=NeoAdapter), file_io_controller=file_io)
+    sidebar.sync_to_file = MagicMock()
+    event = MagicMock()
+    event.mimeData.return_value.urls.return_value = [QtCore.QUrl.fromLocalFile(str(f)) for f in files]
+
+    selected, dropped = [], []
+    sidebar.file_selected.connect(lambda *args: selected.append(args))
+    sidebar.files_dropped.connect(lambda *args: dropped.append(args))
+    sidebar.dropEvent(event)
+
+    assert selected == [(files[0], files, 0)]
+    assert dropped == [(files, files[0])]
+
+    file_io.load_files.return_value = (files[0], files, 0, False)
+    event.mimeData.return_value.urls.return_value = [QtCore.QUrl.fromLocalFile(str(files[0]))]
+    sidebar.dropEvent(event)
+    assert len(dropped) == 1  # a single file's siblings are not preloaded
@@ -196,3 +196,101 @@ class TestBaseAnalysisTabBackwardCompat:
             assert tab.thread_pool is tab._data_loader.thread_pool
         finally:
             AnalysisRegistry._registry.pop(name, None)
+
+
+# ---------------------------------------------------------------------------
+# Parallel multi-file loading
+# ---------------------------------------------------------------------------
+
+
+class _SlowAdapter:
+    """Adapter whose reads block for *delay* seconds (sleep releases the GIL)."""
+
+    def __init__(self, delay=0.2, fail=()):
+        self.delay = delay
+        self.fail = {Path(p) for p in fail}
+        self.calls = []
+
+    def read_recording(self, path, **kwargs):
+        import time
+
+        import numpy as np
+
+        from synaptipy.core.data_model import Channel, Recording
+
+        self.calls.append(Path(path))
+        time.sleep(self.delay)
+        if Path(path) in self.fail:
+            raise OSError(f"cannot read {path}")
+        rec = Recording(Path(path))
+        rec.channels["0"] = Channel("0", "Vm", "mV", 1000.0, [np.zeros(100)])
+        return rec
+
+
+@pytest.fixture
+def fresh_cache():
+    from synaptipy.shared.data_cache import DataCache
+
+    DataCache.reset_instance()
+    yield DataCache.get_instance()
+    DataCache.reset_instance()
+
+
+class TestLoadRecordings:
+    def test_files_decode_concurrently(self, qtbot, fresh_cache):
+        import time
+
+        adapter = _SlowAdapter(delay=0.2)
+        svc = DataLoaderService(adapter)
+        svc.thread_pool.setMaxThreadCount(8)
+        paths = [Path(f"f{i}.abf") for i in range(8)]
+        loaded = []
+        svc.file_loaded.connect(lambda p, r: loaded.append(p))
+
+        t0 = time.perf_counter()
+        with qtbot.waitSignal(svc.batch_finished, timeout=5000) as blocker:
+            batch_id = svc.load_recordings(paths)
+        elapsed = time.perf_counter() - t0
+        svc.wait_for_done()
+
+        assert elapsed < 0.2 * len(paths) / 2  # far below the serial sum
+        assert blocker.args[0] == batch_id
+        assert list(blocker.args[1]) == paths
+        assert sorted(loaded) == sorted(paths)
+        assert all(fresh_cache.contains(p) for p in paths)
+
+    def test_cached_files_are_not_decoded_again(self, qtbot, fresh_cache):
+        adapter = _SlowAdapter(delay=0.0)
+        svc = DataLoaderService(adapter)
+        paths = [Path("a.abf"), Path("b.abf")]
+        with qtbot.waitSignal(svc.batch_finished, timeout=5000):
+            svc.load_recordings(paths)
+        svc.wait_for_done()
+        with qtbot.waitSignal(svc.batch_finished, timeout=5000) as blocker:
+            svc.load_recordings(paths + [Path("a.abf")])
+        svc.wait_for_done()
+
+        assert sorted(adapter.calls) == sorted(paths)
+        assert blocker.args[1][Path("a.abf")] is fresh_cache.get(Path("a.abf"))
+
+    def test_failures_are_reported_per_file(self, qtbot, fresh_cache):
+        adapter = _SlowAdapter(delay=0.0, fail=["bad.abf"])
+        svc = DataLoaderService(adapter)
+        failed, progress = [], []
+        svc.file_failed.connect(lambda p, err: failed.append((p, err[0])))
+        svc.batch_progress.connect(lambda b, done, total: progress.append((done, total)))
+
+        with qtbot.waitSignal(svc.batch_finished, timeout=5000) as blocker:
+            svc.load_recordings([Path("good.abf"), Path("bad.abf")])
+        svc.wait_for_done()
+
+        assert failed == [(Path("bad.abf"), OSError)]
+        assert list(blocker.args[1]) == [Path("good.abf")]
+        assert sorted(progress) == [(1, 2), (2, 2)]
+        assert not fresh_cache.contains(Path("bad.abf"))
+
+    def test_empty_request_finishes_immediately(self, service):
+        finished = []
+        service.batch_finished.connect(lambda b, recs: finished.append(recs))
+        service.load_recordings([])
+        assert finished == [{}]
@@ -0,0 +1,106 @@
+# tests/application/services/test_prefetch_service.py
+# -*- coding: utf-8 -*-
+"""Tests for the neighbour-file prefetcher."""
+
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from synaptipy.application.services.prefetch_service import NeighbourPrefetcher
+from synaptipy.core.data_model import Channel, Recording
+from synaptipy.shared.data_cache import DataCache
+
+
+class _FakeAdapter:
+    """Returns a small synthetic Recording per path and records the calls."""
+
+    def __init__(self, gate: threading.Event = None):
+        self.calls = []
+        self.gate = gate
+
+    def read_recording(self, path, **kwargs):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.calls.append(Path(path))
+        rec = Recording(Path(path))
+        rec.channels["0"] = Channel("0", "Vm", "mV", 1000.0, [np.zeros(1000)])
+        return rec
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = []
+    for i in range(8):
+        p = tmp_path / f"cell_{i}.abf"
+        p.write_bytes(b"\0" * 64)
+        paths.append(p)
+    return paths
+
+
+@pytest.fixture
+def cache():
+    DataCache.reset_instance()
+    return DataCache(max_size=10, max_bytes=10**7, spill_enabled=False)
+
+
+def test_neighbours_nearest_first(files, cache):
+    prefetcher = NeighbourPrefetcher(_FakeAdapter(), radius=2, cache=cache)
+    assert prefetcher.neighbours(files, 3) == [files[4], files[2], files[5], files[1]]
+    assert prefetcher.neighbours(files, 0) == [files[1], files[2]]
+
+
+def test_prefetch_fills_cache(files, cache):
+    adapter = _FakeAdapter()
+    prefetcher = NeighbourPrefetcher(adapter, radius=1, cache=cache)
+    prefetcher.schedule(files, 3)
+    prefetcher.wait_for_done()
+
+    assert sorted(adapter.calls) == [files[2], files[4]]
+    assert cache.contains(files[2]) and cache.contains(files[4])
+    assert not cache.contains(files[3])  # the current file is the foreground load's job
+    # Already cached neighbours are not queued again.
+    assert prefetcher.schedule(files, 3) == []
+
+
+def test_jump_cancels_stale_prefetches(files, cache):
+    gate = threading.Event()
+    adapter = _FakeAdapter(gate)
+    prefetcher = NeighbourPrefetcher(adapter, radius=2, max_threads=1, cache=cache)
+    prefetcher.schedule(files, 1)  # first task blocks on the gate, the rest stay queued
+    prefetcher.schedule(files, 6)  # user jumps: queued tasks for file 1's neighbours are dropped
+    gate.set()
+    prefetcher.wait_for_done()
+
+    stale = {files[0], files[3]}
+    assert not stale & set(adapter.calls)
+    assert {files[5], files[7], files[4]} <= set(adapter.calls)
+
+
+def test_memory_budget_prevents_eviction(files):
+    DataCache.reset_instance()
+    one_recording = 1000 * 8
+    cache = DataCache(max_size=10, max_bytes=one_recording * 4, spill_enabled=False)
+    prefetcher = NeighbourPrefetcher(_FakeAdapter(), radius=3, budget_fraction=0.5, cache=cache)
+    prefetcher.schedule(files, 3)
+    prefetcher.wait_for_done()
+
+    assert len(cache) == 2
+    assert cache.get_stats()["evictions"] == 0
+    assert prefetcher.get_stats()["skipped_budget"] == 4
+
+
+def test_wait_for_blocks_until_prefetch_done(files, cache):
+    gate = threading.Event()
+    prefetcher = NeighbourPrefetcher(_FakeAdapter(gate), radius=1, max_threads=1, cache=cache)
+    prefetcher.schedule(files, 0)
+    for _ in range(500):
+        if prefetcher._in_flight:
+            break
+        threading.Event().wait(0.01)
+    assert prefetcher.wait_for(files[1], timeout=0.05) is False
+    gate.set()
+    assert prefetcher.wait_for(files[1], timeout=5)
+    prefetcher.wait_for_done()
+    assert cache.contains(files[1])
@@ -117,13 +117,36 @@ def pytest_ignore_collect(collection_path, config):
 
 @pytest.fixture(autouse=True)
 def reset_datacache():
-    """Ensure DataCache singleton is reset between tests."""
+    """Ensure the DataCache, ProcessedTraceCache and DerivedSignalStore singletons are reset between tests."""
     try:
+        from synaptipy.core.derived_signals import DerivedSignalStore
         from synaptipy.shared.data_cache import DataCache
+        from synaptipy.shared.processed_cache import ProcessedTraceCache
 
         DataCache.reset_instance()
+        ProcessedTraceCache.reset_instance()
+        DerivedSignalStore.reset_instance()
         yield
         DataCache.reset_instance()
+        ProcessedTraceCache.reset_instance()
+        DerivedSignalStore.reset_instance()
+    except ImportError:
+        yield
+
+
+# Keep tests (and spawned batch workers) away from the persistent cache in ~/.synaptipy/cache.
+os.environ.setdefault("SYNAPTIPY_DISK_CACHE", "0")
+
+
+@pytest.fixture(autouse=True)
+def reset_recording_disk_cache():
+    """Ensure the RecordingDiskCache default instance is rebuilt between tests."""
+    try:
+        from synaptipy.infrastructure.file_readers.recording_cache import RecordingDiskCache
+
+        RecordingDiskCache.set_instance(None)
+        yield
+        RecordingDiskCache.set_instance(None)
     except ImportError:
         yield
 
@@ -858,7 +858,7 @@ class TestFiringDynamicsModule:
 
         v, t = _spiking_trace(n_spikes=4, isi_s=0.05, duration=0.5)
         with patch(
-            "synaptipy.core.analysis.firing_dynamics.calculate_spike_features",
+            "synaptipy.core.analysis.firing_dynamics.compute_spike_feature_table",
             side_effect=ValueError("feature fail"),
         ):
             result = calculate_fi_curve(
@@ -1013,10 +1013,11 @@ class TestFiringDynamicsGaps:
     def test_spike_broadening_index_three_or_more_widths(self):
         """Lines 765-766: broadening index computed when >= 3 valid widths."""
         from synaptipy.core.analysis.firing_dynamics import run_train_dynamics_wrapper
+        from synaptipy.core.results import SpikeFeatureTable
 
-        mock_features = [{"half_width": 0.001 * (i + 1)} for i in range(5)]
+        mock_features = SpikeFeatureTable(np.arange(5), half_width=0.001 * np.arange(1, 6))
         with patch(
-            "synaptipy.core.analysis.firing_dynamics.calculate_spike_features",
+            "synaptipy.core.analysis.firing_dynamics.compute_spike_feature_table",
             return_value=mock_features,
         ):
             v, t = _spiking_trace_local(n_spikes=5, isi_s=0.08, duration=0.6)
@@ -259,6 +259,11 @@ class TestParallelPathTasks:
         rec = _make_recording()
         pipeline = [{"analysis": "rmp_analysis", "scope": "first_trial", "params": {}}]
         self._patch_parallel(monkeypatch, [])
+        # Recordings that cannot be exported to shared memory run in-process
+        monkeypatch.setattr(
+            "synaptipy.core.analysis.batch_engine.export_recording",
+            lambda recording: (_ for _ in ()).throw(ValueError("not exportable")),
+        )
         monkeypatch.setattr(
             engine,
             "_run_batch_sequential",
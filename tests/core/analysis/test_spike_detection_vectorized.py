@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Vectorised and batched dV/dt-threshold spike detection against the per-crossing reference."""
+
+import numpy as np
+import pytest
+from scipy.signal import butter, sosfiltfilt
+
+from synaptipy.core.analysis.single_spike import (
+    _refractory_mask,
+    analyze_multi_sweep_spikes,
+    detect_spikes_threshold,
+    detect_spikes_threshold_batch,
+)
+
+FS = 20000.0
+
+
+def _reference_peaks(data, dt, threshold, refractory_samples, window):
+    """The original loop implementation, kept here as an oracle."""
+    sos = butter(4, 5000.0, btype="low", output="sos", fs=1.0 / dt)
+    dvdt = np.gradient(sosfiltfilt(sos, data), dt)
+    crossings = np.where((dvdt[:-1] < 20000.0) & (dvdt[1:] >= 20000.0))[0] + 1
+    kept = []
+    for idx in crossings:
+        if not kept or idx - kept[-1] >= refractory_samples:
+            kept.append(idx)
+    peaks = []
+    for c in kept:
+        p = c + int(np.argmax(data[c : min(c + window, len(data))]))
+        if data[p] >= threshold:
+            peaks.append(p)
+    return np.array(peaks, dtype=int)
+
+
+@pytest.fixture(scope="module")
+def sweeps():
+    """Noisy sweeps with bursts of closely spaced spikes, including one at the very end."""
+    rng = np.random.default_rng(7)
+    n = 8000
+    out = np.full((3, n), -70.0) + rng.standard_normal((3, n)) * 0.3
+    kernel = 90.0 * np.exp(-np.arange(30) / 6.0) * (1 - np.exp(-np.arange(30) / 1.0))
+    for row, starts in enumerate([[100, 140, 170, 2000, 7985], rng.integers(50, 7900, 120), []]):
+        for s in starts:
+            seg = kernel[: n - s]
+            out[row, s : s + seg.size] += seg
+    return out
+
+
+@pytest.mark.parametrize("refractory,window", [(0, None), (40, None), (40, 10), (200, 4000)])
+def test_matches_reference_and_batch(sweeps, refractory, window):
+    t = np.arange(sweeps.shape[1]) / FS
+    batch = detect_spikes_threshold_batch(sweeps, t, -20.0, refractory, peak_search_window_samples=window)
+    for i, row in enumerate(sweeps):
+        w = window if window is not None else (refractory if refractory > 0 else int(0.005 * FS))
+        expected = _reference_peaks(row, t[1] - t[0], -20.0, refractory, w)
+        single = detect_spikes_threshold(row, t, -20.0, refractory, peak_search_window_samples=window)
+        np.testing.assert_array_equal(single.spike_indices, expected)
+        np.testing.assert_array_equal(batch[i].spike_indices, single.spike_indices)
+        assert batch[i].mean_frequency == single.mean_frequency
+        assert batch[i].metadata["sweep_index"] == i
+
+
+def test_refractory_mask_greedy_chain():
+    rng = np.random.default_rng(0)
+    positions = np.sort(rng.choice(100_000, 20_000, replace=False))
+    expected, last = [], None
+    for p in positions:
+        if last is None or p - last >= 17:
+            expected.append(p)
+            last = p
+    np.testing.assert_array_equal(positions[_refractory_mask(positions, 17)], expected)
+
+
+def test_multi_sweep_batch_and_fallback(sweeps):
+    t = np.arange(sweeps.shape[1]) / FS
+    batched = analyze_multi_sweep_spikes(list(sweeps), t, -20.0, 40)
+    ragged = analyze_multi_sweep_spikes([sweeps[0], sweeps[1][:-1]], t, -20.0, 40)
+    assert [r.value for r in batched[:1]] == [ragged[0].value]
+    assert not ragged[1].is_valid
+    assert not detect_spikes_threshold_batch(sweeps, t[:-1], -20.0, 40)[0].is_valid
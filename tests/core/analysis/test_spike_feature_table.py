@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Columnar spike feature table against the per-spike result objects."""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from synaptipy.core.analysis.single_spike import calculate_spike_features, compute_spike_feature_table
+from synaptipy.core.results import AnalysisResult, SingleSpikeResult, SpikeFeatureTable
+
+FS = 20000.0
+
+
+@pytest.fixture
+def spiking():
+    """Three APs with an afterhyperpolarisation, 60 ms apart."""
+    k = np.arange(1000)
+    shape = 100.0 * np.exp(-k / 8.0) * (1 - np.exp(-k / 1.5)) - 8.0 * np.exp(-k / 200.0) * (1 - np.exp(-k / 30.0))
+    v = np.full(4000, -70.0)
+    starts = (800, 2000, 3000)
+    for s in starts:
+        v[s : s + shape.size] += shape[: v.size - s]
+    t = np.arange(v.size) / FS
+    peaks = np.array([s + int(np.argmax(shape)) for s in starts])
+    return v, t, peaks
+
+
+def test_columns_match_result_objects(spiking):
+    v, t, peaks = spiking
+    table = compute_spike_feature_table(v, t, peaks)
+    results = calculate_spike_features(v, t, peaks)
+
+    assert len(table) == len(results) == 3
+    np.testing.assert_array_equal(table.spike_indices, peaks)
+    for name in SpikeFeatureTable.COLUMNS:
+        np.testing.assert_array_equal(getattr(table, name), [getattr(r, name) for r in results])
+    np.testing.assert_equal(dataclasses.asdict(table[1]), dataclasses.asdict(results[1]))
+    assert all(r.ap_width_arbitrary is None for r in results)
+    assert np.all(table.phase_plane_area > 0) and np.all(np.isfinite(table.half_width))
+
+
+def test_trough_is_mean_around_ahp_minimum(spiking):
+    v, t, peaks = spiking
+    table = compute_spike_feature_table(v, t, peaks)
+    half = int(0.001 * FS)
+    for i, peak in enumerate(peaks):
+        j = int(round(table.ahp_time[i] * FS))
+        window = v[max(peak, j - half) : min(j + half + 1, peak + 1000)]
+        assert table.trough_v[i] == pytest.approx(window.mean(), abs=1e-12)
+
+
+def test_summary_stats_and_dataframe(spiking):
+    v, t, peaks = spiking
+    table = compute_spike_feature_table(v, t, peaks)
+    results = table.to_results()
+
+    base = {f.name for f in dataclasses.fields(AnalysisResult)} | {"parameters"}
+    feature_fields = [f.name for f in dataclasses.fields(SingleSpikeResult) if f.name not in base]
+    stats = table.summary_stats()
+    assert list(stats) == [f"{name}_{stat}" for name in feature_fields for stat in ("mean", "std")]
+    for name in feature_fields:
+        values = [getattr(r, name) for r in results if getattr(r, name) is not None and not np.isnan(getattr(r, name))]
+        expected = (np.mean(values), np.std(values)) if values else (np.nan, np.nan)
+        np.testing.assert_allclose((stats[f"{name}_mean"], stats[f"{name}_std"]), expected, rtol=1e-15)
+
+    df = table.to_dataframe()
+    assert list(df.columns) == list(SpikeFeatureTable.COLUMNS)
+    np.testing.assert_array_equal(df.index.to_numpy(), peaks)
+    assert np.shares_memory(df["half_width"].to_numpy(), table.half_width)
+
+
+def test_empty_and_invalid():
+    v = np.full(100, -70.0)
+    t = np.arange(100) / FS
+    table = compute_spike_feature_table(v, t, np.array([], dtype=int))
+    assert len(table) == 0 and table.to_results() == [] and table.summary_stats() == {}
+    with pytest.raises(TypeError):
+        SpikeFeatureTable(np.arange(2), width=np.zeros(2))
+    with pytest.raises(ValueError):
+        SpikeFeatureTable(np.arange(2), half_width=np.zeros(3))
@@ -852,7 +852,7 @@ class TestDetectEventsTemplateExceptionHandler:
         n = 2000
         data = np.zeros(n)
         with patch(
-            "synaptipy.core.analysis.synaptic_events.signal.fftconvolve",
+            "synaptipy.core.analysis.synaptic_events.matched_filter_bank",
             side_effect=ValueError("forced template error"),
         ):
             result = detect_events_template(
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Tests for the rolling-baseline estimators."""
+
+import numpy as np
+import pytest
+from scipy.ndimage import median_filter
+
+from synaptipy.core import baseline_estimators as be
+from synaptipy.core.analysis.synaptic_events import detect_events_template
+
+FS = 20000.0
+
+
+@pytest.fixture(scope="module")
+def traces():
+    rng = np.random.default_rng(5)
+    t = np.arange(6001) / FS
+    drift = 10.0 * np.sin(2 * np.pi * t / 0.2)
+    return drift + rng.standard_normal((3, t.size)) * 2.0
+
+
+def _windows(data, window):
+    half = window // 2
+    return np.lib.stride_tricks.sliding_window_view(np.pad(data, (half, half), mode="symmetric"), window)
+
+
+@pytest.mark.parametrize("window", [3, 101, 1001])
+def test_running_median_matches_median_filter(traces, window):
+    np.testing.assert_array_equal(be.running_median(traces[0], window), median_filter(traces[0], size=window))
+    np.testing.assert_array_equal(be.running_median(traces, window), median_filter(traces, size=(1, window)))
+
+
+def test_running_percentile_matches_window_percentiles(traces):
+    expected = np.percentile(_windows(traces[1], 201), 20.0, axis=-1)
+    np.testing.assert_allclose(be.running_percentile(traces[1], 201, 20.0), expected, rtol=1e-12, atol=1e-12)
+    with pytest.raises(ValueError):
+        be.running_percentile(traces[1], 201, 120.0)
+
+
+@pytest.mark.parametrize("decimation", [4, 16])
+def test_decimated_median_rank_bound(traces, decimation):
+    window = 801
+    data = traces[2]
+    approx = be.decimated_median(data, window, decimation)
+    wins = _windows(data, window)
+    p_low = np.count_nonzero(wins < approx[:, None], axis=1) / window
+    p_high = np.count_nonzero(wins <= approx[:, None], axis=1) / window
+    step = window // decimation
+    assert np.all(p_low - 0.5 <= step / window) and np.all(0.5 - p_high <= step / window)
+    np.testing.assert_array_equal(be.decimated_median(traces, window, decimation)[2], approx)
+
+
+def test_smooth_trends():
+    t = np.linspace(-1.0, 1.0, 4001)
+    cubic = 3.0 * t**3 - t + 2.0
+    smoothed = be.savgol_trend(cubic, 201)
+    np.testing.assert_allclose(smoothed[100:-100], cubic[100:-100], atol=1e-9)
+    flat = np.full((2, 500), -65.0)
+    np.testing.assert_allclose(be.exponential_trend(flat, 51), flat)
+    assert be.exponential_trend(cubic, 51).shape == cubic.shape
+
+
+def test_dispatch_and_event_detection(traces):
+    data = traces[0]
+    assert be.subtract_rolling_baseline(data, FS, 0.0) is data
+    assert be.subtract_rolling_baseline(data, FS, 0.05) is data  # one sample
+    with pytest.raises(ValueError):
+        be.rolling_baseline(data, 11, "loess")
+    np.testing.assert_allclose(
+        be.subtract_rolling_baseline(data, FS, 10.0, "percentile", percentile=30.0),
+        data - be.running_percentile(data, 201, 30.0),
+    )
+
+    k = np.arange(300) / FS
+    psc = np.exp(-k / 0.004) - np.exp(-k / 0.0005)
+    trace = data.copy()
+    for onset in (1000, 3000, 5000):
+        trace[onset : onset + psc.size] -= 40.0 * psc
+    counts = {
+        method: detect_events_template(
+            trace, FS, 4.0, 0.0005, 0.004, rolling_baseline_window_ms=50.0, baseline_method=method
+        ).event_count
+        for method in be.BASELINE_METHODS
+    }
+    assert counts["median"] >= 3
+    assert all(count >= 1 for count in counts.values())
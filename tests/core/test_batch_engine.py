@@ -324,6 +324,31 @@ class TestBatchAnalysisSystem:
         assert df.iloc[2]["mean"] == 30.0
         assert all(df.trial_index == [0, 1, 2])
 
+    def test_batch_engine_all_trials_uses_trials_batch(self):
+        """A registered trials_batch analyses every iterated trial in one call."""
+        calls = []
+
+        def batch_means(data, time, sampling_rate, **kwargs):
+            calls.append(len(data))
+            return [{"mean": float(np.mean(d))} for d in data]
+
+        @AnalysisRegistry.register("trial_batch_analysis", trials_batch=batch_means)
+        def trial_batch_analysis(data, time, sampling_rate, **kwargs):
+            raise AssertionError("per-trial function must not run when trials_batch is registered")
+
+        engine = BatchAnalysisEngine()
+        rec = Recording(source_file=Path("dummy.abf"))
+        trials = [np.ones(100) * v for v in (10.0, 20.0, 30.0)]
+        rec.channels["0"] = Channel(id="0", name="Vm", units="mV", sampling_rate=1000.0, data_trials=trials)
+        engine.neo_adapter.read_recording = MagicMock(return_value=rec)
+
+        pipeline = [{"analysis": "trial_batch_analysis", "scope": "all_trials", "params": {}}]
+        df = engine.run_batch([Path("f.abf")], pipeline)
+
+        assert calls == [3]
+        assert list(df["mean"]) == [10.0, 20.0, 30.0]
+        assert all(df.trial_index == [0, 1, 2])
+
     def test_batch_engine_multiple_analyses(self):
         """Test running multiple analyses in a pipeline."""
 
@@ -1214,3 +1239,36 @@ class TestBatchAllAnalysisTypes:
         # All expected must be registered
         missing_from_registry = expected_analyses - registered
         assert not missing_from_registry, f"Expected analyses not registered: {missing_from_registry}"
+
+
+class TestWindowedBatchReads:
+    """Analyses that declare their data windows read only those sample ranges."""
+
+    def test_declared_windows(self):
+        params = {"baseline_start": 0.0, "baseline_end": 0.1}
+        assert AnalysisRegistry.get_data_windows("rmp_analysis", params) == [(0.0, 0.1)]
+        assert AnalysisRegistry.get_data_windows("rmp_analysis", {**params, "auto_detect": True}) is None
+        assert AnalysisRegistry.get_data_windows("spike_detection", {}) is None
+
+    def test_windowed_run_matches_eager(self, sample_abf_path, monkeypatch):
+        from synaptipy.infrastructure.file_readers import NeoAdapter
+        from synaptipy.infrastructure.file_readers.abf_reader import AbfSourceHandle
+
+        pipeline = [
+            {"analysis": "rmp_analysis", "scope": "first_trial", "params": {"baseline_start": 0.0, "baseline_end": 0.1}}
+        ]
+        recording = NeoAdapter().read_recording(sample_abf_path)
+        expected = BatchAnalysisEngine().run_batch([recording], pipeline)
+
+        full_reads = []
+        original = AbfSourceHandle.load_channel_data
+
+        def _spy(self, channel_id, trial_index):
+            full_reads.append((channel_id, trial_index))
+            return original(self, channel_id, trial_index)
+
+        monkeypatch.setattr(AbfSourceHandle, "load_channel_data", _spy)
+        windowed = BatchAnalysisEngine(neo_adapter=NeoAdapter()).run_batch([sample_abf_path], pipeline)
+
+        assert full_reads == []
+        assert windowed.iloc[0]["rmp_mv"] == expected.iloc[0]["rmp_mv"]
@@ -3,7 +3,7 @@ from pathlib import Path
 import numpy as np
 import pytest
 
-from synaptipy.core.data_model import Channel, Recording
+from synaptipy.core.data_model import Channel, Recording, stack_trials
 
 # Sample data for testing
 SAMPLE_RATE = 10000.0  # Hz
@@ -400,3 +400,102 @@ def test_recording_close_swallows_exception(sample_recording):
     handle.close.side_effect = OSError("file already closed")
     sample_recording.source_handle = handle
     sample_recording.close()  # Must not propagate OSError
+
+
+# ---------------------------------------------------------------------------
+# Contiguous trial storage
+# ---------------------------------------------------------------------------
+
+
+def test_equal_length_trials_share_one_block():
+    trials = [np.arange(5, dtype=float) + i for i in range(4)]
+    ch = Channel(id="0", name="Vm", units="mV", sampling_rate=1000.0, data_trials=trials)
+
+    matrix = ch.trial_matrix
+    assert matrix.shape == (4, 5)
+    assert matrix.flags.c_contiguous
+    for i in range(4):
+        assert np.shares_memory(ch.get_data(i), matrix)
+        np.testing.assert_array_equal(ch.get_data(i), trials[i])
+    assert ch.get_trial_matrix() is matrix or np.shares_memory(ch.get_trial_matrix(), matrix)
+    assert np.shares_memory(stack_trials(ch.data_trials), matrix)
+    np.testing.assert_allclose(ch.get_averaged_data(), matrix.mean(axis=0))
+
+
+def test_two_dimensional_input_is_rows_of_trials():
+    block = np.arange(12, dtype=np.float32).reshape(3, 4)
+    ch = Channel(id="0", name="Vm", units="mV", sampling_rate=1000.0, data_trials=block)
+    assert ch.num_trials == 3
+    assert ch.num_samples == 4
+    assert ch.trial_matrix is block
+
+
+def test_ragged_trials_fall_back_to_list():
+    ch = Channel(id="0", name="Vm", units="mV", sampling_rate=1000.0, data_trials=[np.ones(3), np.ones(5)])
+    assert ch.trial_matrix is None
+    assert ch.get_trial_matrix() is None
+    assert len(ch.data_trials) == 2
+
+
+def test_elementwise_replacement_invalidates_block():
+    ch = Channel(id="0", name="Vm", units="mV", sampling_rate=1000.0, data_trials=[np.zeros(3), np.zeros(3)])
+    ch.data_trials[1] = np.ones(3)
+    assert ch.trial_matrix is None
+    # get_trial_matrix re-packs the current trials
+    np.testing.assert_array_equal(ch.get_trial_matrix(), [[0, 0, 0], [1, 1, 1]])
+    assert ch.trial_matrix is not None
+
+
+def test_lazy_trials_consolidate_on_average():
+    ch = Channel(id="lazy", name="Vm", units="mV", sampling_rate=1000.0, data_trials=[], loader=lambda i: np.full(4, i))
+    ch.metadata["num_trials"] = 3
+    np.testing.assert_allclose(ch.get_averaged_data(), np.full(4, 1.0))
+    assert ch.trial_matrix.shape == (3, 4)
+
+
+def test_get_trial_matrix_subset():
+    ch = Channel(id="0", name="Vm", units="mV", sampling_rate=1000.0, data_trials=[np.full(2, i) for i in range(5)])
+    assert np.shares_memory(ch.get_trial_matrix([1, 2, 3]), ch.trial_matrix)
+    np.testing.assert_array_equal(ch.get_trial_matrix([4, 0])[:, 0], [4, 0])
+    assert ch.get_trial_matrix([7]) is None
+
+
+def test_undo_snapshots_share_unchanged_trials():
+    ch = Channel(id="0", name="Vm", units="mV", sampling_rate=1000.0, data_trials=[np.zeros(1000), np.ones(1000)])
+    block_bytes = ch.trial_matrix.nbytes
+    ch.push_undo("first")
+    ch.push_undo("second")
+    # Consecutive snapshots reference the same block: nothing was copied.
+    assert ch._undo_stack.nbytes == block_bytes
+    ch.data_trials = np.full((2, 1000), 5.0)
+    ch.push_undo("third")
+    assert ch._undo_stack.nbytes == 2 * block_bytes
+
+    # In-place edits after push_undo work and never reach the snapshots.
+    ch.data_trials[0][0] = 7.0
+    assert ch.get_data(0)[0] == 7.0
+    assert ch.undo() and ch.data_trials[0][0] == 5.0
+    assert ch.undo() and ch.data_trials[0][0] == 0.0
+    ch.data_trials[0][0] = 1.0  # restored trials are writable again
+    assert ch.undo() and ch.data_trials[0][0] == 0.0
+    assert ch.trial_matrix is not None
+
+
+def test_undo_stack_evicts_by_bytes():
+    from synaptipy.core.data_model import UndoStack
+
+    stack = UndoStack(max_depth=20, max_bytes=3 * 8000)
+    for i in range(6):
+        stack.push(f"step{i}", {"data_trials": np.zeros((1, 1000))})
+    assert stack.depth == 3
+    assert stack.nbytes <= 3 * 8000
+    stack.push("huge", {"data_trials": np.zeros((10, 1000))})
+    assert stack.depth == 1  # the newest level is always kept
+
+
+def test_undo_restores_contiguous_block():
+    ch = Channel(id="0", name="Vm", units="mV", sampling_rate=1000.0, data_trials=[np.zeros(3), np.ones(3)])
+    ch.push_undo("edit")
+    ch.data_trials = [np.full(3, 9.0), np.full(3, 9.0)]
+    assert ch.undo()
+    np.testing.assert_array_equal(ch.trial_matrix, [[0, 0, 0], [1, 1, 1]])
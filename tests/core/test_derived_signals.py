@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Tests for the shared derived-signal store."""
+
+import gc
+
+import numpy as np
+import pytest
+
+from synaptipy.core.analysis.single_spike import (
+    calculate_dvdt,
+    calculate_spike_features,
+    detect_spikes_threshold,
+    phase_plane_analysis_wrapper,
+)
+from synaptipy.core.derived_signals import DerivedSignalStore, lowpass_dvdt
+
+FS = 20000.0
+
+
+@pytest.fixture
+def spiking():
+    t = np.arange(4000) / FS
+    v = np.full(t.size, -70.0)
+    for s in (800, 2000, 3200):
+        v[s : s + 40] += 100.0 * np.exp(-np.arange(40) / 8.0) * (1 - np.exp(-np.arange(40) / 1.5))
+    return v, t
+
+
+def test_spike_analyses_filter_and_differentiate_once(spiking):
+    v, t = spiking
+    store = DerivedSignalStore.get_instance()
+    first = detect_spikes_threshold(v, t, -20.0, 40)
+    second = detect_spikes_threshold(v, t, -20.0, 40)
+    assert first.is_valid and len(first.spike_indices) == 3  # 5 kHz SOS path (below Nyquist)
+    calculate_spike_features(v, t, first.spike_indices)
+    calculate_spike_features(v, t, first.spike_indices)
+
+    # Butterworth and Bessel: one filtered trace and one dV/dt each, then reused
+    stats = store.get_stats()
+    assert (stats["misses"], stats["hits"], stats["entries"]) == (4, 2, 4)
+    np.testing.assert_array_equal(first.spike_indices, second.spike_indices)
+
+    # Phase-plane trajectory and kink threshold share one smoothed dV/dt
+    phase_plane_analysis_wrapper(v, t, FS)
+    dvdt = calculate_dvdt(v, FS, sigma_ms=0.1)
+    assert not dvdt.flags.writeable
+    assert calculate_dvdt(v, FS, sigma_ms=0.1) is dvdt
+
+
+def test_in_place_edit_and_collection_invalidate():
+    v = np.sin(np.arange(4000) / 50.0)
+    store = DerivedSignalStore.get_instance()
+    before = lowpass_dvdt(v, 1.0 / FS, 5000.0).copy()
+    v *= 2.0
+    after = lowpass_dvdt(v, 1.0 / FS, 5000.0)
+    np.testing.assert_allclose(after, before * 2.0, atol=1e-9)
+    assert store.get_stats()["invalidations"] == 1
+
+    del v, after
+    gc.collect()
+    assert len(store) == 0 and store.bytes_in_use() == 0
+
+
+def test_byte_budget():
+    store = DerivedSignalStore(max_bytes=3 * 1000 * 8)
+    sources = [np.random.default_rng(i).standard_normal(1000) for i in range(3)]
+    for src in sources:
+        store.get_or_compute(src, "double", lambda s=src: s * 2.0)
+        store.get_or_compute(src, "square", lambda s=src: s**2)
+    stats = store.get_stats()
+    assert stats["entries"] == 3 and stats["evictions"] == 3
+    assert store.bytes_in_use() <= store.max_bytes
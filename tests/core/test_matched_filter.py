@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Tests for the single-FFT matched-filter kernel bank and batched template detection."""
+
+import numpy as np
+import pytest
+from scipy import signal, stats
+
+from synaptipy.core import matched_filter
+from synaptipy.core.analysis.synaptic_events import (
+    _template_z_scores,
+    detect_events_template,
+    detect_events_template_batch,
+    run_event_detection_template_trials,
+    run_event_detection_template_wrapper,
+)
+
+FS = 20000.0
+MULTIPLIERS = (1.0, 2.0, 3.0)
+
+
+@pytest.fixture(scope="module")
+def trials():
+    """Four noisy trials with bi-exponential inward events, including one at the very start."""
+    rng = np.random.default_rng(11)
+    n = 6000
+    t = np.arange(400) / FS
+    psc = np.exp(-t / 0.004) - np.exp(-t / 0.0005)
+    out = rng.standard_normal((4, n)) * 0.5 - 60.0
+    for row in out:
+        for onset in np.r_[0, rng.integers(0, n - psc.size, 8)]:
+            row[onset : onset + psc.size] -= 25.0 * psc
+    return out
+
+
+@pytest.mark.parametrize("shape", ["bi-exponential", "mono-exponential"])
+def test_bank_matches_fftconvolve(trials, shape):
+    for block in (trials[0], trials):
+        out = list(matched_filter.matched_filter_bank(block, 0.0005, 0.004, MULTIPLIERS, FS, shape))
+        assert len(out) == len(MULTIPLIERS)
+        for k, filtered in out:
+            expected = np.stack([signal.fftconvolve(row, k[::-1], mode="same") for row in np.atleast_2d(block)])
+            np.testing.assert_allclose(filtered, expected.reshape(block.shape), rtol=0, atol=1e-9)
+
+
+def test_overlap_save_blocks_match_fftconvolve():
+    """Traces longer than two blocks go through overlap-save and still match fftconvolve."""
+    data = np.random.default_rng(3).standard_normal((2, 5 * matched_filter.MIN_BLOCK_LENGTH + 123))
+    for block in (data[0], data):
+        for k, filtered in matched_filter.matched_filter_bank(block, 0.0005, 0.004, MULTIPLIERS, FS):
+            expected = np.stack([signal.fftconvolve(row, k[::-1], mode="same") for row in np.atleast_2d(block)])
+            np.testing.assert_allclose(filtered, expected.reshape(block.shape), rtol=0, atol=1e-9)
+
+
+def test_kernel_spectra_cached_per_length(trials):
+    matched_filter._bank_spectra.cache_clear()
+    for row in trials:
+        list(matched_filter.matched_filter_bank(row, 0.0005, 0.004, MULTIPLIERS, FS))
+    info = matched_filter._bank_spectra.cache_info()
+    assert (info.misses, info.hits) == (1, len(trials) - 1)
+    assert not matched_filter.kernel_bank(0.0005, 0.004, MULTIPLIERS, FS)[0].flags.writeable
+
+
+def test_combined_z_scores_match_per_kernel_reference(trials):
+    """Pointwise max of per-kernel z-scores, each rolled onto the primary kernel's alignment."""
+    z, mads = _template_z_scores(trials, FS, 0.0005, 0.004, list(MULTIPLIERS), "bi-exponential")
+    kernels = matched_filter.kernel_bank(0.0005, 0.004, MULTIPLIERS, FS)
+    offsets = [int(np.argmax(k)) - (len(k) - 1) // 2 for k in kernels]
+    for i, row in enumerate(trials):
+        layers = []
+        for k, offset in zip(kernels, offsets):
+            filtered = signal.fftconvolve(row, k[::-1], mode="same")
+            layer = (filtered - np.median(filtered)) / stats.median_abs_deviation(filtered, scale="normal")
+            shift = offset - offsets[0]
+            layer = np.roll(layer, shift)
+            if shift > 0:
+                layer[:shift] = 0.0
+            elif shift < 0:
+                layer[shift:] = 0.0
+            layers.append(layer)
+        np.testing.assert_allclose(z[i], np.max(layers, axis=0), rtol=1e-9, atol=1e-9)
+        primary = signal.fftconvolve(row, kernels[0][::-1], mode="same")
+        expected_mad = stats.median_abs_deviation(primary, scale="normal")
+        assert mads[i] == pytest.approx(expected_mad, rel=1e-9)
+
+
+def test_batch_matches_single_trial_detection(trials):
+    t = np.arange(trials.shape[1]) / FS
+    kwargs = dict(threshold_std=4.0, tau_rise=0.0005, tau_decay=0.004, time=t)
+    batch = detect_events_template_batch(trials, FS, **kwargs)
+    for i, row in enumerate(trials):
+        single = detect_events_template(row, FS, **kwargs)
+        assert single.is_valid and single.event_count > 0
+        np.testing.assert_array_equal(batch[i].event_indices, single.event_indices)
+        assert batch[i].summary_stats["noise_mad"] == pytest.approx(single.summary_stats["noise_mad"], rel=1e-12)
+        assert batch[i].metadata["sweep_index"] == i
+
+    assert not detect_events_template_batch(trials[0], FS, **kwargs)[0].is_valid
+    bad_mask = np.zeros((2, trials.shape[1]), dtype=bool)
+    assert not detect_events_template_batch(trials, FS, artifact_mask=bad_mask, **kwargs)[0].is_valid
+
+
+def test_trials_batch_matches_wrapper_per_trial(trials):
+    time = np.arange(trials.shape[1]) / FS
+    params = {"tau_decay_ms": 4.0, "rolling_baseline_window_ms": 50.0, "reject_artifacts": True}
+    batched = run_event_detection_template_trials(list(trials), [time] * len(trials), FS, **params)
+    for row, out in zip(trials, batched):
+        expected = run_event_detection_template_wrapper(row, time, FS, **params)["metrics"]
+        assert out["metrics"]["event_count"] == expected["event_count"]
+        assert out["metrics"]["_event_times"] == expected["_event_times"]
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Tests for the trial storage precision policy."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from synaptipy.core import precision
+from synaptipy.core.analysis.passive_properties import calculate_tau
+from synaptipy.core.data_model import Channel, Recording
+from synaptipy.shared.data_cache import estimate_recording_bytes
+
+
+@pytest.fixture(autouse=True)
+def _restore_default_policy():
+    yield
+    precision.set_default_storage_dtype(None)
+
+
+def _recording(n_trials=3, n_samples=1000):
+    rec = Recording(Path("synthetic.abf"))
+    ch = Channel(
+        "0", "Vm", "mV", 10000.0, [np.random.default_rng(i).normal(-65, 1, n_samples) for i in range(n_trials)]
+    )
+    ch.current_data_trials = [np.zeros(n_samples)] * n_trials
+    ch._recording_ref = rec
+    rec.channels["0"] = ch
+    return rec
+
+
+def test_default_keeps_reader_dtype():
+    ch = _recording().channels["0"]
+    assert ch.storage_dtype is None
+    assert ch.get_data(0).dtype == np.float64
+
+
+def test_global_float32_policy():
+    precision.update_performance_settings({"float32_storage": True})
+    ch = _recording().channels["0"]
+    assert ch.get_data(0).dtype == np.float32
+    assert ch.trial_matrix is not None  # still one contiguous block
+    assert ch.current_data_trials[0].dtype == np.float32
+
+
+def test_recording_policy_converts_loaded_trials_and_halves_memory():
+    rec = _recording()
+    before = estimate_recording_bytes(rec)
+    reference = rec.channels["0"].get_data(1).copy()
+
+    rec.set_storage_dtype("float32")
+    ch = rec.channels["0"]
+    assert ch.trial_matrix.dtype == np.float32
+    assert estimate_recording_bytes(rec) == before // 2
+    np.testing.assert_allclose(ch.get_data(1), reference, rtol=1e-6)
+
+    precision.set_default_storage_dtype("float32")
+    rec.set_storage_dtype("float64")  # per-recording policy wins over the global one
+    assert ch.get_data(1).dtype == np.float64
+
+
+def test_lazy_trials_adopt_policy(sample_abf_path):
+    from synaptipy.infrastructure.file_readers.abf_reader import AbfReader
+
+    rec = AbfReader().read_recording(sample_abf_path, lazy=True)
+    rec.storage_dtype = np.dtype(np.float64)
+    ch = next(iter(rec.channels.values()))
+    assert ch.get_data(0).dtype == np.float64
+    rec.load_trials()
+    assert all(t.dtype == np.float64 for t in ch.data_trials)
+
+
+def test_invalid_dtype_rejected():
+    with pytest.raises(ValueError):
+        precision.set_default_storage_dtype("int16")
+
+
+def test_tau_fit_independent_of_storage_dtype():
+    fs = 20000.0
+    t = np.arange(int(0.3 * fs)) / fs
+    v = np.full_like(t, -65.0)
+    on = t >= 0.05
+    v[on] = -65.0 - 10.0 * (1 - np.exp(-(t[on] - 0.05) / 0.02))
+
+    dense = calculate_tau(v, t, stim_start_time=0.05, fit_duration=0.15)
+    compact = calculate_tau(v.astype(np.float32), t, stim_start_time=0.05, fit_duration=0.15)
+    assert compact["tau_ms"] == pytest.approx(dense["tau_ms"], rel=1e-4)
@@ -393,3 +393,106 @@ class TestApplyNoiseFloorZeroing:
         data = np.full(n, 5.0)
         result = _apply_noise_floor_zeroing(data, time, pre_event_window_s=(99.0, 100.0))
         np.testing.assert_allclose(result, 5.0)
+
+
+class TestCompiledPipeline:
+    FS = 10000.0
+
+    def _pipeline(self):
+        pipeline = SignalProcessingPipeline()
+        pipeline.add_step({"type": "baseline", "method": "mean"})
+        pipeline.add_step({"type": "filter", "method": "highpass", "cutoff": 1.0, "order": 2})
+        pipeline.add_step({"type": "filter", "method": "lowpass", "cutoff": 1000.0, "order": 4})
+        pipeline.add_step({"type": "filter", "method": "notch", "freq": 50.0, "q_factor": 30.0})
+        return pipeline
+
+    def _signal(self, n=20000):
+        t = np.arange(n) / self.FS
+        rng = np.random.default_rng(0)
+        return 5.0 + np.sin(2 * np.pi * 10 * t) + 0.3 * np.sin(2 * np.pi * 50 * t) + rng.normal(0, 0.2, n), t
+
+    def test_consecutive_filters_fused_into_one_pass(self):
+        data, t = self._signal()
+        pipeline = self._pipeline()
+        fused = pipeline.compile(self.FS, len(data))
+        separate = pipeline.compile(self.FS, len(data), fuse=False)
+        assert fused.n_filter_passes == 1
+        assert separate.n_filter_passes == 3
+        assert fused.stage_labels == ["baseline/mean", "filter/highpass+filter/lowpass+filter/notch"]
+
+        # Identical away from the edges, where only the start-up transients differ.
+        edge = 5000
+        np.testing.assert_allclose(fused(data, t)[edge:-edge], separate(data, t)[edge:-edge], atol=1e-3)
+
+    def test_process_reuses_compiled_pipeline(self):
+        data, t = self._signal()
+        pipeline = self._pipeline()
+        first = pipeline.process(data, self.FS, t)
+        compiled = pipeline._compiled[1]
+        for _ in range(3):
+            np.testing.assert_array_equal(pipeline.process(data, self.FS, t), first)
+        assert pipeline._compiled[1] is compiled
+
+        pipeline.add_step({"type": "baseline", "method": "median"})
+        pipeline.process(data, self.FS, t)
+        assert pipeline._compiled[1] is not compiled
+
+    def test_invalid_filter_dropped_at_compile(self):
+        pipeline = SignalProcessingPipeline()
+        pipeline.add_step({"type": "filter", "method": "lowpass", "cutoff": 1e6, "order": 4})
+        compiled = pipeline.compile(self.FS, 1000)
+        assert compiled.n_filter_passes == 0
+        data = np.arange(1000.0)
+        out = compiled(data)
+        np.testing.assert_array_equal(out, data)
+        assert out is not data
+
+
+class TestProcessBatch:
+    FS = 5000.0
+
+    def _trials(self, n_trials=6, n=4000):
+        rng = np.random.default_rng(1)
+        t = np.arange(n) / self.FS
+        return rng.normal(-65, 1, (n_trials, n)) + np.linspace(0, 2, n), t
+
+    def _steps(self):
+        return [
+            {"type": "artifact", "onset_time": 0.2, "duration_ms": 2.0, "method": "linear"},
+            {"type": "baseline", "method": "mode", "start_t": 0.0, "end_t": 0.1, "decimals": 1},
+            {"type": "baseline", "method": "median", "start_t": 0.1, "end_t": 0.2},
+            {"type": "baseline", "method": "region", "start_t": 0.0, "end_t": 0.05},
+            {"type": "baseline", "method": "linear"},
+            {"type": "filter", "method": "lowpass", "cutoff": 500.0, "order": 4},
+            {"type": "filter", "method": "notch", "freq": 50.0, "q_factor": 30.0},
+            {"type": "baseline", "method": "mean"},
+        ]
+
+    def test_block_matches_per_trial_processing(self):
+        trials, t = self._trials()
+        pipeline = SignalProcessingPipeline()
+        pipeline.set_steps(self._steps())
+        block = pipeline.process_batch(trials, self.FS, t)
+        assert block.shape == trials.shape
+        for row, trial in zip(block, trials):
+            np.testing.assert_allclose(row, pipeline.process(trial, self.FS, t), atol=1e-9)
+
+    def test_ragged_trials_grouped_by_length(self):
+        trials, t = self._trials()
+        ragged = [trials[0], trials[1][:3000], trials[2], trials[3][:3000]]
+        times = [t[: len(tr)] for tr in ragged]
+        pipeline = SignalProcessingPipeline()
+        pipeline.set_steps(self._steps())
+        out = pipeline.process_batch(ragged, self.FS, times)
+        assert [len(o) for o in out] == [len(tr) for tr in ragged]
+        for row, trial, tv in zip(out, ragged, times):
+            np.testing.assert_allclose(row, pipeline.process(trial, self.FS, tv), atol=1e-9)
+
+    def test_non_finite_rows_left_unfiltered(self):
+        trials, t = self._trials(3)
+        trials[1, 10] = np.nan
+        pipeline = SignalProcessingPipeline()
+        pipeline.add_step({"type": "filter", "method": "lowpass", "cutoff": 500.0, "order": 4})
+        block = pipeline.process_batch(trials, self.FS, t)
+        np.testing.assert_array_equal(block[1], trials[1])
+        np.testing.assert_allclose(block[0], pipeline.process(trials[0], self.FS, t))
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Tests for the robust statistics kernels."""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from synaptipy.core import robust_stats
+
+
+@pytest.fixture(scope="module")
+def traces():
+    rng = np.random.default_rng(3)
+    return rng.standard_normal((4, 5001)) * 2.0 - 65.0
+
+
+@pytest.mark.parametrize("decimals", [-1, 0, 1, 2])
+def test_mode_matches_unique_counts(traces, decimals):
+    for row in traces:
+        vals, counts = np.unique(np.round(row, decimals), return_counts=True)
+        assert robust_stats.mode(row, decimals) == vals[np.argmax(counts)]
+    expected = stats.mode(np.round(traces, 1), axis=-1, keepdims=True).mode
+    np.testing.assert_array_equal(robust_stats.mode(traces, 1, keepdims=True), expected)
+
+
+def test_mode_ties_sparse_and_nan():
+    assert robust_stats.mode(np.array([2.0, 1.0, 2.0, 1.0]), decimals=0) == 1.0
+    assert robust_stats.mode(np.array([0.0, 1e9, 1e9]), decimals=1) == 1e9  # falls back to np.unique
+    assert np.isnan(robust_stats.mode(np.array([1.0, np.nan])))
+
+
+@pytest.mark.parametrize("n", [5000, 5001])
+def test_median_and_mad_match_numpy_scipy(traces, n):
+    data = traces[:, :n]
+    snapshot = data.copy()
+    np.testing.assert_allclose(robust_stats.median(data), np.median(data, axis=-1), rtol=0, atol=0)
+    np.testing.assert_allclose(
+        robust_stats.mad(data), stats.median_abs_deviation(data, axis=-1, scale="normal"), rtol=1e-15
+    )
+    center, spread = robust_stats.median_mad(data[0])
+    assert center == np.median(data[0])
+    assert spread == pytest.approx(stats.median_abs_deviation(data[0], scale="normal"), rel=1e-15)
+    assert robust_stats.mad(data[0], center=center, scale=1.0) == pytest.approx(
+        stats.median_abs_deviation(data[0]), rel=1e-15
+    )
+    # The input is left untouched and NaN propagates like np.median
+    assert np.array_equal(data, snapshot)
+    assert np.isnan(robust_stats.median(np.array([1.0, np.nan, 2.0])))
+
+
+def test_streaming_quantile_exact_and_approximate(tmp_path):
+    rng = np.random.default_rng(4)
+    trace = rng.standard_normal(200_003)
+    np.save(tmp_path / "trace.npy", trace)
+    memmapped = np.load(tmp_path / "trace.npy", mmap_mode="r")
+    qs = [0.0, 0.05, 0.5, 0.95, 1.0]
+
+    exact = robust_stats.streaming_quantile(memmapped, qs, block_size=17_000)
+    np.testing.assert_allclose(exact, np.quantile(trace, qs), rtol=0, atol=1e-15)
+
+    approx = robust_stats.streaming_quantile(memmapped, 0.5, bins=1000, block_size=17_000, refine_limit=0)
+    assert abs(approx - np.median(trace)) <= (trace.max() - trace.min()) / 1000
+    with pytest.raises(ValueError):
+        robust_stats.streaming_quantile(trace, 1.5)
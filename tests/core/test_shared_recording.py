@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Tests for the shared-memory Recording transport."""
+
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from synaptipy.core.analysis.batch_engine import BatchAnalysisEngine
+from synaptipy.core.data_model import Channel, Recording
+from synaptipy.core.shared_recording import attach_recording, detach, export_recording
+
+
+def _recording(name="cell.abf", ragged=False):
+    rec = Recording(Path(name))
+    rec.protocol_name = "IV"
+    rec.duration = 0.5
+    rec.subject_id = "M1"
+    rec.metadata = {"gain": 10}
+    rng = np.random.default_rng(0)
+    lengths = [5000, 4000] if ragged else [5000, 5000, 5000]
+    ch = Channel("0", "Vm", "mV", 10000.0, [rng.normal(-65, 0.5, n) for n in lengths])
+    ch.current_data_trials = [np.zeros(n) for n in lengths]
+    ch.current_units = "pA"
+    ch.electrode_description = "patch"
+    ch._recording_ref = rec
+    rec.channels["0"] = ch
+    return rec
+
+
+@pytest.mark.parametrize("ragged", [False, True])
+def test_round_trip_shares_memory(ragged):
+    rec = _recording(ragged=ragged)
+    with export_recording(rec) as shared:
+        descriptor = pickle.loads(pickle.dumps(shared.descriptor))
+        assert len(pickle.dumps(descriptor)) < 4096  # no trial data in the descriptor
+        copy, shm = attach_recording(descriptor)
+
+        src, dst = rec.channels["0"], copy.channels["0"]
+        assert copy.protocol_name == "IV" and copy.subject_id == "M1" and copy.metadata == {"gain": 10}
+        assert dst.electrode_description == "patch" and dst.current_units == "pA"
+        assert dst._recording_ref is copy
+        for i in range(src.num_trials):
+            np.testing.assert_array_equal(dst.get_data(i), src.get_data(i))
+            assert np.shares_memory(dst.get_data(i), np.frombuffer(shm.buf, dtype=np.uint8))
+        assert (dst.trial_matrix is not None) == (not ragged)
+        assert len(dst.current_data_trials) == src.num_trials
+
+        del copy, dst
+        detach(shm)
+
+
+def test_parallel_batch_of_inline_recordings_matches_sequential():
+    recs = [_recording(f"cell_{i}.abf") for i in range(3)]
+    pipeline = [{"analysis": "rmp_analysis", "scope": "all_trials", "params": {}}]
+
+    sequential = BatchAnalysisEngine(max_workers=1).run_batch(recs, pipeline)
+    parallel = BatchAnalysisEngine(max_workers=2).run_batch(recs, pipeline)
+
+    cols = ["file_name", "trial_index", "rmp_mv"]
+    cols = [c for c in cols if c in sequential.columns]
+    assert len(parallel) == len(sequential)
+    assert parallel[cols].equals(sequential[cols])
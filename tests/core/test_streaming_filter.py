@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Tests for bounded-memory block filtering."""
+
+import numpy as np
+import pytest
+from scipy import signal
+
+from synaptipy.core import signal_processor
+from synaptipy.core.data_model import Channel
+from synaptipy.core.streaming_filter import TrialSource, filter_streaming, settling_samples, sosfilt_blocks
+
+FS = 20000.0
+DESIGNS = [
+    ("lowpass", {"cutoff": 500.0}),
+    ("highpass", {"cutoff": 1.0}),
+    ("bandpass", {"low_cut": 1.0, "high_cut": 3000.0}),
+    ("notch", {"freq": 50.0, "q_factor": 30.0}),
+    ("multi_harmonic_notch", {"fundamental_hz": 50.0, "q_factor": 30.0}),
+]
+
+
+@pytest.fixture(scope="module")
+def trace():
+    rng = np.random.default_rng(0)
+    t = np.arange(400_000) / FS
+    return rng.standard_normal(t.size).cumsum() * 0.01 + np.sin(2 * np.pi * 50 * t) + rng.standard_normal(t.size)
+
+
+@pytest.fixture
+def memmapped(tmp_path, trace):
+    path = tmp_path / "trace.npy"
+    np.save(path, trace)
+    return np.load(path, mmap_mode="r")
+
+
+@pytest.mark.parametrize("method,params", DESIGNS)
+def test_zero_phase_matches_whole_trace(method, params, memmapped, trace, tmp_path):
+    out = filter_streaming(memmapped, FS, method, tmp_path / "out.npy", block_size=30_000, **params)
+    assert isinstance(out, np.memmap)
+    expected = signal_processor._sosfiltfilt_safe(signal_processor.design_filter_sos(method, FS, **params), trace)
+    assert np.max(np.abs(out - expected)) <= 1e-6 * np.max(np.abs(trace))
+    np.testing.assert_allclose(np.load(tmp_path / "out.npy"), out)
+
+
+@pytest.mark.parametrize("method,params", DESIGNS[:3])
+def test_causal_carries_state_exactly(method, params, memmapped, trace):
+    sos = signal_processor.design_filter_sos(method, FS, **params)
+    out = sosfilt_blocks(sos, memmapped, zero_phase=False, block_size=12_345)
+    np.testing.assert_allclose(out, signal.sosfilt(sos, trace), rtol=0, atol=1e-12)
+
+
+def test_settling_samples_tracks_filter_decay():
+    fast = signal_processor.design_filter_sos("lowpass", FS, cutoff=2000.0)
+    slow = signal_processor.design_filter_sos("highpass", FS, cutoff=1.0)
+    assert 0 < settling_samples(fast) < settling_samples(slow)
+    assert settling_samples(slow, tol=1e-3) < settling_samples(slow, tol=1e-9)
+
+
+def test_trial_source_and_invalid_design(trace):
+    channel = Channel("1", "Vm", "mV", FS, [trace[:50_000], trace[50_000:120_000]])
+    source = TrialSource(channel, 1)
+    assert len(source) == 70_000
+    out = filter_streaming(source, FS, "lowpass", cutoff=500.0, block_size=8_000)
+    sos = signal_processor.design_filter_sos("lowpass", FS, cutoff=500.0)
+    np.testing.assert_allclose(out, signal_processor._sosfiltfilt_safe(sos, trace[50_000:120_000]), atol=1e-8)
+
+    # A cutoff above Nyquist is skipped, as by lowpass_filter.
+    np.testing.assert_array_equal(filter_streaming(source, FS, "lowpass", cutoff=FS), trace[50_000:120_000])
+    with pytest.raises(ValueError):
+        sosfilt_blocks(sos, source, np.empty(10))
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""Tests for the implicit TimeAxis."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from synaptipy.core.analysis.passive_properties import calculate_rmp, run_rmp_analysis_wrapper
+from synaptipy.core.data_model import Channel
+from synaptipy.core.time_axis import TimeAxis, as_time_array
+
+
+@pytest.fixture
+def axis_and_ref():
+    n, fs, t0 = 2500, 20000.0, 0.37
+    return TimeAxis.from_sampling_rate(n, fs, t0), np.linspace(t0, t0 + n / fs, n, endpoint=False)
+
+
+def test_materialize_matches_linspace(axis_and_ref):
+    axis, ref = axis_and_ref
+    np.testing.assert_array_equal(np.asarray(axis), ref)
+    assert len(axis) == axis.size == ref.size
+    assert axis.shape == ref.shape
+    assert axis[0] == ref[0] and axis[-1] == ref[-1] and axis[123] == ref[123]
+
+
+@pytest.mark.parametrize("side", ["left", "right"])
+def test_searchsorted_matches_numpy(axis_and_ref, side):
+    axis, ref = axis_and_ref
+    probes = np.concatenate([ref[::97], ref[::89] + 1e-7, [-1.0, ref[-1] + 1.0]])
+    np.testing.assert_array_equal(np.searchsorted(axis, probes, side=side), np.searchsorted(ref, probes, side=side))
+    assert np.searchsorted(axis, ref[10], side=side) == np.searchsorted(ref, ref[10], side=side)
+
+
+def test_slicing_and_masks(axis_and_ref):
+    axis, ref = axis_and_ref
+    sub = axis[100:400:3]
+    assert isinstance(sub, TimeAxis)
+    np.testing.assert_allclose(np.asarray(sub), ref[100:400:3], rtol=0, atol=1e-12)
+    mask = (axis >= 0.4) & (axis < 0.42)
+    np.testing.assert_array_equal(mask, (ref >= 0.4) & (ref < 0.42))
+    np.testing.assert_array_equal(axis[mask], ref[mask])
+    np.testing.assert_allclose(np.asarray(axis - 0.37), ref - 0.37, atol=1e-12)
+
+
+def test_index_of_and_pickle(axis_and_ref):
+    axis, ref = axis_and_ref
+    assert axis.index_of(ref[42] + 0.2 / 20000.0) == 42
+    assert axis.index_of(-5.0) == 0
+    assert pickle.loads(pickle.dumps(axis)).materialize().tolist() == ref.tolist()
+    assert as_time_array(axis) is not axis
+    assert as_time_array(ref) is ref
+
+
+def test_from_array_detects_uniform_spacing(axis_and_ref):
+    _, ref = axis_and_ref
+    assert TimeAxis.from_array(ref).n == ref.size
+    assert TimeAxis.from_array(np.array([0.0, 1.0, 3.0])) is None
+
+
+def test_channel_time_axes_match_vectors():
+    ch = Channel("0", "Vm", "mV", 1000.0, [np.zeros(50), np.zeros(50)])
+    ch.t_start = 0.25
+    np.testing.assert_array_equal(np.asarray(ch.get_time_axis(1)), ch.get_time_vector(1))
+    np.testing.assert_array_equal(np.asarray(ch.get_relative_time_axis(0)), ch.get_relative_time_vector(0))
+    np.testing.assert_array_equal(np.asarray(ch.get_averaged_time_axis()), ch.get_averaged_time_vector())
+    assert ch.get_time_axis(5) is None
+
+
+def test_rmp_accepts_time_axis(axis_and_ref):
+    axis, ref = axis_and_ref
+    data = -65.0 + 0.1 * np.sin(np.arange(axis.n) / 50.0)
+    dense = calculate_rmp(data, ref, (0.38, 0.45))
+    implicit = calculate_rmp(data, axis, (0.38, 0.45))
+    assert implicit.is_valid
+    assert implicit.value == dense.value
+    assert implicit.drift == pytest.approx(dense.drift)
+    kwargs = {"baseline_start": 0.38, "baseline_end": 0.45}
+    res_axis = run_rmp_analysis_wrapper(data, axis, 20000.0, **kwargs)
+    res_dense = run_rmp_analysis_wrapper(data, ref, 20000.0, **kwargs)
+    assert res_axis["metrics"]["rmp_mv"] == res_dense["metrics"]["rmp_mv"]
+
+
+def test_contiguous_slice_is_bit_identical(axis_and_ref):
+    axis, ref = axis_and_ref
+    window = axis[234:2178]
+    assert window.i0 == 234
+    np.testing.assert_array_equal(np.asarray(window), ref[234:2178])
+    assert window.start == ref[234]
+    assert window.searchsorted(ref[1000]) == 1000 - 234
+    assert window.index_of(ref[2000]) == 2000 - 234
+    np.testing.assert_allclose(np.asarray(window + 0.5), ref[234:2178] + 0.5, rtol=1e-12)
+
+
+def test_get_data_window_lazy_reads_only_the_window(sample_abf_path):
+    from synaptipy.infrastructure.file_readers.abf_reader import AbfReader
+
+    eager = AbfReader().read_recording(sample_abf_path)
+    lazy = AbfReader().read_recording(sample_abf_path, lazy=True)
+    ch_id = next(iter(eager.channels))
+    ch, ref = lazy.channels[ch_id], eager.channels[ch_id]
+
+    i0, i1 = ref.get_window_indices(0, 0.1, 0.2)
+    window = ch.get_data_window(0, 0.1, 0.2)
+    np.testing.assert_array_equal(window, ref.get_data(0)[i0:i1])
+    assert ch.data_trials == []  # window read does not materialise the trial
+    np.testing.assert_array_equal(
+        np.asarray(ref.get_relative_time_axis(0)[i0:i1]), ref.get_relative_time_vector(0)[i0:i1]
+    )
+    # Loaded trials return views.
+    assert np.shares_memory(ref.get_data_window(0, 0.1, 0.2), ref.get_data(0))
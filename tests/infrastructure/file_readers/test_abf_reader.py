@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""Tests for the native memory-mapped ABF reader."""
+
+import struct
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from synaptipy.infrastructure.file_readers import NeoAdapter
+from synaptipy.infrastructure.file_readers.abf_reader import AbfReader, AbfSourceHandle, parse_abf_header
+from synaptipy.shared.error_handling import UnsupportedFormatError
+
+EXAMPLES = sorted((Path(__file__).resolve().parents[3] / "examples" / "data").glob("*.abf"))
+
+
+def _write_abf1(path: Path, raw: np.ndarray, n_channels: int = 2, interval_us: float = 50.0, mode: int = 3) -> None:
+    """Write a minimal ABF1 gap-free file holding interleaved int16 *raw* samples."""
+    header = bytearray(6144)
+
+    def put(offset, fmt, *values):
+        struct.pack_into("<" + fmt, header, offset, *values)
+
+    put(0, "4s", b"ABF ")
+    put(4, "f", 1.83)
+    put(8, "h", mode)
+    put(10, "i", raw.size)
+    put(40, "i", len(header) // 512)
+    put(100, "h", 0)
+    put(120, "h", n_channels)
+    put(122, "f", interval_us / n_channels)
+    put(244, "f", 10.0)
+    put(252, "i", 32768)
+    put(410, "16h", *(list(range(n_channels)) + [-1] * (16 - n_channels)))
+    put(442, "10s", b"Vm prime")
+    put(452, "10s", b"Im")
+    put(602, "8s", b"mV")
+    put(610, "8s", b"nA")
+    put(730, "16f", *([1.0] * 16))
+    put(922, "16f", *([0.1] * 16))
+    put(1050, "16f", *([1.0] * 16))
+    path.write_bytes(bytes(header) + raw.astype("<i2").tobytes())
+
+
+@pytest.fixture
+def abf1_file(tmp_path):
+    raw = np.arange(-200, 200, dtype=np.int16)  # 200 samples x 2 channels
+    path = tmp_path / "synthetic_abf1.abf"
+    _write_abf1(path, raw)
+    return path, raw
+
+
+@pytest.mark.parametrize("abf_path", EXAMPLES, ids=lambda p: p.name)
+def test_matches_neo_axonio(abf_path):
+    """Native decoding reproduces neo AxonIO sample-for-sample."""
+    import neo
+
+    native = AbfReader().read_recording(abf_path)
+    block = neo.AxonIO(str(abf_path)).read_block(signal_group_mode="split-all")
+
+    assert list(native.channels) == ["0"]
+    ch = native.channels["0"]
+    assert ch.units == "mV"
+    assert ch.num_trials == len(block.segments)
+    assert native.session_start_time_dt == block.rec_datetime
+    for i, seg in enumerate(block.segments):
+        expected = seg.analogsignals[0].rescale("mV").magnitude[:, 0]
+        data = ch.get_data(i)
+        assert data.dtype == np.float32
+        np.testing.assert_allclose(data, expected, atol=1e-4)
+
+
+def test_lazy_trials_are_memmap_views(sample_abf_path):
+    rec = AbfReader().read_recording(sample_abf_path, lazy=True)
+    ch = next(iter(rec.channels.values()))
+    assert ch.data_trials == []
+    assert ch.metadata["num_trials"] == rec.source_handle.num_trials
+
+    raw = rec.source_handle.get_raw_view(ch.id, 0)
+    assert isinstance(raw.base, np.memmap) or isinstance(raw, np.memmap)
+    assert ch.get_data(0).shape == raw.shape
+
+
+def test_abf1_gap_free(abf1_file):
+    path, raw = abf1_file
+    header = parse_abf_header(path)
+    assert header.version == pytest.approx(1.83)
+    assert header.sampling_rate == pytest.approx(20000.0)
+    assert [c.name for c in header.channels] == ["Vmprime", "Im"]
+
+    rec = AbfReader().read_recording(path)
+    gain = 10.0 / (0.1 * 32768)
+    np.testing.assert_allclose(rec.channels["0"].get_data(0), raw[0::2] * gain, rtol=1e-6)
+    # nA channel is normalised to pA.
+    assert rec.channels["1"].units == "pA"
+    np.testing.assert_allclose(rec.channels["1"].get_data(0), raw[1::2] * gain * 1e3, rtol=1e-6)
+    assert rec.duration == pytest.approx(200 / 20000.0)
+
+
+def test_channel_whitelist(abf1_file):
+    path, _ = abf1_file
+    rec = AbfReader().read_recording(path, channel_whitelist=["Im"])
+    assert list(rec.channels) == ["1"]
+
+
+def test_unsupported_mode_rejected(tmp_path):
+    path = tmp_path / "event.abf"
+    _write_abf1(path, np.zeros(8, dtype=np.int16), mode=4)
+    with pytest.raises(UnsupportedFormatError):
+        parse_abf_header(path)
+
+
+def test_close_releases_map(abf1_file):
+    path, _ = abf1_file
+    rec = AbfReader().read_recording(path, lazy=True)
+    handle = rec.source_handle
+    assert isinstance(handle, AbfSourceHandle)
+    rec.close()
+    assert handle.load_channel_data("0", 0) is None
+
+
+def test_neo_adapter_uses_native_reader(sample_abf_path):
+    rec = NeoAdapter().read_recording(sample_abf_path)
+    assert isinstance(rec.source_handle, AbfSourceHandle)
+
+
+def test_neo_adapter_falls_back_to_neo(tmp_path, monkeypatch, sample_abf_path):
+    from synaptipy.infrastructure.file_readers.neo_source_handle import NeoSourceHandle
+
+    def _decline(*args, **kwargs):
+        raise UnsupportedFormatError("not handled")
+
+    monkeypatch.setattr(AbfReader, "read_recording", _decline)
+    rec = NeoAdapter().read_recording(sample_abf_path)
+    assert isinstance(rec.source_handle, NeoSourceHandle)
+    assert next(iter(rec.channels.values())).num_trials > 0
+
+
+def test_native_reads_get_command_signals_and_epochs(sample_abf_path, monkeypatch):
+    """Eager native reads run the neo path's Stage 4 (command waveforms, ``abf_epochs``)."""
+    import neo
+
+    parse_header = neo.io.AxonIO._parse_header
+
+    def _parse_with_epochs(self):
+        parse_header(self)
+        self._axon_info["EpochSections"] = ["step"]
+
+    def _protocol(self):
+        n = len(self.header["signal_channels"])
+        return [[np.full(10, 50.0 * (seg + 1))] * n for seg in range(self.segment_count(0))]
+
+    monkeypatch.setattr(neo.io.AxonIO, "_parse_header", _parse_with_epochs)
+    monkeypatch.setattr(neo.io.AxonIO, "read_raw_protocol", _protocol)
+    rec = NeoAdapter().read_recording(sample_abf_path)
+    assert isinstance(rec.source_handle, AbfSourceHandle)
+    assert rec.metadata["abf_epochs"] == ["step"]
+    ch = next(iter(rec.channels.values()))
+    assert ch.current_units == "pA" and len(ch.current_data_trials) == ch.num_trials
+    np.testing.assert_array_equal(ch.current_data_trials[0], 50.0)
+
+
+def test_native_read_defers_to_neo_path_when_axonio_fails(sample_abf_path, monkeypatch):
+    """Files AxonIO cannot parse go through the neo path (and its pyabf rescue) when read eagerly."""
+    from synaptipy.infrastructure.file_readers.neo_source_handle import NeoSourceHandle
+
+    monkeypatch.setattr(NeoAdapter, "_attach_abf_protocol", lambda self, path, rec: False)
+    assert isinstance(NeoAdapter().read_recording(sample_abf_path).source_handle, NeoSourceHandle)
+    assert isinstance(NeoAdapter().read_recording(sample_abf_path, lazy=True).source_handle, AbfSourceHandle)
+
+
+def test_load_block_matches_per_trial(sample_abf_path):
+    rec = AbfReader().read_recording(sample_abf_path, lazy=True)
+    handle = rec.source_handle
+    ch_id = next(iter(rec.channels))
+    trials = list(range(handle.num_trials))[::-1]
+    block = handle.load_block([ch_id], trials)
+    assert block.shape[:2] == (1, len(trials))
+    for row, trial in enumerate(trials):
+        np.testing.assert_array_equal(block[0, row], handle.load_channel_data(ch_id, trial))
+
+
+def test_recording_load_trials_uses_one_bulk_read(abf1_file, monkeypatch):
+    path, raw = abf1_file
+    rec = AbfReader().read_recording(path, lazy=True)
+    calls = []
+    original = AbfSourceHandle.load_block
+
+    def _spy(self, channel_ids, trial_indices):
+        calls.append((list(channel_ids), list(trial_indices)))
+        return original(self, channel_ids, trial_indices)
+
+    monkeypatch.setattr(AbfSourceHandle, "load_block", _spy)
+    rec.load_trials()
+    assert calls == [(["0", "1"], [0])]
+    np.testing.assert_array_equal(rec.channels["1"].get_data(0), rec.source_handle.load_channel_data("1", 0))
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Tests for header-only metadata scanning."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+from neo.rawio.baserawio import BaseRawIO
+
+from synaptipy.infrastructure.file_readers import NeoAdapter, scan_directory, scan_files
+from synaptipy.infrastructure.file_readers.metadata_scan import METADATA_COLUMNS
+
+DATA_DIR = Path(__file__).resolve().parents[3] / "examples" / "data"
+WCP_FILE = DATA_DIR / "240326_003.wcp"
+
+
+@pytest.fixture
+def no_sample_reads(monkeypatch):
+    def _fail(*args, **kwargs):
+        raise AssertionError("header scan must not read samples")
+
+    monkeypatch.setattr(BaseRawIO, "get_analogsignal_chunk", _fail)
+
+
+@pytest.mark.parametrize("native", [True, False], ids=["native", "neo"])
+def test_abf_scan_matches_full_read(sample_abf_path, native):
+    adapter = NeoAdapter()
+    adapter.use_native_abf_reader = native
+    record = adapter.scan_metadata(sample_abf_path)
+    rec = NeoAdapter().read_recording(sample_abf_path)
+    ch = next(iter(rec.channels.values()))
+
+    assert record.header_only
+    assert record.channel_names == [c.name for c in rec.channels.values()]
+    assert record.channel_units == [c.units for c in rec.channels.values()]
+    assert record.sampling_rate == pytest.approx(rec.sampling_rate)
+    assert record.num_sweeps == ch.num_trials
+    assert record.sweep_length == len(ch.get_data(0))
+    assert record.rec_datetime == rec.session_start_time_dt
+    assert record.protocol_name == rec.protocol_name
+
+
+def test_native_abf_scan_normalises_units(sample_abf_path, monkeypatch):
+    from synaptipy.infrastructure.file_readers import neo_adapter
+
+    real_parse = neo_adapter.parse_abf_header
+
+    def _parse(path):
+        header = real_parse(path)
+        for ch, units in zip(header.channels, ["nA", "V"]):
+            ch.units = units
+        return header
+
+    monkeypatch.setattr(neo_adapter, "parse_abf_header", _parse)
+    record = NeoAdapter().scan_metadata(sample_abf_path)
+    assert record.channel_units == ["pA", "mV"][: len(record.channel_units)]
+
+
+def test_rawio_scan_reads_header_only(no_sample_reads):
+    record = NeoAdapter().scan_metadata(WCP_FILE)
+    assert record.file_format == "WinWcpIO"
+    assert record.channel_units == ["pA"]
+    assert record.num_sweeps == 42
+    assert record.sweep_length > 0
+    assert record.sweep_duration_s == pytest.approx(record.sweep_length / record.sampling_rate)
+
+
+def test_get_file_protocols_skips_single_block_files(monkeypatch):
+    import neo
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("single-block files must not be read")
+
+    monkeypatch.setattr(neo.io.WinWcpIO, "read", _fail)
+    assert NeoAdapter().get_file_protocols(WCP_FILE) == []
+
+
+def test_scan_directory_returns_table(tmp_path):
+    for src in sorted(DATA_DIR.iterdir()):
+        if src.suffix in (".abf", ".wcp"):
+            shutil.copy(src, tmp_path / src.name)
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "broken.abf").write_bytes(b"not an abf file")
+    (tmp_path / "notes.txt.bak").write_text("ignored")
+
+    progress = []
+    table = scan_directory(tmp_path, max_workers=4, progress_callback=lambda d, t: progress.append((d, t)))
+
+    assert list(table.columns) == METADATA_COLUMNS
+    assert list(table["path"]) == sorted(table["path"])
+    assert progress[-1] == (len(table), len(table))
+    broken = table[table["file_name"] == "broken.abf"].iloc[0]
+    assert broken["error"]
+    good = table[table["error"].isna()]
+    assert len(good) == len(table) - 1
+    assert (good["num_sweeps"] > 0).all()
+
+    serial = scan_files(table["path"], max_workers=1)
+    assert list(serial["num_sweeps"].fillna(-1)) == list(table["num_sweeps"].fillna(-1))
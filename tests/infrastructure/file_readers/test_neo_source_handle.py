@@ -4,9 +4,10 @@ Tests for the NeoSourceHandle class.
 """
 
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import numpy as np
+import pytest
 
 from synaptipy.infrastructure.file_readers.neo_source_handle import NeoSourceHandle
 
@@ -106,3 +107,71 @@ class TestNeoSourceHandle:
         """Test close handles case when no reader is set."""
         handle = NeoSourceHandle(Path("/test/file.abf"))
         handle.close()  # Should not raise
+
+
+WCP_FILE = Path(__file__).resolve().parents[3] / "examples" / "data" / "240326_003.wcp"
+
+
+@pytest.fixture
+def lazy_wcp():
+    if not WCP_FILE.exists():
+        pytest.skip("Example WCP file not available")
+    from synaptipy.infrastructure.file_readers import NeoAdapter
+
+    return NeoAdapter().read_recording(WCP_FILE, lazy=True)
+
+
+class TestLoadBlock:
+    """Bulk rawio reads via NeoSourceHandle.load_block."""
+
+    def test_matches_eager_read(self, lazy_wcp):
+        from synaptipy.infrastructure.file_readers import NeoAdapter
+
+        eager = NeoAdapter().read_recording(WCP_FILE)
+        ch_id = next(iter(lazy_wcp.channels))
+        block = lazy_wcp.source_handle.load_block([ch_id], [5, 2, 7])
+        assert block.shape[:2] == (1, 3)
+        for row, trial in enumerate([5, 2, 7]):
+            np.testing.assert_array_equal(block[0, row], eager.channels[ch_id].get_data(trial))
+
+    def test_one_chunk_read_per_segment(self, lazy_wcp):
+        handle = lazy_wcp.source_handle
+        ch_id = next(iter(lazy_wcp.channels))
+        with patch.object(handle._reader, "get_analogsignal_chunk", wraps=handle._reader.get_analogsignal_chunk) as spy:
+            handle.load_block([ch_id], [3, 1, 2])
+        assert [c.kwargs["seg_index"] for c in spy.call_args_list] == [1, 2, 3]
+
+    def test_proxy_trials_load_lazily(self, lazy_wcp):
+        ch = next(iter(lazy_wcp.channels.values()))
+        data = ch.get_data(0)
+        assert data is not None and data.ndim == 1
+
+    def test_channel_bulk_load_fills_contiguous_block(self, lazy_wcp):
+        ch = next(iter(lazy_wcp.channels.values()))
+        with patch.object(lazy_wcp.source_handle, "load_channel_data") as per_trial:
+            matrix = ch.get_trial_matrix()
+        per_trial.assert_not_called()
+        assert matrix.shape[0] == ch.num_trials
+        assert np.shares_memory(ch.trial_matrix, matrix)
+
+    def test_invalid_request_returns_none(self, lazy_wcp):
+        handle = lazy_wcp.source_handle
+        ch_id = next(iter(lazy_wcp.channels))
+        assert handle.load_block([ch_id], [10_000]) is None
+        assert handle.load_block([], [0]) is None
+
+    def test_channel_ids_need_not_match_rawio_header(self, lazy_wcp):
+        handle = lazy_wcp.source_handle
+        ch_id = next(iter(lazy_wcp.channels))
+        expected = lazy_wcp.channels[ch_id].get_data(1)
+        handle.set_channel_map({"renamed": handle._channel_map[ch_id]})
+        assert handle._rawio_channel_map() == {"renamed": (0, 0)}
+        np.testing.assert_array_equal(handle.load_channel_data("renamed", 1), expected)
+
+    def test_proxy_fallback_without_rawio_reader(self, lazy_wcp):
+        handle = lazy_wcp.source_handle
+        ch_id = next(iter(lazy_wcp.channels))
+        expected = handle.load_block([ch_id], [0, 1])
+        handle._reader, handle._raw_map = None, None
+        np.testing.assert_array_equal(handle.load_channel_data(ch_id, 1), expected[0, 1])
+        np.testing.assert_array_equal(handle.load_block([ch_id], [0, 1]), expected)
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""Tests for the lazy h5py-backed NWB icephys reader."""
+
+import h5py
+import numpy as np
+import pytest
+
+from synaptipy.infrastructure.file_readers import NeoAdapter, NwbReader
+from synaptipy.infrastructure.file_readers.nwb_reader import NwbSourceHandle
+from synaptipy.shared.error_handling import UnsupportedFormatError
+
+FS = 10000.0
+
+
+def _by_name(rec):
+    return {ch.name: ch for ch in rec.channels.values()}
+
+
+def _series(group, name, data, ntype, sweep, protocol, unit="volts", conversion=1e-3, compression=None):
+    ts = group.create_group(name)
+    ts.attrs["neurodata_type"] = ntype
+    ts.attrs["sweep_number"] = np.uint64(sweep)
+    ts.attrs["stimulus_description"] = protocol
+    ds = ts.create_dataset("data", data=data, chunks=(250,) if compression else None, compression=compression)
+    ds.attrs["unit"] = unit
+    ds.attrs["conversion"] = conversion
+    ds.attrs["offset"] = 0.0
+    st = ts.create_dataset("starting_time", data=float(sweep))
+    st.attrs["rate"] = FS
+
+
+@pytest.fixture
+def nwb2_file(tmp_path):
+    """Two channels x six sweeps, alternating between two protocols."""
+    path = tmp_path / "cell.nwb"
+    with h5py.File(path, "w") as f:
+        f.attrs["nwb_version"] = "2.7.0"
+        f.create_dataset("session_start_time", data="2024-03-26T10:00:00+00:00")
+        acq = f.create_group("acquisition")
+        for sweep in range(6):
+            protocol = "IV" if sweep % 2 == 0 else "Ramp"
+            vm = np.full(1000, -65.0 + sweep)  # mV, stored with conversion 1e-3 to volts
+            _series(acq, f"Vm_sweep_{sweep:03d}", vm, "CurrentClampSeries", sweep, protocol, compression="gzip")
+            im = np.full(1000, 10.0 * sweep)  # pA stored in amperes
+            _series(acq, f"Im_sweep_{sweep:03d}", im * 1e-12, "CurrentClampSeries", sweep, protocol, "amperes", 1.0)
+    return path
+
+
+@pytest.fixture
+def allen_nwb1_file(tmp_path):
+    path = tmp_path / "allen.nwb"
+    with h5py.File(path, "w") as f:
+        acq = f.create_group("acquisition/timeseries")
+        stim = f.create_group("stimulus/presentation")
+        epochs = f.create_group("epochs")
+        for sweep, proto in enumerate(["Long Square", "Short Square", "Long Square"]):
+            for group, value, unit in ((acq, -0.07, "Volts"), (stim, 1e-10, "Amps")):
+                ts = group.create_group(f"Sweep_{sweep}")
+                ds = ts.create_dataset("data", data=np.full(500, value))
+                ds.attrs["unit"] = unit
+                ts.create_dataset("starting_time", data=0.0).attrs["rate"] = FS
+            ep = epochs.create_group(f"Experiment_{sweep}")
+            ep.create_dataset("description", data=f"Stimulus was {proto}, 400 pA")
+    return path
+
+
+def test_nwb2_channels_grouped_across_sweeps(nwb2_file):
+    rec = NwbReader().read_recording(nwb2_file)
+    vm, im = _by_name(rec)["Vm"], _by_name(rec)["Im"]
+    assert (vm.name, vm.units, vm.num_trials) == ("Vm", "mV", 6)
+    assert (im.name, im.units) == ("Im", "pA")
+    np.testing.assert_allclose(vm.get_data(3), -62.0)
+    np.testing.assert_allclose(im.get_data(2), 20.0)
+    assert rec.session_start_time_dt.year == 2024
+    assert rec.source_handle is None  # eager reads close the file
+
+
+def test_lazy_reads_only_requested_sweeps(nwb2_file, monkeypatch):
+    reads = []
+    original = NwbSourceHandle.load_channel_data
+
+    def _counting(self, channel_id, trial_index):
+        reads.append((channel_id, trial_index))
+        return original(self, channel_id, trial_index)
+
+    monkeypatch.setattr(NwbSourceHandle, "load_channel_data", _counting)
+    rec = NwbReader().read_recording(nwb2_file, lazy=True)
+    try:
+        vm = _by_name(rec)["Vm"]
+        assert vm.num_trials == 6 and not reads
+        np.testing.assert_allclose(vm.get_data(4), -61.0)
+        assert reads == [(vm.id, 4)]
+    finally:
+        rec.close()
+
+
+def test_windows_of_compressed_sweeps_decode_once(nwb2_file):
+    rec = NwbReader().read_recording(nwb2_file, lazy=True)
+    handle = rec.source_handle
+    vm, im = _by_name(rec)["Vm"].id, _by_name(rec)["Im"].id
+    try:
+        a = handle.load_window(vm, 1, 100, 200)
+        b = handle.load_window(vm, 1, 600, 700)
+        assert a.shape == b.shape == (100,)
+        assert handle._cache_bytes == 1000 * 8  # one decoded sweep
+        # A later whole-sweep read takes the decoded sweep out of the cache
+        np.testing.assert_allclose(handle.load_channel_data(vm, 1), -64.0)
+        assert handle._cache_bytes == 0
+        # Uncompressed datasets are sliced directly
+        np.testing.assert_allclose(handle.load_window(im, 5, 0, 10), 50.0)
+        assert handle._cache_bytes == 0
+    finally:
+        rec.close()
+
+
+def test_load_block(nwb2_file):
+    rec = NwbReader().read_recording(nwb2_file, lazy=True)
+    try:
+        ids = [_by_name(rec)["Vm"].id, _by_name(rec)["Im"].id]
+        block = rec.source_handle.load_block(ids, [0, 5])
+        assert block.shape == (2, 2, 1000)
+        np.testing.assert_allclose(block[:, :, 0], [[-65.0, -60.0], [0.0, 50.0]])
+    finally:
+        rec.close()
+
+
+def test_protocol_selection(nwb2_file):
+    adapter = NeoAdapter()
+    assert adapter.get_file_protocols(nwb2_file) == ["IV", "Ramp"]
+    rec = adapter.read_recording(nwb2_file, lazy=True, protocol="Ramp")
+    try:
+        ch = _by_name(rec)["Vm"]
+        assert rec.protocol_name == "Ramp" and ch.num_trials == 3
+        np.testing.assert_allclose(ch.get_data(0), -64.0)  # sweep 1
+    finally:
+        rec.close()
+    with pytest.raises(ValueError):
+        NwbReader().read_recording(nwb2_file, protocol="Missing")
+
+
+def test_protocol_dropping_leading_channel(tmp_path):
+    """Channel ids stop matching index positions once a protocol drops a channel."""
+    path = tmp_path / "split.nwb"
+    with h5py.File(path, "w") as f:
+        f.attrs["nwb_version"] = "2.7.0"
+        acq = f.create_group("acquisition")
+        _series(acq, "Im_sweep_000", np.full(1000, 5e-12), "CurrentClampSeries", 0, "B", "amperes", 1.0)
+        _series(acq, "Vm_sweep_001", np.full(800, -70.0), "CurrentClampSeries", 1, "A")
+    rec = NwbReader().read_recording(path, protocol="A")
+    assert [ch.name for ch in rec.channels.values()] == ["Vm"]
+    assert rec.duration == pytest.approx(800 / FS)
+
+
+def test_allen_nwb1_layout(allen_nwb1_file):
+    adapter = NeoAdapter()
+    assert adapter.get_file_protocols(allen_nwb1_file) == ["Long Square", "Short Square"]
+    rec = adapter.read_recording(str(allen_nwb1_file) + "::Long Square")
+    voltage, current = rec.channels["0"], rec.channels["1"]
+    assert (voltage.name, voltage.units, voltage.num_trials) == ("Voltage", "mV", 2)
+    assert (current.name, current.units) == ("Current", "pA")
+    np.testing.assert_allclose(voltage.get_data(1), -70.0)
+    np.testing.assert_allclose(current.get_data(0), 100.0)
+
+
+def test_scan_metadata(nwb2_file):
+    record = NeoAdapter().scan_metadata(nwb2_file)
+    assert record.header_only
+    assert sorted(record.channel_names) == ["Im", "Vm"]
+    assert (record.num_sweeps, record.sweep_length, record.sampling_rate) == (6, 1000, FS)
+    assert record.protocol_name == "IV, Ramp"
+
+
+def test_non_icephys_file_is_unsupported(tmp_path):
+    path = tmp_path / "ecephys.nwb"
+    with h5py.File(path, "w") as f:
+        f.create_group("acquisition")
+    with pytest.raises(UnsupportedFormatError):
+        NwbReader().read_recording(path)
+
+
+def test_native_reader_failure_falls_back_to_neo(allen_nwb1_file, monkeypatch):
+    def _broken(*args, **kwargs):
+        raise RuntimeError("unexpected layout")
+
+    monkeypatch.setattr(NwbReader, "read_recording", _broken)
+    rec = NeoAdapter().read_recording(allen_nwb1_file)
+    assert rec.channels and all(ch.num_trials for ch in rec.channels.values())
+
+
+def test_na_units_are_unknown(tmp_path):
+    path = tmp_path / "units.nwb"
+    with h5py.File(path, "w") as f:
+        f.attrs["nwb_version"] = "2.7.0"
+        acq = f.create_group("acquisition")
+        _series(acq, "Im_sweep_000", np.full(100, 2.0), "VoltageClampSeries", 0, "A", "nA", 1.0)
+        _series(acq, "Aux_sweep_000", np.full(100, 2.0), "VoltageClampSeries", 0, "A", "NA", 1.0)
+    channels = _by_name(NwbReader().read_recording(path))
+    assert channels["Im"].units == "pA"
+    np.testing.assert_allclose(channels["Im"].get_data(0), 2000.0)
+    assert channels["Aux"].units == "unknown"
+    np.testing.assert_allclose(channels["Aux"].get_data(0), 2.0)
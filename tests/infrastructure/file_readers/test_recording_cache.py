@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""Tests for the persistent decoded-recording disk cache."""
+
+import datetime
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from synaptipy.core.precision import set_default_storage_dtype
+from synaptipy.infrastructure.file_readers import NeoAdapter, RecordingDiskCache
+from synaptipy.infrastructure.file_readers.recording_cache import _CHANNEL_ATTRS, _RECORDING_ATTRS
+
+
+@pytest.fixture
+def abf_copy(tmp_path, sample_abf_path):
+    dst = tmp_path / "data" / sample_abf_path.name
+    dst.parent.mkdir()
+    shutil.copy(sample_abf_path, dst)
+    return dst
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return RecordingDiskCache(cache_dir=tmp_path / "cache")
+
+
+@pytest.fixture
+def counting_adapter():
+    adapter = NeoAdapter()
+    spy = MagicMock(wraps=adapter)
+    return spy
+
+
+def test_round_trip_preserves_recording(cache, abf_copy, counting_adapter):
+    first = cache.read_recording(counting_adapter, abf_copy)
+    second = cache.read_recording(counting_adapter, abf_copy)
+
+    assert counting_adapter.read_recording.call_count == 1
+    assert cache.get_stats()["hits"] == 1
+    assert second is not first
+    assert second.sampling_rate == first.sampling_rate
+    assert second.duration == first.duration
+    assert second.session_start_time_dt == first.session_start_time_dt
+    assert list(second.channels) == list(first.channels)
+    for ch_id, ch in first.channels.items():
+        cached = second.channels[ch_id]
+        assert (cached.name, cached.units, cached.num_trials) == (ch.name, ch.units, ch.num_trials)
+        for i in range(ch.num_trials):
+            np.testing.assert_array_equal(cached.get_data(i), ch.get_data(i))
+            assert cached.get_data(i).dtype == ch.get_data(i).dtype
+
+
+def _assert_same(cached, fresh, where):
+    assert type(cached) is type(fresh), f"{where}: {type(cached).__name__} != {type(fresh).__name__}"
+    if isinstance(fresh, np.ndarray):
+        assert cached.dtype == fresh.dtype, where
+        np.testing.assert_array_equal(cached, fresh, err_msg=where)
+    elif isinstance(fresh, dict):
+        assert list(cached) == list(fresh), where
+        for key in fresh:
+            _assert_same(cached[key], fresh[key], f"{where}[{key!r}]")
+    elif isinstance(fresh, (list, tuple)):
+        assert len(cached) == len(fresh), where
+        for i, (a, b) in enumerate(zip(cached, fresh)):
+            _assert_same(a, b, f"{where}[{i}]")
+    else:
+        assert cached == fresh, where
+
+
+def _assert_same_recording(cached, fresh):
+    for attr in _RECORDING_ATTRS + ("session_start_time_dt", "metadata"):
+        _assert_same(getattr(cached, attr), getattr(fresh, attr), attr)
+    assert list(cached.channels) == list(fresh.channels)
+    for ch_id, ch in fresh.channels.items():
+        other = cached.channels[ch_id]
+        for attr in ("id", "name", "units", "sampling_rate", "metadata") + _CHANNEL_ATTRS:
+            _assert_same(getattr(other, attr), getattr(ch, attr), f"channel {ch_id}.{attr}")
+        _assert_same(other.data_trials, ch.data_trials, f"channel {ch_id}.data_trials")
+        _assert_same(other.current_data_trials, ch.current_data_trials, f"channel {ch_id}.current_data_trials")
+
+
+def test_cached_recording_matches_fresh_read_field_by_field(cache, abf_copy):
+    adapter = NeoAdapter()
+    fresh = adapter.read_recording(abf_copy)
+    fresh.metadata.update(
+        {
+            "epochs": np.arange(6, dtype=np.int32).reshape(2, 3),
+            "gain": np.float32(2.5),
+            "acquired": datetime.datetime(2024, 3, 26, 10, 0, 5),
+            "protocol_file": Path("protocols/iv.pro"),
+            "window": (0.1, 0.5),
+            "by_sweep": {0: "IV", 1: "Ramp"},
+        }
+    )
+    next(iter(fresh.channels.values())).metadata["offsets"] = np.array([0.5, -0.5])
+    assert cache.put(abf_copy, fresh)
+
+    cached = cache.get(abf_copy)
+    assert cached is not None
+    _assert_same_recording(cached, fresh)
+
+    plain = adapter.read_recording(abf_copy)
+    cache.clear()
+    cache.read_recording(adapter, abf_copy)
+    _assert_same_recording(cache.read_recording(adapter, abf_copy), plain)
+
+
+def test_storage_dtype_policy_is_part_of_key(cache, abf_copy):
+    default_key = cache.fingerprint(abf_copy)
+    set_default_storage_dtype(np.float32)
+    try:
+        assert cache.fingerprint(abf_copy) != default_key
+    finally:
+        set_default_storage_dtype(None)
+
+
+def test_default_instance_is_opt_in(monkeypatch):
+    monkeypatch.delenv("SYNAPTIPY_DISK_CACHE", raising=False)
+    RecordingDiskCache.set_instance(None)
+    assert not RecordingDiskCache.get_instance().enabled
+    monkeypatch.setenv("SYNAPTIPY_DISK_CACHE", "1")
+    RecordingDiskCache.set_instance(None)
+    assert RecordingDiskCache.get_instance().enabled
+
+
+def test_modified_file_invalidates_entry(cache, abf_copy, counting_adapter):
+    cache.read_recording(counting_adapter, abf_copy)
+    st = abf_copy.stat()
+    os.utime(abf_copy, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    cache.read_recording(counting_adapter, abf_copy)
+    assert counting_adapter.read_recording.call_count == 2
+
+
+def test_read_options_are_part_of_key(cache, abf_copy):
+    assert cache.fingerprint(abf_copy) != cache.fingerprint(abf_copy, channel_whitelist=["0"])
+    assert cache.fingerprint(abf_copy) != cache.fingerprint(abf_copy, force_kHz_to_Hz=True)
+    assert cache.fingerprint(abf_copy.with_name("missing.abf")) is None
+
+
+def test_lazy_reads_bypass_cache(cache, abf_copy, counting_adapter):
+    cache.read_recording(counting_adapter, abf_copy, lazy=True)
+    cache.read_recording(counting_adapter, abf_copy, lazy=True)
+    assert counting_adapter.read_recording.call_count == 2
+    assert cache.size_bytes() == 0
+
+
+def test_disabled_cache_never_writes(tmp_path, abf_copy, counting_adapter):
+    disabled = RecordingDiskCache(cache_dir=tmp_path / "cache", enabled=False)
+    disabled.read_recording(counting_adapter, abf_copy)
+    assert disabled.get(abf_copy) is None
+    assert not (tmp_path / "cache").exists()
+
+
+def test_lru_eviction_respects_size_cap(tmp_path, sample_abf_path):
+    files = []
+    for i in range(3):
+        dst = tmp_path / f"f{i}.abf"
+        shutil.copy(sample_abf_path, dst)
+        files.append(dst)
+
+    probe = RecordingDiskCache(cache_dir=tmp_path / "probe")
+    probe.read_recording(NeoAdapter(), files[0])
+    entry_size = probe.size_bytes()
+
+    cache = RecordingDiskCache(cache_dir=tmp_path / "cache", max_bytes=int(entry_size * 2.5))
+    adapter = NeoAdapter()
+    cache.read_recording(adapter, files[0])
+    cache.read_recording(adapter, files[1])
+    # Touch f0 so f1 becomes least recently used.
+    entry0 = cache.cache_dir / f"{cache.fingerprint(files[0])}.npz"
+    os.utime(entry0, ns=(entry0.stat().st_atime_ns, entry0.stat().st_mtime_ns + 10**9))
+    cache.read_recording(adapter, files[2])
+
+    assert cache.get_stats()["evictions"] == 1
+    assert cache.get(files[0]) is not None
+    assert cache.get(files[1]) is None
+
+
+def test_corrupt_entry_is_discarded(cache, abf_copy):
+    cache.read_recording(NeoAdapter(), abf_copy)
+    entry = cache.cache_dir / f"{cache.fingerprint(abf_copy)}.npz"
+    entry.write_bytes(b"not an archive")
+    assert cache.get(abf_copy) is None
+    assert not entry.exists()
+
+
+def test_batch_engine_reads_through_cache(tmp_path, abf_copy):
+    from synaptipy.core.analysis.batch_engine import BatchAnalysisEngine
+
+    RecordingDiskCache.set_instance(RecordingDiskCache(cache_dir=tmp_path / "cache"))
+    adapter = MagicMock(wraps=NeoAdapter())
+    # auto_detect has no declared window, so the whole file is decoded (and cached)
+    pipeline = [{"analysis": "rmp_analysis", "scope": "first_trial", "params": {"auto_detect": True}}]
+
+    BatchAnalysisEngine(neo_adapter=adapter).run_batch([abf_copy], pipeline)
+    BatchAnalysisEngine(neo_adapter=adapter).run_batch([abf_copy], pipeline)
+
+    assert adapter.read_recording.call_count == 1
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Tests for the SQLite recording catalog."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from synaptipy.infrastructure.file_readers import NeoAdapter, RecordingCatalog
+from synaptipy.infrastructure.file_readers.recording_catalog import CATALOG_COLUMNS
+
+DATA_DIR = Path(__file__).resolve().parents[3] / "examples" / "data"
+ABF_FILES = ["2023_04_11_0018.abf", "2023_04_11_0019.abf"]
+WCP_FILE = "240326_003.wcp"
+
+
+class _CountingAdapter(NeoAdapter):
+    def __init__(self):
+        super().__init__()
+        self.scanned = []
+
+    def scan_metadata(self, filepath):
+        self.scanned.append(Path(filepath).name)
+        return super().scan_metadata(filepath)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    rig1, rig2 = tmp_path / "rig1", tmp_path / "rig2" / "day1"
+    rig1.mkdir()
+    rig2.mkdir(parents=True)
+    shutil.copy(DATA_DIR / ABF_FILES[0], rig1 / ABF_FILES[0])
+    shutil.copy(DATA_DIR / ABF_FILES[1], rig2 / ABF_FILES[1])
+    shutil.copy(DATA_DIR / WCP_FILE, rig2 / WCP_FILE)
+    (rig2 / "broken.abf").write_bytes(b"not an abf file")
+    return tmp_path
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    cat = RecordingCatalog(tmp_path / "catalog.sqlite", adapter=_CountingAdapter())
+    yield cat
+    cat.close()
+
+
+def test_index_and_query(tree, catalog):
+    result = catalog.index_directory(tree, max_workers=4)
+    assert (result.added, result.failed) == (4, 1)
+    assert len(catalog) == 4
+
+    table = catalog.query()
+    assert list(table.columns) == CATALOG_COLUMNS
+    assert len(table) == 3  # failed scans are excluded by default
+    assert len(catalog.query(include_errors=True)) == 4
+
+    abf = NeoAdapter().scan_metadata(DATA_DIR / ABF_FILES[0])
+    row = table[table["file_name"] == ABF_FILES[0]].iloc[0]
+    assert row["channel_units"] == abf.channel_units
+    assert row["num_sweeps"] == abf.num_sweeps
+    assert row["rec_datetime"] == abf.rec_datetime
+
+    assert [p.name for p in catalog.query_paths(units="pA", min_sweeps=40)] == [WCP_FILE]
+    assert [p.name for p in catalog.query_paths(sampling_rate=abf.sampling_rate, path_contains="RIG1")] == [
+        ABF_FILES[0]
+    ]
+    assert {p.name for p in catalog.query_paths(directory=tree / "rig2")} == {ABF_FILES[1], WCP_FILE}
+    assert catalog.query_paths(min_sweeps=10_000) == []
+    assert "pA" in catalog.distinct("units")
+
+
+def test_rescan_only_touches_new_or_changed_files(tree, catalog):
+    catalog.index_directory(tree)
+    adapter = catalog.adapter
+    adapter.scanned.clear()
+
+    result = catalog.index_directory(tree)
+    assert (result.unchanged, result.scanned) == (4, 0)
+    assert adapter.scanned == []
+
+    # Touched but identical: only the mtime is refreshed.
+    touched = tree / "rig1" / ABF_FILES[0]
+    os.utime(touched, ns=(touched.stat().st_atime_ns, touched.stat().st_mtime_ns + 10**9))
+    # New file and removed file.
+    shutil.copy(DATA_DIR / ABF_FILES[1], tree / "rig1" / "copy.abf")
+    (tree / "rig2" / "day1" / WCP_FILE).unlink()
+
+    result = catalog.index_directory(tree)
+    assert (result.added, result.touched, result.removed, result.unchanged) == (1, 1, 1, 2)
+    assert adapter.scanned == ["copy.abf"]
+    assert catalog.query_paths(units="pA") == []
+    assert catalog.index_directory(tree).scanned == 0
+
+
+def test_unknown_filter_rejected(catalog):
+    with pytest.raises(ValueError):
+        catalog.query(samplerate=20000)
+    with pytest.raises(ValueError):
+        catalog.distinct("path")
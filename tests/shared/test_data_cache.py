@@ -4,7 +4,9 @@
 Tests for the DataCache class.
 """
 
+import threading
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
@@ -230,3 +232,131 @@ class TestDataCache:
 
         # The cleanup method should have been called on recording1
         # (we can't easily test this without mocking, but the eviction should work)
+
+
+def _sized_recording(name: str, n_trials: int = 4, n_samples: int = 1000) -> Recording:
+    """Recording holding ``n_trials * n_samples`` float64 samples in one channel."""
+    recording = Recording(source_file=Path(name))
+    trials = [np.full(n_samples, float(i)) for i in range(n_trials)]
+    recording.channels = {"0": Channel("0", "Vm", "mV", 10000.0, trials)}
+    return recording
+
+
+class TestDataCacheByteBudget:
+    """Byte-budgeted RAM tier and memory-mapped spill tier."""
+
+    ENTRY_BYTES = 4 * 1000 * 8
+
+    @pytest.fixture
+    def budget_cache(self, tmp_path):
+        return DataCache(max_size=10, max_bytes=int(self.ENTRY_BYTES * 2.5), spill_dir=tmp_path / "spill")
+
+    def test_evicts_by_bytes_not_count(self, budget_cache):
+        for name in ("a.abf", "b.abf", "c.abf"):
+            budget_cache.put(Path(name), _sized_recording(name))
+
+        assert not budget_cache.contains(Path("a.abf"))
+        assert budget_cache.size() == 2
+        stats = budget_cache.get_stats()
+        assert stats["bytes_in_ram"] == 2 * self.ENTRY_BYTES
+        assert stats["evictions"] == 1
+
+    def test_evicted_recording_is_spilled_and_restored(self, budget_cache):
+        first = _sized_recording("a.abf")
+        budget_cache.put(Path("a.abf"), first)
+        budget_cache.put(Path("b.abf"), _sized_recording("b.abf"))
+        budget_cache.put(Path("c.abf"), _sized_recording("c.abf"))
+
+        assert budget_cache.is_spilled(Path("a.abf"))
+        # The spilled recording stays usable, backed by memory-mapped files
+        matrix = first.channels["0"].trial_matrix
+        assert isinstance(matrix, np.memmap)
+        np.testing.assert_array_equal(first.channels["0"].get_data(3), np.full(1000, 3.0))
+
+        restored = budget_cache.get(Path("a.abf"))
+        assert restored is first
+        assert not isinstance(restored.channels["0"].trial_matrix, np.memmap)
+        np.testing.assert_array_equal(restored.channels["0"].get_data(2), np.full(1000, 2.0))
+        stats = budget_cache.get_stats()
+        assert stats["spills"] >= 1
+        assert stats["spill_hits"] == 1
+        assert budget_cache.contains(Path("a.abf"))
+        assert not budget_cache.is_spilled(Path("a.abf"))
+
+    def test_hit_and_miss_counters(self, budget_cache):
+        budget_cache.put(Path("a.abf"), _sized_recording("a.abf"))
+        budget_cache.get(Path("a.abf"))
+        budget_cache.get(Path("missing.abf"))
+        stats = budget_cache.get_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_performance_settings_shrink_budget(self, budget_cache):
+        budget_cache.put(Path("a.abf"), _sized_recording("a.abf"))
+        budget_cache.put(Path("b.abf"), _sized_recording("b.abf"))
+
+        budget_cache.update_performance_settings({"max_ram_allocation_gb": self.ENTRY_BYTES / 1024**3})
+        assert budget_cache.size() == 1
+        assert budget_cache.contains(Path("b.abf"))
+        assert budget_cache.is_spilled(Path("a.abf"))
+
+    def test_spill_disabled_drops_evicted(self, tmp_path):
+        cache = DataCache(max_bytes=self.ENTRY_BYTES, spill_enabled=False, spill_dir=tmp_path / "spill")
+        first = _sized_recording("a.abf")
+        cache.put(Path("a.abf"), first)
+        cache.put(Path("b.abf"), _sized_recording("b.abf"))
+        assert not cache.is_spilled(Path("a.abf"))
+        assert first.channels["0"].data_trials == []
+        assert cache.get(Path("a.abf")) is None
+
+    def test_clear_removes_spill_files(self, budget_cache, tmp_path):
+        for name in ("a.abf", "b.abf", "c.abf"):
+            budget_cache.put(Path(name), _sized_recording(name))
+        assert any((tmp_path / "spill").rglob("*.npy"))
+        budget_cache.clear()
+        assert not any((tmp_path / "spill").rglob("*.npy"))
+        assert budget_cache.get_stats()["spilled_files"] == []
+
+    def test_spill_writes_outside_lock_and_keep_recording_open(self, budget_cache, monkeypatch):
+        first = _sized_recording("a.abf")
+        first.close = MagicMock()
+        lock_free = []
+        original = DataCache._spill_channel
+
+        def _probe(channel, ci, entry):
+            probe = threading.Thread(target=lambda: lock_free.append(budget_cache._lock.acquire(timeout=1)))
+            probe.start()
+            probe.join()
+            if lock_free[-1]:
+                budget_cache._lock.release()
+            return original(channel, ci, entry)
+
+        monkeypatch.setattr(DataCache, "_spill_channel", staticmethod(_probe))
+        for name, recording in (("a.abf", first), ("b.abf", None), ("c.abf", None)):
+            budget_cache.put(Path(name), recording or _sized_recording(name))
+
+        assert lock_free and all(lock_free)
+        assert budget_cache.is_spilled(Path("a.abf"))
+        first.close.assert_not_called()
+        np.testing.assert_array_equal(first.channels["0"].get_data(1), np.full(1000, 1.0))
+
+    def test_get_during_spill_write_cancels_spill(self, budget_cache, monkeypatch, tmp_path):
+        first = _sized_recording("a.abf")
+        fetched = []
+        original = DataCache._spill_channel
+
+        def _fetch_back(channel, ci, entry):
+            result = original(channel, ci, entry)
+            fetched.append(budget_cache.get(Path("a.abf")))
+            return result
+
+        monkeypatch.setattr(DataCache, "_spill_channel", staticmethod(_fetch_back))
+        budget_cache.put(Path("a.abf"), first)
+        budget_cache.put(Path("b.abf"), _sized_recording("b.abf"))
+        budget_cache.put(Path("c.abf"), _sized_recording("c.abf"))
+
+        assert fetched[0] is first
+        assert budget_cache.contains(Path("a.abf"))
+        assert not isinstance(first.channels["0"].trial_matrix, np.memmap)
+        spilled = {p.parent.name for p in (tmp_path / "spill").rglob("*.npy")}
+        assert len(spilled) == len(budget_cache.get_stats()["spilled_files"])
@@ -220,6 +220,16 @@ class TestDataCacheCoverage:
         assert p in self.cache
         assert Path("missing.abf") not in self.cache
 
+    def test_holds_checks_identity(self):
+        """holds() is true only for the cached object itself, until it is removed."""
+        p = Path("held.abf")
+        rec = _make_recording(p)
+        self.cache.put(p, rec)
+        assert self.cache.holds(rec)
+        assert not self.cache.holds(_make_recording(p))
+        self.cache.remove(p)
+        assert not self.cache.holds(rec)
+
     def test_repr_contains_size(self):
         """__repr__."""
         r = repr(self.cache)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Tests for the shared processed-trace cache."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from synaptipy.core.data_model import Channel
+from synaptipy.core.processing_pipeline import SignalProcessingPipeline
+from synaptipy.shared.processed_cache import ProcessedTraceCache
+
+FS = 10000.0
+
+
+@pytest.fixture
+def channel():
+    rng = np.random.default_rng(1)
+    return Channel("1", "Vm", "mV", FS, [rng.standard_normal(2000) for _ in range(4)])
+
+
+@pytest.fixture
+def pipeline():
+    p = SignalProcessingPipeline()
+    p.add_step({"type": "filter", "method": "lowpass", "cutoff": 500.0, "order": 4})
+    return p
+
+
+def test_trials_processed_once_per_configuration(channel, pipeline):
+    cache = ProcessedTraceCache()
+    expected = [pipeline.process(channel.get_data(i), FS) for i in range(4)]
+
+    with patch.object(pipeline, "process_batch", wraps=pipeline.process_batch) as batch:
+        first = cache.get_trials(pipeline, channel, [0, 1, 2, 3])
+        again = cache.get_trials(pipeline, channel, [1, 3])
+        assert batch.call_count == 1
+
+    for got, want in zip(first, expected):
+        np.testing.assert_allclose(got, want)
+    assert again[0] is first[1] and again[1] is first[3]
+    assert not first[0].flags.writeable
+
+    # An equal pipeline built elsewhere shares the entries; a changed one does not.
+    twin = SignalProcessingPipeline()
+    twin.set_steps(pipeline.get_steps())
+    assert twin.step_hash == pipeline.step_hash
+    assert cache.get_trial(twin, channel, 2) is first[2]
+    pipeline.add_step({"type": "baseline", "method": "mean"})
+    assert cache.get_trial(pipeline, channel, 2) is not first[2]
+    assert cache.get_stats()["hits"] == 3
+
+
+def test_data_change_and_empty_pipeline(channel, pipeline):
+    cache = ProcessedTraceCache()
+    before = cache.get_trial(pipeline, channel, 0)
+    channel.data_trials = [t * 2 for t in channel.data_trials]
+    after = cache.get_trial(pipeline, channel, 0)
+    np.testing.assert_allclose(after, before * 2, atol=1e-12)
+    assert cache.get_stats()["invalidations"] == 1
+
+    # Nothing to apply: no entries are stored.
+    raw = cache.get_trial(SignalProcessingPipeline(), channel, 1)
+    np.testing.assert_array_equal(raw, channel.get_data(1))
+    assert len(cache) == 1
+    assert cache.invalidate(channel) == 1 and len(cache) == 0
+
+
+def test_byte_budget_evicts_least_recently_used(channel, pipeline):
+    cache = ProcessedTraceCache(max_bytes=2 * 2000 * 8)
+    cache.get_trials(pipeline, channel, [0, 1])
+    cache.get_trial(pipeline, channel, 0)  # 0 becomes most recently used
+    cache.get_trial(pipeline, channel, 2)
+    stats = cache.get_stats()
+    assert (stats["entries"], stats["evictions"]) == (2, 1)
+    assert cache.bytes_in_use() <= cache.max_bytes
+    cache.get_trial(pipeline, channel, 0)
+    assert cache.get_stats()["hits"] == 2  # trial 1 was evicted, trial 0 kept
+
+
+def test_channel_without_id_and_single_miss(channel, pipeline):
+    """Spec'd channel mocks have no ``id``; a lone miss goes through ``process``."""
+    stub = MagicMock(spec=Channel)
+    stub.sampling_rate = FS
+    stub.get_data.side_effect = channel.get_data
+    stub.get_relative_time_vector.side_effect = channel.get_relative_time_vector
+
+    cache = ProcessedTraceCache()
+    with patch.object(pipeline, "process", wraps=pipeline.process) as single:
+        first = cache.get_trial(pipeline, stub, 0)
+    single.assert_called_once()
+    assert cache.get_trial(pipeline, stub, 0) is first
+    assert cache.invalidate(stub) == 1
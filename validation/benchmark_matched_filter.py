@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+"""
+Matched-Filter Bank Benchmark
+=============================
+
+Times the template-matching filter stage of
+:func:`synaptipy.core.analysis.synaptic_events.detect_events_template`
+against the previous implementation, one ``scipy.signal.fftconvolve`` per
+kernel, on white noise (the filter cost does not depend on the content).
+
+Usage::
+
+    python validation/benchmark_matched_filter.py
+    python validation/benchmark_matched_filter.py --duration 5 --fs 20000 --multipliers 1,2,3
+    python validation/benchmark_matched_filter.py --trials 10 --duration 2
+
+Reported rows:
+
+* ``fftconvolve per kernel`` - the reference.
+* ``matched_filter_bank`` - :func:`synaptipy.core.matched_filter.matched_filter_bank`
+  on the same trace; ``max_abs_diff`` is its largest deviation from the reference.
+* ``detect_events_template`` / ``detect_events_template_batch`` (with
+  ``--trials`` > 1) - full detection on ``--trials`` traces, one call per
+  trial against one batched call.  ``speedup`` of the batch row is relative
+  to the per-trial loop.
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+from scipy.signal import fftconvolve
+
+from synaptipy.core.analysis.synaptic_events import detect_events_template, detect_events_template_batch
+from synaptipy.core.matched_filter import kernel_bank, matched_filter_bank
+
+TAU_RISE = 0.0005
+TAU_DECAY = 0.005
+
+
+def _best_time(fn: Callable[[], object], repeats: int):
+    best, out = np.inf, None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def run_benchmark(
+    duration_s: float = 60.0,
+    sampling_rate: float = 50000.0,
+    multipliers: tuple = (1.0, 2.0, 3.0, 4.0),
+    trials: int = 1,
+    repeats: int = 3,
+) -> List[Dict[str, object]]:
+    """Time the reference and the bank; returns one row per measurement."""
+    rng = np.random.default_rng(2024)
+    data = rng.standard_normal((max(1, trials), int(duration_s * sampling_rate))) * 2.0
+    kernels = kernel_bank(TAU_RISE, TAU_DECAY, tuple(multipliers), sampling_rate)
+
+    ref_time, reference = _best_time(lambda: [fftconvolve(data[0], k[::-1], mode="same") for k in kernels], repeats)
+    bank_time, filtered = _best_time(
+        lambda: [f for _, f in matched_filter_bank(data[0], TAU_RISE, TAU_DECAY, multipliers, sampling_rate)],
+        repeats,
+    )
+    rows: List[Dict[str, object]] = [
+        {"stage": "fftconvolve per kernel", "time_s": ref_time, "speedup": 1.0},
+        {
+            "stage": "matched_filter_bank",
+            "time_s": bank_time,
+            "speedup": ref_time / bank_time,
+            "max_abs_diff": float(max(np.abs(a - b).max() for a, b in zip(filtered, reference))),
+        },
+    ]
+
+    options = dict(kernel_multipliers=list(multipliers), rolling_baseline_window_ms=None)
+    loop_time, _ = _best_time(
+        lambda: [detect_events_template(row, sampling_rate, 4.0, TAU_RISE, TAU_DECAY, **options) for row in data],
+        repeats,
+    )
+    rows.append({"stage": f"detect_events_template x{len(data)}", "time_s": loop_time, "speedup": 1.0})
+    if len(data) > 1:
+        batch_time, _ = _best_time(
+            lambda: detect_events_template_batch(data, sampling_rate, 4.0, TAU_RISE, TAU_DECAY, **options), repeats
+        )
+        rows.append(
+            {
+                "stage": f"detect_events_template_batch ({len(data)})",
+                "time_s": batch_time,
+                "speedup": loop_time / batch_time,
+            }
+        )
+    return rows
+
+
+def format_report(rows: List[Dict[str, object]], duration_s: float, sampling_rate: float, multipliers: tuple) -> str:
+    """Markdown table of :func:`run_benchmark` rows."""
+    cols = ["stage", "time_s", "speedup", "max_abs_diff"]
+    lines = [
+        "# Matched-Filter Bank Benchmark",
+        "",
+        f"{duration_s:g} s at {sampling_rate:g} Hz, {len(multipliers)} kernels "
+        f"(tau_decay x {', '.join(f'{m:g}' for m in multipliers)}); detection without rolling baseline.",
+        "",
+        "| " + " | ".join(cols) + " |",
+        "|" + "---|" * len(cols),
+    ]
+    for row in rows:
+        cells = []
+        for col in cols:
+            value = row.get(col, "")
+            cells.append(f"{value:.4g}" if isinstance(value, float) else str(value))
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Synaptipy Matched-Filter Bank Benchmark")
+    parser.add_argument("--duration", type=float, default=60.0, help="Trace length (s)")
+    parser.add_argument("--fs", type=float, default=50000.0, help="Sampling rate (Hz)")
+    parser.add_argument("--multipliers", default="1,2,3,4", help="Comma-separated tau_decay multipliers")
+    parser.add_argument("--trials", type=int, default=1, help="Trials for the per-trial vs batched detection rows")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per stage (best is kept)")
+    args = parser.parse_args()
+
+    mults = tuple(float(m) for m in args.multipliers.split(",") if m.strip())
+    results = run_benchmark(args.duration, args.fs, mults, args.trials, args.repeats)
+    print(format_report(results, args.duration, args.fs, mults))
@@ -263,7 +263,7 @@ def sweep_ahp_windows(
 
     # For AHP, we just verify that the default window captures the AHP.
     # The metric is whether fAHP depth changes with window size.
-    from synaptipy.core.analysis.single_spike import calculate_spike_features
+    from synaptipy.core.analysis.single_spike import compute_spike_feature_table
 
     voltage, time = _generate_standard_spike_trace()
     sampling_rate = 1.0 / (time[1] - time[0])
@@ -285,19 +285,15 @@ def sweep_ahp_windows(
     for scale in scale_factors:
         fahp = (FAHP_WINDOW_MS[0] * scale, FAHP_WINDOW_MS[1] * scale)
         mahp = (MAHP_WINDOW_MS[0] * scale, MAHP_WINDOW_MS[1] * scale)
-        features = calculate_spike_features(
+        features = compute_spike_feature_table(
             voltage,
             time,
             spike_result.spike_indices,
             fahp_window_ms=fahp,
             mahp_window_ms=mahp,
         )
-        depths = [
-            f.get("fahp_depth", np.nan)
-            for f in features
-            if f.get("fahp_depth") is not None and not np.isnan(f.get("fahp_depth", np.nan))
-        ]
-        mean_depth = float(np.mean(depths)) if depths else 0.0
+        depths = features.fahp_depth[~np.isnan(features.fahp_depth)]
+        mean_depth = float(np.mean(depths)) if depths.size else 0.0
         metric_values.append(mean_depth)
 
     default_idx = scale_factors.index(1.0) if 1.0 in scale_factors else 2